@@ -15,6 +15,26 @@ class Settings(BaseSettings):
     # API 키
     GEMINI_API_KEY: str = Field(default="", env="GEMINI_API_KEY")
     
+    # Gemini 설정
+    GEMINI_MODEL: str = Field(default="gemini-1.5-flash", env="GEMINI_MODEL")
+    GEMINI_TEMPERATURE: float = Field(default=0.7, env="GEMINI_TEMPERATURE")
+    GEMINI_MAX_OUTPUT_TOKENS: int = Field(default=8192, env="GEMINI_MAX_OUTPUT_TOKENS")
+    GEMINI_API_BASE_URL: str = Field(
+        default="https://generativelanguage.googleapis.com/v1beta", env="GEMINI_API_BASE_URL"
+    )
+    GEMINI_TIMEOUT: float = Field(default=120.0, env="GEMINI_TIMEOUT")  # 호출 한 번의 전체 제한 시간 (초)
+    GEMINI_CONNECT_TIMEOUT: float = Field(default=10.0, env="GEMINI_CONNECT_TIMEOUT")
+    GEMINI_MAX_CONNECTIONS: int = Field(default=20, env="GEMINI_MAX_CONNECTIONS")  # 워커당 연결 풀 크기
+    GEMINI_HTTP2: bool = Field(default=True, env="GEMINI_HTTP2")  # h2 패키지가 없으면 HTTP/1.1
+    
+    # Gemini 호출 속도 제한 (REDIS_URL이 있으면 클러스터 전체 기준)
+    GEMINI_REQUESTS_PER_MINUTE: int = Field(default=60, env="GEMINI_REQUESTS_PER_MINUTE")
+    GEMINI_TOKENS_PER_MINUTE: int = Field(default=1_000_000, env="GEMINI_TOKENS_PER_MINUTE")
+    GEMINI_MAX_CONCURRENCY: int = Field(default=8, env="GEMINI_MAX_CONCURRENCY")  # 워커당 동시 호출 수
+    # 사용량 초과 시 첫 대기 (초)
+    GEMINI_BACKOFF_INITIAL: float = Field(default=2.0, env="GEMINI_BACKOFF_INITIAL")
+    GEMINI_BACKOFF_MAX: float = Field(default=60.0, env="GEMINI_BACKOFF_MAX")  # 최대 대기 (초)
+    
     # 서버 설정
     HOST: str = Field(default="0.0.0.0", env="HOST")
     PORT: int = Field(default=8000, env="PORT")
@@ -31,6 +51,137 @@ class Settings(BaseSettings):
     DEFAULT_TARGET_LANGUAGE: str = Field(default="ko", env="DEFAULT_TARGET_LANGUAGE")
     MAX_VIDEO_DURATION: int = Field(default=3600, env="MAX_VIDEO_DURATION")  # 1시간
     
+    # 일괄 번역 설정
+    BATCH_MAX_URLS: int = Field(default=50, env="BATCH_MAX_URLS")  # 요청당 최대 영상 수
+    BATCH_ITEM_TIMEOUT: float = Field(default=300.0, env="BATCH_ITEM_TIMEOUT")  # 영상당 제한 시간 (초)
+    
+    # 자막 번역 설정
+    # 우선순위 순서
+    TRANSCRIPT_LANGUAGES: str = Field(default="en,en-US,en-GB", env="TRANSCRIPT_LANGUAGES")
+    SEGMENT_BATCH_SIZE: int = Field(default=50, env="SEGMENT_BATCH_SIZE")  # 묶음당 최대 자막 줄 수
+    # 묶음당 입력 토큰 예산
+    SEGMENT_BATCH_MAX_TOKENS: int = Field(default=1500, env="SEGMENT_BATCH_MAX_TOKENS")
+    SEGMENT_BATCH_CONCURRENCY: int = Field(default=4, env="SEGMENT_BATCH_CONCURRENCY")  # 동시 번역 묶음 수
+    SEGMENT_BATCH_RETRIES: int = Field(default=2, env="SEGMENT_BATCH_RETRIES")  # 응답이 잘못된 묶음 재시도 횟수
+    
+    # 자막 번역 메모리 (반복 문장 재사용) - REDIS_URL이 있으면 Redis, 없으면 SQLite
+    TRANSLATION_MEMORY_ENABLED: bool = Field(default=True, env="TRANSLATION_MEMORY_ENABLED")
+    TRANSLATION_MEMORY_PATH: str = Field(
+        default="data/translation_memory.db", env="TRANSLATION_MEMORY_PATH"
+    )
+    # SQLite LRU 한도
+    TRANSLATION_MEMORY_MAX_ENTRIES: int = Field(
+        default=100_000, env="TRANSLATION_MEMORY_MAX_ENTRIES"
+    )
+    # Redis 보관 시간 (30일)
+    TRANSLATION_MEMORY_TTL: int = Field(default=30 * 86400, env="TRANSLATION_MEMORY_TTL")
+    
+    # 캐시 설정
+    CACHE_ENABLED: bool = Field(default=True, env="CACHE_ENABLED")
+    CACHE_TTL: int = Field(default=86400, env="CACHE_TTL")  # 24시간 (초 단위)
+    # 12시간 - 지나면 기존 결과 반환 후 백그라운드 갱신 (0이면 끔)
+    CACHE_SOFT_TTL: int = Field(default=43200, env="CACHE_SOFT_TTL")
+    # 5분 - 비공개 영상 등 실패 결과 캐시 (0이면 끔)
+    NEGATIVE_CACHE_TTL: int = Field(default=300, env="NEGATIVE_CACHE_TTL")
+    REDIS_URL: str = Field(default="", env="REDIS_URL")  # 비어 있으면 메모리 캐시 사용
+    # 캐시용 비동기 Redis 연결 풀 (워커당, 서버 시작 시 생성)
+    REDIS_MAX_CONNECTIONS: int = Field(default=50, env="REDIS_MAX_CONNECTIONS")  # 풀 크기 상한
+    REDIS_POOL_TIMEOUT: float = Field(default=1.0, env="REDIS_POOL_TIMEOUT")  # 빈 연결을 기다리는 최대 시간 (초)
+    # 명령 하나의 응답 제한 시간 (초)
+    REDIS_SOCKET_TIMEOUT: float = Field(default=0.5, env="REDIS_SOCKET_TIMEOUT")
+    REDIS_CONNECT_TIMEOUT: float = Field(default=1.0, env="REDIS_CONNECT_TIMEOUT")
+    # 이보다 오래 쉰 연결은 PING 후 사용 (초)
+    REDIS_HEALTH_CHECK_INTERVAL: int = Field(default=30, env="REDIS_HEALTH_CHECK_INTERVAL")
+    REDIS_RETRIES: int = Field(default=2, env="REDIS_RETRIES")  # 연결 오류/시간 초과 시 재연결 후 재시도 횟수
+    MEMORY_CACHE_MAX_ENTRIES: int = Field(default=1000, env="MEMORY_CACHE_MAX_ENTRIES")
+    # 64MB
+    MEMORY_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024, env="MEMORY_CACHE_MAX_BYTES")
+    
+    # 번역 결과 영구 저장소 (캐시 뒤의 L3) - postgresql://... 또는 로컬용 sqlite:///경로
+    DATABASE_URL: str = Field(default="", env="DATABASE_URL")  # 비어 있으면 사용하지 않음
+    DATABASE_POOL_MIN_SIZE: int = Field(default=1, env="DATABASE_POOL_MIN_SIZE")
+    DATABASE_POOL_MAX_SIZE: int = Field(default=10, env="DATABASE_POOL_MAX_SIZE")
+    TRANSLATION_STORE_ENABLED: bool = Field(default=True, env="TRANSLATION_STORE_ENABLED")
+    STORE_BATCH_SIZE: int = Field(default=50, env="STORE_BATCH_SIZE")  # 묶음당 최대 기록 행 수
+    STORE_FLUSH_INTERVAL: float = Field(default=1.0, env="STORE_FLUSH_INTERVAL")  # 최대 기록 지연 (초)
+    # 기록 대기 한도 (초과 시 오래된 것부터 버림)
+    STORE_MAX_PENDING: int = Field(default=1000, env="STORE_MAX_PENDING")
+    
+    # Prometheus 메트릭 (/metrics) - gunicorn 워커 합산은 PROMETHEUS_MULTIPROC_DIR 사용
+    METRICS_ENABLED: bool = Field(default=True, env="METRICS_ENABLED")
+    
+    # 요청 단계별 시간 (Server-Timing 헤더, 느린 요청 로그, 선택적 OpenTelemetry)
+    SERVER_TIMING_ENABLED: bool = Field(default=True, env="SERVER_TIMING_ENABLED")
+    # 넘으면 INFO 로그
+    TIMING_SLOW_REQUEST_MS: float = Field(default=5000.0, env="TIMING_SLOW_REQUEST_MS")
+    OTEL_ENABLED: bool = Field(default=False, env="OTEL_ENABLED")  # opentelemetry-sdk 필요
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = Field(
+        default="http://localhost:4317", env="OTEL_EXPORTER_OTLP_ENDPOINT"
+    )
+    OTEL_SERVICE_NAME: str = Field(default="youtube-translator", env="OTEL_SERVICE_NAME")
+    
+    # API 사용량 / 오류 기록 (DATABASE_URL의 api_usage, error_logs 테이블)
+    TELEMETRY_ENABLED: bool = Field(default=True, env="TELEMETRY_ENABLED")
+    # 초과 시 오래된 기록부터 버림
+    TELEMETRY_BUFFER_SIZE: int = Field(default=10_000, env="TELEMETRY_BUFFER_SIZE")
+    TELEMETRY_BATCH_SIZE: int = Field(default=500, env="TELEMETRY_BATCH_SIZE")  # 묶음당 최대 행 수
+    # 최대 기록 지연 (초)
+    TELEMETRY_FLUSH_INTERVAL: float = Field(default=2.0, env="TELEMETRY_FLUSH_INTERVAL")
+    
+    # 2단계 캐시 설정 (Redis 사용 시 워커별 L1)
+    CACHE_L1_MAX_ENTRIES: int = Field(default=200, env="CACHE_L1_MAX_ENTRIES")
+    CACHE_L1_MAX_BYTES: int = Field(default=16 * 1024 * 1024, env="CACHE_L1_MAX_BYTES")  # 16MB
+    CACHE_L1_TTL: int = Field(default=300, env="CACHE_L1_TTL")  # 5분
+    # pub/sub 무효화
+    CACHE_INVALIDATION_ENABLED: bool = Field(default=True, env="CACHE_INVALIDATION_ENABLED")
+    
+    # 캐시 값 형식 - auto: JSON + zstd (zstandard가 없으면 zlib)
+    # json, json+zlib, json+zstd, msgpack+zstd ...
+    CACHE_CODEC: str = Field(default="auto", env="CACHE_CODEC")
+    # 이보다 작으면 압축 생략
+    CACHE_COMPRESS_MIN_BYTES: int = Field(default=1024, env="CACHE_COMPRESS_MIN_BYTES")
+    CACHE_COMPRESS_LEVEL: int = Field(default=3, env="CACHE_COMPRESS_LEVEL")
+    
+    # 캐시 적중 빠른 경로 - 인코딩된 응답 본문을 워커별로 보관 (ETag 포함)
+    RESPONSE_CACHE_ENABLED: bool = Field(default=True, env="RESPONSE_CACHE_ENABLED")
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(default=200, env="RESPONSE_CACHE_MAX_ENTRIES")
+    # 32MB
+    RESPONSE_CACHE_MAX_BYTES: int = Field(default=32 * 1024 * 1024, env="RESPONSE_CACHE_MAX_BYTES")
+    # 5분 - soft TTL/다른 워커 갱신 반영 주기
+    RESPONSE_CACHE_TTL: int = Field(default=300, env="RESPONSE_CACHE_TTL")
+    
+    # GET /api/translations/{video_id} HTTP 캐시 (nginx proxy_cache, 브라우저)
+    HTTP_CACHE_MAX_AGE: int = Field(default=300, env="HTTP_CACHE_MAX_AGE")  # 5분
+    # 1시간
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = Field(
+        default=3600, env="HTTP_CACHE_STALE_WHILE_REVALIDATE"
+    )
+    
+    # 인기 영상 캐시 워머 - 많이 요청된 영상을 미리 캐시에 채우고 soft TTL 전에 갱신
+    WARMER_ENABLED: bool = Field(default=True, env="WARMER_ENABLED")
+    WARMER_INTERVAL: int = Field(default=600, env="WARMER_INTERVAL")  # 10분
+    WARMER_TOP_N: int = Field(default=50, env="WARMER_TOP_N")
+    # 주기당 Gemini 번역 예산
+    WARMER_MAX_TRANSLATIONS: int = Field(default=5, env="WARMER_MAX_TRANSLATIONS")
+    WARMER_SOURCE: str = Field(default="auto", env="WARMER_SOURCE")  # auto, redis, local, store
+    
+    # 중복 요청 합치기 (single-flight) - 분산 모드는 Redis 필요
+    SINGLEFLIGHT_DISTRIBUTED: bool = Field(default=False, env="SINGLEFLIGHT_DISTRIBUTED")
+    # 락 유지 시간 (초) - 작업 중에는 1/3마다 연장, 노드가 죽으면 이 시간 후 해제
+    SINGLEFLIGHT_LOCK_TTL: int = Field(default=120, env="SINGLEFLIGHT_LOCK_TTL")
+    # 다른 노드의 결과를 기다리는 최대 시간 (초) - BATCH_ITEM_TIMEOUT과 같게
+    SINGLEFLIGHT_WAIT_TIMEOUT: int = Field(default=300, env="SINGLEFLIGHT_WAIT_TIMEOUT")
+    
+    # 비동기 번역 작업 큐 설정
+    JOB_WORKERS: int = Field(default=2, env="JOB_WORKERS")  # 프로세스당 워커 수
+    JOB_QUEUE_MAX_DEPTH: int = Field(default=100, env="JOB_QUEUE_MAX_DEPTH")  # 초과 시 429
+    JOB_LEASE_SECONDS: int = Field(default=300, env="JOB_LEASE_SECONDS")  # 재전달까지 대기 시간
+    JOB_MAX_ATTEMPTS: int = Field(default=3, env="JOB_MAX_ATTEMPTS")
+    JOB_RESULT_TTL: int = Field(default=3600, env="JOB_RESULT_TTL")  # 작업 기록 보관 시간
+    JOB_MAX_WAIT: int = Field(default=30, env="JOB_MAX_WAIT")  # long-poll 최대 대기 시간 (초)
+    # gunicorn.conf.py가 설정 - 2 이상이면 REDIS_URL 필요
+    GUNICORN_WORKERS: int = Field(default=1, env="GUNICORN_WORKERS")
+    
     # 프로젝트 경로
     BASE_DIR: Path = Path(__file__).resolve().parent.parent
     
@@ -3,19 +3,33 @@ YouTube Translator API - 메인 서버
 영어 YouTube 영상을 한국어로 번역하는 FastAPI 서버입니다.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Path as PathParam, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response, StreamingResponse
 from contextlib import asynccontextmanager
 import logging
+import time
+import traceback
 from pathlib import Path
 
 from app.config import settings
-from app.models import TranslateRequest, TranslateResponse, HealthCheckResponse
+from app.models import (
+    TranslateRequest, TranslateResponse, BatchTranslateRequest, TranslationStatus,
+    HealthCheckResponse, JobResponse, WebSocketMessage, LanguageCode
+)
 from app.services.translator import TranslatorService
+from app.services.response_cache import EncodedResponse, etag_matches
+from app.services.jobs import JobManager, QueueFullError, create_job_queue
+from app.services.transcript import fetch_transcript
+from app.services.telemetry import create_telemetry_writer
+from app.services.warmer import create_cache_warmer
+from app.services.metrics import HTTP_REQUEST_DURATION, render_metrics
+from app.services.timing import (
+    configure_tracing, log_request_timings, request_span, shutdown_tracing, start_request_timing
+)
 from fastapi import WebSocket, WebSocketDisconnect
-from typing import List, Dict
+from typing import List, Dict, Optional
 import json
 from youtube_transcript_api import YouTubeTranscriptApi
 
@@ -34,8 +48,20 @@ async def lifespan(app: FastAPI):
     # 시작 시
     logger.info(f"🚀 YouTube Translator 서버 시작 - 포트: {settings.PORT}")
     logger.info(f"📊 환경: {'개발' if settings.DEBUG else '프로덕션'}")
+    configure_tracing()
+    await translator_service.start()  # 캐시용 비동기 Redis 연결 풀
+    await job_manager.start()
+    await telemetry.start()
+    if cache_warmer is not None:
+        await cache_warmer.start()
     yield
     # 종료 시
+    if cache_warmer is not None:
+        await cache_warmer.stop()
+    await job_manager.stop()
+    await translator_service.aclose()
+    await telemetry.stop()
+    shutdown_tracing()
     logger.info("👋 서버 종료")
 
 
@@ -61,6 +87,77 @@ app.add_middleware(
 # 번역 서비스 초기화
 translator_service = TranslatorService()
 
+# 비동기 번역 작업 관리자 (워커는 lifespan에서 시작)
+job_manager = JobManager(
+    translator_service,
+    queue=create_job_queue(),
+    workers=settings.JOB_WORKERS,
+    lease_seconds=settings.JOB_LEASE_SECONDS,
+    max_attempts=settings.JOB_MAX_ATTEMPTS
+)
+
+# API 사용량 / 오류 기록 (버퍼에 모아 백그라운드에서 DB에 기록)
+telemetry = create_telemetry_writer()
+
+# 인기 영상 캐시 워머 (주기 작업은 lifespan에서 시작)
+cache_warmer = create_cache_warmer(translator_service)
+
+# 스트리밍 라우트 - api_usage는 본문을 다 보낸 뒤 event_stream_response()가 기록
+STREAM_ENDPOINTS = ("/api/translate/stream", "/api/translate/batch/stream")
+
+
+@app.middleware("http")
+async def record_request(request: Request, call_next):
+    """
+    요청마다 응답 시간과 상태 코드 기록
+    
+    모든 라우트는 Prometheus 히스토그램에, /api/ 요청은 api_usage에도 기록합니다
+    (둘 다 메모리에만 쓰므로 응답 지연 없음).
+    단계별 시간(검증, 캐시, Gemini, 파싱 등)은 Server-Timing 헤더와 로그로 남깁니다.
+    
+    스트리밍 응답은 헤더를 보내자마자 여기로 돌아오므로, 시작된 스트림의
+    api_usage는 본문이 끝난 뒤 기록합니다. 처리되지 않은 예외는 500 핸들러가 기록합니다.
+    """
+    path = request.url.path
+    if path == "/metrics" or path.startswith("/static/"):
+        return await call_next(request)
+    
+    start = time.perf_counter()
+    timings = start_request_timing()
+    status_code = 500
+    try:
+        attributes = {"http.method": request.method, "http.target": path}
+        with request_span(f"{request.method} {path}", **attributes):
+            response = await call_next(request)
+        status_code = response.status_code
+        if settings.SERVER_TIMING_ENABLED:
+            response.headers["Server-Timing"] = timings.header()
+        return response
+    finally:
+        elapsed = time.perf_counter() - start
+        # 경로 대신 라우트 템플릿(/api/jobs/{job_id})으로 라벨 개수 제한
+        route = request.scope.get("route")
+        HTTP_REQUEST_DURATION.labels(
+            request.method, getattr(route, "path", "unmatched"), str(status_code)
+        ).observe(elapsed)
+        log_request_timings(request.method, path, status_code, timings)
+        
+        if path.startswith("/api/") and not (path in STREAM_ENDPOINTS and status_code < 400):
+            record_usage(request, status_code, elapsed)
+
+
+def record_usage(request: Request, status_code: int, elapsed: float):
+    """api_usage에 요청 한 건 기록 (메모리 버퍼)"""
+    telemetry.record_usage(
+        endpoint=request.url.path,
+        method=request.method,
+        status_code=status_code,
+        response_time_ms=elapsed * 1000,
+        ip_address=request.client.host if request.client else None,
+        user_agent=request.headers.get("user-agent")
+    )
+
+
 # 정적 파일 경로 설정
 static_dir = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
@@ -91,6 +188,9 @@ async def translate_youtube(
     """
     YouTube 영상을 한국어로 번역
     
+    캐시 적중 시에는 인코딩해 둔 응답 본문을 검증/직렬화 없이 그대로 보냅니다.
+    (ETag와 304는 조건부 GET인 GET /api/translations/{video_id}에서만)
+    
     Args:
         request: YouTube URL을 포함한 번역 요청
         background_tasks: 백그라운드 작업 (로깅, 통계 등)
@@ -111,8 +211,25 @@ async def translate_youtube(
                 detail="유효하지 않은 YouTube URL입니다."
             )
         
-        # 번역 실행
-        result = await translator_service.translate(str(request.youtube_url))
+        # 캐시 적중 빠른 경로 - 인코딩된 본문 그대로 반환
+        encoded = await translator_service.get_cached_response(
+            str(request.youtube_url),
+            request.target_language.value
+        )
+        if encoded is not None:
+            background_tasks.add_task(
+                log_translation_stats,
+                url=str(request.youtube_url),
+                success=True
+            )
+            return Response(content=encoded.body, media_type="application/json")
+        
+        # 번역 실행 (캐시는 위에서 이미 확인)
+        result = await translator_service.translate(
+            str(request.youtube_url),
+            request.target_language.value,
+            cache_checked=True
+        )
         
         # 백그라운드에서 통계 기록
         background_tasks.add_task(
@@ -141,29 +258,379 @@ async def translate_youtube(
         )
 
 
+@app.get(
+    "/api/translations/{video_id}",
+    response_model=TranslateResponse,
+    responses={304: {"description": "If-None-Match와 ETag가 같음"}, 404: {"description": "캐시된 번역 없음"}}
+)
+async def get_translation(
+    request: Request,
+    video_id: str = PathParam(..., pattern=r"^[0-9A-Za-z_-]{11}$", description="YouTube 비디오 ID"),
+    lang: LanguageCode = Query(LanguageCode.KO, description="번역 대상 언어")
+):
+    """
+    캐시된 번역 결과 조회 (HTTP 캐시 가능)
+    
+    번역을 새로 시작하지 않고 캐시(L1 → L2 → 저장소)에 있는 결과만 돌려주므로
+    nginx proxy_cache와 브라우저가 그대로 캐시할 수 있습니다.
+    ETag와 Cache-Control을 붙이고, If-None-Match가 같으면 304를 보냅니다.
+    없으면 404 - POST /api/translate로 번역을 요청하세요.
+    
+    Args:
+        request: 요청 헤더 (If-None-Match)
+        video_id: YouTube 비디오 ID (11자)
+        lang: 번역 대상 언어
+        
+    Returns:
+        번역 결과 (JSON 본문) 또는 304
+        
+    Raises:
+        HTTPException: 404 (캐시 미스), 400 (캐시된 실패 결과)
+    """
+    no_store = {"Cache-Control": "no-store"}
+    try:
+        encoded = await translator_service.get_cached_response(
+            f"https://www.youtube.com/watch?v={video_id}",
+            lang.value
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e), headers=no_store)
+    
+    if encoded is None:
+        raise HTTPException(
+            status_code=404,
+            detail="캐시된 번역이 없습니다. POST /api/translate로 번역을 요청하세요.",
+            headers=no_store
+        )
+    
+    cache_control = (
+        f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+    return encoded_json_response(encoded, request, cache_control)
+
+
+@app.post("/api/translate/stream")
+async def translate_youtube_stream(
+    request: TranslateRequest,
+    http_request: Request,
+    format: str = Query("sse", pattern="^(sse|ndjson)$", description="스트림 형식 (sse 또는 ndjson)")
+):
+    """
+    YouTube 영상 번역 - 스트리밍
+    
+    번역 텍스트를 생성되는 대로 전달합니다.
+    
+    - sse: text/event-stream (event: chunk / complete / error)
+    - ndjson: 한 줄에 하나의 JSON 이벤트
+    
+    마지막 complete 이벤트에 /api/translate와 같은 전체 결과가 담깁니다.
+    """
+    if not translator_service.is_valid_youtube_url(str(request.youtube_url)):
+        raise HTTPException(
+            status_code=400,
+            detail="유효하지 않은 YouTube URL입니다."
+        )
+    
+    events = translator_service.translate_stream(
+        str(request.youtube_url),
+        request.target_language.value
+    )
+    
+    return event_stream_response(events, format, http_request)
+
+
+@app.post("/api/translate/batch/stream")
+async def translate_batch_stream(
+    request: BatchTranslateRequest,
+    http_request: Request,
+    format: str = Query("ndjson", pattern="^(sse|ndjson)$", description="스트림 형식 (sse 또는 ndjson)")
+):
+    """
+    여러 YouTube 영상 일괄 번역 - 끝나는 순서대로 스트리밍
+    
+    - result: 영상 하나의 결과 {index, result} (index는 요청 목록의 위치)
+    - complete: 전체 완료 {total, succeeded, failed}
+    
+    영상별 제한 시간(item_timeout)을 넘긴 영상은 failed 결과로 전달되고,
+    클라이언트 연결이 끊기면 남은 번역은 취소됩니다.
+    
+    Raises:
+        HTTPException: URL 개수 초과(400)
+    """
+    if len(request.youtube_urls) > settings.BATCH_MAX_URLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 최대 {settings.BATCH_MAX_URLS}개까지 번역할 수 있습니다."
+        )
+    
+    item_timeout = min(
+        request.item_timeout or settings.BATCH_ITEM_TIMEOUT, settings.BATCH_ITEM_TIMEOUT
+    )
+    results = translator_service.translate_batch_stream(
+        [str(url) for url in request.youtube_urls],
+        request.target_language.value,
+        item_timeout=item_timeout
+    )
+    
+    async def events():
+        succeeded = 0
+        async for index, result in results:
+            if result.status == TranslationStatus.COMPLETED:
+                succeeded += 1
+            yield {"type": "result", "index": index, "result": result.to_dict()}
+        
+        total = len(request.youtube_urls)
+        yield {
+            "type": "complete", "total": total, "succeeded": succeeded, "failed": total - succeeded
+        }
+    
+    return event_stream_response(events(), format, http_request)
+
+
+def encoded_json_response(
+    encoded: EncodedResponse,
+    request: Request,
+    cache_control: Optional[str] = None
+) -> Response:
+    """
+    인코딩된 JSON 본문을 ETag와 함께 응답 (If-None-Match가 같으면 304)
+    
+    Args:
+        encoded: 본문과 ETag
+        request: If-None-Match 헤더를 읽을 요청
+        cache_control: Cache-Control 헤더 (304에도 같이 보냄)
+        
+    Returns:
+        Response: 200 (JSON 본문) 또는 304 (본문 없음)
+    """
+    headers = {"ETag": encoded.etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request.headers.get("if-none-match"), encoded.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
+
+def event_stream_response(
+    events,
+    format: str,
+    request: Optional[Request] = None
+) -> StreamingResponse:
+    """
+    이벤트 dict 스트림을 SSE 또는 NDJSON 응답으로 변환
+    
+    Args:
+        events: {"type": ..., ...} 이벤트를 내보내는 async iterator
+        format: "sse" 또는 "ndjson"
+        request: 있으면 본문을 다 보낸 뒤 api_usage에 기록
+            (전체 시간, error 이벤트나 예외로 끝나면 상태 500)
+    """
+    start = time.perf_counter()
+    
+    async def encode():
+        status_code = 200
+        try:
+            async for event in events:
+                if event["type"] == "error":
+                    status_code = 500
+                payload = json.dumps(event, ensure_ascii=False, default=str)
+                if format == "sse":
+                    yield f"event: {event['type']}\ndata: {payload}\n\n"
+                else:
+                    yield payload + "\n"
+        except Exception:
+            status_code = 500
+            raise
+        finally:
+            if request is not None:
+                record_usage(request, status_code, time.perf_counter() - start)
+    
+    return StreamingResponse(
+        encode(),
+        media_type="text/event-stream" if format == "sse" else "application/x-ndjson",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # nginx 버퍼링 끄기
+        }
+    )
+
+
+@app.post("/api/jobs", response_model=JobResponse, status_code=202)
+async def create_translation_job(request: TranslateRequest):
+    """
+    번역 작업 등록 (비동기 모드)
+    
+    번역을 기다리지 않고 작업 ID를 바로 반환합니다.
+    결과는 GET /api/jobs/{job_id}로 조회하세요.
+    
+    Raises:
+        HTTPException: 잘못된 URL(400), 대기열 가득 참(429)
+    """
+    if not translator_service.is_valid_youtube_url(str(request.youtube_url)):
+        raise HTTPException(
+            status_code=400,
+            detail="유효하지 않은 YouTube URL입니다."
+        )
+    
+    try:
+        job = await job_manager.submit(
+            str(request.youtube_url),
+            request.target_language.value
+        )
+    except QueueFullError as e:
+        raise HTTPException(
+            status_code=429,
+            detail=str(e),
+            headers={"Retry-After": "30"}
+        )
+    
+    return job
+
+
+@app.get("/api/jobs/{job_id}", response_model=JobResponse)
+async def get_translation_job(
+    job_id: str,
+    wait: int = Query(0, ge=0, description="작업이 끝날 때까지 기다릴 최대 시간 (초, long-poll)")
+):
+    """
+    번역 작업 상태 조회
+    
+    wait를 지정하면 작업이 끝나거나 그 시간이 지날 때까지 응답을 미룹니다.
+    
+    Raises:
+        HTTPException: 없는 작업(404)
+    """
+    timeout = min(wait, settings.JOB_MAX_WAIT)
+    if timeout:
+        job = await job_manager.wait(job_id, timeout)
+    else:
+        job = await job_manager.get(job_id)
+    
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    
+    return job
+
+
+@app.websocket("/ws/{client_id}")
+async def subtitle_websocket(websocket: WebSocket, client_id: str):
+    """
+    실시간 번역 자막 WebSocket
+    
+    클라이언트가 {"type": "init", "url": ...}를 보내면
+    자막을 가져와 묶음 단위로 번역하면서 결과를 순서대로 보냅니다.
+    
+    서버 → 클라이언트 메시지:
+    - progress: 진행 상황 (WebSocketMessage)
+    - ready: 첫 묶음 번역 완료 - 이때부터 재생 가능 {total, subtitles}
+    - segments: 이후 묶음 번역 결과 (WebSocketMessage, data.subtitles)
+    - complete: 전체 번역 완료 (WebSocketMessage)
+    - error: 오류 {message}
+    """
+    await websocket.accept()
+    logger.info(f"🔌 WebSocket 연결: {client_id}")
+    
+    async def send_message(message_type: str, data: Dict):
+        message = WebSocketMessage(type=message_type, data=data)
+        await websocket.send_text(message.json(ensure_ascii=False))
+    
+    try:
+        while True:
+            message = await websocket.receive_json()
+            if message.get("type") != "init":
+                await websocket.send_json({"type": "error", "message": "알 수 없는 메시지입니다."})
+                continue
+            
+            url = str(message.get("url", ""))
+            video_id = translator_service.extract_video_id(url)
+            if not translator_service.is_valid_youtube_url(url) or not video_id:
+                await websocket.send_json({"type": "error", "message": "유효하지 않은 YouTube URL입니다."})
+                continue
+            
+            target_language = message.get("target_language")
+            
+            try:
+                await send_message("progress", {"stage": "transcript", "percentage": 0})
+                segments = await fetch_transcript(video_id)
+                total = len(segments)
+                if not total:
+                    raise ValueError("이 영상에는 번역할 자막이 없습니다.")
+                
+                translated = 0
+                batches = translator_service.translate_segments(segments, target_language)
+                async for offset, subtitles in batches:
+                    translated += len(subtitles)
+                    if offset == 0:
+                        # 첫 묶음이 끝나면 바로 재생을 시작할 수 있도록 ready 전송
+                        await websocket.send_json(
+                            {"type": "ready", "total": total, "subtitles": subtitles}
+                        )
+                    else:
+                        await send_message(
+                            "segments", {"start_index": offset, "subtitles": subtitles}
+                        )
+                    
+                    await send_message("progress", {
+                        "stage": "translate",
+                        "current_segment": translated,
+                        "total_segments": total,
+                        "percentage": round(translated / total * 100)
+                    })
+                
+                await send_message("complete", {"total_segments": total})
+                logger.info(f"✅ WebSocket 자막 번역 완료: {video_id} ({total}줄)")
+                
+            except ValueError as e:
+                await websocket.send_json({"type": "error", "message": str(e)})
+            except Exception as e:
+                logger.error(f"WebSocket 번역 오류: {e}")
+                await websocket.send_json({
+                    "type": "error",
+                    "message": "번역 처리 중 오류가 발생했습니다. 잠시 후 다시 시도해주세요."
+                })
+    
+    except WebSocketDisconnect:
+        logger.info(f"🔌 WebSocket 연결 종료: {client_id}")
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 (gunicorn 워커 전체 합산)"""
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/api/stats")
 async def get_stats():
     """사용 통계 반환 (관리자용)"""
     if not settings.DEBUG:
         raise HTTPException(status_code=404)
     
-    # 실제로는 데이터베이스에서 가져옴
+    # api_usage 기록에서 계산 (DB가 없으면 이 프로세스의 집계)
     return {
-        "total_translations": 1234,
-        "today_translations": 56,
-        "success_rate": 0.95,
-        "average_response_time": 3.2
+        **await telemetry.summary(),
+        "telemetry": telemetry.stats(),
+        "cache": translator_service.get_cache_stats(),
+        "streaming": translator_service.get_stream_stats(),
+        "gemini": translator_service.scheduler.stats(),
+        "warmer": cache_warmer.stats() if cache_warmer is not None else None
     }
 
 
 # 헬퍼 함수
 async def log_translation_stats(url: str, success: bool, error: str = None):
-    """번역 통계 기록 (백그라운드)"""
-    # 실제로는 데이터베이스나 분석 서비스에 기록
+    """번역 통계 기록 (백그라운드) - 요청 자체는 미들웨어가 api_usage에 기록"""
     if success:
         logger.info(f"✅ 번역 성공: {url}")
     else:
         logger.error(f"❌ 번역 실패: {url} - {error}")
+        telemetry.record_error(
+            "TranslationError",
+            error or "",
+            endpoint="/api/translate",
+            request_data={"youtube_url": url}
+        )
 
 
 # 에러 핸들러
@@ -175,7 +642,8 @@ async def not_found_handler(request, exc):
         content={
             "error": "요청하신 페이지를 찾을 수 없습니다.",
             "path": str(request.url.path)
-        }
+        },
+        headers=getattr(exc, "headers", None)  # Cache-Control: no-store 등
     )
 
 
@@ -183,6 +651,13 @@ async def not_found_handler(request, exc):
 async def internal_error_handler(request, exc):
     """500 에러 커스텀 처리"""
     logger.error(f"내부 서버 오류: {exc}")
+    # 오류 기록은 여기서 한 번만 (미들웨어는 예외를 그대로 전달)
+    telemetry.record_error(
+        type(exc).__name__,
+        str(exc),
+        "".join(traceback.format_exception(type(exc), exc, exc.__traceback__)),
+        endpoint=str(request.url.path)
+    )
     return JSONResponse(
         status_code=500,
         content={
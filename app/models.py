@@ -3,6 +3,7 @@ YouTube Translator API 모델 정의
 Pydantic v1을 사용한 안정적인 버전
 """
 
+import json
 from pydantic import BaseModel, HttpUrl, Field, validator
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -62,6 +63,37 @@ class TranslateRequest(BaseModel):
         }
 
 
+class BatchTranslateRequest(BaseModel):
+    """YouTube 일괄 번역 요청 모델"""
+    youtube_urls: List[HttpUrl] = Field(
+        ...,
+        min_items=1,
+        description="번역할 YouTube 영상 URL 목록"
+    )
+    target_language: LanguageCode = Field(
+        default=LanguageCode.KO,
+        description="번역 대상 언어"
+    )
+    item_timeout: Optional[float] = Field(
+        None,
+        gt=0,
+        description="영상당 제한 시간 (초, 서버 최대값을 넘을 수 없음)"
+    )
+    
+    class Config:
+        """Pydantic v1 설정"""
+        schema_extra = {
+            "example": {
+                "youtube_urls": [
+                    "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                    "https://youtu.be/9bZkp7q19f0"
+                ],
+                "target_language": "ko",
+                "item_timeout": 120
+            }
+        }
+
+
 # Response 모델
 class TranslationSegment(BaseModel):
     """번역 세그먼트 (자막 한 줄)"""
@@ -75,13 +107,14 @@ class TranslationSegment(BaseModel):
         le=1.0,
         description="번역 신뢰도 (0.0 ~ 1.0)"
     )
+    from_memory: bool = Field(False, description="번역 메모리에서 재사용한 세그먼트 여부")
 
 
 class VideoMetadata(BaseModel):
     """YouTube 영상 메타데이터"""
     video_id: str = Field(..., description="YouTube 영상 ID")
-    title: str = Field(..., description="영상 제목")
-    channel: str = Field(..., description="채널명")
+    title: Optional[str] = Field(None, description="영상 제목")
+    channel: Optional[str] = Field(None, description="채널명")
     duration: int = Field(..., description="영상 길이 (초)")
     thumbnail_url: Optional[HttpUrl] = Field(None, description="썸네일 URL")
     published_at: Optional[datetime] = Field(None, description="게시일")
@@ -90,20 +123,34 @@ class VideoMetadata(BaseModel):
 class TranslateResponse(BaseModel):
     """번역 응답 모델"""
     status: TranslationStatus = Field(..., description="번역 상태")
-    video_metadata: VideoMetadata = Field(..., description="영상 메타데이터")
+    youtube_url: Optional[str] = Field(None, description="번역한 YouTube URL")
+    video_metadata: Optional[VideoMetadata] = Field(None, description="영상 메타데이터")
     segments: List[TranslationSegment] = Field(
         default_factory=list,
         description="번역된 자막 세그먼트 목록"
     )
-    total_segments: int = Field(..., description="전체 세그먼트 수")
+    total_segments: int = Field(0, description="전체 세그먼트 수")
+    translation: Optional[str] = Field(None, description="전체 번역 텍스트")
+    summary: Optional[str] = Field(None, description="핵심 내용 요약")
+    video_title: Optional[str] = Field(None, description="영상 제목")
+    channel_name: Optional[str] = Field(None, description="채널명")
+    video_duration: Optional[str] = Field(None, description="영상 길이 (표시용)")
+    word_count: Optional[int] = Field(None, description="번역문 단어 수")
+    confidence_score: Optional[float] = Field(None, description="번역 신뢰도 (0.0 ~ 1.0)")
+    translated_at: Optional[datetime] = Field(None, description="번역 시간")
     processing_time: Optional[float] = Field(None, description="처리 시간 (초)")
     error_message: Optional[str] = Field(None, description="오류 발생 시 메시지")
     
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 직렬화 가능한 dict로 변환"""
+        return json.loads(self.json())
+    
     class Config:
         """응답 예시"""
         schema_extra = {
             "example": {
                 "status": "completed",
+                "youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
                 "video_metadata": {
                     "video_id": "dQw4w9WgXcQ",
                     "title": "Example Video",
@@ -121,11 +168,42 @@ class TranslateResponse(BaseModel):
                     }
                 ],
                 "total_segments": 1,
+                "translation": "[00:00] 안녕하세요, 세계!",
                 "processing_time": 2.5
             }
         }
 
 
+# 비동기 작업 응답
+class JobResponse(BaseModel):
+    """번역 작업 상태 응답 모델"""
+    job_id: str = Field(..., description="작업 ID")
+    status: TranslationStatus = Field(
+        ..., description="작업 상태 (pending, processing, completed, failed)"
+    )
+    youtube_url: str = Field(..., description="번역할 YouTube URL")
+    target_language: str = Field(..., description="번역 대상 언어")
+    created_at: datetime = Field(..., description="작업 등록 시간")
+    started_at: Optional[datetime] = Field(None, description="처리 시작 시간")
+    finished_at: Optional[datetime] = Field(None, description="처리 종료 시간")
+    attempts: int = Field(0, description="처리 시도 횟수")
+    result: Optional[TranslateResponse] = Field(None, description="번역 결과 (완료 시)")
+    error_message: Optional[str] = Field(None, description="오류 발생 시 메시지")
+    
+    class Config:
+        """응답 예시"""
+        schema_extra = {
+            "example": {
+                "job_id": "3f2b8c1e9d7a4b6c8e0f1a2b3c4d5e6f",
+                "status": "pending",
+                "youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+                "target_language": "ko",
+                "created_at": "2025-06-17T12:00:00",
+                "attempts": 0
+            }
+        }
+
+
 # 헬스체크 응답
 class HealthCheckResponse(BaseModel):
     """헬스체크 응답 모델"""
@@ -6,17 +6,61 @@ YouTube Translator 서비스 패키지
 
 현재 서비스:
 - translator: YouTube 영상 번역 서비스 (Gemini API 사용)
+- cache: 번역 결과 캐시 엔진 (LRU/TTL 메모리 캐시, L1+L2 2단계 캐시)
+- codec: 캐시 값 직렬화/압축 형식 (orjson/msgpack + zstd/zlib, 형식 바이트)
+- response_cache: 인코딩된 응답 본문과 ETag (캐시 적중 빠른 경로, 304)
+- redis_pool: 캐시용 비동기 Redis 클라이언트 (연결 풀, 시간 제한, 상태 확인, 재연결)
+- singleflight: 같은 영상의 동시 번역 요청 합치기
+- jobs: 비동기 번역 작업 큐와 백그라운드 워커
+- transcript: YouTube 자막 가져오기와 묶음 나누기
+- translation_memory: 자막 세그먼트 번역 메모리 (반복 문장 재사용)
+- rate_limiter: Gemini 호출 속도 제한 스케줄러 (RPM/TPM, 우선순위 레인)
+- gemini_client: Gemini REST API 비동기 클라이언트 (httpx, 연결 재사용)
+- store: 번역 결과 영구 저장소 (PostgreSQL / SQLite, 캐시 뒤의 L3)
+- telemetry: API 사용량 / 오류 기록 버퍼 (api_usage, error_logs)
+- metrics: Prometheus 메트릭 (지연 시간 히스토그램, 캐시/재시도 카운터)
+- response_parser: Gemini 번역 응답 파서 (한 번 훑기, [00:00] 세그먼트 분리)
+- timing: 요청별 단계 시간 측정 (Server-Timing 헤더, 구조화 로그, OpenTelemetry)
+- warmer: 인기 영상 캐시 워머 (요청 빈도 집계, 한가할 때만 미리 번역/갱신)
 
 향후 추가 가능한 서비스:
-- cache: 캐싱 서비스
 - auth: 인증 서비스
 - analytics: 분석 서비스
 """
 
 from app.services.translator import TranslatorService
+from app.services.cache import MemoryCache, TieredCache
+from app.services.singleflight import SingleFlight, RedisSingleFlight
+from app.services.jobs import JobManager, QueueFullError
+from app.services.transcript import fetch_transcript, batch_segments
+from app.services.translation_memory import SQLiteTranslationMemory, RedisTranslationMemory
+from app.services.rate_limiter import GeminiScheduler, priority_lane
+from app.services.gemini_client import GeminiClient, GeminiAPIError
+from app.services.store import PostgresTranslationStore, SQLiteTranslationStore
+from app.services.telemetry import TelemetryWriter
+from app.services.warmer import AccessCounter, CacheWarmer
 
 __all__ = [
     "TranslatorService",
+    "MemoryCache",
+    "TieredCache",
+    "SingleFlight",
+    "RedisSingleFlight",
+    "JobManager",
+    "QueueFullError",
+    "fetch_transcript",
+    "batch_segments",
+    "SQLiteTranslationMemory",
+    "RedisTranslationMemory",
+    "GeminiScheduler",
+    "priority_lane",
+    "GeminiClient",
+    "GeminiAPIError",
+    "PostgresTranslationStore",
+    "SQLiteTranslationStore",
+    "TelemetryWriter",
+    "AccessCounter",
+    "CacheWarmer",
 ]
 
 # 서비스 인스턴스 생성 (싱글톤 패턴)
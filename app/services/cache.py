@@ -0,0 +1,523 @@
+"""
+번역 결과 캐시 엔진
+
+- MemoryCache: 프로세스 내부(in-process) LRU/TTL 캐시.
+  단순 딕셔너리와 달리 크기 제한과 만료 시간이 있어서
+  gunicorn 워커의 메모리가 무한히 늘어나지 않습니다.
+- TieredCache: 워커별 L1(MemoryCache) + 공유 L2(Redis) 2단계 캐시.
+  L2 적중 시 L1으로 승격하고, 저장은 두 계층에 모두 기록합니다.
+  L2는 비동기 Redis 클라이언트(redis_pool.py)라서 조회/저장은 코루틴입니다.
+  codec을 주면 L2에는 압축된 바이트로 저장하고, L1에는 디코딩된 객체를 둡니다 (codec.py).
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Iterable, Tuple
+import logging
+
+from app.services.codec import CacheCodec, CodecError
+from app.services.metrics import CACHE_REQUESTS
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    캐시 값의 대략적인 크기(바이트) 계산
+
+    Args:
+        value: 캐시에 저장할 값
+
+    Returns:
+        int: UTF-8 JSON으로 직렬화했을 때의 바이트 수
+    """
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, tuple):
+        return sum(estimate_size(item) for item in value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+class MemoryCache:
+    """
+    LRU + TTL 메모리 캐시
+
+    - 항목 수(max_entries)와 전체 크기(max_bytes) 두 가지 상한을 가집니다.
+    - 항목마다 만료 시각이 있으며, 만료된 항목은 조회 시 제거됩니다.
+    - 상한을 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다 (LRU).
+    - 적중/미스/제거 횟수를 집계합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: Optional[int] = None
+    ):
+        """
+        Args:
+            max_entries: 최대 항목 수
+            max_bytes: 최대 전체 크기 (바이트)
+            default_ttl: 기본 만료 시간 (초, None이면 만료 없음)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+
+        # key -> (value, 만료 시각, 크기)
+        self._data: "OrderedDict[str, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회 (적중 시 LRU 순서 갱신)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            value, expires_at, _ = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간 (초, None이면 default_ttl 사용)
+
+        Returns:
+            bool: 저장 여부 (max_bytes보다 큰 값은 저장하지 않음)
+        """
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            logger.warning(f"캐시 항목이 너무 큽니다 ({size} bytes) - 저장 생략: {key}")
+            return False
+
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            self._evict()
+
+        return True
+
+    def delete(self, key: str) -> bool:
+        """캐시 항목 삭제"""
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+                return True
+        return False
+
+    def clear(self):
+        """전체 캐시 비우기"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def _remove(self, key: str):
+        """항목 제거 (lock 보유 상태에서 호출)"""
+        _, _, size = self._data.pop(key)
+        self._bytes -= size
+
+    def _evict(self):
+        """상한을 넘는 동안 가장 오래된 항목 제거 (lock 보유 상태에서 호출)"""
+        while self._data and (
+            len(self._data) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest_key = next(iter(self._data))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        # 통계와 LRU 순서에 영향을 주지 않는 존재 확인
+        entry = self._data.get(key)
+        return entry is not None and (entry[1] is None or entry[1] > time.monotonic())
+
+    @property
+    def size_bytes(self) -> int:
+        """현재 저장된 전체 크기 (바이트)"""
+        return self._bytes
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 반환
+
+        Returns:
+            dict: 항목 수, 크기, 적중/미스/제거 횟수, 적중률
+        """
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+def _copy(value: Any) -> Any:
+    """dict는 얕은 복사 (L1 값과 호출자가 받은 값을 분리)"""
+    return dict(value) if isinstance(value, dict) else value
+
+
+class TieredCache:
+    """
+    L1 메모리 + L2 Redis 2단계 캐시
+
+    - 조회: L1 → L2 순서로 확인하고, L2 적중 시 L1으로 승격합니다.
+    - 저장: L2와 L1에 모두 기록합니다 (write-through).
+    - 일괄 조회/저장: L1에 없는 키는 MGET 한 번, 저장은 파이프라인 한 번 (get_many / set_many).
+    - 무효화: Redis pub/sub으로 다른 워커에 변경된 키를 알려서
+      각 워커의 L1에 남은 오래된 값을 제거합니다.
+
+    L2가 없으면 L1만 사용하는 메모리 캐시로 동작합니다.
+    L2 오류(시간 초과, 연결 끊김)는 요청을 실패시키지 않고
+    조회는 미스로, 저장은 L1에만 기록한 것으로 처리합니다.
+
+    L1은 항상 디코딩된 객체를 저장하므로 L1 적중에는 디코딩 비용이 없습니다.
+    codec은 L2 경계에서만 씁니다 - 저장할 때 L2로 보낼 값을 인코딩하고,
+    L2 적중 값을 한 번 디코딩해서 L1으로 승격합니다.
+    codec이 없으면 L2는 JSON 문자열을 저장합니다 (예전 방식).
+    L1에 넣고 꺼낼 때 dict는 얕은 복사본을 쓰므로 호출자가 최상위 필드를
+    고쳐도(pop 등) 캐시 값은 바뀌지 않습니다.
+    """
+
+    INVALIDATION_CHANNEL = "yt_translation:invalidate"
+
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: Optional[Any] = None,
+        l1_ttl: Optional[int] = None,
+        codec: Optional[CacheCodec] = None
+    ):
+        """
+        Args:
+            l1: 워커별 메모리 캐시
+            l2: 비동기 Redis 클라이언트 (codec을 쓰면 decode_responses=False, 없으면 None)
+            l1_ttl: L1 보관 시간 (초, None이면 l1.default_ttl 사용)
+            codec: 캐시 값 codec (None이면 L2에 JSON 문자열 저장)
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.codec = codec
+
+        # 자신이 보낸 무효화 메시지를 구분하기 위한 ID
+        self.node_id = uuid.uuid4().hex
+        self._pubsub = None
+        self._listener = None
+
+        # L2 통계
+        self.l2_hits = 0
+        self.l2_misses = 0
+        self.promotions = 0
+        self.invalidations_received = 0
+        self.decode_errors = 0
+        self.l2_errors = 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        캐시 조회 (L1 → L2, L2 적중 시 L1 승격)
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            저장된 값 또는 None
+        """
+        value = self.l1.get(key)
+        CACHE_REQUESTS.labels("l1", "miss" if value is None else "hit").inc()
+        if value is not None:
+            return _copy(value)
+        if self.l2 is None:
+            return None
+
+        try:
+            cached = await self.l2.get(key)
+        except Exception as e:
+            self._l2_error("조회", key, e)
+            return None
+        if not cached:
+            self.l2_misses += 1
+            CACHE_REQUESTS.labels("l2", "miss").inc()
+            return None
+
+        return await self._from_l2(key, cached)
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """
+        여러 키를 한 번에 조회 (L1 → 나머지는 L2 MGET 한 번, L2 적중 시 L1 승격)
+
+        Args:
+            keys: 캐시 키 목록 (중복 가능)
+
+        Returns:
+            dict: 찾은 키 → 값 (없는 키는 빠짐)
+        """
+        found: Dict[str, Any] = {}
+        missing = []
+        for key in dict.fromkeys(keys):
+            value = self.l1.get(key)
+            CACHE_REQUESTS.labels("l1", "miss" if value is None else "hit").inc()
+            if value is None:
+                missing.append(key)
+                continue
+            found[key] = _copy(value)
+
+        if not missing or self.l2 is None:
+            return found
+
+        try:
+            values = await self.l2.mget(missing)
+        except Exception as e:
+            self._l2_error("일괄 조회", f"{len(missing)}개 키", e)
+            return found
+
+        for key, cached in zip(missing, values):
+            if not cached:
+                self.l2_misses += 1
+                CACHE_REQUESTS.labels("l2", "miss").inc()
+                continue
+            value = await self._from_l2(key, cached)
+            if value is not None:
+                found[key] = value
+
+        return found
+
+    async def _from_l2(self, key: str, cached: Any) -> Optional[Any]:
+        """L2 적중 값 디코딩 후 L1으로 승격 (L1에는 디코딩된 객체)"""
+        self.l2_hits += 1
+        CACHE_REQUESTS.labels("l2", "hit").inc()
+        if self.codec is None:
+            value = json.loads(cached)
+        else:
+            value = await self._decode(key, cached)
+            if value is None:
+                return None
+
+        if self.l1.set(key, _copy(value), ttl=self.l1_ttl):
+            self.promotions += 1
+
+        return value
+
+    async def _decode(self, key: str, data: Any) -> Optional[Any]:
+        """codec으로 디코딩 - 해석할 수 없는 값은 지우고 미스로 처리"""
+        try:
+            return self.codec.decode(data)
+        except CodecError as e:
+            self.decode_errors += 1
+            logger.warning(f"캐시 값 해석 실패 - 삭제: {key} ({e})")
+            self.l1.delete(key)
+            if self.l2 is not None:
+                try:
+                    await self.l2.delete(key)
+                except Exception as e:
+                    self._l2_error("삭제", key, e)
+            return None
+
+    def _encode(self, value: Any) -> Any:
+        """L2에 저장할 값 (codec 바이트 또는 JSON 문자열)"""
+        if self.codec is None:
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return self.codec.encode(value)
+
+    def _l2_error(self, action: str, key: str, error: Exception):
+        """L2 오류 기록 - 요청은 L1만으로 계속 처리"""
+        self.l2_errors += 1
+        CACHE_REQUESTS.labels("l2", "error").inc()
+        logger.warning(f"L2 캐시 {action} 실패: {key} ({type(error).__name__}: {error})")
+
+    async def set(self, key: str, value: Any, ttl: int):
+        """
+        캐시 저장 (L2 → L1 write-through)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 만료 시간 (초)
+        """
+        if self.l2 is not None:
+            try:
+                await self.l2.setex(key, ttl, self._encode(value))
+                await self._publish_invalidation(key)
+            except Exception as e:
+                self._l2_error("저장", key, e)
+
+        l1_ttl = min(ttl, self.l1_ttl) if self.l1_ttl else ttl
+        self.l1.set(key, _copy(value), ttl=l1_ttl)
+
+    async def set_many(self, items: Dict[str, Any], ttl: int):
+        """
+        여러 항목을 한 번에 저장 (L2 파이프라인 한 번 → L1)
+
+        Args:
+            items: 캐시 키 → 저장할 값
+            ttl: 만료 시간 (초)
+        """
+        if not items:
+            return
+
+        if self.l2 is not None:
+            try:
+                pipe = self.l2.pipeline(transaction=False)
+                for key, value in items.items():
+                    pipe.setex(key, ttl, self._encode(value))
+                    if self._listener is not None:
+                        pipe.publish(self.INVALIDATION_CHANNEL, f"{self.node_id}:{key}")
+                await pipe.execute()
+            except Exception as e:
+                self._l2_error("일괄 저장", f"{len(items)}개 키", e)
+
+        l1_ttl = min(ttl, self.l1_ttl) if self.l1_ttl else ttl
+        for key, value in items.items():
+            self.l1.set(key, _copy(value), ttl=l1_ttl)
+
+    async def delete(self, key: str):
+        """모든 계층에서 삭제하고 다른 워커에 무효화 전파"""
+        self.l1.delete(key)
+        if self.l2 is not None:
+            try:
+                await self.l2.delete(key)
+                await self._publish_invalidation(key)
+            except Exception as e:
+                self._l2_error("삭제", key, e)
+
+    async def _publish_invalidation(self, key: str):
+        """다른 워커에 키 무효화 알림"""
+        if self._listener is None:
+            return
+
+        try:
+            await self.l2.publish(self.INVALIDATION_CHANNEL, f"{self.node_id}:{key}")
+        except Exception as e:
+            logger.warning(f"캐시 무효화 전파 실패: {e}")
+
+    def _handle_invalidation(self, message: Dict[str, Any]):
+        """무효화 메시지 처리 - 다른 워커가 바꾼 키를 L1에서 제거"""
+        data = message.get("data")
+        if isinstance(data, bytes):
+            # decode_responses=False 클라이언트
+            data = data.decode("utf-8", "replace")
+        if not isinstance(data, str) or ":" not in data:
+            return
+
+        origin, key = data.split(":", 1)
+        if origin == self.node_id:
+            return
+
+        self.l1.delete(key)
+        self.invalidations_received += 1
+
+    async def start_invalidation_listener(self):
+        """Redis pub/sub 무효화 리스너 시작 (백그라운드 Task)"""
+        if self.l2 is None or self._listener is not None:
+            return
+
+        try:
+            self._pubsub = self.l2.pubsub(ignore_subscribe_messages=True)
+            await self._pubsub.subscribe(self.INVALIDATION_CHANNEL)
+            self._listener = asyncio.ensure_future(self._listen())
+            logger.info("📡 캐시 무효화 리스너 시작")
+        except Exception as e:
+            logger.warning(f"캐시 무효화 리스너 시작 실패 - L1 TTL로만 일관성 유지: {e}")
+            self._pubsub = None
+            self._listener = None
+
+    async def _listen(self):
+        """무효화 메시지 수신 루프 - 연결이 끊기면 잠시 후 다시 수신 (재구독은 클라이언트가 처리)"""
+        while True:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is not None:
+                    self._handle_invalidation(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"캐시 무효화 수신 실패 - 1초 후 다시 시도: {e}")
+                await asyncio.sleep(1.0)
+
+    async def stop_invalidation_listener(self):
+        """무효화 리스너 중지"""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.aclose()
+            except Exception as e:
+                logger.warning(f"캐시 무효화 구독 종료 실패: {e}")
+            self._pubsub = None
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        계층별 캐시 통계 반환
+
+        Returns:
+            dict: L1 통계와 L2 적중/미스/승격/무효화 횟수
+        """
+        stats = {
+            "backend": "memory+redis" if self.l2 is not None else "memory",
+            "l1": self.l1.stats(),
+            "l2_hits": self.l2_hits,
+            "l2_misses": self.l2_misses,
+            "promotions": self.promotions,
+            "invalidations_received": self.invalidations_received,
+            "l2_errors": self.l2_errors,
+        }
+        if self.codec is not None:
+            stats["codec"] = self.codec.stats()
+            stats["decode_errors"] = self.decode_errors
+        return stats
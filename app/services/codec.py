@@ -0,0 +1,242 @@
+"""
+캐시 값 직렬화 (codec)
+
+번역 결과를 json.dumps 문자열로 Redis에 넣으면 긴 영상은 항목 하나가
+수십 KB라 Redis 메모리와 네트워크 시간이 커집니다. 이 모듈은 결과를
+압축된 바이트로 바꾸고, 맨 앞 1바이트에 형식을 기록합니다.
+
+    [형식 바이트][본문]
+    형식 바이트 = 0x10 | (직렬화 << 2) | 압축
+      직렬화: 0 = JSON (orjson, 없으면 json), 1 = msgpack
+      압축:   0 = 없음, 1 = zlib, 2 = zstd
+
+- 예전 항목(UTF-8 JSON 텍스트, '{'로 시작)은 형식 바이트 없이 그대로 읽습니다.
+- 작은 값은 압축하지 않습니다 (CACHE_COMPRESS_MIN_BYTES).
+- orjson / msgpack / zstandard는 선택 의존성입니다. 없으면 json / zlib를 씁니다.
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Union
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+FORMAT_VERSION = 0x10
+SERIALIZERS = {"json": 0, "msgpack": 1}
+COMPRESSORS = {"none": 0, "zlib": 1, "zstd": 2}
+
+
+class CodecError(ValueError):
+    """캐시 값을 해석할 수 없음 (알 수 없는 형식, 필요한 패키지 없음, 손상된 값)"""
+
+
+def _default(value: Any) -> Any:
+    """기본 직렬화기가 모르는 값 변환 (json.dumps(default=str)와 같은 역할)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def dump_json(value: Any) -> bytes:
+    """값 → UTF-8 JSON 바이트 (orjson이 있으면 orjson, datetime/Enum은 문자열)"""
+    if orjson is not None:
+        return orjson.dumps(value, default=_default)
+    return json.dumps(
+        value, ensure_ascii=False, default=_default, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def _load_json(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+class CacheCodec:
+    """
+    캐시 값 인코더/디코더
+
+    쓰기는 설정한 형식 하나로 하고, 읽기는 형식 바이트를 보고
+    어떤 형식이든 (예전 JSON 포함) 해석합니다.
+    """
+
+    def __init__(
+        self,
+        serializer: str = "json",
+        compressor: str = "zlib",
+        compress_min_bytes: int = 1024,
+        level: int = 3
+    ):
+        """
+        Args:
+            serializer: json / msgpack
+            compressor: none / zlib / zstd
+            compress_min_bytes: 이보다 작은 값은 압축하지 않음
+            level: 압축 수준
+        """
+        if serializer not in SERIALIZERS:
+            raise ValueError(f"알 수 없는 직렬화 형식: {serializer}")
+        if compressor not in COMPRESSORS:
+            raise ValueError(f"알 수 없는 압축 형식: {compressor}")
+        if serializer == "msgpack" and msgpack is None:
+            raise ValueError("msgpack 패키지가 설치되지 않았습니다")
+        if compressor == "zstd" and zstandard is None:
+            raise ValueError("zstandard 패키지가 설치되지 않았습니다")
+
+        self.serializer = serializer
+        self.compressor = compressor
+        self.compress_min_bytes = compress_min_bytes
+        self.level = level
+        self._zstd_compressor = (
+            zstandard.ZstdCompressor(level=level) if compressor == "zstd" else None
+        )
+
+        # 통계 (압축률 확인용)
+        self.encoded = 0
+        self.raw_bytes = 0
+        self.encoded_bytes = 0
+
+    @property
+    def name(self) -> str:
+        if self.compressor == "none":
+            return self.serializer
+        return f"{self.serializer}+{self.compressor}"
+
+    def encode(self, value: Any) -> bytes:
+        """
+        값 → 형식 바이트 + (압축된) 본문
+
+        Args:
+            value: JSON으로 표현 가능한 값 (datetime, Enum은 문자열로 저장)
+
+        Returns:
+            bytes: 캐시에 저장할 값
+        """
+        if self.serializer == "msgpack":
+            body = msgpack.packb(value, default=_default, use_bin_type=True)
+        else:
+            body = dump_json(value)
+
+        raw_size = len(body)
+        compressor = self.compressor if raw_size >= self.compress_min_bytes else "none"
+        if compressor == "zstd":
+            body = self._zstd_compressor.compress(body)
+        elif compressor == "zlib":
+            body = zlib.compress(body, self.level)
+
+        header = FORMAT_VERSION | (SERIALIZERS[self.serializer] << 2) | COMPRESSORS[compressor]
+        data = bytes((header,)) + body
+
+        self.encoded += 1
+        self.raw_bytes += raw_size
+        self.encoded_bytes += len(data)
+        return data
+
+    @staticmethod
+    def decode(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        캐시 값 → 원래 값 (예전 JSON 텍스트 포함)
+
+        Raises:
+            CodecError: 알 수 없는 형식이거나 필요한 패키지가 없거나 값이 손상됨
+        """
+        if isinstance(data, str):
+            # decode_responses=True 클라이언트로 읽은 예전 항목
+            try:
+                return json.loads(data)
+            except ValueError as e:
+                raise CodecError(f"캐시 값 해석 실패: {e}")
+
+        data = bytes(data)
+        if not data:
+            raise CodecError("빈 캐시 값")
+
+        header = data[0]
+        if header & 0xF0 != FORMAT_VERSION:
+            # 형식 바이트가 없는 예전 JSON 항목
+            try:
+                return _load_json(data)
+            except ValueError as e:
+                raise CodecError(f"캐시 값 해석 실패: {e}")
+
+        serializer, compressor = (header >> 2) & 0x03, header & 0x03
+        body = data[1:]
+        try:
+            if compressor == COMPRESSORS["zlib"]:
+                body = zlib.decompress(body)
+            elif compressor == COMPRESSORS["zstd"]:
+                if zstandard is None:
+                    raise CodecError("zstd로 압축된 값이지만 zstandard 패키지가 없습니다")
+                body = zstandard.ZstdDecompressor().decompress(body)
+            elif compressor != COMPRESSORS["none"]:
+                raise CodecError(f"알 수 없는 압축 형식: {compressor}")
+
+            if serializer == SERIALIZERS["msgpack"]:
+                if msgpack is None:
+                    raise CodecError("msgpack 값이지만 msgpack 패키지가 없습니다")
+                return msgpack.unpackb(body, raw=False)
+            if serializer == SERIALIZERS["json"]:
+                return _load_json(body)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"캐시 값 해석 실패: {e}")
+
+        raise CodecError(f"알 수 없는 직렬화 형식: {serializer}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "codec": self.name,
+            "encoded": self.encoded,
+            "raw_bytes": self.raw_bytes,
+            "encoded_bytes": self.encoded_bytes,
+            "compression_ratio": (
+                round(self.encoded_bytes / self.raw_bytes, 3) if self.raw_bytes else None
+            ),
+        }
+
+
+def create_cache_codec(name: Optional[str] = None) -> CacheCodec:
+    """
+    CACHE_CODEC 설정에 맞는 codec 생성
+
+    - auto: JSON + zstd (zstandard가 없으면 zlib)
+    - json, json+zlib, json+zstd, msgpack, msgpack+zlib, msgpack+zstd
+
+    설정한 패키지가 없으면 경고 후 auto로 대체합니다.
+    """
+    name = (name or settings.CACHE_CODEC).lower()
+    options = {
+        "compress_min_bytes": settings.CACHE_COMPRESS_MIN_BYTES,
+        "level": settings.CACHE_COMPRESS_LEVEL,
+    }
+
+    if name != "auto":
+        serializer, _, compressor = name.partition("+")
+        try:
+            return CacheCodec(serializer, compressor or "none", **options)
+        except ValueError as e:
+            logger.warning(f"CACHE_CODEC={name} 사용 불가 - auto로 대체합니다: {e}")
+
+    return CacheCodec("json", "zstd" if zstandard is not None else "zlib", **options)
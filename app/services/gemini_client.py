@@ -0,0 +1,233 @@
+"""
+Gemini REST API 비동기 클라이언트
+
+google-generativeai SDK는 동기 HTTP 호출이라 asyncio.to_thread로 감싸야 했고,
+동시 번역이 많아지면 기본 스레드 풀이 바닥나서 다른 작업까지 밀렸습니다.
+이 모듈은 httpx.AsyncClient 하나를 재사용해 (keep-alive, 가능하면 HTTP/2)
+이벤트 루프 안에서 직접 Gemini REST API를 호출합니다.
+
+- 호출마다 전체 제한 시간을 둘 수 있고, 시간 초과나 취소 시 연결을 끊어
+  업스트림 요청도 실제로 중단됩니다.
+- 스트리밍은 streamGenerateContent?alt=sse 응답을 한 줄씩 읽습니다.
+"""
+
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+import logging
+
+import httpx
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def _http2_available() -> bool:
+    """HTTP/2 지원 패키지(h2) 설치 여부"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class GeminiAPIError(Exception):
+    """Gemini API 호출 실패"""
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def is_quota(self) -> bool:
+        """사용량 초과(429 / RESOURCE_EXHAUSTED) 여부"""
+        return self.status_code == 429 or "quota" in str(self).lower()
+
+    @property
+    def retryable(self) -> bool:
+        """다시 시도하면 성공할 수 있는 오류인지 (네트워크/시간 초과/5xx)"""
+        return self.status_code is None or self.status_code >= 500
+
+
+class GeminiClient:
+    """
+    Gemini generateContent / streamGenerateContent 비동기 클라이언트
+
+    HTTP 클라이언트는 첫 호출 때 만들어 이후 계속 재사용하고,
+    서버 종료 시 aclose()로 닫습니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        base_url: str = "https://generativelanguage.googleapis.com/v1beta",
+        generation_config: Optional[Dict[str, Any]] = None,
+        timeout: float = 120.0,
+        connect_timeout: float = 10.0,
+        max_connections: int = 20,
+        http2: bool = True,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        """
+        Args:
+            api_key: Gemini API 키
+            model: 모델 이름 (예: gemini-1.5-flash)
+            base_url: REST API 주소
+            generation_config: temperature, maxOutputTokens 등
+            timeout: 호출 한 번의 기본 전체 제한 시간 (초)
+            connect_timeout: 연결 제한 시간 (초)
+            max_connections: 연결 풀 크기
+            http2: HTTP/2 사용 여부 (h2 패키지가 없으면 HTTP/1.1)
+            transport: 테스트용 httpx transport
+        """
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.generation_config = generation_config or {}
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_connections = max_connections
+        self.http2 = http2 and _http2_available()
+        self.transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """재사용하는 HTTP 클라이언트 (처음 사용할 때 생성)"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers={"x-goog-api-key": self.api_key},
+                http2=self.http2,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                # 전체 제한 시간은 호출마다 asyncio.wait_for로 따로 적용
+                timeout=httpx.Timeout(self.timeout, connect=self.connect_timeout),
+                transport=self.transport
+            )
+        return self._client
+
+    def _payload(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            "generationConfig": self.generation_config,
+        }
+
+    @staticmethod
+    def _error_from_response(status_code: int, body: bytes) -> GeminiAPIError:
+        """오류 응답 본문에서 메시지 추출"""
+        try:
+            message = json.loads(body)["error"]["message"]
+        except (ValueError, KeyError, TypeError):
+            message = body.decode("utf-8", "replace")[:200]
+        return GeminiAPIError(f"Gemini API 오류 ({status_code}): {message}", status_code)
+
+    @staticmethod
+    def _extract_text(data: Dict[str, Any]) -> str:
+        """응답 JSON에서 텍스트 추출"""
+        candidates = data.get("candidates") or []
+        if not candidates:
+            reason = (data.get("promptFeedback") or {}).get("blockReason", "응답 없음")
+            raise GeminiAPIError(f"Gemini가 응답을 생성하지 않았습니다: {reason}", 400)
+
+        parts = (candidates[0].get("content") or {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
+
+    async def generate(self, prompt: str, timeout: Optional[float] = None) -> str:
+        """
+        generateContent 호출
+
+        Args:
+            prompt: 프롬프트
+            timeout: 전체 제한 시간 (초, 기본값: 생성자 timeout)
+
+        Returns:
+            str: 응답 텍스트
+
+        Raises:
+            GeminiAPIError: HTTP 오류, 시간 초과, 네트워크 오류
+        """
+        timeout = timeout or self.timeout
+        try:
+            response = await asyncio.wait_for(
+                self.client.post(
+                    f"/models/{self.model}:generateContent", json=self._payload(prompt)
+                ),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            raise GeminiAPIError(f"Gemini 응답 시간 초과 ({timeout:.0f}초)")
+        except httpx.HTTPError as e:
+            raise GeminiAPIError(f"Gemini 연결 오류: {e}")
+
+        if response.status_code != 200:
+            raise self._error_from_response(response.status_code, response.content)
+
+        return self._extract_text(response.json())
+
+    async def stream(self, prompt: str, timeout: Optional[float] = None) -> AsyncIterator[str]:
+        """
+        streamGenerateContent(SSE) 호출 - 텍스트 조각을 받는 대로 전달
+
+        소비자가 중간에 멈추거나 제한 시간이 지나면 응답 스트림을 닫아
+        업스트림 생성도 중단됩니다.
+
+        Args:
+            prompt: 프롬프트
+            timeout: 전체 제한 시간 (초, 기본값: 생성자 timeout)
+
+        Yields:
+            str: 응답 텍스트 조각
+
+        Raises:
+            GeminiAPIError: HTTP 오류, 시간 초과, 네트워크 오류
+        """
+        timeout = timeout or self.timeout
+        deadline = asyncio.get_running_loop().time() + timeout
+        request = self.client.build_request(
+            "POST",
+            f"/models/{self.model}:streamGenerateContent",
+            params={"alt": "sse"},
+            json=self._payload(prompt)
+        )
+
+        try:
+            response = await asyncio.wait_for(self.client.send(request, stream=True), timeout)
+        except asyncio.TimeoutError:
+            raise GeminiAPIError(f"Gemini 응답 시간 초과 ({timeout:.0f}초)")
+        except httpx.HTTPError as e:
+            raise GeminiAPIError(f"Gemini 연결 오류: {e}")
+
+        try:
+            if response.status_code != 200:
+                raise self._error_from_response(response.status_code, await response.aread())
+
+            lines = response.aiter_lines()
+            while True:
+                remaining = deadline - asyncio.get_running_loop().time()
+                try:
+                    line = await asyncio.wait_for(lines.__anext__(), max(remaining, 0))
+                except StopAsyncIteration:
+                    return
+                except asyncio.TimeoutError:
+                    raise GeminiAPIError(f"Gemini 응답 시간 초과 ({timeout:.0f}초)")
+                except httpx.HTTPError as e:
+                    raise GeminiAPIError(f"Gemini 연결 오류: {e}")
+
+                if not line.startswith("data:"):
+                    continue
+                text = self._extract_text(json.loads(line[5:]))
+                if text:
+                    yield text
+        finally:
+            # 다 읽지 않은 스트림을 닫으면 연결을 끊어 업스트림 생성도 멈춤
+            await response.aclose()
+
+    async def aclose(self):
+        """HTTP 클라이언트 닫기 (서버 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
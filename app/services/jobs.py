@@ -0,0 +1,536 @@
+"""
+비동기 번역 작업 큐
+
+긴 영상은 번역이 오래 걸려서 /api/translate 요청이 nginx 타임아웃에 걸리고
+워커 슬롯을 계속 차지합니다. 작업 모드에서는 요청을 큐에 넣고
+작업 ID를 바로 돌려준 뒤, 백그라운드 워커가 큐를 비우며 번역합니다.
+클라이언트는 작업 상태를 조회(또는 long-poll)해서 결과를 받습니다.
+
+- RedisJobQueue: 여러 워커/노드가 공유하는 큐 (REDIS_URL 설정 시, 비동기 클라이언트)
+- InMemoryJobQueue: Redis가 없을 때 사용하는 프로세스 내부 큐
+  (작업 조회가 등록한 프로세스로만 가능하므로 gunicorn 워커 1개일 때만 사용)
+
+처리 중인 작업은 임대(lease) 기한을 가지며, 워커가 죽어서 기한이 지나면
+큐로 다시 돌아가 다른 워커가 처리합니다 (crash-safe 재전달).
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+import logging
+
+from app.config import settings
+from app.models import TranslationStatus
+from app.services.rate_limiter import priority_lane
+from app.services.metrics import QUEUE_WAIT
+from app.services.redis_pool import build_async_redis_client, close_async_redis_client
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 더 이상 바뀌지 않는 작업 상태
+FINAL_STATUSES = (TranslationStatus.COMPLETED.value, TranslationStatus.FAILED.value)
+
+
+class QueueFullError(Exception):
+    """큐가 가득 차서 작업을 받을 수 없음 (HTTP 429)"""
+
+
+def _now() -> str:
+    """작업 기록용 현재 시각 (ISO 8601)"""
+    return datetime.utcnow().isoformat()
+
+
+class InMemoryJobQueue:
+    """
+    프로세스 내부 작업 큐
+
+    같은 워커 프로세스 안에서만 공유됩니다.
+    처리 중인 작업의 임대 기한이 지나면 큐로 되돌립니다.
+    """
+
+    def __init__(self, max_depth: int = 100, job_ttl: int = 3600):
+        """
+        Args:
+            max_depth: 대기 중인 작업 최대 개수
+            job_ttl: 작업 기록 보관 시간 (초)
+        """
+        self.max_depth = max_depth
+        self.job_ttl = job_ttl
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=max_depth)
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._expires: Dict[str, float] = {}
+        self._processing: Dict[str, float] = {}  # job_id -> 임대 기한
+
+    async def enqueue(self, job: Dict[str, Any]):
+        """작업 추가 (가득 차면 QueueFullError)"""
+        self._prune()
+        try:
+            self._queue.put_nowait(job["job_id"])
+        except asyncio.QueueFull:
+            raise QueueFullError("번역 대기열이 가득 찼습니다.")
+
+        self._jobs[job["job_id"]] = job
+        self._expires[job["job_id"]] = time.monotonic() + self.job_ttl
+
+    async def dequeue(self, lease_seconds: float, timeout: float) -> Optional[str]:
+        """
+        작업 하나 꺼내기 (임대 시작)
+
+        Returns:
+            작업 ID 또는 None (timeout 동안 작업 없음)
+        """
+        try:
+            job_id = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+        self._processing[job_id] = time.monotonic() + lease_seconds
+        return job_id
+
+    async def extend(self, job_id: str, lease_seconds: float):
+        """처리 중인 작업의 임대 연장"""
+        if job_id in self._processing:
+            self._processing[job_id] = time.monotonic() + lease_seconds
+
+    async def ack(self, job_id: str):
+        """작업 처리 완료 (임대 해제)"""
+        self._processing.pop(job_id, None)
+
+    async def requeue_expired(self) -> int:
+        """임대 기한이 지난 작업을 큐로 되돌리기"""
+        now = time.monotonic()
+        expired = [job_id for job_id, deadline in self._processing.items() if deadline <= now]
+
+        requeued = 0
+        for job_id in expired:
+            del self._processing[job_id]
+            try:
+                self._queue.put_nowait(job_id)
+                requeued += 1
+            except asyncio.QueueFull:
+                await self.update(job_id, status=TranslationStatus.FAILED.value,
+                                  error_message="재시도 대기열이 가득 찼습니다.", finished_at=_now())
+        return requeued
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회"""
+        job = self._jobs.get(job_id)
+        return dict(job) if job is not None else None
+
+    async def update(self, job_id: str, **fields: Any):
+        """작업 필드 갱신"""
+        if job_id in self._jobs:
+            self._jobs[job_id].update(fields)
+
+    async def depth(self) -> int:
+        """대기 중인 작업 수"""
+        return self._queue.qsize()
+
+    async def aclose(self):
+        """정리할 연결 없음 (RedisJobQueue와 같은 인터페이스)"""
+
+    def _prune(self):
+        """보관 시간이 지난 완료 작업 기록 정리"""
+        now = time.monotonic()
+        for job_id in [j for j, exp in self._expires.items() if exp <= now]:
+            if self._jobs.get(job_id, {}).get("status") in FINAL_STATUSES:
+                self._jobs.pop(job_id, None)
+                self._expires.pop(job_id, None)
+
+
+class RedisJobQueue:
+    """
+    Redis 기반 작업 큐
+
+    - queue (LIST): 대기 중인 작업 ID (LPUSH로 넣고 RPOP으로 꺼냄)
+    - processing (ZSET): 처리 중인 작업 ID와 임대 기한
+    - job:{id} (HASH): 작업 기록 - 필드마다 JSON 값 (보관 시간 후 만료)
+
+    작업 기록을 필드별 HASH로 두어 갱신은 바뀐 필드만 HSET합니다.
+    하트비트와 작업 종료가 동시에 갱신해도 서로의 필드를 덮어쓰지 않습니다.
+    꺼내기와 임대 등록, 만료 작업 되돌리기, 갱신은 Lua 스크립트로 원자적으로 처리합니다.
+    """
+
+    PREFIX = "yt_translation:jobs:"
+
+    # 깊이 확인 후 추가 (가득 차면 0) - ARGV[4..]: 필드, 값 쌍
+    ENQUEUE_SCRIPT = """
+if redis.call("llen", KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call("hset", KEYS[2], unpack(ARGV, 4))
+redis.call("expire", KEYS[2], ARGV[3])
+redis.call("lpush", KEYS[1], ARGV[1])
+return 1
+"""
+
+    # 꺼내면서 임대 등록
+    DEQUEUE_SCRIPT = """
+local job_id = redis.call("rpop", KEYS[1])
+if job_id then
+    redis.call("zadd", KEYS[2], ARGV[1], job_id)
+end
+return job_id
+"""
+
+    # 임대 기한이 지난 작업을 큐 맨 앞(다음 차례)으로 되돌림
+    REQUEUE_SCRIPT = """
+local expired = redis.call("zrangebyscore", KEYS[2], "-inf", ARGV[1])
+for _, job_id in ipairs(expired) do
+    redis.call("zrem", KEYS[2], job_id)
+    redis.call("rpush", KEYS[1], job_id)
+end
+return #expired
+"""
+
+    # 있는 작업의 필드만 갱신 (만료된 작업을 되살리지 않음) - ARGV[2..]: 필드, 값 쌍
+    UPDATE_SCRIPT = """
+if redis.call("exists", KEYS[1]) == 0 then
+    return 0
+end
+redis.call("hset", KEYS[1], unpack(ARGV, 2))
+redis.call("expire", KEYS[1], ARGV[1])
+return 1
+"""
+
+    def __init__(
+        self,
+        redis_client: Any,
+        max_depth: int = 100,
+        job_ttl: int = 3600,
+        poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            redis_client: 비동기 Redis 클라이언트 (redis.asyncio, decode_responses=True)
+            max_depth: 대기 중인 작업 최대 개수
+            job_ttl: 작업 기록 보관 시간 (초)
+            poll_interval: 큐가 비었을 때 다시 확인하는 간격 (초)
+        """
+        self.redis = redis_client
+        self.max_depth = max_depth
+        self.job_ttl = job_ttl
+        self.poll_interval = poll_interval
+        self.queue_key = f"{self.PREFIX}queue"
+        self.processing_key = f"{self.PREFIX}processing"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.PREFIX}job:{job_id}"
+
+    @staticmethod
+    def _encode_fields(fields: Dict[str, Any]) -> List[str]:
+        """HSET 인자 (필드, JSON 값, ...)"""
+        args: List[str] = []
+        for name, value in fields.items():
+            args.extend((name, json.dumps(value, ensure_ascii=False, default=str)))
+        return args
+
+    async def enqueue(self, job: Dict[str, Any]):
+        """작업 추가 (가득 차면 QueueFullError)"""
+        added = await self.redis.eval(
+            self.ENQUEUE_SCRIPT, 2,
+            self.queue_key, self._job_key(job["job_id"]),
+            job["job_id"], self.max_depth, self.job_ttl,
+            *self._encode_fields(job)
+        )
+        if not added:
+            raise QueueFullError("번역 대기열이 가득 찼습니다.")
+
+    async def dequeue(self, lease_seconds: float, timeout: float) -> Optional[str]:
+        """
+        작업 하나 꺼내기 (임대 시작)
+
+        Returns:
+            작업 ID 또는 None (timeout 동안 작업 없음)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job_id = await self.redis.eval(
+                self.DEQUEUE_SCRIPT, 2,
+                self.queue_key, self.processing_key,
+                time.time() + lease_seconds
+            )
+            if job_id:
+                return job_id
+            if time.monotonic() >= deadline:
+                return None
+            await asyncio.sleep(self.poll_interval)
+
+    async def extend(self, job_id: str, lease_seconds: float):
+        """처리 중인 작업의 임대 연장"""
+        await self.redis.zadd(self.processing_key, {job_id: time.time() + lease_seconds}, xx=True)
+
+    async def ack(self, job_id: str):
+        """작업 처리 완료 (임대 해제)"""
+        await self.redis.zrem(self.processing_key, job_id)
+
+    async def requeue_expired(self) -> int:
+        """임대 기한이 지난 작업을 큐로 되돌리기"""
+        return int(await self.redis.eval(
+            self.REQUEUE_SCRIPT, 2,
+            self.queue_key, self.processing_key,
+            time.time()
+        ))
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회"""
+        raw = await self.redis.hgetall(self._job_key(job_id))
+        if not raw:
+            return None
+        return {name: json.loads(value) for name, value in raw.items()}
+
+    async def update(self, job_id: str, **fields: Any):
+        """작업 필드 갱신 (바뀐 필드만 원자적으로 기록)"""
+        if not fields:
+            return
+        await self.redis.eval(
+            self.UPDATE_SCRIPT, 1,
+            self._job_key(job_id),
+            self.job_ttl, *self._encode_fields(fields)
+        )
+
+    async def depth(self) -> int:
+        """대기 중인 작업 수"""
+        return int(await self.redis.llen(self.queue_key))
+
+    async def aclose(self):
+        """Redis 연결 풀 닫기 (서버 종료 시)"""
+        await close_async_redis_client(self.redis)
+
+
+def create_job_queue() -> Any:
+    """
+    설정에 맞는 작업 큐 생성 - REDIS_URL이 있으면 Redis, 아니면 메모리
+
+    메모리 큐는 프로세스마다 따로 있어서, gunicorn 워커가 여러 개면
+    작업을 등록한 워커가 아닌 곳으로 간 조회가 404가 됩니다.
+    그래서 REDIS_URL 없이 워커가 여러 개(GUNICORN_WORKERS > 1)면 시작을 거부합니다.
+
+    Raises:
+        RuntimeError: 메모리 큐인데 gunicorn 워커가 여러 개
+    """
+    redis_client = build_async_redis_client(decode_responses=True)
+    if redis_client is not None:
+        logger.info("📦 Redis 작업 큐 사용")
+        return RedisJobQueue(
+            redis_client,
+            max_depth=settings.JOB_QUEUE_MAX_DEPTH,
+            job_ttl=settings.JOB_RESULT_TTL
+        )
+
+    if settings.GUNICORN_WORKERS > 1:
+        raise RuntimeError(
+            f"메모리 작업 큐는 워커 프로세스 하나에서만 동작합니다 "
+            f"(gunicorn 워커 {settings.GUNICORN_WORKERS}개) - REDIS_URL을 설정하거나 워커를 1개로 줄이세요."
+        )
+
+    logger.info("💾 메모리 작업 큐 사용 (이 프로세스 안에서만 공유)")
+    return InMemoryJobQueue(
+        max_depth=settings.JOB_QUEUE_MAX_DEPTH,
+        job_ttl=settings.JOB_RESULT_TTL
+    )
+
+
+class JobManager:
+    """
+    번역 작업 관리자
+
+    작업 등록/조회와 백그라운드 워커 풀을 관리합니다.
+    FastAPI lifespan에서 start()/stop()을 호출합니다.
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        queue: Any,
+        workers: int = 2,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            translator: TranslatorService 인스턴스
+            queue: InMemoryJobQueue 또는 RedisJobQueue
+            workers: 백그라운드 워커 수
+            lease_seconds: 작업 임대 시간 (초) - 이 시간 동안 소식이 없으면 재전달
+            max_attempts: 최대 처리 시도 횟수
+            poll_interval: long-poll 시 상태 확인 간격 (초)
+        """
+        self.translator = translator
+        self.queue = queue
+        self.workers = workers
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+
+        self._tasks: List[asyncio.Task] = []
+        self._events: Dict[str, asyncio.Event] = {}
+
+    async def start(self):
+        """워커 풀과 재전달 감시 작업 시작"""
+        if self._tasks:
+            return
+
+        # 이전 프로세스가 처리하다 죽은 작업 회수
+        requeued = await self.queue.requeue_expired()
+        if requeued:
+            logger.info(f"♻️ 임대가 만료된 작업 {requeued}개 재전달")
+
+        for index in range(self.workers):
+            self._tasks.append(asyncio.create_task(self._worker(index)))
+        self._tasks.append(asyncio.create_task(self._reaper()))
+
+        logger.info(f"👷 번역 작업 워커 {self.workers}개 시작")
+
+    async def stop(self):
+        """워커 풀 중지 (처리 중이던 작업은 임대 만료 후 재전달됨)"""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        await self.queue.aclose()
+
+    async def submit(
+        self,
+        youtube_url: str,
+        target_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        번역 작업 등록
+
+        Returns:
+            dict: 등록된 작업 기록 (status=pending)
+
+        Raises:
+            QueueFullError: 대기열이 가득 참
+        """
+        job = {
+            "job_id": uuid.uuid4().hex,
+            "status": TranslationStatus.PENDING.value,
+            "youtube_url": youtube_url,
+            "target_language": target_language or settings.DEFAULT_TARGET_LANGUAGE,
+            "created_at": _now(),
+            "started_at": None,
+            "finished_at": None,
+            "attempts": 0,
+            "result": None,
+            "error_message": None,
+        }
+        await self.queue.enqueue(job)
+        logger.info(f"📥 번역 작업 등록: {job['job_id']} ({youtube_url})")
+        return job
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회"""
+        return await self.queue.get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """
+        작업이 끝나거나 timeout이 지날 때까지 기다렸다가 반환 (long-poll)
+
+        Args:
+            job_id: 작업 ID
+            timeout: 최대 대기 시간 (초)
+
+        Returns:
+            dict: 작업 기록 또는 None (없는 작업)
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            job = await self.queue.get(job_id)
+            remaining = deadline - time.monotonic()
+            if job is None or job["status"] in FINAL_STATUSES:
+                self._events.pop(job_id, None)
+                return job
+            if remaining <= 0:
+                return job
+
+            # 같은 프로세스에서 끝나면 바로 깨어나고, 아니면 주기적으로 다시 확인
+            event = self._events.setdefault(job_id, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), min(self.poll_interval, remaining))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _worker(self, index: int):
+        """큐에서 작업을 꺼내 번역하는 워커"""
+        while True:
+            try:
+                job_id = await self.queue.dequeue(
+                    self.lease_seconds, timeout=self.poll_interval * 10
+                )
+                if job_id is None:
+                    continue
+                await self._process(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"작업 워커 {index} 오류: {e}")
+                await asyncio.sleep(self.poll_interval)
+
+    async def _process(self, job_id: str):
+        """작업 하나 처리 (처리 중에는 임대를 주기적으로 연장)"""
+        job = await self.queue.get(job_id)
+        if job is None:
+            await self.queue.ack(job_id)
+            return
+
+        attempts = job.get("attempts", 0) + 1
+        if attempts > self.max_attempts:
+            await self._finish(job_id, status=TranslationStatus.FAILED.value,
+                               error_message="최대 재시도 횟수를 초과했습니다.")
+            return
+
+        await self.queue.update(job_id, status=TranslationStatus.PROCESSING.value,
+                                started_at=_now(), attempts=attempts)
+        if attempts == 1 and job.get("created_at"):
+            waited = datetime.utcnow() - datetime.fromisoformat(job["created_at"])
+            QUEUE_WAIT.labels("jobs", "batch").observe(waited.total_seconds())
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            # 백그라운드 작업은 batch 레인 - 사용자가 기다리는 요청이 먼저
+            with priority_lane("batch"):
+                result = await self.translator.translate(job["youtube_url"], job["target_language"])
+        except Exception as e:
+            logger.error(f"번역 작업 실패: {job_id} - {e}")
+            await self._finish(job_id, status=TranslationStatus.FAILED.value, error_message=str(e))
+        else:
+            await self._finish(job_id, status=TranslationStatus.COMPLETED.value,
+                               result=json.loads(result.json()))
+        finally:
+            heartbeat.cancel()
+
+    async def _finish(self, job_id: str, **fields: Any):
+        """작업 종료 기록 후 임대 해제, 기다리는 long-poll 깨우기"""
+        await self.queue.update(job_id, finished_at=_now(), **fields)
+        await self.queue.ack(job_id)
+
+        event = self._events.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    async def _heartbeat(self, job_id: str):
+        """처리 중인 작업의 임대 연장 (한 번 실패해도 다음 주기에 다시 시도)"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self.queue.extend(job_id, self.lease_seconds)
+            except Exception as e:
+                logger.error(f"작업 임대 연장 실패 ({job_id}): {e}")
+
+    async def _reaper(self):
+        """임대가 만료된 작업을 주기적으로 큐에 되돌림"""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 2)
+            try:
+                requeued = await self.queue.requeue_expired()
+                if requeued:
+                    logger.warning(f"♻️ 임대가 만료된 작업 {requeued}개 재전달")
+            except Exception as e:
+                logger.error(f"작업 재전달 확인 실패: {e}")
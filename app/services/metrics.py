@@ -0,0 +1,198 @@
+"""
+Prometheus 메트릭
+
+prometheus.yml이 web:8000/metrics를 수집하므로 주요 경로의 지연 시간과
+캐시 적중, 재시도, 사용량 초과, 동시 처리 수를 여기서 정의합니다.
+
+- gunicorn 워커 여러 개가 떠 있어도 합산되도록 PROMETHEUS_MULTIPROC_DIR이
+  설정되어 있으면 prometheus_client의 multiprocess 모드로 수집합니다
+  (gunicorn.conf.py가 디렉터리 준비와 종료된 워커 정리를 담당).
+- 메트릭 기록은 메모리 카운터 증가 정도라 운영에서도 켜 둘 수 있습니다.
+- prometheus_client가 없거나 METRICS_ENABLED=False면 아무 일도 하지 않는 객체를 씁니다.
+"""
+
+import asyncio
+import os
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Tuple
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import prometheus_client
+    from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram
+except ImportError:  # 선택 의존성
+    prometheus_client = None
+    CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+ENABLED = prometheus_client is not None and settings.METRICS_ENABLED
+
+# 지연 시간 구간 (초) - 캐시 조회는 밀리초, Gemini 호출은 수십 초까지
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+
+
+class _NoopMetric:
+    """prometheus_client가 없을 때 쓰는 빈 메트릭"""
+
+    def labels(self, *args: Any, **kwargs: Any) -> "_NoopMetric":
+        return self
+
+    def observe(self, value: float):
+        pass
+
+    def inc(self, amount: float = 1):
+        pass
+
+    def dec(self, amount: float = 1):
+        pass
+
+
+def _histogram(
+    name: str,
+    documentation: str,
+    labelnames: Tuple[str, ...] = (),
+    buckets=SLOW_BUCKETS
+):
+    if not ENABLED:
+        return _NoopMetric()
+    return Histogram(name, documentation, labelnames, buckets=buckets)
+
+
+def _counter(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    if not ENABLED:
+        return _NoopMetric()
+    return Counter(name, documentation, labelnames)
+
+
+def _gauge(name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+    if not ENABLED:
+        return _NoopMetric()
+    # 여러 워커 값은 살아 있는 프로세스 것만 합산
+    return Gauge(name, documentation, labelnames, multiprocess_mode="livesum")
+
+
+# ===========================
+# 지연 시간
+# ===========================
+
+HTTP_REQUEST_DURATION = _histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간",
+    ("method", "route", "status"), buckets=SLOW_BUCKETS
+)
+TRANSLATE_DURATION = _histogram(
+    "yt_translate_duration_seconds", "번역 요청 전체 시간 (캐시 조회부터 결과 반환까지)",
+    ("outcome",)
+)
+CACHE_LOOKUP_DURATION = _histogram(
+    "yt_cache_lookup_duration_seconds", "번역 결과 캐시 조회 시간 (L1 → L2 → 저장소)",
+    buckets=FAST_BUCKETS
+)
+GEMINI_CALL_DURATION = _histogram(
+    "yt_gemini_call_duration_seconds", "Gemini API 호출 시간 (속도 제한 대기 제외)",
+    ("kind", "status")
+)
+PARSE_DURATION = _histogram(
+    "yt_parse_duration_seconds", "Gemini 응답 파싱 시간",
+    ("kind",), buckets=FAST_BUCKETS
+)
+QUEUE_WAIT = _histogram(
+    "yt_queue_wait_seconds", "대기열에서 기다린 시간 (scheduler: Gemini 호출 자리, jobs: 작업 큐)",
+    ("queue", "lane")
+)
+
+# ===========================
+# 카운터
+# ===========================
+
+CACHE_REQUESTS = _counter(
+    "yt_cache_requests_total", "계층별 캐시 조회 결과",
+    ("tier", "result")
+)
+RETRIES = _counter(
+    "yt_retries_total", "재시도 횟수",
+    ("kind",)
+)
+QUOTA_ERRORS = _counter(
+    "yt_gemini_quota_errors_total", "Gemini 사용량 초과(429) 응답 수"
+)
+CACHE_WARMER = _counter(
+    "yt_cache_warmer_total", "캐시 워머가 확인한 인기 영상 처리 결과",
+    ("outcome",)
+)
+
+# ===========================
+# 동시 처리 수
+# ===========================
+
+TRANSLATIONS_IN_FLIGHT = _gauge(
+    "yt_translations_in_flight", "Gemini로 번역 중인 영상 수"
+)
+GEMINI_CALLS_IN_FLIGHT = _gauge(
+    "yt_gemini_calls_in_flight", "진행 중인 Gemini API 호출 수"
+)
+
+
+@contextmanager
+def track_in_flight(gauge: Any) -> Iterator[None]:
+    """블록 실행 동안 게이지 1 증가"""
+    gauge.inc()
+    try:
+        yield
+    finally:
+        gauge.dec()
+
+
+@contextmanager
+def observe_duration(histogram: Any) -> Iterator[None]:
+    """블록 실행 시간 기록 (labels()를 적용한 히스토그램)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start)
+
+
+@contextmanager
+def gemini_call(kind: str) -> Iterator[None]:
+    """Gemini 호출 시간과 동시 호출 수 기록 (status: ok / error / cancelled)"""
+    GEMINI_CALLS_IN_FLIGHT.inc()
+    start = time.perf_counter()
+    status = "error"
+    try:
+        yield
+        status = "ok"
+    except (GeneratorExit, asyncio.CancelledError):
+        status = "cancelled"
+        raise
+    finally:
+        GEMINI_CALLS_IN_FLIGHT.dec()
+        GEMINI_CALL_DURATION.labels(kind, status).observe(time.perf_counter() - start)
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """
+    /metrics 응답 본문 생성
+
+    Returns:
+        tuple: (본문, Content-Type)
+    """
+    if not ENABLED:
+        return b"# metrics disabled\n", CONTENT_TYPE_LATEST
+
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        # 모든 워커가 남긴 파일을 합쳐서 수집
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry, path=multiproc_dir)
+    else:
+        registry = prometheus_client.REGISTRY
+
+    return prometheus_client.generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,420 @@
+"""
+Gemini API 호출 스케줄러 (토큰 버킷 속도 제한)
+
+모든 Gemini 호출은 이 스케줄러를 거칩니다.
+
+- 분당 요청 수(RPM)와 분당 토큰 수(TPM)를 토큰 버킷으로 제한합니다.
+  Redis가 있으면 클러스터 전체가 버킷 하나를 공유하고(서버 시작 시 use_redis로 연결,
+  redis_pool의 비동기 클라이언트), Redis 장애 시에는 워커별 로컬 버킷으로 대체합니다.
+- 우선순위 레인: 사용자가 기다리는 요청(interactive)이
+  일괄/백그라운드 요청(batch)보다, batch는 캐시 워머(background)보다
+  먼저 버킷을 사용합니다.
+- 적응형 백오프: 사용량 초과(quota) 오류가 나면 모든 호출을 잠시 멈추고,
+  연속으로 발생하면 대기 시간을 두 배씩 늘립니다.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+import logging
+
+from app.config import settings
+from app.services.metrics import QUEUE_WAIT, QUOTA_ERRORS
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 우선순위 레인 (숫자가 작을수록 먼저)
+LANES = {
+    "interactive": 0,
+    "batch": 1,
+    "background": 2,  # 캐시 워머 - 남는 자리만 사용
+}
+
+# 현재 작업의 레인 - translate_batch, 작업 큐 워커 등에서 지정
+_current_lane: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "gemini_lane", default="interactive"
+)
+
+
+@contextmanager
+def priority_lane(lane: str) -> Iterator[None]:
+    """
+    이 블록 안에서 시작한 Gemini 호출의 우선순위 레인 지정
+
+    asyncio Task는 만들어질 때 context를 복사하므로
+    블록 안에서 만든 하위 작업에도 같은 레인이 적용됩니다.
+
+    Args:
+        lane: "interactive", "batch" 또는 "background"
+    """
+    if lane not in LANES:
+        raise ValueError(f"알 수 없는 레인: {lane}")
+
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class LocalRateLimiter:
+    """
+    워커(프로세스) 내부 토큰 버킷
+
+    RPM 버킷과 TPM 버킷 두 개를 함께 검사해서
+    둘 다 충분할 때만 차감합니다.
+    """
+
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Args:
+            rpm: 분당 최대 요청 수
+            tpm: 분당 최대 토큰 수
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._backoff_until = 0.0
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._updated = now
+        self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    async def try_acquire(self, tokens: int) -> float:
+        """
+        요청 1개 + 토큰 tokens개 차감 시도
+
+        Args:
+            tokens: 예상 토큰 수 (TPM보다 크면 TPM으로 계산)
+
+        Returns:
+            float: 0이면 차감 성공, 아니면 다시 시도할 때까지 기다릴 시간 (초)
+        """
+        now = time.monotonic()
+        if now < self._backoff_until:
+            return self._backoff_until - now
+
+        self._refill()
+        tokens = min(tokens, self.tpm)
+
+        wait = 0.0
+        if self._requests < 1:
+            wait = max(wait, (1 - self._requests) * 60 / self.rpm)
+        if self._tokens < tokens:
+            wait = max(wait, (tokens - self._tokens) * 60 / self.tpm)
+        if wait > 0:
+            return wait
+
+        self._requests -= 1
+        self._tokens -= tokens
+        return 0.0
+
+    async def pause(self, seconds: float):
+        """seconds 동안 모든 호출 중지 (백오프)"""
+        self._backoff_until = max(self._backoff_until, time.monotonic() + seconds)
+
+
+class RedisRateLimiter:
+    """
+    Redis 기반 클러스터 공용 토큰 버킷
+
+    버킷 상태를 Redis 해시에 두고 Lua 스크립트로 원자적으로 검사/차감합니다.
+    백오프도 Redis 키로 공유해서 한 노드가 사용량 초과를 만나면
+    모든 노드가 함께 멈춥니다. Redis 오류 시에는 로컬 버킷을 사용합니다.
+    """
+
+    PREFIX = "yt_translation:gemini:"
+
+    # KEYS: RPM 버킷, TPM 버킷, 백오프 키 / ARGV: 현재 시각(ms), RPM, TPM, 토큰 수
+    # 반환: 0이면 차감 성공, 아니면 기다릴 시간 (ms)
+    ACQUIRE_SCRIPT = """
+local backoff = redis.call("PTTL", KEYS[3])
+if backoff > 0 then
+    return backoff
+end
+
+local now = tonumber(ARGV[1])
+
+local function refill(key, capacity)
+    local state = redis.call("HMGET", key, "tokens", "ts")
+    local tokens = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    local rate = capacity / 60000
+    return math.min(capacity, tokens + math.max(0, now - ts) * rate), rate
+end
+
+local rpm = tonumber(ARGV[2])
+local tpm = tonumber(ARGV[3])
+local need = math.min(tonumber(ARGV[4]), tpm)
+local requests, request_rate = refill(KEYS[1], rpm)
+local tokens, token_rate = refill(KEYS[2], tpm)
+
+local wait = 0
+if requests < 1 then
+    wait = math.max(wait, (1 - requests) / request_rate)
+end
+if tokens < need then
+    wait = math.max(wait, (need - tokens) / token_rate)
+end
+if wait > 0 then
+    return math.ceil(wait)
+end
+
+redis.call("HSET", KEYS[1], "tokens", tostring(requests - 1), "ts", ARGV[1])
+redis.call("HSET", KEYS[2], "tokens", tostring(tokens - need), "ts", ARGV[1])
+redis.call("PEXPIRE", KEYS[1], 120000)
+redis.call("PEXPIRE", KEYS[2], 120000)
+return 0
+"""
+
+    def __init__(self, redis_client: Any, rpm: int, tpm: int):
+        """
+        Args:
+            redis_client: 비동기 Redis 클라이언트 (redis_pool)
+            rpm: 클러스터 전체 분당 최대 요청 수
+            tpm: 클러스터 전체 분당 최대 토큰 수
+        """
+        self.redis = redis_client
+        self.rpm = rpm
+        self.tpm = tpm
+        self.local = LocalRateLimiter(rpm, tpm)
+        self.fallbacks = 0
+        self._keys = (f"{self.PREFIX}rpm", f"{self.PREFIX}tpm", f"{self.PREFIX}backoff")
+
+    async def try_acquire(self, tokens: int) -> float:
+        """
+        요청 1개 + 토큰 tokens개 차감 시도 (Redis 장애 시 로컬 버킷)
+
+        Returns:
+            float: 0이면 차감 성공, 아니면 기다릴 시간 (초)
+        """
+        try:
+            wait_ms = await self.redis.eval(
+                self.ACQUIRE_SCRIPT, 3, *self._keys,
+                int(time.time() * 1000), self.rpm, self.tpm, int(tokens)
+            )
+            return int(wait_ms) / 1000
+        except Exception as e:
+            self.fallbacks += 1
+            logger.warning(f"Redis 속도 제한 실패 - 로컬 버킷 사용: {e}")
+            return await self.local.try_acquire(tokens)
+
+    async def pause(self, seconds: float):
+        """클러스터 전체 호출을 seconds 동안 중지"""
+        await self.local.pause(seconds)
+        try:
+            await self.redis.set(self._keys[2], "1", px=max(1, int(seconds * 1000)))
+        except Exception as e:
+            logger.warning(f"백오프 전파 실패: {e}")
+
+
+class GeminiScheduler:
+    """
+    Gemini 호출 스케줄러
+
+    호출하기 전에 slot()으로 자리를 받아야 합니다.
+    대기자는 (레인 우선순위, 도착 순서)로 정렬되어 맨 앞 대기자만 버킷을 사용하므로
+    interactive 요청은 먼저 와 있던 batch 요청보다 앞서 나갑니다.
+    동시에 진행 중인 호출 수도 max_concurrency로 제한합니다.
+    """
+
+    def __init__(
+        self,
+        limiter: Any,
+        max_concurrency: int = 8,
+        backoff_initial: float = 2.0,
+        backoff_max: float = 60.0
+    ):
+        """
+        Args:
+            limiter: LocalRateLimiter 또는 RedisRateLimiter
+            max_concurrency: 워커당 동시 호출 수 상한
+            backoff_initial: 첫 사용량 초과 시 멈추는 시간 (초)
+            backoff_max: 최대 백오프 시간 (초)
+        """
+        self.limiter = limiter
+        self.max_concurrency = max(1, max_concurrency)
+        self.backoff_initial = backoff_initial
+        self.backoff_max = backoff_max
+        self.backoff = 0.0
+        self._paused_until = 0.0  # 백오프 종료 시각 (monotonic)
+
+        self._waiters: list = []
+        self._seq = itertools.count()
+        self._in_flight = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._cond: Optional[asyncio.Condition] = None
+
+        # 통계
+        self.granted = {lane: 0 for lane in LANES}
+        self.delayed = 0
+        self.wait_seconds = 0.0
+        self.quota_errors = 0
+
+    def _condition(self) -> asyncio.Condition:
+        """현재 이벤트 루프의 Condition (루프가 바뀌면 새로 만듦 - 테스트 등)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._cond = asyncio.Condition()
+            self._waiters = []
+            self._in_flight = 0
+        return self._cond
+
+    @asynccontextmanager
+    async def slot(self, tokens: int, lane: Optional[str] = None) -> AsyncIterator[None]:
+        """
+        Gemini 호출 자리 받기
+
+        Args:
+            tokens: 이번 호출의 예상 토큰 수 (입력 + 출력)
+            lane: 우선순위 레인 (None이면 현재 context의 레인)
+        """
+        lane = lane or _current_lane.get()
+        await self._acquire(tokens, lane)
+        try:
+            yield
+        finally:
+            await self._release()
+
+    async def _acquire(self, tokens: int, lane: str):
+        cond = self._condition()
+        ticket: Tuple[int, int] = (LANES[lane], next(self._seq))
+        started = time.monotonic()
+        delayed = False
+
+        async with cond:
+            heapq.heappush(self._waiters, ticket)
+            cond.notify_all()  # 앞서던 대기자가 우선순위를 다시 확인하도록
+
+            try:
+                while True:
+                    await cond.wait_for(
+                        lambda: (
+                            self._waiters[0] == ticket
+                            and self._in_flight < self.max_concurrency
+                        )
+                    )
+                    wait = await self.limiter.try_acquire(tokens)
+                    if wait <= 0:
+                        break
+
+                    # 버킷이 찰 때까지 대기 (더 급한 요청이 오면 깨어나서 순서 재확인)
+                    delayed = True
+                    try:
+                        await asyncio.wait_for(cond.wait(), timeout=wait)
+                    except asyncio.TimeoutError:
+                        pass
+            finally:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                cond.notify_all()
+
+            self._in_flight += 1
+
+        self.granted[lane] += 1
+        QUEUE_WAIT.labels("scheduler", lane).observe(time.monotonic() - started)
+        if delayed:
+            self.delayed += 1
+            self.wait_seconds += time.monotonic() - started
+
+    async def _release(self):
+        cond = self._condition()
+        async with cond:
+            self._in_flight = max(0, self._in_flight - 1)
+            cond.notify_all()
+
+    def is_idle(self) -> bool:
+        """
+        여유가 있는지 (캐시 워머처럼 급하지 않은 작업을 시작해도 되는지)
+
+        기다리는 호출이 없고, 사용량 초과 백오프 시간이 지났으며,
+        동시 호출 자리가 절반 넘게 비어 있으면 True입니다.
+        """
+        return (
+            not self._waiters
+            and time.monotonic() >= self._paused_until
+            and self._in_flight * 2 < self.max_concurrency
+        )
+
+    def use_redis(self, redis_client: Optional[Any]):
+        """
+        클러스터 공용 버킷으로 전환 (None이면 워커별 버킷으로 되돌림)
+
+        Args:
+            redis_client: 비동기 Redis 클라이언트 (TranslatorService.start에서 연결)
+        """
+        rpm, tpm = self.limiter.rpm, self.limiter.tpm
+        if redis_client is not None:
+            self.limiter = RedisRateLimiter(redis_client, rpm, tpm)
+        else:
+            self.limiter = LocalRateLimiter(rpm, tpm)
+
+    async def report_quota_error(self):
+        """
+        사용량 초과 오류 - 백오프 시간을 늘리고 모든 호출을 잠시 멈춤
+
+        이미 멈춘 동안 들어온 오류(같은 한도에 동시에 걸린 호출들)는
+        한 번의 사용량 초과로 보고 백오프를 더 늘리지 않습니다.
+        """
+        self.quota_errors += 1
+        QUOTA_ERRORS.inc()
+        if time.monotonic() < self._paused_until:
+            return
+        self.backoff = min(
+            self.backoff_max, self.backoff * 2 if self.backoff else self.backoff_initial
+        )
+        self._paused_until = time.monotonic() + self.backoff
+        await self.limiter.pause(self.backoff)
+        logger.warning(f"⏸️ Gemini 사용량 초과 - {self.backoff:.0f}초 동안 호출 중지")
+
+    def report_success(self):
+        """호출 성공 - 백오프 시간을 점차 줄임"""
+        if self.backoff:
+            self.backoff = self.backoff / 2 if self.backoff / 2 >= self.backoff_initial else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 통계 반환"""
+        waiting = {lane: 0 for lane in LANES}
+        names = {priority: lane for lane, priority in LANES.items()}
+        for priority, _ in self._waiters:
+            waiting[names[priority]] += 1
+
+        return {
+            "backend": "redis" if isinstance(self.limiter, RedisRateLimiter) else "local",
+            "rpm": self.limiter.rpm,
+            "tpm": self.limiter.tpm,
+            "in_flight": self._in_flight,
+            "waiting": waiting,
+            "granted": dict(self.granted),
+            "delayed": self.delayed,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "quota_errors": self.quota_errors,
+            "backoff": self.backoff,
+            "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+        }
+
+
+def create_gemini_scheduler() -> GeminiScheduler:
+    """
+    설정에 맞는 Gemini 스케줄러 생성
+
+    워커별 버킷으로 시작하고, REDIS_URL이 있으면 서버 시작 시
+    TranslatorService.start()가 use_redis()로 클러스터 공용 버킷에 연결합니다.
+    """
+    return GeminiScheduler(
+        LocalRateLimiter(settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE),
+        max_concurrency=settings.GEMINI_MAX_CONCURRENCY,
+        backoff_initial=settings.GEMINI_BACKOFF_INITIAL,
+        backoff_max=settings.GEMINI_BACKOFF_MAX
+    )
@@ -0,0 +1,118 @@
+"""
+캐시용 비동기 Redis 클라이언트
+
+동기 redis 클라이언트는 명령마다 이벤트 루프를 막으므로, Redis가 느려지면
+그 워커의 모든 요청이 함께 멈춥니다. 캐시 계층(TieredCache L2, 분산 single-flight)과
+작업 큐(RedisJobQueue), 번역 메모리(RedisTranslationMemory)는
+이 모듈의 redis.asyncio 클라이언트를 씁니다.
+
+- 워커당 연결 풀 하나를 공유합니다 (REDIS_MAX_CONNECTIONS개까지, 다 쓰면 REDIS_POOL_TIMEOUT까지 대기).
+- 명령마다 REDIS_SOCKET_TIMEOUT 제한이 있어 느린 Redis는 캐시 미스처럼 처리됩니다.
+- REDIS_HEALTH_CHECK_INTERVAL보다 오래 쉰 연결은 PING으로 확인한 뒤 씁니다.
+- 연결이 끊기면 다시 연결해서 REDIS_RETRIES번까지 재시도합니다.
+
+서버 시작 시 lifespan에서 만들고(TranslatorService.start) 종료 시 닫습니다(aclose).
+"""
+
+from typing import Any, Optional
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as redis_asyncio
+    from redis.asyncio.retry import Retry
+    from redis.backoff import ExponentialBackoff
+    from redis.exceptions import ConnectionError as RedisConnectionError
+except ImportError:  # 선택 의존성
+    redis_asyncio = None
+
+
+def build_async_redis_client(
+    url: Optional[str] = None,
+    decode_responses: bool = False
+) -> Optional[Any]:
+    """
+    연결 풀을 가진 비동기 Redis 클라이언트 생성 (연결은 첫 명령 때)
+
+    이벤트 루프 밖(모듈 import 시)에서도 만들 수 있습니다.
+    REDIS_URL이 비어 있거나 redis 패키지가 없으면 None을 반환합니다.
+
+    Args:
+        url: Redis URL (기본값: REDIS_URL)
+        decode_responses: 응답을 문자열로 받을지 (압축된 캐시 값은 False)
+
+    Returns:
+        redis.asyncio.Redis 또는 None
+    """
+    url = url or settings.REDIS_URL
+    if not url:
+        return None
+
+    if redis_asyncio is None:
+        logger.warning("redis 패키지가 없습니다 - 메모리 캐시로 대체합니다")
+        return None
+
+    pool = redis_asyncio.BlockingConnectionPool.from_url(
+        url,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+        socket_keepalive=True,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+        # 끊긴 연결만 다시 연결해서 재시도 (시간 초과는 재시도하지 않고 바로 실패)
+        retry=Retry(
+            ExponentialBackoff(cap=0.2, base=0.01),
+            settings.REDIS_RETRIES,
+            supported_errors=(RedisConnectionError,)
+        ),
+        decode_responses=decode_responses,
+    )
+    return redis_asyncio.Redis(connection_pool=pool)
+
+
+async def create_async_redis_client(
+    url: Optional[str] = None,
+    decode_responses: bool = False
+) -> Optional[Any]:
+    """
+    연결 풀을 가진 비동기 Redis 클라이언트 생성
+
+    REDIS_URL이 비어 있거나, redis 패키지가 없거나,
+    PING에 실패하면 None을 반환합니다 (메모리 캐시로 대체).
+
+    Args:
+        url: Redis URL (기본값: REDIS_URL)
+        decode_responses: 응답을 문자열로 받을지 (압축된 캐시 값은 False)
+
+    Returns:
+        redis.asyncio.Redis 또는 None
+    """
+    client = build_async_redis_client(url, decode_responses)
+    if client is None:
+        return None
+
+    try:
+        await client.ping()
+    except Exception as e:
+        logger.warning(f"Redis 연결 실패 - 메모리 캐시로 대체합니다: {e}")
+        await close_async_redis_client(client)
+        return None
+
+    logger.info(f"🔌 비동기 Redis 연결 풀 준비 - 최대 {settings.REDIS_MAX_CONNECTIONS}개 연결")
+    return client
+
+
+async def close_async_redis_client(client: Optional[Any]):
+    """클라이언트와 연결 풀 닫기 (서버 종료 시)"""
+    if client is None:
+        return
+
+    try:
+        await client.aclose(close_connection_pool=True)
+    except Exception as e:
+        logger.warning(f"Redis 연결 종료 실패: {e}")
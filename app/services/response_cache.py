@@ -0,0 +1,72 @@
+"""
+인코딩된 응답 본문 캐시 (캐시 적중 빠른 경로)
+
+캐시 적중 응답은 매번 TranslateResponse(**cached)로 모델을 다시 만들고,
+FastAPI가 response_model로 한 번 더 검증한 뒤 jsonable_encoder + json.dumps로
+직렬화합니다. 세그먼트가 많은 결과는 적중 한 번에 수십 ms가 걸립니다.
+
+이 모듈은 응답 본문을 한 번만 인코딩(orjson, 없으면 json)해서 워커별 메모리 캐시에
+ETag와 함께 두고, 다음 적중부터는 그 바이트를 그대로 돌려주도록 합니다.
+
+- EncodedResponse: (본문 바이트, ETag)
+- encode_response: 응답 모델 → EncodedResponse
+- etag_matches: If-None-Match 헤더 비교 (304 응답용)
+"""
+
+import hashlib
+from typing import NamedTuple, Optional
+
+from pydantic import BaseModel
+
+from app.services.codec import dump_json
+
+
+class EncodedResponse(NamedTuple):
+    """인코딩이 끝난 JSON 응답 본문과 ETag"""
+
+    body: bytes
+    etag: str
+
+
+def encode_response(model: BaseModel) -> EncodedResponse:
+    """
+    응답 모델을 JSON 바이트로 인코딩하고 ETag 계산
+
+    FastAPI의 response_model 직렬화와 같은 내용입니다 (None 필드 포함,
+    datetime은 ISO 8601 문자열, Enum은 값).
+
+    Args:
+        model: 응답 모델 (TranslateResponse 등)
+
+    Returns:
+        EncodedResponse: 본문과 강한 ETag (본문 해시)
+    """
+    body = dump_json(model.dict())
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return EncodedResponse(body, etag)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, RFC 9110)
+
+    Args:
+        if_none_match: 요청 헤더 값 (여러 ETag를 쉼표로 구분, * 가능)
+        etag: 현재 응답의 ETag
+
+    Returns:
+        bool: 일치하면 True (304 Not Modified 응답)
+    """
+    if not if_none_match:
+        return False
+
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
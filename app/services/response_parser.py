@@ -0,0 +1,200 @@
+"""
+Gemini 번역 응답 파서
+
+URL 프롬프트 응답 (=== 영상 정보 === / === 요약 === / === 전체 번역 ===)을
+한 번만 훑으면서 제목, 채널, 길이, 요약을 뽑고 전체 번역을 [00:00] 시간 표시 기준
+세그먼트로 나눕니다. 단어 수도 조각마다 더해 가므로 전체 텍스트를 다시 훑지 않습니다
+(이전에는 패턴 5개로 각각 전체를 검색하고, 단어 수를 세려고 re.sub로 한 번 더 훑었습니다).
+
+- 정규식은 모듈을 불러올 때 한 번만 컴파일합니다.
+- 스트리밍 응답은 feed()로 조각이 도착하는 대로 완성된 줄만 처리하고
+  close()로 마무리하므로, 마지막에 전체 텍스트를 다시 파싱하지 않아도 됩니다.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+# 섹션 머리글: === 요약 ===
+SECTION_HEADER = re.compile(r"=+\s*(.+?)\s*=+$")
+# 영상 정보 항목: 제목: ... / 채널: ... / 길이: ...
+INFO_FIELD = re.compile(r"(제목|채널|길이):\s*(.+)")
+# 줄 맨 앞의 시간 표시: [01:23] / [1:02:03]
+TIMESTAMP = re.compile(r"\[(?:(\d{1,2}):)?(\d{1,2}):(\d{2})\]\s*")
+# 영상 길이 표시: 10:30 / 1:02:03
+DURATION = re.compile(r"(?:(\d+):)?(\d{1,2}):(\d{2})")
+WORD_CHAR = re.compile(r"\w")
+
+SECTIONS = {"영상 정보": "info", "요약": "summary", "전체 번역": "body"}
+INFO_KEYS = {"제목": "video_title", "채널": "channel_name", "길이": "video_duration"}
+
+
+def _is_bullet(line: str) -> bool:
+    """줄 맨 앞 토큰이 글자 없는 글머리표(-, *, • 등)인지"""
+    return not line[0].isalnum() and not WORD_CHAR.search(line.split(None, 1)[0])
+
+
+def count_words(line: str) -> int:
+    """
+    한 줄의 단어 수 - 공백으로 나눈 토큰 수
+
+    정규식으로 문장 부호를 지우고 다시 나누는 것보다 몇 배 빠릅니다.
+    줄 맨 앞의 글머리표는 세지 않습니다.
+    """
+    words = len(line.split())
+    if words and _is_bullet(line.lstrip()):
+        words -= 1
+    return words
+
+
+def _seconds(match: "re.Match") -> int:
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
+
+class TranslationResponseParser:
+    """
+    번역 응답을 한 줄씩 처리하는 파서
+
+    사용 예:
+        parser = TranslationResponseParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+        fields = parser.close()
+    """
+
+    def __init__(self):
+        self._pending: List[str] = []  # 아직 줄바꿈이 오지 않은 조각
+        self._section: Optional[str] = None
+        self._summary: Optional[List[str]] = None
+        self._segments: List[Tuple[int, List[str]]] = []  # (시작 초, 줄 목록)
+        self.fields: Dict[str, str] = {}
+        self.word_count = 0
+        self.length = 0
+
+    def feed(self, chunk: str):
+        """응답 조각 추가 - 완성된 줄만 처리하고 나머지는 다음 조각과 합침"""
+        self.length += len(chunk)
+        if "\n" not in chunk:
+            self._pending.append(chunk)
+            return
+
+        head, _, tail = chunk.rpartition("\n")
+        if self._pending:
+            self._pending.append(head)
+            head = "".join(self._pending)
+            self._pending = []
+        if tail:
+            self._pending.append(tail)
+
+        self._lines(head)
+
+    def _lines(self, text: str):
+        """완성된 줄 묶음 처리"""
+        # 단어 수는 묶음 전체를 한 번에 나눠 세고, 머리글/글머리표만 줄 단위로 보정
+        self.word_count += len(text.split())
+
+        for line in text.split("\n"):
+            stripped = line.strip()
+            if not stripped:
+                if self._section == "summary":
+                    self._summary.append("")
+                continue
+
+            first = stripped[0]
+            if first == "=":
+                header = SECTION_HEADER.match(stripped)
+                if header and header.group(1) in SECTIONS:
+                    title = header.group(1)
+                    self.word_count -= len(stripped.split()) - len(title.split())
+                    self._section = SECTIONS[title]
+                    if self._section == "summary":
+                        self._summary = []
+                    continue
+
+            if first == "[" and self._section == "body":
+                timestamp = TIMESTAMP.match(stripped)
+                if timestamp:
+                    self._segments.append((_seconds(timestamp), [stripped[timestamp.end():]]))
+                    continue
+
+            if not first.isalnum() and _is_bullet(stripped):
+                self.word_count -= 1
+
+            if self._section == "body":
+                if self._segments:
+                    self._segments[-1][1].append(stripped)
+            elif self._section == "summary":
+                self._summary.append(line)
+            elif len(self.fields) < len(INFO_KEYS):
+                # 영상 정보는 전체 번역 섹션 앞에서만 찾음 (본문의 "길이:" 등은 무시)
+                match = INFO_FIELD.search(stripped)
+                if match:
+                    self.fields.setdefault(INFO_KEYS[match.group(1)], match.group(2).strip())
+
+    def close(self) -> Dict[str, Any]:
+        """
+        남은 조각을 처리하고 결과 반환
+
+        Returns:
+            dict: TranslateResponse 필드
+                (video_title, channel_name, video_duration, summary,
+                 segments, total_segments, word_count, confidence_score)
+        """
+        if self._pending:
+            self._lines("".join(self._pending))
+            self._pending = []
+
+        result: Dict[str, Any] = dict(self.fields)
+        if self._summary is not None:
+            summary = "\n".join(self._summary).strip()
+            if summary:
+                result["summary"] = summary
+
+        segments = self._build_segments()
+        if segments:
+            result["segments"] = segments
+            result["total_segments"] = len(segments)
+
+        result["word_count"] = self.word_count
+        # 신뢰도 점수 (간단한 휴리스틱)
+        result["confidence_score"] = min(0.95, self.length / 10000)
+        return result
+
+    def _build_segments(self) -> List[Dict[str, Any]]:
+        """
+        TranslationSegment 형식으로 변환
+
+        끝 시간은 다음 세그먼트의 시작 시간, 마지막 세그먼트는 영상 길이를 씁니다.
+        URL 프롬프트 응답에는 원문이 없으므로 original_text는 비워 둡니다.
+        """
+        duration = DURATION.search(self.fields.get("video_duration", ""))
+        video_end = _seconds(duration) if duration else 0
+
+        segments = []
+        ends = [start for start, _ in self._segments[1:]] + [video_end]
+        for (start, lines), end in zip(self._segments, ends):
+            text = lines[0] if len(lines) == 1 else "\n".join(lines).strip()
+            if not text:
+                continue
+            segments.append({
+                "start_time": start,
+                "end_time": max(start, end),
+                "original_text": "",
+                "translated_text": text,
+            })
+        return segments
+
+
+def parse_translation_response(text: str) -> Dict[str, Any]:
+    """
+    번역 응답 전체를 한 번에 파싱
+
+    Args:
+        text: Gemini 응답 텍스트
+
+    Returns:
+        dict: TranslationResponseParser.close() 결과
+    """
+    parser = TranslationResponseParser()
+    parser.feed(text)
+    return parser.close()
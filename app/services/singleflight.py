@@ -0,0 +1,241 @@
+"""
+중복 번역 요청 합치기 (single-flight)
+
+인기 영상에 같은 요청이 동시에 몰리면 캐시 미스가 한꺼번에 발생해서
+같은 영상에 대해 Gemini API를 여러 번 호출하게 됩니다.
+이 모듈은 같은 키의 작업을 한 번만 실행하고,
+나머지 요청은 그 결과를 함께 기다리도록 합니다.
+
+- SingleFlight: 워커(프로세스) 내부에서 합치기
+- RedisSingleFlight: Redis 락으로 워커/노드 간 합치기
+"""
+
+import asyncio
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+import logging
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    프로세스 내부 single-flight
+
+    같은 키로 동시에 들어온 호출 중 첫 번째만 실제 작업을 실행하고,
+    나머지는 같은 작업의 결과(또는 예외)를 그대로 받습니다.
+    작업은 별도 Task로 실행되므로 첫 번째 호출자가 취소되어도
+    기다리는 다른 호출자에게는 영향이 없고,
+    기다리는 호출자가 모두 취소되면 작업도 취소됩니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._waiters: Dict[str, int] = {}
+
+        # 통계
+        self.leaders = 0    # 실제로 작업을 실행한 횟수
+        self.coalesced = 0  # 진행 중인 작업에 합류한 횟수
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키별로 작업을 한 번만 실행
+
+        Args:
+            key: 작업 키 (보통 캐시 키)
+            fn: 실제 작업을 수행하는 코루틴 함수
+
+        Returns:
+            작업 결과 (같은 키의 모든 호출자가 공유)
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            self.leaders += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+            logger.info(f"🤝 진행 중인 번역에 합류: {key}")
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # 마지막 호출자까지 떠나면 결과를 받을 사람이 없으므로 작업 취소
+            if self._waiters.get(key) == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def in_flight(self, key: str) -> bool:
+        """해당 키의 작업이 진행 중인지 여부"""
+        return key in self._inflight
+
+    def stats(self) -> Dict[str, int]:
+        """합치기 통계 반환"""
+        return {
+            "in_flight": len(self._inflight),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+        }
+
+
+class RedisSingleFlight:
+    """
+    Redis 락 기반 분산 single-flight
+
+    락(SET NX PX)을 얻은 노드만 작업을 실행하고, 작업하는 동안
+    lock_ttl의 1/3마다 락을 연장합니다 (Gemini 재시도로 lock_ttl보다 길어져도 유지).
+    락을 얻지 못한 노드는 check()로 결과(보통 캐시)를 주기적으로 확인하다가
+    결과가 생기면 그대로 반환합니다. 락이 결과 없이 풀리면(작업 실패 등)
+    다시 락을 잡으려 하므로, 기다리던 노드 중 하나만 작업을 이어받습니다.
+    대기 시간이 지나면 직접 작업을 실행합니다.
+    """
+
+    LOCK_PREFIX = "yt_translation:lock:"
+
+    # 내 토큰일 때만 락 해제 (다른 노드가 새로 잡은 락은 건드리지 않음)
+    RELEASE_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+    # 내 토큰일 때만 락 연장
+    EXTEND_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+    def __init__(
+        self,
+        redis_client: Any,
+        lock_ttl: float = 120.0,
+        wait_timeout: float = 300.0,
+        poll_interval: float = 0.5
+    ):
+        """
+        Args:
+            redis_client: 비동기 Redis 클라이언트 (redis_pool.py)
+            lock_ttl: 락 유지 시간 (초) - 작업 중에는 계속 연장, 작업 노드가 죽으면 이 시간 후 해제
+            wait_timeout: 다른 노드의 결과를 기다리는 최대 시간 (초)
+            poll_interval: 결과 확인 간격 (초)
+        """
+        self.redis = redis_client
+        self.lock_ttl = lock_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+
+        # 통계
+        self.acquired = 0
+        self.waited = 0
+        self.fallbacks = 0
+
+    async def do(
+        self,
+        key: str,
+        fn: Callable[[], Awaitable[T]],
+        check: Callable[[], Awaitable[Optional[T]]]
+    ) -> T:
+        """
+        클러스터 전체에서 키별로 작업을 한 번만 실행
+
+        Args:
+            key: 작업 키
+            fn: 실제 작업을 수행하는 코루틴 함수
+            check: 다른 노드가 만든 결과를 확인하는 코루틴 함수 (없으면 None 반환)
+
+        Returns:
+            작업 결과
+        """
+        lock_key = f"{self.LOCK_PREFIX}{key}"
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+        waiting = False
+
+        while True:
+            try:
+                acquired = await self.redis.set(
+                    lock_key, token, nx=True, px=int(self.lock_ttl * 1000)
+                )
+            except Exception as e:
+                # Redis 장애 시에는 락 없이 진행 (워커 내부 합치기는 여전히 동작)
+                logger.warning(f"분산 락 획득 실패 - 락 없이 진행: {e}")
+                return await fn()
+
+            if acquired:
+                self.acquired += 1
+                return await self._run_locked(lock_key, token, fn)
+
+            # 다른 노드가 작업 중 - 결과를 기다림
+            if not waiting:
+                waiting = True
+                self.waited += 1
+                logger.info(f"⏳ 다른 노드의 번역 결과 대기: {key}")
+
+            while time.monotonic() < deadline:
+                await asyncio.sleep(self.poll_interval)
+
+                result = await check()
+                if result is not None:
+                    return result
+
+                try:
+                    if not await self.redis.exists(lock_key):
+                        break  # 작업 노드가 결과 없이 끝남 (실패 등) - 락을 다시 시도
+                except Exception:
+                    break
+            else:
+                self.fallbacks += 1
+                logger.warning(f"다른 노드의 결과를 받지 못해 직접 실행: {key}")
+                return await fn()
+
+    async def _run_locked(self, lock_key: str, token: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """락을 연장하면서 작업 실행, 끝나면 락 해제"""
+        keepalive = asyncio.ensure_future(self._keep_alive(lock_key, token))
+        try:
+            return await fn()
+        finally:
+            keepalive.cancel()
+            await self._release(lock_key, token)
+
+    async def _keep_alive(self, lock_key: str, token: str):
+        """작업하는 동안 lock_ttl의 1/3마다 락 연장"""
+        while True:
+            await asyncio.sleep(self.lock_ttl / 3)
+            try:
+                extended = await self.redis.eval(
+                    self.EXTEND_SCRIPT, 1, lock_key, token, int(self.lock_ttl * 1000)
+                )
+            except Exception as e:
+                logger.warning(f"분산 락 연장 실패 - 다음 주기에 다시 시도: {e}")
+                continue
+            if not extended:
+                logger.warning(f"분산 락을 잃음 - 연장 중단: {lock_key}")
+                return
+
+    async def _release(self, lock_key: str, token: str):
+        """락 해제"""
+        try:
+            await self.redis.eval(self.RELEASE_SCRIPT, 1, lock_key, token)
+        except Exception as e:
+            logger.warning(f"분산 락 해제 실패 (TTL 후 자동 해제): {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """분산 락 통계 반환"""
+        return {
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "fallbacks": self.fallbacks,
+        }
@@ -0,0 +1,470 @@
+"""
+번역 결과 영구 저장소 (캐시 뒤의 L3)
+
+메모리(L1)와 Redis(L2) 캐시는 재시작하거나 항목이 밀려나면 사라지고,
+그때마다 같은 영상을 Gemini로 다시 번역해야 했습니다.
+완료된 번역을 init.sql의 translations 테이블에 보관하고,
+캐시에 없을 때 여기서 찾아 캐시를 다시 채웁니다.
+
+- 저장은 요청 경로를 막지 않도록 버퍼에 모았다가 묶음으로 기록합니다
+  (STORE_BATCH_SIZE개가 모이거나 STORE_FLUSH_INTERVAL초마다).
+- PostgresTranslationStore: asyncpg 연결 풀 (운영용)
+- SQLiteTranslationStore: 같은 인터페이스의 SQLite 대역 (로컬 개발/테스트용)
+"""
+
+import asyncio
+import hashlib
+from abc import ABC, abstractmethod
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# translations 테이블에 기록하는 열 (result는 전체 응답 JSON)
+COLUMNS = (
+    "cache_key", "youtube_url", "video_id", "target_language",
+    "video_title", "channel_name", "video_duration", "translation", "summary",
+    "word_count", "confidence_score", "processing_time", "result",
+)
+
+
+def store_key(cache_key: str) -> str:
+    """
+    translations.cache_key 값 (VARCHAR(64)에 맞도록 캐시 키의 SHA-256)
+
+    Args:
+        cache_key: 번역 캐시 키
+
+    Returns:
+        str: 64자리 16진수 해시
+    """
+    return hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+
+
+def _clip(value: Any, length: int) -> Optional[str]:
+    """VARCHAR 길이에 맞게 자르기"""
+    return None if value is None else str(value)[:length]
+
+
+def build_row(cache_key: str, video_id: str, target_language: str, result: Dict[str, Any]) -> Tuple:
+    """
+    번역 결과를 translations 행으로 변환
+
+    Args:
+        cache_key: 번역 캐시 키
+        video_id: YouTube 비디오 ID
+        target_language: 번역 대상 언어
+        result: 번역 결과 (캐시에 저장하는 dict)
+
+    Returns:
+        tuple: COLUMNS 순서의 값
+    """
+    confidence = result.get("confidence_score")
+    return (
+        store_key(cache_key),
+        result.get("youtube_url") or "",
+        _clip(video_id, 20),
+        _clip(target_language, 10),
+        result.get("video_title"),
+        _clip(result.get("channel_name"), 255),
+        _clip(result.get("video_duration"), 20),
+        result.get("translation") or "",
+        result.get("summary"),
+        result.get("word_count"),
+        None if confidence is None else round(min(max(float(confidence), 0.0), 1.0), 2),
+        result.get("processing_time"),
+        json.dumps(result, ensure_ascii=False, default=str),
+    )
+
+
+class BatchedTranslationStore(ABC):
+    """
+    묶음 기록 공통 로직
+
+    save()는 버퍼에 넣기만 하고, 백그라운드 작업이 모아서 _write_rows()로 기록합니다.
+    기록 전인 결과도 get()에서 바로 보이며, 기록에 실패한 행은 다음 묶음에 다시 넣습니다.
+    백엔드는 _fetch()와 _write_rows()를 구현합니다.
+    """
+
+    backend = "none"
+
+    def __init__(self, batch_size: int = 50, flush_interval: float = 1.0, max_pending: int = 1000):
+        """
+        Args:
+            batch_size: 이만큼 모이면 바로 기록
+            flush_interval: 최대 기록 지연 (초)
+            max_pending: 기록 대기 최대 행 수 (초과 시 오래된 것부터 버림)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: "OrderedDict[str, Tuple]" = OrderedDict()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+
+        self.counters = {
+            "lookups": 0,
+            "hits": 0,
+            "writes": 0,
+            "batches": 0,
+            "write_errors": 0,
+            "dropped": 0,
+        }
+
+    # --- 백엔드별 구현 ---
+
+    @abstractmethod
+    async def _fetch(self, key: str) -> Optional[str]:
+        """store_key로 result JSON 조회"""
+
+    @abstractmethod
+    async def _write_rows(self, rows: List[Tuple]):
+        """행 묶음을 upsert"""
+
+    async def _close_backend(self):
+        pass
+
+    async def _popular(self, limit: int) -> List[str]:
+        """번역 횟수가 많은 비디오 ID (캐시 워머용)"""
+        return []
+
+    # --- 공통 인터페이스 ---
+
+    async def get(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        저장된 번역 결과 조회
+
+        Args:
+            cache_key: 번역 캐시 키
+
+        Returns:
+            dict: 번역 결과 또는 None
+        """
+        key = store_key(cache_key)
+        self.counters["lookups"] += 1
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.counters["hits"] += 1
+            return json.loads(pending[-1])
+
+        raw = await self._fetch(key)
+        if raw is None:
+            return None
+
+        self.counters["hits"] += 1
+        return json.loads(raw) if isinstance(raw, str) else raw
+
+    async def save(
+        self,
+        cache_key: str,
+        video_id: str,
+        target_language: str,
+        result: Dict[str, Any]
+    ):
+        """
+        번역 결과 저장 예약 (바로 반환, 기록은 백그라운드에서 묶음으로)
+
+        Args:
+            cache_key: 번역 캐시 키
+            video_id: YouTube 비디오 ID
+            target_language: 번역 대상 언어
+            result: 번역 결과
+        """
+        row = build_row(cache_key, video_id, target_language, result)
+        self._pending.pop(row[0], None)
+        self._pending[row[0]] = row
+        self._trim_pending()
+
+        self._ensure_flusher()
+        if len(self._pending) >= self.batch_size:
+            self._wakeup.set()
+
+    def _trim_pending(self):
+        while len(self._pending) > self.max_pending:
+            self._pending.popitem(last=False)
+            self.counters["dropped"] += 1
+
+    def _ensure_flusher(self):
+        """현재 이벤트 루프에 기록 작업이 없으면 시작"""
+        if self._flusher is not None and not self._flusher.done():
+            return
+
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._flusher = asyncio.get_running_loop().create_task(self._flush_loop())
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+            if self._pending:
+                await self.flush()
+
+    async def flush(self):
+        """대기 중인 결과를 모두 기록"""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+
+        async with self._flush_lock:
+            while self._pending:
+                rows = list(self._pending.values())[:self.batch_size]
+                try:
+                    await self._write_rows(rows)
+                except Exception as e:
+                    # 남겨 두고 다음 주기에 다시 시도
+                    self.counters["write_errors"] += 1
+                    logger.error(f"번역 저장소 기록 실패 ({len(rows)}건): {e}")
+                    return
+
+                for row in rows:
+                    # 기록하는 동안 같은 키가 새로 저장됐으면 그것은 남겨 둠
+                    if self._pending.get(row[0]) is row:
+                        del self._pending[row[0]]
+                self.counters["writes"] += len(rows)
+                self.counters["batches"] += 1
+
+    async def popular_videos(self, limit: int) -> List[str]:
+        """
+        인기 영상 비디오 ID (init.sql의 popular_videos 뷰 순서)
+
+        캐시와 Redis가 모두 비었을 때 캐시 워머가 데울 영상을 고르는 데 씁니다.
+
+        Args:
+            limit: 최대 개수
+
+        Returns:
+            list: 비디오 ID (많이 번역된 순)
+        """
+        return await self._popular(limit)
+
+    async def aclose(self):
+        """남은 결과를 기록하고 연결 닫기 (서버 종료 시)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        await self.flush()
+        await self._close_backend()
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 통계 반환"""
+        stats = dict(self.counters)
+        stats["backend"] = self.backend
+        stats["pending"] = len(self._pending)
+        stats["hit_rate"] = stats["hits"] / stats["lookups"] if stats["lookups"] else 0.0
+        return stats
+
+
+class PostgresTranslationStore(BatchedTranslationStore):
+    """
+    PostgreSQL translations 테이블 저장소 (asyncpg 연결 풀)
+
+    연결 풀은 첫 사용 때 만들고, 묶음 기록은 executemany 한 번으로 보냅니다.
+    """
+
+    backend = "postgres"
+
+    UPSERT_SQL = f"""
+        INSERT INTO translations ({", ".join(COLUMNS)})
+        VALUES ({", ".join(f"${i}" for i in range(1, len(COLUMNS)))}, ${len(COLUMNS)}::jsonb)
+        ON CONFLICT (cache_key) DO UPDATE SET
+            {", ".join(f"{column} = EXCLUDED.{column}" for column in COLUMNS[1:])},
+            status = 'completed'
+    """
+
+    SELECT_SQL = (
+        "SELECT result::text FROM translations "
+        "WHERE cache_key = $1 AND status = 'completed'"
+    )
+
+    POPULAR_SQL = "SELECT video_id FROM popular_videos LIMIT $1"
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10, **kwargs):
+        """
+        Args:
+            dsn: postgresql:// 연결 URL
+            min_size: 연결 풀 최소 크기
+            max_size: 연결 풀 최대 크기
+        """
+        super().__init__(**kwargs)
+        self.dsn = dsn
+        self.min_size = min_size
+        self.max_size = max_size
+        self._pool = None
+        self._pool_lock = asyncio.Lock()
+
+    async def _get_pool(self):
+        if self._pool is None:
+            async with self._pool_lock:
+                if self._pool is None:
+                    import asyncpg
+
+                    self._pool = await asyncpg.create_pool(
+                        self.dsn, min_size=self.min_size, max_size=self.max_size
+                    )
+        return self._pool
+
+    async def _fetch(self, key: str) -> Optional[str]:
+        pool = await self._get_pool()
+        return await pool.fetchval(self.SELECT_SQL, key)
+
+    async def _write_rows(self, rows: List[Tuple]):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.executemany(self.UPSERT_SQL, rows)
+
+    async def _popular(self, limit: int) -> List[str]:
+        pool = await self._get_pool()
+        return [row["video_id"] for row in await pool.fetch(self.POPULAR_SQL, limit)]
+
+    async def _close_backend(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+class SQLiteTranslationStore(BatchedTranslationStore):
+    """
+    SQLite 대역 저장소
+
+    translations 테이블의 같은 열을 사용하며, 쿼리는 스레드에서 실행합니다.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, **kwargs):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+        """
+        super().__init__(**kwargs)
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS translations (
+                {" TEXT, ".join(COLUMNS)} TEXT,
+                status TEXT DEFAULT 'completed',
+                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                updated_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (cache_key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def _fetch_sync(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM translations WHERE cache_key = ? AND status = 'completed'",
+                (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _write_rows_sync(self, rows: List[Tuple]):
+        placeholders = ", ".join("?" * len(COLUMNS))
+        updates = ", ".join(f"{column} = excluded.{column}" for column in COLUMNS[1:])
+        with self._lock:
+            self._conn.executemany(
+                f"""
+                INSERT INTO translations ({", ".join(COLUMNS)}) VALUES ({placeholders})
+                ON CONFLICT (cache_key) DO UPDATE SET {updates},
+                    status = 'completed', updated_at = CURRENT_TIMESTAMP
+                """,
+                rows
+            )
+            self._conn.commit()
+
+    def _popular_sync(self, limit: int) -> List[str]:
+        # popular_videos 뷰와 같은 순서 (SQLite 테이블에는 뷰가 없음)
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT video_id FROM translations WHERE status = 'completed'
+                GROUP BY video_id ORDER BY COUNT(*) DESC, MAX(updated_at) DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    async def _fetch(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._fetch_sync, key)
+
+    async def _popular(self, limit: int) -> List[str]:
+        return await asyncio.to_thread(self._popular_sync, limit)
+
+    async def _write_rows(self, rows: List[Tuple]):
+        await asyncio.to_thread(self._write_rows_sync, rows)
+
+    async def _close_backend(self):
+        with self._lock:
+            self._conn.close()
+
+
+def create_translation_store() -> Optional[BatchedTranslationStore]:
+    """
+    DATABASE_URL에 맞는 번역 저장소 생성
+
+    - postgresql://... → PostgresTranslationStore (asyncpg 필요)
+    - sqlite:///경로 → SQLiteTranslationStore (로컬 개발/테스트용)
+
+    Returns:
+        번역 저장소 또는 None (DATABASE_URL이 없거나, 비활성화했거나, 드라이버가 없음)
+    """
+    url = settings.DATABASE_URL
+    if not url or not settings.TRANSLATION_STORE_ENABLED:
+        return None
+
+    options = {
+        "batch_size": settings.STORE_BATCH_SIZE,
+        "flush_interval": settings.STORE_FLUSH_INTERVAL,
+        "max_pending": settings.STORE_MAX_PENDING,
+    }
+
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        if path != ":memory:" and not Path(path).is_absolute():
+            path = str(settings.BASE_DIR / path)
+        logger.info(f"🗄️ 번역 저장소 - SQLite ({path})")
+        return SQLiteTranslationStore(path, **options)
+
+    if url.startswith(("postgresql://", "postgres://")):
+        try:
+            import asyncpg  # noqa: F401
+        except ImportError:
+            logger.warning("asyncpg 패키지가 없어 번역 저장소를 사용하지 않습니다")
+            return None
+
+        logger.info("🗄️ 번역 저장소 - PostgreSQL")
+        return PostgresTranslationStore(
+            url,
+            min_size=settings.DATABASE_POOL_MIN_SIZE,
+            max_size=settings.DATABASE_POOL_MAX_SIZE,
+            **options
+        )
+
+    logger.warning(f"지원하지 않는 DATABASE_URL 형식 - 번역 저장소를 사용하지 않습니다: {url.split(':', 1)[0]}")
+    return None
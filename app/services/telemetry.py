@@ -0,0 +1,487 @@
+"""
+API 사용량 / 오류 기록 (telemetry)
+
+요청마다 DB에 바로 INSERT하면 응답이 DB 지연만큼 느려지고,
+DB가 멈추면 요청도 함께 멈춥니다. 여기서는 기록을 메모리 링 버퍼에 넣기만 하고
+백그라운드 작업이 모아서 api_usage / error_logs 테이블에 한 번에 기록합니다.
+
+- 버퍼가 가득 차면 가장 오래된 기록을 버립니다 (요청 지연을 늘리지 않음).
+- TELEMETRY_FLUSH_INTERVAL초마다, 또는 TELEMETRY_BATCH_SIZE개가 모이면 기록합니다.
+- PostgreSQL은 COPY, SQLite 대역은 여러 행 INSERT로 기록합니다.
+- /api/stats 수치는 DB가 있으면 DB에서, 없으면 이 프로세스의 집계로 계산합니다.
+"""
+
+import asyncio
+import ipaddress
+import json
+import sqlite3
+import threading
+from collections import deque
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+USAGE_COLUMNS = (
+    "endpoint", "method", "status_code", "response_time", "ip_address", "user_agent", "created_at"
+)
+ERROR_COLUMNS = (
+    "error_type", "error_message", "error_traceback", "endpoint", "request_data", "created_at"
+)
+
+# 번역 통계에 포함하는 엔드포인트 (정확히 일치 - GET /api/translations/{id} 조회는 제외)
+TRANSLATION_ENDPOINTS = ("/api/translate", "/api/translate/stream", "/api/translate/batch/stream")
+
+
+class SQLiteTelemetrySink:
+    """api_usage / error_logs의 SQLite 대역 (로컬 개발/테스트용)"""
+
+    backend = "sqlite"
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS api_usage (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                endpoint TEXT NOT NULL,
+                method TEXT NOT NULL,
+                status_code INTEGER,
+                response_time REAL,
+                ip_address TEXT,
+                user_agent TEXT,
+                created_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS error_logs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                error_type TEXT NOT NULL,
+                error_message TEXT NOT NULL,
+                error_traceback TEXT,
+                endpoint TEXT,
+                request_data TEXT,
+                created_at TEXT NOT NULL
+            );
+            """
+        )
+
+    def _insert(self, table: str, columns: Tuple[str, ...], rows: List[Tuple]):
+        # 한 문장에 여러 행 (SQLite 변수 제한 999개 안에서 나눠 실행)
+        per_statement = max(1, 999 // len(columns))
+        row_placeholder = f"({', '.join('?' * len(columns))})"
+        with self._lock:
+            for i in range(0, len(rows), per_statement):
+                chunk = rows[i:i + per_statement]
+                values = [self._to_sqlite(value) for row in chunk for value in row]
+                self._conn.execute(
+                    f"INSERT INTO {table} ({', '.join(columns)}) "
+                    f"VALUES {', '.join([row_placeholder] * len(chunk))}",
+                    values
+                )
+            self._conn.commit()
+
+    @staticmethod
+    def _to_sqlite(value: Any) -> Any:
+        if isinstance(value, datetime):
+            return value.strftime("%Y-%m-%d %H:%M:%S")
+        if isinstance(value, Decimal):
+            return float(value)
+        if value is not None and not isinstance(value, (str, int, float)):
+            return str(value)
+        return value
+
+    def _summary(self) -> Dict[str, Any]:
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                SELECT COUNT(*),
+                       SUM(CASE WHEN DATE(created_at) = DATE('now') THEN 1 ELSE 0 END),
+                       AVG(CASE WHEN status_code < 400 THEN 1.0 ELSE 0.0 END),
+                       AVG(response_time)
+                FROM api_usage WHERE endpoint IN ({",".join("?" * len(TRANSLATION_ENDPOINTS))})
+                """,
+                TRANSLATION_ENDPOINTS
+            ).fetchone()
+            (errors_today,) = self._conn.execute(
+                "SELECT COUNT(*) FROM error_logs WHERE DATE(created_at) = DATE('now')"
+            ).fetchone()
+        return _summary_from_row(row, errors_today)
+
+    async def write_usage(self, rows: List[Tuple]):
+        await asyncio.to_thread(self._insert, "api_usage", USAGE_COLUMNS, rows)
+
+    async def write_errors(self, rows: List[Tuple]):
+        await asyncio.to_thread(self._insert, "error_logs", ERROR_COLUMNS, rows)
+
+    async def summary(self) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._summary)
+
+    async def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class PostgresTelemetrySink:
+    """init.sql의 api_usage / error_logs 테이블 (asyncpg, COPY로 기록)"""
+
+    backend = "postgres"
+
+    SUMMARY_SQL = """
+        SELECT COUNT(*),
+               COUNT(*) FILTER (WHERE date = CURRENT_DATE),
+               AVG(CASE WHEN status_code < 400 THEN 1.0 ELSE 0.0 END),
+               AVG(response_time)
+        FROM api_usage WHERE endpoint = ANY($1::text[])
+    """
+
+    def __init__(self, dsn: str, max_size: int = 2):
+        """
+        Args:
+            dsn: postgresql:// 연결 URL
+            max_size: 연결 풀 최대 크기 (기록은 백그라운드 작업 하나뿐)
+        """
+        self.dsn = dsn
+        self.max_size = max_size
+        self._pool = None
+
+    async def _get_pool(self):
+        if self._pool is None:
+            import asyncpg
+
+            self._pool = await asyncpg.create_pool(self.dsn, min_size=1, max_size=self.max_size)
+        return self._pool
+
+    @staticmethod
+    def _usage_record(row: Tuple) -> Tuple:
+        endpoint, method, status_code, response_time, ip_address, user_agent, created_at = row
+        try:
+            ip = ipaddress.ip_address(ip_address) if ip_address else None
+        except ValueError:
+            ip = None
+        return (
+            endpoint[:255], method[:10], status_code,
+            Decimal(f"{response_time:.3f}"), ip, user_agent, created_at,
+        )
+
+    @staticmethod
+    def _error_record(row: Tuple) -> Tuple:
+        error_type, message, traceback, endpoint, request_data, created_at = row
+        return (
+            error_type[:100], message, traceback,
+            endpoint[:255] if endpoint else None,
+            None if request_data is None
+            else json.dumps(request_data, ensure_ascii=False, default=str),
+            created_at,
+        )
+
+    async def write_usage(self, rows: List[Tuple]):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "api_usage",
+                records=[self._usage_record(row) for row in rows],
+                columns=list(USAGE_COLUMNS)
+            )
+
+    async def write_errors(self, rows: List[Tuple]):
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "error_logs",
+                records=[self._error_record(row) for row in rows],
+                columns=list(ERROR_COLUMNS)
+            )
+
+    async def summary(self) -> Dict[str, Any]:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(self.SUMMARY_SQL, list(TRANSLATION_ENDPOINTS))
+            errors_today = await conn.fetchval(
+                "SELECT COUNT(*) FROM error_logs WHERE created_at >= CURRENT_DATE"
+            )
+        return _summary_from_row(tuple(row), errors_today)
+
+    async def close(self):
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+
+def _summary_from_row(row: Tuple, errors_today: int) -> Dict[str, Any]:
+    """(전체, 오늘, 성공률, 평균 응답 시간 ms) 행을 /api/stats 형식으로 변환"""
+    total, today, success_rate, average_ms = row
+    return {
+        "total_translations": total or 0,
+        "today_translations": today or 0,
+        "success_rate": round(float(success_rate), 4) if success_rate is not None else None,
+        "average_response_time": (
+            round(float(average_ms) / 1000, 3) if average_ms is not None else None
+        ),
+        "errors_today": errors_today or 0,
+    }
+
+
+class TelemetryWriter:
+    """
+    사용량 / 오류 기록 버퍼
+
+    record_*()는 버퍼에 넣기만 하는 동기 함수라 요청 처리 중 어디서든 부를 수 있습니다.
+    기록 대상(sink)이 없으면 버퍼 없이 프로세스 내부 집계만 유지합니다.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Any] = None,
+        capacity: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0
+    ):
+        """
+        Args:
+            sink: SQLiteTelemetrySink / PostgresTelemetrySink (None이면 집계만)
+            capacity: 링 버퍼 크기 (테이블별, 가득 차면 오래된 기록부터 버림)
+            batch_size: 이만큼 모이면 바로 기록
+            flush_interval: 최대 기록 지연 (초)
+        """
+        self.sink = sink
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._usage: Deque[Tuple] = deque(maxlen=capacity)
+        self._errors: Deque[Tuple] = deque(maxlen=capacity)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+        self.counters = {"recorded": 0, "written": 0, "dropped": 0, "write_errors": 0}
+
+        # DB가 없을 때 /api/stats에 쓰는 프로세스 내부 집계
+        self._local = {
+            "day": date.today(),
+            "total": 0,
+            "today": 0,
+            "succeeded": 0,
+            "response_time_total": 0.0,
+            "errors_today": 0,
+        }
+
+    # --- 기록 ---
+
+    def _push(self, buffer: Deque[Tuple], row: Tuple):
+        self.counters["recorded"] += 1
+        if self.sink is None:
+            return
+
+        if len(buffer) == buffer.maxlen:
+            self.counters["dropped"] += 1
+        buffer.append(row)
+
+        if self._wakeup is not None and len(buffer) >= self.batch_size:
+            self._wakeup.set()
+
+    def _roll_day(self):
+        today = date.today()
+        if self._local["day"] != today:
+            self._local.update(day=today, today=0, errors_today=0)
+
+    def record_usage(
+        self,
+        endpoint: str,
+        method: str,
+        status_code: int,
+        response_time_ms: float,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ):
+        """
+        API 요청 한 건 기록 (api_usage)
+
+        Args:
+            endpoint: 요청 경로
+            method: HTTP 메서드
+            status_code: 응답 상태 코드
+            response_time_ms: 응답 시간 (밀리초)
+            ip_address: 클라이언트 IP
+            user_agent: User-Agent 헤더
+        """
+        if endpoint in TRANSLATION_ENDPOINTS:
+            self._roll_day()
+            self._local["total"] += 1
+            self._local["today"] += 1
+            self._local["succeeded"] += status_code < 400
+            self._local["response_time_total"] += response_time_ms
+
+        self._push(self._usage, (
+            endpoint, method, status_code, response_time_ms,
+            ip_address, user_agent, datetime.now(timezone.utc),
+        ))
+
+    def record_error(
+        self,
+        error_type: str,
+        message: str,
+        traceback: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        request_data: Optional[Dict[str, Any]] = None
+    ):
+        """
+        오류 한 건 기록 (error_logs)
+
+        Args:
+            error_type: 예외 클래스 이름 등
+            message: 오류 메시지
+            traceback: 스택 트레이스
+            endpoint: 요청 경로
+            request_data: 요청 내용 (JSON으로 저장)
+        """
+        self._roll_day()
+        self._local["errors_today"] += 1
+        self._push(self._errors, (
+            error_type, message, traceback, endpoint, request_data, datetime.now(timezone.utc),
+        ))
+
+    # --- 백그라운드 기록 ---
+
+    async def start(self):
+        """기록 작업 시작 (lifespan에서 호출)"""
+        if self.sink is None or (self._flusher is not None and not self._flusher.done()):
+            return
+
+        self._wakeup = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_loop())
+        logger.info(f"📈 사용량 기록 시작 - {self.sink.backend}")
+
+    async def _flush_loop(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    @staticmethod
+    def _drain(buffer: Deque[Tuple], limit: int) -> List[Tuple]:
+        return [buffer.popleft() for _ in range(min(limit, len(buffer)))]
+
+    async def flush(self):
+        """버퍼에 있는 기록을 모두 기록 - 실패한 묶음은 버림 (재시도로 쌓이지 않도록)"""
+        if self.sink is None:
+            return
+
+        targets = ((self._usage, self.sink.write_usage), (self._errors, self.sink.write_errors))
+        for buffer, write in targets:
+            while buffer:
+                rows = self._drain(buffer, self.batch_size)
+                try:
+                    await write(rows)
+                    self.counters["written"] += len(rows)
+                except Exception as e:
+                    self.counters["write_errors"] += 1
+                    self.counters["dropped"] += len(rows)
+                    logger.warning(f"사용량 기록 실패 - {len(rows)}건 버림: {e}")
+                    break
+
+    async def stop(self):
+        """남은 기록을 쓰고 종료 (lifespan에서 호출)"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+
+        await self.flush()
+        if self.sink is not None:
+            await self.sink.close()
+
+    # --- 통계 ---
+
+    def _local_summary(self) -> Dict[str, Any]:
+        self._roll_day()
+        local = self._local
+        total = local["total"]
+        return {
+            "total_translations": total,
+            "today_translations": local["today"],
+            "success_rate": round(local["succeeded"] / total, 4) if total else None,
+            "average_response_time": (
+                round(local["response_time_total"] / total / 1000, 3) if total else None
+            ),
+            "errors_today": local["errors_today"],
+        }
+
+    async def summary(self) -> Dict[str, Any]:
+        """
+        /api/stats용 번역 통계
+
+        Returns:
+            dict: total_translations, today_translations, success_rate,
+                  average_response_time(초), errors_today, source
+        """
+        if self.sink is not None:
+            try:
+                summary = await self.sink.summary()
+                summary["source"] = self.sink.backend
+                return summary
+            except Exception as e:
+                logger.warning(f"사용량 통계 조회 실패 - 프로세스 집계 사용: {e}")
+
+        summary = self._local_summary()
+        summary["source"] = "process"
+        return summary
+
+    def stats(self) -> Dict[str, Any]:
+        """기록 파이프라인 상태"""
+        stats = dict(self.counters)
+        stats["buffered"] = len(self._usage) + len(self._errors)
+        stats["capacity"] = self.capacity
+        stats["backend"] = self.sink.backend if self.sink is not None else "none"
+        return stats
+
+
+def create_telemetry_writer() -> TelemetryWriter:
+    """
+    DATABASE_URL에 맞는 사용량 기록기 생성
+
+    DB가 없거나 TELEMETRY_ENABLED=False면 프로세스 내부 집계만 합니다.
+    """
+    options = {
+        "capacity": settings.TELEMETRY_BUFFER_SIZE,
+        "batch_size": settings.TELEMETRY_BATCH_SIZE,
+        "flush_interval": settings.TELEMETRY_FLUSH_INTERVAL,
+    }
+
+    url = settings.DATABASE_URL
+    if not url or not settings.TELEMETRY_ENABLED:
+        return TelemetryWriter(**options)
+
+    if url.startswith("sqlite:///"):
+        path = url[len("sqlite:///"):]
+        if path != ":memory:" and not Path(path).is_absolute():
+            path = str(settings.BASE_DIR / path)
+        return TelemetryWriter(SQLiteTelemetrySink(path), **options)
+
+    if url.startswith(("postgresql://", "postgres://")):
+        try:
+            import asyncpg  # noqa: F401
+        except ImportError:
+            logger.warning("asyncpg 패키지가 없어 사용량을 DB에 기록하지 않습니다")
+            return TelemetryWriter(**options)
+        return TelemetryWriter(PostgresTelemetrySink(url), **options)
+
+    return TelemetryWriter(**options)
@@ -0,0 +1,200 @@
+"""
+요청별 단계 시간 측정 (Server-Timing / 구조화 로그 / OpenTelemetry)
+
+번역 결과에는 processing_time 하나만 남아서 p99가 튀어도 시간이
+검증, 캐시, 프롬프트 생성, Gemini, 파싱 중 어디에 쓰였는지 알 수 없었습니다.
+
+- span("gemini") 블록으로 단계 시간을 현재 요청 기록(contextvar)에 더합니다.
+  같은 단계가 여러 번 실행되면 (재시도, 세그먼트 묶음) 시간과 횟수를 합산합니다.
+- 미들웨어가 요청마다 기록을 시작하고, 끝나면 Server-Timing 헤더와
+  로그 필드(extra={"timings": ...})로 내보냅니다.
+- OTEL_ENABLED=True이고 opentelemetry-sdk가 설치되어 있으면 같은 단계를
+  OpenTelemetry span으로도 만들어 OTLP 수집기로 보냅니다.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import logging
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# OpenTelemetry tracer (configure_tracing() 후에만 설정)
+_tracer: Optional[Any] = None
+
+
+class RequestTimings:
+    """요청 하나의 단계별 소요 시간"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}  # 단계 → 누적 시간 (초)
+        self.counts: Dict[str, int] = {}
+
+    def add(self, name: str, seconds: float):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    @property
+    def total(self) -> float:
+        return time.perf_counter() - self.started
+
+    def as_dict(self) -> Dict[str, float]:
+        """단계별 밀리초 (total 포함)"""
+        timings = {name: round(seconds * 1000, 2) for name, seconds in self.stages.items()}
+        timings["total"] = round(self.total * 1000, 2)
+        return timings
+
+    def header(self) -> str:
+        """
+        Server-Timing 헤더 값
+
+        Returns:
+            str: 예) 'cache;dur=0.41, gemini;dur=3120.5;desc="x2", total;dur=3130.2'
+        """
+        parts = []
+        for name, seconds in self.stages.items():
+            part = f"{name};dur={seconds * 1000:.2f}"
+            if self.counts[name] > 1:
+                part += f';desc="x{self.counts[name]}"'
+            parts.append(part)
+        parts.append(f"total;dur={self.total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+_current_timings: contextvars.ContextVar[Optional[RequestTimings]] = contextvars.ContextVar(
+    "request_timings", default=None
+)
+
+
+def start_request_timing() -> RequestTimings:
+    """현재 요청(context)의 단계 시간 기록 시작"""
+    timings = RequestTimings()
+    _current_timings.set(timings)
+    return timings
+
+
+def current_timings() -> Optional[RequestTimings]:
+    """현재 요청의 기록 (요청 밖이면 None)"""
+    return _current_timings.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[None]:
+    """
+    단계 시간 측정
+
+    요청 밖(백그라운드 작업 등)에서는 기록할 곳이 없으므로 시간만 재고 버립니다.
+
+    Args:
+        name: 단계 이름 (Server-Timing 토큰으로 쓰이므로 영문/숫자/_)
+        attributes: OpenTelemetry span 속성
+    """
+    start = time.perf_counter()
+    try:
+        if _tracer is None:
+            yield
+        else:
+            with _tracer.start_as_current_span(name, attributes=attributes or None):
+                yield
+    finally:
+        record_stage(name, time.perf_counter() - start)
+
+
+def record_stage(name: str, seconds: float):
+    """이미 잰 시간을 단계에 더함 (블록으로 감싸기 어려운 대기 시간 등)"""
+    timings = _current_timings.get()
+    if timings is not None:
+        timings.add(name, seconds)
+
+
+@contextmanager
+def request_span(name: str, **attributes: Any) -> Iterator[None]:
+    """요청 전체 OpenTelemetry span (단계 시간에는 더하지 않음)"""
+    if _tracer is None:
+        yield
+        return
+
+    with _tracer.start_as_current_span(name, attributes=attributes or None):
+        yield
+
+
+def log_request_timings(method: str, path: str, status_code: int, timings: RequestTimings):
+    """
+    요청 단계 시간 로그 (구조화 필드 포함)
+
+    TIMING_SLOW_REQUEST_MS를 넘은 요청은 INFO, 나머지는 DEBUG로 남깁니다.
+    """
+    fields = timings.as_dict()
+    level = logging.INFO if fields["total"] >= settings.TIMING_SLOW_REQUEST_MS else logging.DEBUG
+    if not logger.isEnabledFor(level):
+        return
+
+    summary = " ".join(f"{name}={ms}ms" for name, ms in fields.items())
+    logger.log(
+        level,
+        f"⏱️ {method} {path} {status_code} {summary}",
+        extra={
+            "http_method": method,
+            "http_path": path,
+            "http_status": status_code,
+            "timings": fields,
+        }
+    )
+
+
+def configure_tracing() -> bool:
+    """
+    OpenTelemetry 내보내기 설정 (lifespan에서 한 번 호출)
+
+    Returns:
+        bool: 설정 여부 (OTEL_ENABLED=False이거나 패키지가 없으면 False)
+    """
+    global _tracer
+
+    if not settings.OTEL_ENABLED:
+        return False
+
+    try:
+        from opentelemetry import trace
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    except ImportError:
+        logger.warning("opentelemetry-sdk가 설치되지 않아 트레이스를 내보내지 않습니다")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME})
+    )
+    # 배치로 모아 별도 스레드에서 전송 - 요청 경로는 막지 않음
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=settings.OTEL_EXPORTER_OTLP_ENDPOINT, insecure=True)
+        )
+    )
+    trace.set_tracer_provider(provider)
+    _tracer = trace.get_tracer("youtube_translator")
+
+    logger.info(f"🔭 OpenTelemetry 트레이스 전송 - {settings.OTEL_EXPORTER_OTLP_ENDPOINT}")
+    return True
+
+
+def shutdown_tracing():
+    """남은 span 전송 후 종료 (lifespan 종료 시)"""
+    global _tracer
+
+    if _tracer is None:
+        return
+
+    from opentelemetry import trace
+
+    provider = trace.get_tracer_provider()
+    if hasattr(provider, "shutdown"):
+        provider.shutdown()
+    _tracer = None
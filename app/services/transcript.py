@@ -0,0 +1,138 @@
+"""
+YouTube 자막(transcript) 처리
+
+youtube_transcript_api로 시간 정보가 있는 자막을 가져오고,
+번역을 위해 여러 세그먼트를 토큰 예산에 맞춰 묶음(batch)으로 나눕니다.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence
+import logging
+
+from youtube_transcript_api import (
+    InvalidVideoId,
+    NoTranscriptAvailable,
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi,
+)
+
+from app.config import settings
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+# 세그먼트 하나를 JSON 항목({"i": n, "t": "..."})으로 감쌀 때 붙는 토큰 수 (대략)
+SEGMENT_TOKEN_OVERHEAD = 8
+
+
+class TranscriptUnavailableError(ValueError):
+    """영상에 가져올 수 있는 자막이 없음 (자막 꺼짐, 요청한 언어 없음)"""
+
+
+class VideoUnavailableError(ValueError):
+    """영상 자체를 볼 수 없음 (비공개, 삭제, 잘못된 ID) - 다시 시도해도 같은 결과"""
+
+
+async def fetch_transcript(video_id: str, languages: Sequence[str] = None) -> List[Dict[str, Any]]:
+    """
+    YouTube 자막 가져오기
+
+    Args:
+        video_id: YouTube 비디오 ID
+        languages: 우선순위 순서의 자막 언어 목록 (기본값: TRANSCRIPT_LANGUAGES)
+
+    Returns:
+        list: [{"text": str, "start": float, "duration": float}, ...]
+
+    Raises:
+        VideoUnavailableError: 비공개/삭제된 영상
+        TranscriptUnavailableError: 자막이 없음
+        ValueError: 그 밖의 이유로 자막을 가져올 수 없음 (요청 제한, 네트워크 오류 등)
+    """
+    if languages is None:
+        languages = [
+            lang.strip() for lang in settings.TRANSCRIPT_LANGUAGES.split(",") if lang.strip()
+        ]
+
+    try:
+        # youtube_transcript_api는 동기 HTTP 클라이언트를 사용
+        segments = await asyncio.to_thread(
+            YouTubeTranscriptApi.get_transcript,
+            video_id,
+            languages=list(languages)
+        )
+    except (VideoUnavailable, InvalidVideoId) as e:
+        raise VideoUnavailableError(f"이 영상을 볼 수 없습니다 (비공개 또는 삭제된 영상): {type(e).__name__}")
+    except (TranscriptsDisabled, NoTranscriptFound, NoTranscriptAvailable) as e:
+        raise TranscriptUnavailableError(f"이 영상의 자막을 가져올 수 없습니다: {type(e).__name__}")
+    except Exception as e:
+        logger.warning(f"자막 가져오기 실패 ({video_id}): {e}")
+        raise ValueError(f"이 영상의 자막을 가져올 수 없습니다: {type(e).__name__}")
+
+    # 빈 줄 제거 및 공백 정리
+    return [
+        {
+            "text": " ".join(segment["text"].split()),
+            "start": float(segment["start"]),
+            "duration": float(segment.get("duration", 0.0)),
+        }
+        for segment in segments
+        if segment.get("text", "").strip()
+    ]
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    텍스트의 토큰 수 대략 계산
+
+    영어는 약 4글자, 한중일 문자는 약 1~2글자가 토큰 하나이므로
+    UTF-8 바이트 수 / 4로 두 경우를 함께 근사합니다.
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        int: 예상 토큰 수
+    """
+    return len(text.encode("utf-8")) // 4 + 1
+
+
+def batch_segments(
+    segments: List[Dict[str, Any]],
+    batch_size: int,
+    max_tokens: Optional[int] = None
+) -> List[List[Dict[str, Any]]]:
+    """
+    자막 세그먼트를 묶음으로 나누기
+
+    세그먼트를 순서대로 채우다가 묶음의 세그먼트 수가 batch_size에 이르거나
+    예상 토큰 수가 max_tokens를 넘으면 새 묶음을 시작합니다.
+    세그먼트 하나가 max_tokens보다 커도 단독 묶음으로 포함됩니다.
+
+    Args:
+        segments: 자막 세그먼트 목록
+        batch_size: 묶음당 최대 세그먼트 수
+        max_tokens: 묶음당 최대 예상 토큰 수 (None이면 개수로만 나눔)
+
+    Returns:
+        list: 세그먼트 묶음 목록
+    """
+    batch_size = max(1, batch_size)
+    batches: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+
+    for segment in segments:
+        tokens = estimate_tokens(segment["text"]) + SEGMENT_TOKEN_OVERHEAD
+        over_budget = max_tokens is not None and current_tokens + tokens > max_tokens
+        if current and (len(current) >= batch_size or over_budget):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(segment)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
@@ -0,0 +1,364 @@
+"""
+자막 세그먼트 번역 메모리 (translation memory)
+
+여러 영상에 반복되는 문장("구독과 좋아요 부탁드립니다", 인트로, 광고 문구,
+한 강연 안에서 반복되는 표현 등)은 한 번 번역한 결과를 재사용합니다.
+정규화한 원문 + 대상 언어를 키로 저장하고, 정확히 일치하면
+해당 세그먼트는 Gemini 호출 없이 바로 번역문을 돌려줍니다.
+
+- SQLiteTranslationMemory: 단일 서버용 (파일 하나, 최대 항목 수 초과 시 LRU 제거)
+- RedisTranslationMemory: 여러 워커/노드 공유용 (TTL 만료 + Redis maxmemory 정책)
+
+조회/저장은 모두 async입니다. SQLite 작업은 스레드에서 실행하고(asyncio.to_thread),
+Redis는 비동기 클라이언트를 써서 번역 중에 이벤트 루프를 막지 않습니다.
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import logging
+
+from app.config import settings
+from app.services.redis_pool import build_async_redis_client, close_async_redis_client
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+
+def normalize_segment(text: str) -> str:
+    """
+    번역 메모리 키용 원문 정규화
+
+    유니코드 호환 문자 통일(NFKC), 대소문자 무시, 공백 정리만 합니다.
+    문장 부호는 번역에 영향을 주므로 그대로 둡니다.
+
+    Args:
+        text: 자막 원문
+
+    Returns:
+        str: 정규화된 원문
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+def memory_key(text: str, target_language: str) -> str:
+    """
+    번역 메모리 키 생성
+
+    Args:
+        text: 자막 원문
+        target_language: 번역 대상 언어
+
+    Returns:
+        str: "{언어}:{정규화 원문 해시}"
+    """
+    digest = hashlib.sha1(normalize_segment(text).encode("utf-8")).hexdigest()
+    return f"{target_language}:{digest}"
+
+
+class TranslationMemoryStats:
+    """번역 메모리 적중 통계 (백엔드 공통)"""
+
+    def __init__(self):
+        self.lookups = 0
+        self.hits = 0
+        self.writes = 0
+        self.evictions = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "misses": self.lookups - self.hits,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+        }
+
+
+class SQLiteTranslationMemory:
+    """
+    SQLite 기반 번역 메모리
+
+    항목 수가 max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    조회할 때마다 쓰지 않도록, 적중한 항목의 사용 시각은 모아 두었다가
+    다음 저장 때나 touch_batch개가 모이면 한 번에 기록합니다.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 100_000, touch_batch: int = 500):
+        """
+        Args:
+            path: SQLite 파일 경로 (":memory:" 가능)
+            max_entries: 최대 저장 항목 수
+            touch_batch: 모아 둔 사용 시각이 이만큼 되면 저장을 기다리지 않고 기록
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self.touch_batch = touch_batch
+        self.stats_counter = TranslationMemoryStats()
+
+        self._touched: Dict[str, float] = {}  # key -> 아직 기록하지 않은 사용 시각
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS translation_memory (
+                key TEXT PRIMARY KEY,
+                translation TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_translation_memory_last_used "
+            "ON translation_memory (last_used)"
+        )
+        self._conn.commit()
+
+    async def get_many(self, texts: List[str], target_language: str) -> List[Optional[str]]:
+        """
+        여러 원문의 번역 조회
+
+        Args:
+            texts: 자막 원문 목록
+            target_language: 번역 대상 언어
+
+        Returns:
+            list: 원문 순서대로 번역문 (없으면 None)
+        """
+        if not texts:
+            return []
+
+        keys = [memory_key(text, target_language) for text in texts]
+        found = await asyncio.to_thread(self._get_many_sync, keys)
+
+        results = [found.get(key) for key in keys]
+        self.stats_counter.lookups += len(keys)
+        self.stats_counter.hits += sum(1 for result in results if result is not None)
+        return results
+
+    def _get_many_sync(self, keys: List[str]) -> Dict[str, str]:
+        found: Dict[str, str] = {}
+
+        with self._lock:
+            unique = list(dict.fromkeys(keys))
+            # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for i in range(0, len(unique), 500):
+                chunk = unique[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT key, translation FROM translation_memory "
+                    f"WHERE key IN ({placeholders})",
+                    chunk
+                ).fetchall()
+                found.update(rows)
+
+            if found:
+                now = time.time()
+                self._touched.update(dict.fromkeys(found, now))
+                if len(self._touched) >= self.touch_batch:
+                    self._flush_touched()
+                    self._conn.commit()
+
+        return found
+
+    async def put_many(self, pairs: Iterable[Tuple[str, str]], target_language: str):
+        """
+        번역 결과 저장
+
+        Args:
+            pairs: (원문, 번역문) 목록
+            target_language: 번역 대상 언어
+        """
+        now = time.time()
+        rows = [
+            (memory_key(text, target_language), translation, now)
+            for text, translation in pairs
+        ]
+        if rows:
+            await asyncio.to_thread(self._put_many_sync, rows)
+
+    def _put_many_sync(self, rows: List[Tuple[str, str, float]]):
+        with self._lock:
+            self._flush_touched()
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO translation_memory (key, translation, last_used) "
+                "VALUES (?, ?, ?)",
+                rows
+            )
+            self.stats_counter.writes += len(rows)
+            self._evict()
+            self._conn.commit()
+
+    def _flush_touched(self):
+        """모아 둔 사용 시각 기록 (락 안에서 호출, 커밋은 호출한 쪽에서)"""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE translation_memory SET last_used = ? WHERE key = ?",
+            [(used, key) for key, used in self._touched.items()]
+        )
+        self._touched = {}
+
+    def _evict(self):
+        """최대 항목 수를 넘으면 가장 오래 사용하지 않은 항목 제거 (락 안에서 호출)"""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM translation_memory").fetchone()
+        overflow = count - self.max_entries
+        if overflow <= 0:
+            return
+
+        self._conn.execute(
+            """
+            DELETE FROM translation_memory WHERE key IN (
+                SELECT key FROM translation_memory ORDER BY last_used LIMIT ?
+            )
+            """,
+            (overflow,)
+        )
+        self.stats_counter.evictions += overflow
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM translation_memory").fetchone()
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """번역 메모리 통계 반환"""
+        stats = self.stats_counter.as_dict()
+        stats.update({
+            "backend": self.backend,
+            "entries": len(self),
+            "max_entries": self.max_entries,
+        })
+        return stats
+
+    async def aclose(self):
+        """남은 사용 시각을 기록하고 닫기 (서버 종료 시)"""
+        await asyncio.to_thread(self._close_sync)
+
+    def _close_sync(self):
+        with self._lock:
+            self._flush_touched()
+            self._conn.commit()
+            self._conn.close()
+
+
+class RedisTranslationMemory:
+    """
+    Redis 기반 번역 메모리
+
+    항목마다 TTL을 두고 조회될 때마다 연장하므로 자주 쓰이는 문장만 남습니다.
+    메모리 한도에 이르면 Redis의 maxmemory-policy(allkeys-lru 권장)가 제거합니다.
+    """
+
+    backend = "redis"
+    PREFIX = "yt_translation:tm:"
+
+    def __init__(self, redis_client: Any, ttl: int = 30 * 86400):
+        """
+        Args:
+            redis_client: 비동기 Redis 클라이언트 (redis.asyncio, decode_responses=True)
+            ttl: 항목 보관 시간 (초) - 조회 시 연장
+        """
+        self.redis = redis_client
+        self.ttl = ttl
+        self.stats_counter = TranslationMemoryStats()
+
+    async def get_many(self, texts: List[str], target_language: str) -> List[Optional[str]]:
+        """
+        여러 원문의 번역 조회 (MGET 한 번)
+
+        Args:
+            texts: 자막 원문 목록
+            target_language: 번역 대상 언어
+
+        Returns:
+            list: 원문 순서대로 번역문 (없으면 None)
+        """
+        if not texts:
+            return []
+
+        keys = [f"{self.PREFIX}{memory_key(text, target_language)}" for text in texts]
+        results = await self.redis.mget(keys)
+
+        # 적중한 항목은 TTL 연장 (자주 쓰이는 문장 유지)
+        hit_keys = {key for key, result in zip(keys, results) if result is not None}
+        if hit_keys:
+            pipe = self.redis.pipeline(transaction=False)
+            for key in hit_keys:
+                pipe.expire(key, self.ttl)
+            await pipe.execute()
+
+        self.stats_counter.lookups += len(keys)
+        self.stats_counter.hits += sum(1 for result in results if result is not None)
+        return results
+
+    async def put_many(self, pairs: Iterable[Tuple[str, str]], target_language: str):
+        """
+        번역 결과 저장 (파이프라인 한 번)
+
+        Args:
+            pairs: (원문, 번역문) 목록
+            target_language: 번역 대상 언어
+        """
+        pipe = self.redis.pipeline(transaction=False)
+        count = 0
+        for text, translation in pairs:
+            pipe.setex(f"{self.PREFIX}{memory_key(text, target_language)}", self.ttl, translation)
+            count += 1
+
+        if count:
+            await pipe.execute()
+            self.stats_counter.writes += count
+
+    def stats(self) -> Dict[str, Any]:
+        """번역 메모리 통계 반환"""
+        stats = self.stats_counter.as_dict()
+        stats["backend"] = self.backend
+        return stats
+
+    async def aclose(self):
+        """Redis 연결 풀 닫기 (서버 종료 시)"""
+        await close_async_redis_client(self.redis)
+
+
+def create_translation_memory() -> Optional[Any]:
+    """
+    설정에 맞는 번역 메모리 생성
+
+    REDIS_URL이 있으면 Redis, 없으면 SQLite 파일을 사용합니다.
+
+    Returns:
+        번역 메모리 또는 None (TRANSLATION_MEMORY_ENABLED=False이거나 초기화 실패)
+    """
+    if not settings.TRANSLATION_MEMORY_ENABLED:
+        return None
+
+    redis_client = build_async_redis_client(decode_responses=True)
+    if redis_client is not None:
+        logger.info("✅ 번역 메모리 - Redis")
+        return RedisTranslationMemory(redis_client, ttl=settings.TRANSLATION_MEMORY_TTL)
+
+    path = settings.TRANSLATION_MEMORY_PATH
+    if path != ":memory:" and not os.path.isabs(path):
+        path = str(settings.BASE_DIR / path)
+
+    try:
+        memory = SQLiteTranslationMemory(path, max_entries=settings.TRANSLATION_MEMORY_MAX_ENTRIES)
+    except Exception as e:
+        logger.warning(f"번역 메모리 초기화 실패 - 사용하지 않음: {e}")
+        return None
+
+    logger.info(f"✅ 번역 메모리 - SQLite ({path})")
+    return memory
@@ -5,23 +5,66 @@ Gemini API를 사용하여 YouTube 영상을 번역합니다.
 이 모듈은 전체 애플리케이션의 핵심입니다!
 """
 
-import google.generativeai as genai
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, AsyncIterator, List, Tuple
 import re
 import time
 import hashlib
 import json
 from datetime import datetime
 import asyncio
+from contextlib import aclosing
 from functools import lru_cache
 import logging
 
 from app.config import settings
 from app.models import TranslateResponse, TranslationStatus
+from app.services.cache import MemoryCache, TieredCache
+from app.services.codec import create_cache_codec
+from app.services.redis_pool import close_async_redis_client, create_async_redis_client
+from app.services.response_cache import EncodedResponse, encode_response
+from app.services.singleflight import SingleFlight, RedisSingleFlight
+from app.services.transcript import (
+    TranscriptUnavailableError,
+    VideoUnavailableError,
+    batch_segments,
+    estimate_tokens,
+    fetch_transcript,
+)
+from app.services.rate_limiter import create_gemini_scheduler, priority_lane
+from app.services.gemini_client import GeminiAPIError, GeminiClient
+from app.services.translation_memory import create_translation_memory
+from app.services.store import create_translation_store
+from app.services.response_parser import TranslationResponseParser, count_words
+from app.services.warmer import AccessCounter
+from app.services.metrics import (
+    CACHE_LOOKUP_DURATION, CACHE_REQUESTS, PARSE_DURATION, RETRIES, TRANSLATE_DURATION,
+    TRANSLATIONS_IN_FLIGHT, gemini_call, observe_duration, track_in_flight
+)
+from app.services.timing import record_stage, span
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 프롬프트 버전 - 프롬프트 형식이 바뀌면 올려서 이전 캐시와 구분합니다
+PROMPT_VERSION = "2"
+
+# 캐시 항목에만 붙는 필드 (조회 시 제거되어 응답에는 나가지 않음)
+CACHED_AT_FIELD = "_cached_at"  # 캐시에 넣은 시각 (soft TTL 판단)
+NEGATIVE_FIELD = "_negative"    # 실패 결과 항목 (NEGATIVE_CACHE_TTL 동안 유지)
+
+# 자막이 없는 영상 표시 (NEGATIVE_CACHE_TTL 동안 자막 조회를 건너뛰고 URL 프롬프트로 번역)
+NO_TRANSCRIPT_KEY_PREFIX = "yt_transcript:none:"
+
+# 번역 대상 언어 이름 (프롬프트용)
+LANGUAGE_NAMES = {
+    "en": "영어",
+    "ko": "한국어",
+    "ja": "일본어",
+    "zh": "중국어",
+    "es": "스페인어",
+    "fr": "프랑스어",
+}
+
 
 class TranslatorService:
     """
@@ -37,34 +80,152 @@ class TranslatorService:
         if not settings.GEMINI_API_KEY:
             raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다!")
         
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        
-        # 모델 초기화
-        self.model = genai.GenerativeModel(
-            settings.GEMINI_MODEL,
-            generation_config=genai.GenerationConfig(
-                temperature=settings.GEMINI_TEMPERATURE,
-                max_output_tokens=settings.GEMINI_MAX_OUTPUT_TOKENS,
-            )
+        # Gemini 클라이언트 (연결을 재사용하는 비동기 REST 클라이언트)
+        self.gemini = GeminiClient(
+            api_key=settings.GEMINI_API_KEY,
+            model=settings.GEMINI_MODEL,
+            base_url=settings.GEMINI_API_BASE_URL,
+            generation_config={
+                "temperature": settings.GEMINI_TEMPERATURE,
+                "maxOutputTokens": settings.GEMINI_MAX_OUTPUT_TOKENS,
+            },
+            timeout=settings.GEMINI_TIMEOUT,
+            connect_timeout=settings.GEMINI_CONNECT_TIMEOUT,
+            max_connections=settings.GEMINI_MAX_CONNECTIONS,
+            http2=settings.GEMINI_HTTP2
         )
         
-        # 캐시 초기화 (Redis 또는 메모리)
+        # 캐시 초기화 (메모리 - Redis L2는 start()에서 연결)
+        self.redis = None
         self.cache = self._initialize_cache()
         
+        # 인코딩된 응답 본문 캐시 (캐시 적중 빠른 경로, 워커별)
+        self.response_cache = None
+        if settings.CACHE_ENABLED and settings.RESPONSE_CACHE_ENABLED:
+            self.response_cache = MemoryCache(
+                max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+                max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+                default_ttl=settings.RESPONSE_CACHE_TTL
+            )
+        
+        # 캐시 뒤의 영구 저장소 (DATABASE_URL - Postgres 또는 SQLite)
+        self.store = create_translation_store()
+        
+        # 캐시 키 통계 (정규화 키 도입 효과 측정용)
+        self.cache_key_stats = {
+            "lookups": 0,
+            "hits": 0,
+            "legacy_hits": 0,      # 예전 URL 해시 키에서 찾아 옮긴 횟수
+            "normalized_hits": 0,  # URL이 달라 예전 방식이면 미스였을 적중
+            "store_hits": 0,       # 캐시에 없어 영구 저장소에서 찾은 횟수
+        }
+        
+        # stale-while-revalidate / 실패 캐시 통계
+        self.revalidation_stats = {
+            "stale_hits": 0,        # soft TTL이 지난 결과를 바로 반환한 횟수
+            "refreshes": 0,         # 백그라운드 갱신 시작 횟수
+            "refresh_failures": 0,  # 갱신 실패 (기존 결과를 hard TTL까지 계속 사용)
+            "negative_hits": 0,     # 캐시된 실패로 Gemini 호출을 건너뛴 횟수
+            "negative_saves": 0,    # 실패 결과를 캐시한 횟수
+            "no_transcript_hits": 0,   # 자막 없음 표시로 자막 조회를 건너뛴 횟수
+            "no_transcript_saves": 0,  # 자막 없음을 캐시한 횟수
+        }
+        self._refreshing: Dict[str, "asyncio.Task[None]"] = {}
+        
+        # 영상별 요청 빈도 (캐시 워머가 인기 영상을 고를 때 사용)
+        self.access_counter = AccessCounter()
+        
+        # 같은 영상의 동시 번역 요청 합치기 (워커 내부 + start() 후 선택적으로 Redis 락)
+        self._inflight = SingleFlight()
+        self._distributed_inflight = None
+        
+        # 모든 Gemini 호출이 함께 쓰는 속도 제한 스케줄러 (RPM/TPM, 우선순위, 백오프)
+        self.scheduler = create_gemini_scheduler()
+        
+        # 자막 세그먼트 번역 메모리 (여러 영상의 반복 문장 재사용)
+        self.translation_memory = create_translation_memory()
+        
+        # 스트리밍 통계 (첫 바이트까지 걸린 시간)
+        self.stream_stats = {
+            "streams": 0,
+            "cache_hits": 0,
+            "ttfb_count": 0,
+            "ttfb_total": 0.0,
+            "ttfb_last": None,
+        }
+        
         logger.info(f"✅ 번역 서비스 초기화 완료 - 모델: {settings.GEMINI_MODEL}")
     
-    def _initialize_cache(self) -> Optional[Any]:
-        """캐시 초기화 - Redis 사용 가능하면 Redis, 아니면 메모리 캐시"""
+    def _initialize_cache(self) -> Optional[TieredCache]:
+        """
+        캐시 초기화
+        
+        크기 제한이 있는 메모리 캐시로 시작하고,
+        start()에서 Redis에 연결되면 L1 메모리 + L2 Redis 2단계 캐시로 바꿉니다.
+        """
         if not settings.CACHE_ENABLED:
             return None
             
-        redis_client = settings.get_redis_client()
-        if redis_client:
-            logger.info("📦 Redis 캐시 사용")
-            return redis_client
-        else:
-            logger.info("💾 메모리 캐시 사용")
-            return {}  # 간단한 딕셔너리 캐시
+        # codec은 start()에서 L2를 붙이면 L2 경계에서 사용 (예전 JSON 항목도 읽을 수 있음)
+        logger.info("💾 메모리 캐시 사용")
+        return TieredCache(
+            l1=MemoryCache(
+                max_entries=settings.MEMORY_CACHE_MAX_ENTRIES,
+                max_bytes=settings.MEMORY_CACHE_MAX_BYTES,
+                default_ttl=settings.CACHE_TTL
+            ),
+            codec=create_cache_codec()
+        )
+    
+    async def start(self):
+        """
+        Redis 연결 (서버 시작 시 lifespan에서 호출)
+        
+        REDIS_URL이 있고 연결되면 비동기 연결 풀을 만들고 클러스터 공용 Gemini 속도 제한 버킷,
+        L1 메모리 + L2 Redis 2단계 캐시와 분산 single-flight에 연결합니다.
+        연결에 실패하면 워커별 버킷과 메모리 캐시를 그대로 씁니다.
+        """
+        if self.redis is not None:
+            return
+        
+        self.redis = await create_async_redis_client(decode_responses=False)
+        if self.redis is None:
+            return
+        
+        self.scheduler.use_redis(self.redis)
+        if self.cache is None:
+            return
+        
+        logger.info("📦 L1 메모리 + L2 Redis 캐시 사용")
+        self.cache = TieredCache(
+            l1=MemoryCache(
+                max_entries=settings.CACHE_L1_MAX_ENTRIES,
+                max_bytes=settings.CACHE_L1_MAX_BYTES,
+                default_ttl=settings.CACHE_L1_TTL
+            ),
+            l2=self.redis,
+            l1_ttl=settings.CACHE_L1_TTL,
+            codec=self.cache.codec
+        )
+        if settings.CACHE_INVALIDATION_ENABLED:
+            await self.cache.start_invalidation_listener()
+        self._distributed_inflight = self._initialize_distributed_inflight()
+    
+    def _initialize_distributed_inflight(self) -> Optional[RedisSingleFlight]:
+        """분산 single-flight 초기화 - Redis 캐시와 설정이 모두 있을 때만 사용"""
+        if not settings.SINGLEFLIGHT_DISTRIBUTED:
+            return None
+        
+        if self.cache is None or self.cache.l2 is None:
+            logger.warning("SINGLEFLIGHT_DISTRIBUTED 설정에는 Redis가 필요합니다 - 워커 내부 합치기만 사용")
+            return None
+        
+        logger.info("🔒 Redis 락 기반 분산 중복 요청 합치기 사용")
+        return RedisSingleFlight(
+            self.cache.l2,
+            lock_ttl=settings.SINGLEFLIGHT_LOCK_TTL,
+            wait_timeout=settings.SINGLEFLIGHT_WAIT_TIMEOUT
+        )
     
     @staticmethod
     def is_valid_youtube_url(url: str) -> bool:
@@ -109,102 +270,553 @@ class TranslatorService:
         
         return None
     
-    def _generate_cache_key(self, url: str) -> str:
+    def _generate_cache_key(self, url: str, target_language: Optional[str] = None) -> str:
         """
         URL로부터 캐시 키 생성
         
+        같은 영상을 가리키는 URL(youtu.be, watch?v=...&t=30, m.youtube.com,
+        embed 등)은 모두 같은 키를 갖도록 비디오 ID를 기준으로 만듭니다.
+        번역 결과에 영향을 주는 대상 언어, 프롬프트 버전, 모델명도 포함합니다.
+        
         Args:
             url: YouTube URL
+            target_language: 번역 대상 언어 (기본값: DEFAULT_TARGET_LANGUAGE)
             
         Returns:
             str: 캐시 키
         """
-        # URL을 해시하여 캐시 키 생성
+        video_id = self.extract_video_id(url)
+        if not video_id:
+            # 비디오 ID를 찾을 수 없으면 URL 해시로 대체
+            return self._legacy_cache_key(url)
+        
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        return f"yt_translation:v2:{video_id}:{language}:{PROMPT_VERSION}:{settings.GEMINI_MODEL}"
+    
+    @staticmethod
+    def _legacy_cache_key(url: str) -> str:
+        """예전 방식의 캐시 키 (URL 문자열 MD5 해시)"""
         return f"yt_translation:{hashlib.md5(url.encode()).hexdigest()}"
     
-    async def _get_from_cache(self, url: str) -> Optional[Dict[str, Any]]:
+    async def _get_from_cache(
+        self,
+        url: str,
+        target_language: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         캐시에서 번역 결과 조회
         
+        정규화 키에 없으면 예전 URL 해시 키도 확인하고,
+        찾으면 정규화 키로 옮겨 저장합니다 (한국어 결과만 해당).
+        캐시에 없으면 영구 저장소(L3)에서 찾아 캐시를 다시 채웁니다.
+        
+        CACHE_SOFT_TTL이 지난 결과는 그대로 반환하고 백그라운드에서 다시 번역합니다.
+        캐시된 실패 항목이면 Gemini를 다시 부르지 않고 같은 오류를 냅니다.
+        
         Args:
             url: YouTube URL
+            target_language: 번역 대상 언어
             
         Returns:
             dict: 캐시된 번역 결과 또는 None
+            
+        Raises:
+            ValueError: 캐시된 실패 결과 (NEGATIVE_CACHE_TTL 이내)
+        """
+        if self.cache is None and self.store is None:
+            return None
+        
+        with observe_duration(CACHE_LOOKUP_DURATION):
+            cached = await self._lookup_cache_tiers(url, target_language)
+        
+        return self._resolve_cached(url, target_language, cached)
+    
+    def _resolve_cached(
+        self,
+        url: str,
+        target_language: Optional[str],
+        cached: Optional[Dict[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목의 메타데이터 처리 (실패 항목, soft TTL)
+        
+        Raises:
+            ValueError: 캐시된 실패 결과
         """
-        if not self.cache:
+        if cached is None:
             return None
         
-        cache_key = self._generate_cache_key(url)
+        # 캐시는 조회마다 복사본(L1 얕은 복사, L2 디코딩)을 돌려주므로 메타데이터 필드를 바로 제거해도 됨
+        if cached.pop(NEGATIVE_FIELD, False):
+            self.revalidation_stats["negative_hits"] += 1
+            raise ValueError(cached.get("error_message") or "번역할 수 없는 영상입니다.")
+        
+        cached_at = cached.pop(CACHED_AT_FIELD, None)
+        if (
+            cached_at is not None
+            and settings.CACHE_SOFT_TTL
+            and time.time() - cached_at > settings.CACHE_SOFT_TTL
+        ):
+            self.revalidation_stats["stale_hits"] += 1
+            self._schedule_refresh(url, target_language)
+        
+        return cached
+    
+    async def _lookup_cache_tiers(
+        self,
+        url: str,
+        target_language: Optional[str]
+    ) -> Optional[Dict[str, Any]]:
+        """L1 → L2 → 예전 키 → 저장소(L3) 순서로 조회 (_get_from_cache 참고)"""
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        cache_key = self._generate_cache_key(url, language)
+        self.cache_key_stats["lookups"] += 1
         
         try:
-            if isinstance(self.cache, dict):
-                # 메모리 캐시
-                return self.cache.get(cache_key)
-            else:
-                # Redis 캐시
-                cached = self.cache.get(cache_key)
-                if cached:
-                    return json.loads(cached)
+            cached = None
+            if self.cache is not None:
+                # L1 → L2 순서로 조회 (L2 적중 시 L1 승격)
+                cached = await self.cache.get(cache_key)
+                
+                # 예전 키는 항상 한국어 프롬프트로 만들어졌음
+                legacy_key = self._legacy_cache_key(url)
+                if cached is None and language == "ko" and legacy_key != cache_key:
+                    cached = await self.cache.get(legacy_key)
+                    if cached is not None:
+                        self.cache_key_stats["legacy_hits"] += 1
+                        await self.cache.set(cache_key, cached, ttl=settings.CACHE_TTL)
+                        logger.info(f"🔁 예전 캐시 키 이전: {legacy_key} → {cache_key}")
+            
+            # L3 - 재시작이나 캐시 제거 후에도 Gemini를 다시 부르지 않도록
+            if cached is None and self.store is not None:
+                cached = await self.store.get(cache_key)
+                CACHE_REQUESTS.labels("store", "miss" if cached is None else "hit").inc()
+                if cached is not None:
+                    self.cache_key_stats["store_hits"] += 1
+                    cached = self._restored_entry(cached)
+                    if self.cache is not None:
+                        await self.cache.set(cache_key, cached, ttl=settings.CACHE_TTL)
+                    logger.info(f"🗄️ 저장소에서 결과 복원: {cache_key}")
+            
+            if cached is not None:
+                self.cache_key_stats["hits"] += 1
+                if cached.get("youtube_url") != url:
+                    self.cache_key_stats["normalized_hits"] += 1
+            
+            return cached
         except Exception as e:
             logger.error(f"캐시 조회 실패: {e}")
         
         return None
     
-    async def _save_to_cache(self, url: str, data: Dict[str, Any]):
+    async def _get_many_from_cache(
+        self,
+        urls: List[str],
+        target_language: Optional[str] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        여러 영상의 캐시 항목을 한 번에 조회 (일괄 번역용)
+        
+        _lookup_cache_tiers와 같은 순서(L1 → L2 → 예전 키 → 저장소)지만
+        L1에 없는 키는 예전 키까지 묶어 MGET 한 번으로 조회하고,
+        다시 채울 항목은 파이프라인 한 번으로 저장합니다.
+        결과의 메타데이터(실패 항목, soft TTL)는 _resolve_cached로 처리해야 합니다.
+        
+        Args:
+            urls: 유효한 YouTube URL 목록
+            target_language: 번역 대상 언어
+            
+        Returns:
+            list: urls 순서대로 캐시 항목 (없으면 None, 같은 영상이어도 각각 다른 dict)
+        """
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        keys = [self._generate_cache_key(url, language) for url in urls]
+        self.cache_key_stats["lookups"] += len(urls)
+        
+        found: Dict[str, Dict[str, Any]] = {}
+        try:
+            if self.cache is not None:
+                # 예전 키는 항상 한국어 프롬프트로 만들어졌음
+                legacy_keys = {}
+                if language == "ko":
+                    for url, key in zip(urls, keys):
+                        legacy_key = self._legacy_cache_key(url)
+                        if legacy_key != key:
+                            legacy_keys[legacy_key] = key
+                
+                found = await self.cache.get_many(keys + list(legacy_keys))
+                migrated = {}
+                for legacy_key, key in legacy_keys.items():
+                    if key not in found and legacy_key in found:
+                        found[key] = migrated[key] = found[legacy_key]
+                        self.cache_key_stats["legacy_hits"] += 1
+                if migrated:
+                    await self.cache.set_many(migrated, ttl=settings.CACHE_TTL)
+                    logger.info(f"🔁 예전 캐시 키 이전: {len(migrated)}개")
+            
+            # L3 - 캐시에 없는 영상만 (동시에 조회)
+            missing = [key for key in dict.fromkeys(keys) if key not in found]
+            if missing and self.store is not None:
+                restored = await asyncio.gather(*(self.store.get(key) for key in missing))
+                refill = {}
+                for key, cached in zip(missing, restored):
+                    CACHE_REQUESTS.labels("store", "miss" if cached is None else "hit").inc()
+                    if cached is not None:
+                        self.cache_key_stats["store_hits"] += 1
+                        found[key] = refill[key] = self._restored_entry(cached)
+                if refill and self.cache is not None:
+                    await self.cache.set_many(refill, ttl=settings.CACHE_TTL)
+                    logger.info(f"🗄️ 저장소에서 결과 복원: {len(refill)}개")
+        except Exception as e:
+            logger.error(f"캐시 일괄 조회 실패: {e}")
+        
+        results = []
+        for url, key in zip(urls, keys):
+            cached = found.get(key)
+            if cached is not None:
+                self.cache_key_stats["hits"] += 1
+                if cached.get("youtube_url") != url:
+                    self.cache_key_stats["normalized_hits"] += 1
+                cached = dict(cached)  # 같은 영상이 여러 번 있어도 메타데이터는 각각 처리
+            results.append(cached)
+        
+        return results
+    
+    async def get_cached_response(
+        self,
+        youtube_url: str,
+        target_language: Optional[str] = None
+    ) -> Optional[EncodedResponse]:
+        """
+        캐시 적중 시 인코딩된 응답 본문 반환 (API 빠른 경로)
+        
+        워커별 응답 본문 캐시에 있으면 그 바이트를 그대로 돌려주고,
+        없으면 일반 캐시(L1 → L2 → 저장소)에서 찾아 한 번만 인코딩한 뒤 보관합니다.
+        응답 모델 검증과 직렬화는 워커마다 항목당 한 번만 일어납니다.
+        None이면 모든 캐시 계층을 이미 확인한 것이므로, 이어서 번역할 때는
+        translate(..., cache_checked=True)로 같은 조회를 반복하지 않습니다.
+        
+        본문 캐시는 RESPONSE_CACHE_TTL(L1과 같은 5분)까지만 보관하므로
+        soft TTL 확인과 다른 워커의 갱신은 그 안에 반영됩니다.
+        
+        Args:
+            youtube_url: YouTube URL
+            target_language: 번역 대상 언어
+            
+        Returns:
+            EncodedResponse: (JSON 본문, ETag) 또는 None (캐시 미스, 잘못된 URL)
+            
+        Raises:
+            ValueError: 캐시된 실패 결과
+        """
+        if not self.is_valid_youtube_url(youtube_url):
+            return None
+        
+        start_time = time.time()
+        cache_key = self._generate_cache_key(youtube_url, target_language)
+        encoded = self.response_cache.get(cache_key) if self.response_cache is not None else None
+        if encoded is None:
+            cached = await self._get_from_cache(youtube_url, target_language)
+            if not cached:
+                return None
+            with span("encode"):
+                encoded = encode_response(TranslateResponse(**cached))
+            if self.response_cache is not None:
+                self.response_cache.set(cache_key, encoded)
+        
+        self._record_access(youtube_url, target_language)
+        TRANSLATE_DURATION.labels("cache_hit").observe(time.time() - start_time)
+        return encoded
+    
+    async def _save_to_cache(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        target_language: Optional[str] = None
+    ):
         """
         번역 결과를 캐시에 저장
         
         Args:
             url: YouTube URL
             data: 저장할 데이터
+            target_language: 번역 대상 언어
         """
-        if not self.cache:
-            return
+        cache_key = self._generate_cache_key(url, target_language)
         
-        cache_key = self._generate_cache_key(url)
+        # 이전 결과로 인코딩해 둔 응답 본문은 버림
+        if self.response_cache is not None:
+            self.response_cache.delete(cache_key)
         
-        try:
-            if isinstance(self.cache, dict):
-                # 메모리 캐시
-                self.cache[cache_key] = data
-            else:
-                # Redis 캐시 (TTL 설정)
-                self.cache.setex(
+        if self.store is not None:
+            # 요청을 막지 않고 모아서 기록 (캐시가 비어도 다시 읽을 수 있도록)
+            language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+            try:
+                # 번역 시각도 함께 저장 - 복원한 결과의 soft TTL을 이어서 판단
+                await self.store.save(
                     cache_key,
-                    settings.CACHE_TTL,
-                    json.dumps(data, ensure_ascii=False, default=str)
+                    self.extract_video_id(url) or "",
+                    language,
+                    {**data, CACHED_AT_FIELD: time.time()}
                 )
+            except Exception as e:
+                logger.error(f"저장소 기록 예약 실패: {e}")
+        
+        if self.cache is None:
+            return
+        
+        try:
+            # L2(Redis)와 L1(메모리)에 함께 저장
+            await self._cache_set(cache_key, data)
             
             logger.info(f"✅ 캐시 저장 완료: {cache_key}")
         except Exception as e:
             logger.error(f"캐시 저장 실패: {e}")
     
-    def _create_translation_prompt(self, url: str) -> str:
+    async def _cache_set(self, cache_key: str, data: Dict[str, Any], ttl: Optional[int] = None):
+        """
+        저장 시각을 붙여 캐시에 저장
+        
+        항목은 CACHE_TTL(hard TTL)이 지나야 사라지고,
+        저장 시각은 CACHE_SOFT_TTL이 지났는지 판단하는 데 씁니다.
+        
+        Args:
+            cache_key: 캐시 키
+            data: 저장할 데이터 (원본은 바꾸지 않음)
+            ttl: 만료 시간 (초, 기본값: CACHE_TTL)
+        """
+        await self.cache.set(
+            cache_key, {**data, CACHED_AT_FIELD: time.time()}, ttl=ttl or settings.CACHE_TTL
+        )
+    
+    @staticmethod
+    def _restored_entry(stored: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        저장소(L3)에서 읽은 결과를 캐시 항목으로
+        
+        저장할 때의 번역 시각(_cached_at)을 그대로 두어, 오래된 결과는 복원 후에도
+        stale-while-revalidate로 갱신되게 합니다. 시각이 없는 예전 행은 바로 갱신 대상입니다.
+        """
+        return {CACHED_AT_FIELD: 0.0, **stored}
+    
+    @staticmethod
+    def _is_permanent_failure(error: Exception) -> bool:
+        """
+        다시 시도해도 같은 결과인 실패인지 확인
+        
+        YouTube에서 볼 수 없는 영상(비공개/삭제)과 잘못된 요청, 차단된 응답 등
+        Gemini 4xx 오류가 해당합니다.
+        사용량 초과(429), 시간 초과, 연결 오류, 5xx는 일시적인 실패로 봅니다.
+        API 키/권한 오류(401, 403, API 키에 관한 400)는 영상과 상관없는 설정 문제이므로
+        캐시하지 않습니다 - 키를 고치면 바로 번역되어야 합니다.
+        """
+        if isinstance(error, VideoUnavailableError):
+            return True
+        if not isinstance(error, GeminiAPIError) or error.status_code is None or error.is_quota:
+            return False
+        if error.status_code in (401, 403):
+            return False
+        message = str(error).lower()
+        if error.status_code == 400 and ("api key" in message or "api_key" in message):
+            return False
+        return 400 <= error.status_code < 500
+    
+    async def _save_negative(self, url: str, target_language: Optional[str], message: str):
+        """
+        실패 결과를 짧게 캐시 (NEGATIVE_CACHE_TTL)
+        
+        같은 영상을 계속 요청해도 그동안은 Gemini를 다시 부르지 않고 같은 오류를 돌려줍니다.
+        영구 저장소(L3)에는 기록하지 않습니다.
+        
+        Args:
+            url: YouTube URL
+            target_language: 번역 대상 언어
+            message: 요청자에게 돌려줄 오류 메시지
+        """
+        if self.cache is None or not settings.NEGATIVE_CACHE_TTL:
+            return
+        
+        cache_key = self._generate_cache_key(url, target_language)
+        if self.response_cache is not None:
+            self.response_cache.delete(cache_key)
+        try:
+            await self._cache_set(
+                cache_key,
+                {NEGATIVE_FIELD: True, "youtube_url": url, "error_message": message},
+                ttl=settings.NEGATIVE_CACHE_TTL
+            )
+            self.revalidation_stats["negative_saves"] += 1
+            logger.info(f"🚫 실패 결과 캐시 ({settings.NEGATIVE_CACHE_TTL}초): {cache_key}")
+        except Exception as e:
+            logger.error(f"실패 결과 캐시 저장 실패: {e}")
+    
+    def _schedule_refresh(self, url: str, target_language: Optional[str]):
+        """
+        soft TTL이 지난 결과를 백그라운드에서 다시 번역 (stale-while-revalidate)
+        
+        키마다 갱신은 하나만 실행하고, 같은 키의 번역이 이미 진행 중이면 건너뜁니다.
+        """
+        cache_key = self._generate_cache_key(url, target_language)
+        if cache_key in self._refreshing or self._inflight.in_flight(cache_key):
+            return
+        
+        task = asyncio.ensure_future(self._refresh(url, target_language, cache_key))
+        self._refreshing[cache_key] = task
+        task.add_done_callback(lambda _: self._refreshing.pop(cache_key, None))
+    
+    async def _refresh(self, url: str, target_language: Optional[str], cache_key: str):
+        """
+        백그라운드 갱신 - 실패해도 기존 결과는 hard TTL까지 그대로 사용
+        
+        batch 레인으로 호출하므로 사용자 요청의 Gemini 호출보다 뒤로 밀리고,
+        그 사이 같은 키로 들어온 요청은 진행 중인 갱신에 합류합니다.
+        """
+        self.revalidation_stats["refreshes"] += 1
+        logger.info(f"♻️ 오래된 캐시 갱신 시작: {cache_key}")
+        try:
+            with priority_lane("batch"):
+                await self._inflight.do(
+                    cache_key,
+                    lambda: self._translate_uncached(
+                        url, target_language, time.time(), cache_failure=False
+                    )
+                )
+        except Exception as e:
+            self.revalidation_stats["refresh_failures"] += 1
+            logger.warning(f"캐시 갱신 실패 - 기존 결과를 계속 사용: {cache_key} ({e})")
+    
+    def _record_access(self, url: str, target_language: Optional[str]):
+        """요청 빈도 기록 (캐시 워머용)"""
+        self.access_counter.record(
+            self.extract_video_id(url),
+            target_language or settings.DEFAULT_TARGET_LANGUAGE
+        )
+    
+    async def cache_state(self, url: str, target_language: Optional[str] = None) -> str:
+        """
+        캐시 워머용 캐시 상태 확인
+        
+        캐시에는 없고 영구 저장소에만 있으면 캐시로 복원합니다 (Gemini 호출 없음).
+        사용자 조회가 아니므로 적중률 통계와 stale-while-revalidate 갱신에는 반영하지 않습니다.
+        
+        Args:
+            url: YouTube URL
+            target_language: 번역 대상 언어
+            
+        Returns:
+            str: "fresh", "stale" (soft TTL 지남), "restored", "negative", "missing"
+        """
+        cache_key = self._generate_cache_key(url, target_language)
+        entry = await self.cache.get(cache_key) if self.cache is not None else None
+        
+        if entry is None and self.store is not None:
+            entry = await self.store.get(cache_key)
+            if entry is not None:
+                entry = self._restored_entry(entry)
+                if self.cache is not None:
+                    await self.cache.set(cache_key, entry, ttl=settings.CACHE_TTL)
+                    return "restored"
+        
+        if entry is None:
+            return "missing"
+        if entry.get(NEGATIVE_FIELD):
+            return "negative"
+        if time.time() - entry.get(CACHED_AT_FIELD, 0) >= settings.CACHE_SOFT_TTL:
+            return "stale"
+        return "fresh"
+    
+    async def warm(self, url: str, target_language: Optional[str] = None) -> bool:
+        """
+        캐시 워머의 미리 번역 / 갱신
+        
+        가장 낮은 background 레인으로 호출하므로 사용자 요청과 일괄 작업이 먼저 버킷을 씁니다.
+        사용자 요청이 background 레인 번역에 합류해 기다리지 않도록 single-flight에는
+        등록하지 않고, 같은 키가 이미 번역 중이면 건너뜁니다.
+        
+        Returns:
+            bool: 번역했으면 True, 이미 번역 중이라 건너뛰었으면 False
+            
+        Raises:
+            Exception: 번역 실패 (기존 캐시 결과는 그대로)
+        """
+        if self._inflight.in_flight(self._generate_cache_key(url, target_language)):
+            return False
+        
+        with priority_lane("background"):
+            await self._translate_uncached(url, target_language, time.time(), cache_failure=False)
+        return True
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계 조회
+        
+        Returns:
+            dict: 캐시 종류와 계층별 적중/미스/제거 통계, 캐시 키 적중률
+        """
+        if self.cache is None:
+            return {"backend": "disabled"}
+        
+        stats = self.cache.stats()
+        
+        # 정규화 키 적중률과, 예전 URL 해시 키였다면 나왔을 적중률 비교
+        key_stats = dict(self.cache_key_stats)
+        lookups = key_stats["lookups"]
+        url_key_hits = key_stats["hits"] - key_stats["normalized_hits"]
+        key_stats["hit_rate"] = key_stats["hits"] / lookups if lookups else 0.0
+        key_stats["url_key_hit_rate"] = url_key_hits / lookups if lookups else 0.0
+        stats["keys"] = key_stats
+        
+        # 중복 요청 합치기 통계
+        stats["singleflight"] = self._inflight.stats()
+        if self._distributed_inflight is not None:
+            stats["singleflight"]["distributed"] = self._distributed_inflight.stats()
+        
+        # 세그먼트 번역 메모리 통계
+        if self.translation_memory is not None:
+            stats["translation_memory"] = self.translation_memory.stats()
+        
+        # 영구 저장소(L3) 통계
+        if self.store is not None:
+            stats["store"] = self.store.stats()
+        
+        # 인코딩된 응답 본문 캐시 (빠른 경로) 통계
+        if self.response_cache is not None:
+            stats["response_cache"] = self.response_cache.stats()
+        
+        # stale-while-revalidate / 실패 캐시 통계
+        stats["revalidation"] = dict(self.revalidation_stats, refreshing=len(self._refreshing))
+        
+        return stats
+    
+    def _create_translation_prompt(self, url: str, target_language: Optional[str] = None) -> str:
         """
         번역 프롬프트 생성
         
         Args:
             url: YouTube URL
+            target_language: 번역 대상 언어 (기본값: DEFAULT_TARGET_LANGUAGE)
             
         Returns:
             str: Gemini API용 프롬프트
         """
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        language_name = LANGUAGE_NAMES.get(language, language)
+        
         prompt = f"""
-다음 YouTube 영상의 음성을 한국어로 번역해주세요.
+다음 YouTube 영상의 음성을 {language_name}로 번역해주세요.
 
 YouTube URL: {url}
 
 번역 요구사항:
 1. 영상의 전체 내용을 빠짐없이 번역해주세요.
-2. 문맥을 고려하여 자연스러운 한국어로 번역해주세요.
+2. 문맥을 고려하여 자연스러운 {language_name}로 번역해주세요.
 3. 전문 용어는 정확하게 번역하되, 필요시 영어를 병기해주세요. 예: 머신러닝(Machine Learning)
 4. 화자가 여러 명인 경우, [화자 1], [화자 2] 등으로 구분해주세요.
 5. 중요한 내용은 **굵게** 표시해주세요.
 6. 시간 표시가 가능한 경우 [00:00] 형식으로 표시해주세요.
 
 추가로 다음 정보도 포함해주세요:
-- 영상 제목 (한국어로 번역)
+- 영상 제목 ({language_name}로 번역)
 - 채널 이름
 - 영상 길이
 - 핵심 내용 3줄 요약
@@ -223,12 +835,19 @@ YouTube URL: {url}
 """
         return prompt
     
-    async def translate(self, youtube_url: str) -> TranslateResponse:
+    async def translate(
+        self,
+        youtube_url: str,
+        target_language: Optional[str] = None,
+        cache_checked: bool = False
+    ) -> TranslateResponse:
         """
         YouTube 영상 번역 - 메인 함수
         
         Args:
             youtube_url: 번역할 YouTube URL
+            target_language: 번역 대상 언어 (기본값: DEFAULT_TARGET_LANGUAGE)
+            cache_checked: get_cached_response()가 이미 캐시 미스를 확인한 경우 True
             
         Returns:
             TranslateResponse: 번역 결과
@@ -239,84 +858,735 @@ YouTube URL: {url}
         start_time = time.time()
         
         # 1. URL 유효성 검사
-        if not self.is_valid_youtube_url(youtube_url):
-            raise ValueError("유효하지 않은 YouTube URL입니다.")
+        with span("validate"):
+            if not self.is_valid_youtube_url(youtube_url):
+                raise ValueError("유효하지 않은 YouTube URL입니다.")
+        self._record_access(youtube_url, target_language)
         
-        # 2. 캐시 확인
-        cached_result = await self._get_from_cache(youtube_url)
+        # 2. 캐시 확인 (API 빠른 경로에서 이미 확인했으면 건너뜀)
+        cached_result = None
+        if not cache_checked:
+            with span("cache"):
+                cached_result = await self._get_from_cache(youtube_url, target_language)
         if cached_result:
             logger.info("✨ 캐시에서 결과 반환")
+            TRANSLATE_DURATION.labels("cache_hit").observe(time.time() - start_time)
             return TranslateResponse(**cached_result)
         
-        # 3. Gemini API로 번역 요청
+        # 3. Gemini API로 번역 요청 (같은 영상의 동시 요청은 한 번만 호출)
+        return await self._translate_miss(youtube_url, target_language, start_time)
+    
+    async def _translate_miss(
+        self,
+        youtube_url: str,
+        target_language: Optional[str],
+        start_time: float
+    ) -> TranslateResponse:
+        """
+        캐시 미스 번역 - 같은 영상의 동시 요청은 Gemini를 한 번만 호출
+        
+        translate()와, 캐시를 미리 한꺼번에 확인한 일괄 번역이 사용합니다.
+        
+        Raises:
+            ValueError: 번역 실패
+        """
+        cache_key = self._generate_cache_key(youtube_url, target_language)
         try:
-            logger.info(f"🔄 번역 시작: {youtube_url}")
+            parsed_result = await self._inflight.do(
+                cache_key,
+                lambda: self._translate_uncached(youtube_url, target_language, start_time)
+            )
+        except Exception:
+            TRANSLATE_DURATION.labels("error").observe(time.time() - start_time)
+            raise
+        
+        TRANSLATE_DURATION.labels("translated").observe(time.time() - start_time)
+        return TranslateResponse(**parsed_result)
+    
+    async def _translate_uncached(
+        self,
+        youtube_url: str,
+        target_language: Optional[str],
+        start_time: float,
+        cache_failure: bool = True,
+        chunks: Optional["asyncio.Queue[Optional[str]]"] = None
+    ) -> Dict[str, Any]:
+        """
+        캐시 미스 시 실제 번역 수행
+        
+        분산 락이 켜져 있으면 클러스터 전체에서 한 노드만 Gemini를 호출하고,
+        나머지 노드는 캐시에 결과가 생기기를 기다립니다.
+        
+        Args:
+            cache_failure: 다시 시도해도 같은 실패를 캐시할지 (백그라운드 갱신은 False)
+            chunks: URL 프롬프트 번역 시 Gemini 응답 조각을 넣을 큐 (translate_stream)
+        
+        Returns:
+            dict: 파싱된 번역 결과 (캐시에 저장된 것과 같음)
+        """
+        with track_in_flight(TRANSLATIONS_IN_FLIGHT):
+            if self._distributed_inflight is None:
+                return await self._run_translation(
+                    youtube_url, target_language, start_time, cache_failure, chunks
+                )
             
-            # 프롬프트 생성
-            prompt = self._create_translation_prompt(youtube_url)
+            return await self._distributed_inflight.do(
+                self._generate_cache_key(youtube_url, target_language),
+                lambda: self._run_translation(
+                    youtube_url, target_language, start_time, cache_failure, chunks
+                ),
+                check=lambda: self._get_from_cache(youtube_url, target_language)
+            )
+    
+    async def _run_translation(
+        self,
+        youtube_url: str,
+        target_language: Optional[str],
+        start_time: float,
+        cache_failure: bool = True,
+        chunks: Optional["asyncio.Queue[Optional[str]]"] = None
+    ) -> Dict[str, Any]:
+        """
+        Gemini API 호출 → 파싱 → 캐시 저장
+        
+        다시 시도해도 같은 실패(비공개 영상 등)는 cache_failure이면
+        NEGATIVE_CACHE_TTL 동안 캐시합니다.
+        chunks가 있으면 URL 프롬프트 번역을 스트리밍으로 호출하고 조각을 큐에 넣습니다.
+        
+        Returns:
+            dict: 파싱된 번역 결과
             
-            # API 호출 (속도 제한 고려)
-            response = await self._call_gemini_api(prompt)
+        Raises:
+            ValueError: 번역 실패
+        """
+        try:
+            logger.info(f"🔄 번역 시작: {youtube_url}")
             
-            # 응답 파싱
-            parsed_result = self._parse_translation_response(response, youtube_url)
+            # 1. 자막 가져오기 (자막이 있으면 자막 기반 번역)
+            video_id = self.extract_video_id(youtube_url)
+            segments = await self._fetch_segments(video_id)
+            
+            if segments:
+                parsed_result = await self._translate_transcript(
+                    youtube_url, video_id, segments, target_language
+                )
+            else:
+                # 2. 자막이 없는 영상은 기존 방식 (URL 프롬프트)
+                with span("prompt"):
+                    prompt = self._create_translation_prompt(youtube_url, target_language)
+                if chunks is None:
+                    response = await self._call_gemini_api(prompt)
+                    parsed_result = self._parse_translation_response(response, youtube_url)
+                else:
+                    parsed_result = await self._stream_prompt(prompt, youtube_url, chunks)
             
             # 처리 시간 추가
             parsed_result['processing_time'] = time.time() - start_time
             
             # 캐시에 저장
-            await self._save_to_cache(youtube_url, parsed_result)
+            await self._save_to_cache(youtube_url, parsed_result, target_language)
             
             logger.info(f"✅ 번역 완료 - 소요시간: {parsed_result['processing_time']:.2f}초")
             
-            return TranslateResponse(**parsed_result)
+            return parsed_result
             
         except Exception as e:
             logger.error(f"번역 실패: {str(e)}")
-            raise ValueError(f"번역 처리 중 오류가 발생했습니다: {str(e)}")
+            message = f"번역 처리 중 오류가 발생했습니다: {str(e)}"
+            if cache_failure and self._is_permanent_failure(e):
+                await self._save_negative(youtube_url, target_language, message)
+            raise ValueError(message)
+    
+    async def _fetch_segments(self, video_id: str) -> List[Dict[str, Any]]:
+        """
+        번역할 자막 가져오기
+        
+        자막이 없는 영상은 NEGATIVE_CACHE_TTL 동안 표시해 두고 YouTube에 다시 묻지 않습니다.
+        자막을 가져오지 못하면 빈 목록을 반환합니다 (URL 프롬프트로 번역).
+        
+        Returns:
+            list: 자막 세그먼트 (없으면 빈 목록)
+            
+        Raises:
+            VideoUnavailableError: 비공개/삭제된 영상 - 번역할 수 없음
+        """
+        key = f"{NO_TRANSCRIPT_KEY_PREFIX}{video_id}"
+        if self.cache is not None:
+            try:
+                if await self.cache.get(key):
+                    self.revalidation_stats["no_transcript_hits"] += 1
+                    return []
+            except Exception as e:
+                logger.warning(f"자막 없음 표시 조회 실패: {e}")
+        
+        try:
+            with span("transcript"):
+                return await fetch_transcript(video_id)
+        except VideoUnavailableError:
+            raise
+        except TranscriptUnavailableError as e:
+            logger.info(f"자막 없음 - 영상 URL 프롬프트로 번역: {e}")
+            if self.cache is not None and settings.NEGATIVE_CACHE_TTL:
+                try:
+                    await self.cache.set(
+                        key, {NEGATIVE_FIELD: True}, ttl=settings.NEGATIVE_CACHE_TTL
+                    )
+                    self.revalidation_stats["no_transcript_saves"] += 1
+                except Exception as e:
+                    logger.warning(f"자막 없음 표시 저장 실패: {e}")
+        except ValueError as e:
+            logger.info(f"자막을 가져오지 못함 - 영상 URL 프롬프트로 번역: {e}")
+        return []
+    
+    async def translate_stream(
+        self,
+        youtube_url: str,
+        target_language: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        YouTube 영상 번역 - 스트리밍 버전
+        
+        Gemini가 생성하는 텍스트를 도착하는 대로 전달합니다.
+        마지막에는 전체 텍스트를 파싱한 결과를 캐시에 저장하고 함께 전달합니다.
+        
+        translate()와 같은 번역 경로와 single-flight 키를 씁니다. 그래서 자막 기반
+        번역이나 진행 중인 번역에 합류한 경우에는 chunk 없이 complete만 전달합니다.
+        
+        Args:
+            youtube_url: 번역할 YouTube URL
+            target_language: 번역 대상 언어
+            
+        Yields:
+            dict: 이벤트
+                - {"type": "chunk", "text": ...}: 번역 텍스트 조각
+                - {"type": "complete", "result": ..., "cached": bool, "ttfb": 초}: 최종 결과
+                - {"type": "error", "message": ...}: 오류
+        """
+        start_time = time.time()
+        self.stream_stats["streams"] += 1
+        
+        if not self.is_valid_youtube_url(youtube_url):
+            yield {"type": "error", "message": "유효하지 않은 YouTube URL입니다."}
+            return
+        self._record_access(youtube_url, target_language)
+        
+        # 캐시 적중 시 전체 결과를 바로 전달 (캐시된 실패는 오류로)
+        try:
+            cached_result = await self._get_from_cache(youtube_url, target_language)
+        except ValueError as e:
+            yield {"type": "error", "message": str(e)}
+            return
+        if cached_result:
+            self.stream_stats["cache_hits"] += 1
+            self._record_ttfb(time.time() - start_time)
+            yield {"type": "complete", "result": cached_result, "cached": True,
+                   "ttfb": time.time() - start_time}
+            return
+        
+        logger.info(f"🔄 스트리밍 번역 시작: {youtube_url}")
+        
+        # translate()와 같은 single-flight 키로 번역 - 같은 영상의 번역이 진행 중이면
+        # 그 결과를 기다리고, 이 요청이 번역하면 다른 요청들이 합류합니다.
+        # 자막이 있으면 자막 기반 번역, 없을 때만 URL 프롬프트를 스트리밍합니다.
+        chunks: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        flight = asyncio.ensure_future(self._inflight.do(
+            self._generate_cache_key(youtube_url, target_language),
+            lambda: self._translate_uncached(
+                youtube_url, target_language, start_time, chunks=chunks
+            )
+        ))
+        flight.add_done_callback(lambda _: chunks.put_nowait(None))
+        
+        ttfb = None
+        try:
+            while True:
+                text = await chunks.get()
+                if text is None:
+                    break
+                if ttfb is None:
+                    ttfb = time.time() - start_time
+                    self._record_ttfb(ttfb)
+                    logger.info(f"⚡ 첫 번역 조각 도착 - {ttfb:.2f}초")
+                yield {"type": "chunk", "text": text}
+            
+            try:
+                parsed_result = await flight
+            except Exception as e:
+                logger.error(f"스트리밍 번역 실패: {str(e)}")
+                yield {"type": "error", "message": str(e)}
+                return
+        finally:
+            # 클라이언트가 떠나면 합류한 다른 요청이 없을 때만 번역(Gemini 스트림) 취소
+            if not flight.done():
+                flight.cancel()
+        
+        if ttfb is None:
+            ttfb = time.time() - start_time
+            self._record_ttfb(ttfb)
+        
+        logger.info(f"✅ 스트리밍 번역 완료 - 소요시간: {time.time() - start_time:.2f}초")
+        yield {"type": "complete", "result": parsed_result, "cached": False, "ttfb": ttfb}
+    
+    def _record_ttfb(self, ttfb: float):
+        """스트리밍 첫 바이트 시간 기록"""
+        self.stream_stats["ttfb_count"] += 1
+        self.stream_stats["ttfb_total"] += ttfb
+        self.stream_stats["ttfb_last"] = ttfb
+    
+    def get_stream_stats(self) -> Dict[str, Any]:
+        """
+        스트리밍 통계 조회
+        
+        Returns:
+            dict: 스트림 수, 캐시 적중 수, 평균/최근 첫 바이트 시간 (초)
+        """
+        stats = dict(self.stream_stats)
+        ttfb_total = stats.pop("ttfb_total")
+        ttfb_count = stats.pop("ttfb_count")
+        stats["ttfb_avg"] = ttfb_total / ttfb_count if ttfb_count else None
+        return stats
+    
+    def _create_segment_prompt(
+        self,
+        texts: List[str],
+        target_language: Optional[str] = None
+    ) -> str:
+        """
+        자막 세그먼트 묶음 번역 프롬프트 생성
+        
+        입력과 출력 모두 [{"i": 번호, "t": 문장}] 형식의 JSON 배열을 사용해
+        응답을 줄 번호로 정확히 맞출 수 있게 합니다.
+        
+        Args:
+            texts: 번역할 자막 문장 목록
+            target_language: 번역 대상 언어
+            
+        Returns:
+            str: Gemini API용 프롬프트
+        """
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        language_name = LANGUAGE_NAMES.get(language, language)
+        items = json.dumps(
+            [{"i": i, "t": text} for i, text in enumerate(texts, 1)],
+            ensure_ascii=False
+        )
+        
+        return f"""
+다음은 YouTube 영상 자막의 연속된 줄입니다. 각 줄의 "t"를 자연스러운 {language_name}로 번역해주세요.
+
+요구사항:
+1. 입력과 같은 형식의 JSON 배열로만 답해주세요: [{{"i": 번호, "t": "번역"}}, ...]
+2. 모든 번호를 빠짐없이 포함하고, 줄을 합치거나 나누지 마세요.
+3. 앞뒤 줄의 문맥을 고려해주세요.
+4. 코드 블록이나 설명 없이 JSON만 출력해주세요.
+
+자막:
+{items}
+"""
+    
+    @staticmethod
+    def _parse_segment_response(response_text: str, texts: List[str]) -> Tuple[List[str], int]:
+        """
+        묶음 번역 JSON 응답 파싱
+        
+        Args:
+            response_text: Gemini 응답 텍스트 (코드 블록으로 감싸져 있어도 됨)
+            texts: 원문 목록
+            
+        Returns:
+            tuple: (번역문 목록 - 빠진 줄은 원문 유지, 빠진 줄 수)
+        """
+        translations = list(texts)
+        
+        try:
+            start = response_text.index("[")
+            end = response_text.rindex("]") + 1
+            items = json.loads(response_text[start:end])
+        except ValueError:
+            return translations, len(texts)
+        
+        found = set()
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            index, text = item.get("i"), item.get("t")
+            valid_index = isinstance(index, int) and 1 <= index <= len(texts)
+            if valid_index and isinstance(text, str) and text.strip():
+                translations[index - 1] = text.strip()
+                found.add(index)
+        
+        return translations, len(texts) - len(found)
+    
+    async def _translate_segment_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        target_language: Optional[str] = None
+    ) -> List[str]:
+        """
+        자막 세그먼트 묶음 하나를 번역
+        
+        JSON이 깨졌거나 줄이 빠진 응답은 SEGMENT_BATCH_RETRIES번까지 다시 요청합니다.
+        호출 실패는 _call_gemini_api()가 이미 백오프로 재시도했으므로 그대로 전달합니다.
+        
+        Args:
+            batch: 자막 세그먼트 목록
+            target_language: 번역 대상 언어
+            
+        Returns:
+            list: 세그먼트 순서대로의 번역문 (끝까지 응답에 없는 줄은 원문 유지)
+        """
+        texts = [segment["text"] for segment in batch]
+        prompt = self._create_segment_prompt(texts, target_language)
+        attempts = max(0, settings.SEGMENT_BATCH_RETRIES) + 1
+        translations = texts
+        
+        for attempt in range(attempts):
+            response = await self._call_gemini_api(prompt)
+            
+            with span("parse"), observe_duration(PARSE_DURATION.labels("segments")):
+                translations, missing = self._parse_segment_response(response, texts)
+            if not missing:
+                return translations
+            
+            logger.warning(f"묶음 응답에서 {missing}/{len(texts)}줄 누락 (시도 {attempt + 1}/{attempts})")
+            if attempt < attempts - 1:
+                RETRIES.labels("segment_batch").inc()
+        
+        return translations
+    
+    async def translate_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        target_language: Optional[str] = None
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        """
+        자막 세그먼트를 묶음 단위로 번역하여 순서대로 전달 (파이프라인)
+        
+        번역 메모리에 있는 세그먼트는 바로 채우고, 나머지만 토큰 예산
+        (SEGMENT_BATCH_MAX_TOKENS)에 맞춰 묶어 번역합니다.
+        여러 묶음을 동시에 번역하되 결과는 영상 순서대로 내보내므로
+        앞부분이 끝나는 즉시 재생을 시작할 수 있습니다.
+        
+        Args:
+            segments: [{"text", "start", "duration"}, ...]
+            target_language: 번역 대상 언어
+            
+        Yields:
+            tuple: (시작 인덱스, [{"start", "duration", "text", "translation", "from_memory"}, ...])
+        """
+        language = target_language or settings.DEFAULT_TARGET_LANGUAGE
+        texts = [segment["text"] for segment in segments]
+        
+        # 1. 번역 메모리 조회 - 적중한 세그먼트는 Gemini로 보내지 않음
+        translations = await self._lookup_translation_memory(texts, language)
+        from_memory = [translation is not None for translation in translations]
+        miss_indexes = [i for i, hit in enumerate(from_memory) if not hit]
+        
+        # 2. 미스만 묶어서 번역
+        batches = batch_segments(
+            [segments[i] for i in miss_indexes],
+            settings.SEGMENT_BATCH_SIZE,
+            settings.SEGMENT_BATCH_MAX_TOKENS
+        )
+        semaphore = asyncio.Semaphore(max(1, settings.SEGMENT_BATCH_CONCURRENCY))
+        
+        async def translate_batch(batch: List[Dict[str, Any]]) -> List[str]:
+            async with semaphore:
+                return await self._translate_segment_batch(batch, target_language)
+        
+        def build(start: int, end: int) -> List[Dict[str, Any]]:
+            return [
+                {
+                    "start": segments[i]["start"],
+                    "duration": segments[i]["duration"],
+                    "text": texts[i],
+                    "translation": translations[i],
+                    "from_memory": from_memory[i],
+                }
+                for i in range(start, end)
+            ]
+        
+        tasks = [asyncio.create_task(translate_batch(batch)) for batch in batches]
+        try:
+            offset = 0
+            position = 0
+            for batch, task in zip(batches, tasks):
+                batch_translations = await task
+                indexes = miss_indexes[position:position + len(batch)]
+                position += len(batch)
+                
+                for i, translation in zip(indexes, batch_translations):
+                    translations[i] = translation
+                await self._store_translation_memory(
+                    [texts[i] for i in indexes], batch_translations, language
+                )
+                
+                # 이 묶음의 마지막 세그먼트까지 (사이의 메모리 적중 포함) 전달
+                end = indexes[-1] + 1
+                yield offset, build(offset, end)
+                offset = end
+            
+            # 뒤쪽에 남은 메모리 적중 세그먼트
+            if offset < len(segments):
+                yield offset, build(offset, len(segments))
+        finally:
+            # 클라이언트 연결이 끊기거나 실패하면 남은 묶음 번역 취소
+            for task in tasks:
+                task.cancel()
+    
+    async def _lookup_translation_memory(
+        self,
+        texts: List[str],
+        language: str
+    ) -> List[Optional[str]]:
+        """
+        번역 메모리에서 세그먼트 번역 조회
+        
+        Returns:
+            list: 원문 순서대로 번역문 (없거나 조회 실패 시 None)
+        """
+        if self.translation_memory is None or not texts:
+            return [None] * len(texts)
+        
+        try:
+            return await self.translation_memory.get_many(texts, language)
+        except Exception as e:
+            logger.warning(f"번역 메모리 조회 실패: {e}")
+            return [None] * len(texts)
+    
+    async def _store_translation_memory(
+        self,
+        texts: List[str],
+        translations: List[str],
+        language: str
+    ):
+        """
+        번역 메모리에 세그먼트 번역 저장
+        
+        응답에서 빠져 원문이 그대로 남은 줄은 저장하지 않습니다.
+        """
+        if self.translation_memory is None:
+            return
+        
+        pairs = [
+            (text, translation)
+            for text, translation in zip(texts, translations)
+            if translation != text
+        ]
+        try:
+            await self.translation_memory.put_many(pairs, language)
+        except Exception as e:
+            logger.warning(f"번역 메모리 저장 실패: {e}")
     
-    async def _call_gemini_api(self, prompt: str) -> str:
+    async def _translate_transcript(
+        self,
+        youtube_url: str,
+        video_id: str,
+        segments: List[Dict[str, Any]],
+        target_language: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        자막 전체를 번역해 응답 데이터 만들기
+        
+        Args:
+            youtube_url: 원본 YouTube URL
+            video_id: YouTube 비디오 ID
+            segments: 자막 세그먼트 목록
+            target_language: 번역 대상 언어
+            
+        Returns:
+            dict: TranslateResponse 필드 구조의 번역 결과
+        """
+        translated: List[Dict[str, Any]] = []
+        async for _, batch in self.translate_segments(segments, target_language):
+            translated.extend(batch)
+        
+        last = segments[-1]
+        duration = int(last["start"] + last["duration"])
+        
+        return {
+            'status': TranslationStatus.COMPLETED,
+            'youtube_url': youtube_url,
+            'video_metadata': {'video_id': video_id, 'duration': duration},
+            'segments': [
+                {
+                    'start_time': item["start"],
+                    'end_time': item["start"] + item["duration"],
+                    'original_text': item["text"],
+                    'translated_text': item["translation"],
+                    'from_memory': item["from_memory"],
+                }
+                for item in translated
+            ],
+            'total_segments': len(translated),
+            'translation': "\n".join(
+                f"[{self._format_timestamp(item['start'])}] {item['translation']}"
+                for item in translated
+            ),
+            'video_duration': self._format_timestamp(duration),
+            'word_count': sum(count_words(item["translation"]) for item in translated),
+            'translated_at': datetime.now(),
+        }
+    
+    @staticmethod
+    def _format_timestamp(seconds: float) -> str:
+        """초를 [mm:ss] / [h:mm:ss] 표시 형식으로 변환"""
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
+        if hours:
+            return f"{hours}:{minutes:02d}:{secs:02d}"
+        return f"{minutes:02d}:{secs:02d}"
+    
+    @staticmethod
+    def _estimate_call_tokens(prompt: str) -> int:
+        """
+        Gemini 호출 한 번의 예상 토큰 수 (입력 + 출력)
+        
+        번역 결과는 대략 입력과 비슷한 길이이므로 입력 토큰의 두 배로 잡되,
+        출력은 GEMINI_MAX_OUTPUT_TOKENS를 넘지 않습니다.
+        """
+        tokens = estimate_tokens(prompt)
+        return tokens + min(tokens, settings.GEMINI_MAX_OUTPUT_TOKENS)
+    
+    async def _call_gemini_api(self, prompt: str, timeout: Optional[float] = None) -> str:
         """
         Gemini API 호출 (속도 제한 처리 포함)
         
+        호출마다 스케줄러에서 자리를 받은 뒤 실행하고,
+        사용량 초과 오류는 스케줄러에 알려 전체 호출을 잠시 멈춥니다.
+        
         Args:
             prompt: API에 전송할 프롬프트
+            timeout: 호출 한 번의 제한 시간 (초, 기본값: GEMINI_TIMEOUT)
             
         Returns:
             str: API 응답 텍스트
         """
         max_retries = 3
         retry_delay = 1.0
+        tokens = self._estimate_call_tokens(prompt)
         
         for attempt in range(max_retries):
             try:
-                # 비동기로 실행
-                response = await asyncio.to_thread(
-                    self.model.generate_content,
-                    prompt
-                )
+                wait_start = time.perf_counter()
+                async with self.scheduler.slot(tokens):
+                    record_stage("rate_limit", time.perf_counter() - wait_start)
+                    with span("gemini", attempt=attempt + 1), gemini_call("generate"):
+                        text = await self.gemini.generate(prompt, timeout=timeout)
                 
-                return response.text
+                self.scheduler.report_success()
+                return text
                 
-            except Exception as e:
+            except GeminiAPIError as e:
                 logger.warning(f"API 호출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 
-                if "quota" in str(e).lower():
+                if e.is_quota:
+                    await self.scheduler.report_quota_error()
                     raise ValueError("API 사용량을 초과했습니다. 잠시 후 다시 시도해주세요.")
                 
-                if attempt < max_retries - 1:
+                if e.retryable and attempt < max_retries - 1:
+                    RETRIES.labels("gemini").inc()
                     await asyncio.sleep(retry_delay)
                     retry_delay *= 2  # 지수 백오프
                 else:
                     raise
     
-    def _parse_translation_response(self, response_text: str, youtube_url: str) -> Dict[str, Any]:
+    async def _stream_prompt(
+        self,
+        prompt: str,
+        youtube_url: str,
+        chunks: "asyncio.Queue[Optional[str]]"
+    ) -> Dict[str, Any]:
+        """
+        URL 프롬프트를 스트리밍으로 번역 - 조각은 큐에 넣고 도착하는 대로 파싱
+        
+        Returns:
+            dict: 파싱된 번역 결과
+        """
+        pieces = []
+        parser = TranslationResponseParser()
+        async with aclosing(self._stream_gemini_api(prompt)) as stream:
+            async for text in stream:
+                pieces.append(text)
+                parser.feed(text)
+                chunks.put_nowait(text)
+        return self._parse_translation_response("".join(pieces), youtube_url, parser=parser)
+    
+    async def _stream_gemini_api(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Gemini API 스트리밍 호출
+        
+        첫 조각이 오기 전의 일시적 오류는 재시도합니다.
+        소비자가 중간에 멈추면 업스트림 요청도 끊깁니다.
+        
+        Args:
+            prompt: API에 전송할 프롬프트
+            
+        Yields:
+            str: 응답 텍스트 조각
+        """
+        max_retries = 3
+        retry_delay = 1.0
+        tokens = self._estimate_call_tokens(prompt)
+        
+        for attempt in range(max_retries):
+            received = False
+            try:
+                # 스트림이 끝날 때까지 스케줄러 자리를 차지
+                async with self.scheduler.slot(tokens), \
+                        aclosing(self.gemini.stream(prompt)) as stream:
+                    with gemini_call("stream"):
+                        async for text in stream:
+                            received = True
+                            yield text
+                
+                self.scheduler.report_success()
+                return
+                
+            except GeminiAPIError as e:
+                logger.warning(f"스트리밍 API 호출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
+                
+                if e.is_quota:
+                    await self.scheduler.report_quota_error()
+                    raise ValueError("API 사용량을 초과했습니다. 잠시 후 다시 시도해주세요.")
+                
+                # 이미 일부를 전달했다면 재시도하면 내용이 중복됨
+                if received or not e.retryable or attempt == max_retries - 1:
+                    raise
+                
+                RETRIES.labels("gemini").inc()
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2  # 지수 백오프
+    
+    async def aclose(self):
+        """백그라운드 갱신 취소, Gemini/Redis 연결 닫기, 저장 대기 중인 결과와 번역 메모리 기록 (서버 종료 시)"""
+        for task in list(self._refreshing.values()):
+            task.cancel()
+        await self.gemini.aclose()
+        if self.redis is not None:
+            if self.cache is not None:
+                await self.cache.stop_invalidation_listener()
+            self.scheduler.use_redis(None)
+            await close_async_redis_client(self.redis)
+            self.redis = None
+        if self.store is not None:
+            await self.store.aclose()
+        if self.translation_memory is not None:
+            await self.translation_memory.aclose()
+    
+    def _parse_translation_response(
+        self,
+        response_text: str,
+        youtube_url: str,
+        parser: Optional[TranslationResponseParser] = None
+    ) -> Dict[str, Any]:
         """
         Gemini API 응답을 파싱하여 구조화된 데이터로 변환
         
         Args:
             response_text: API 응답 텍스트
             youtube_url: 원본 YouTube URL
+            parser: 스트리밍 중 조각을 받아 둔 파서 (없으면 response_text를 새로 파싱)
             
         Returns:
             dict: 파싱된 번역 결과
@@ -329,35 +1599,16 @@ YouTube URL: {url}
             'translated_at': datetime.now()
         }
         
-        # 응답에서 구조화된 정보 추출 시도
-        try:
-            # 영상 정보 추출
-            title_match = re.search(r'제목:\s*(.+)', response_text)
-            if title_match:
-                result['video_title'] = title_match.group(1).strip()
-            
-            channel_match = re.search(r'채널:\s*(.+)', response_text)
-            if channel_match:
-                result['channel_name'] = channel_match.group(1).strip()
-            
-            duration_match = re.search(r'길이:\s*(.+)', response_text)
-            if duration_match:
-                result['video_duration'] = duration_match.group(1).strip()
-            
-            # 요약 추출
-            summary_match = re.search(r'=== 요약 ===\n([\s\S]*?)\n=== 전체 번역 ===', response_text)
-            if summary_match:
-                result['summary'] = summary_match.group(1).strip()
-            
-            # 단어 수 계산
-            korean_text = re.sub(r'[^\w\s]', '', response_text)
-            result['word_count'] = len(korean_text.split())
-            
-            # 신뢰도 점수 (간단한 휴리스틱)
-            result['confidence_score'] = min(0.95, len(response_text) / 10000)
+        with span("parse"), observe_duration(PARSE_DURATION.labels("translation")):
+            # 영상 정보, 요약, [00:00] 세그먼트, 단어 수를 한 번에 추출
+            try:
+                if parser is None:
+                    parser = TranslationResponseParser()
+                    parser.feed(response_text)
+                result.update(parser.close())
             
-        except Exception as e:
-            logger.warning(f"응답 파싱 중 일부 오류: {e}")
+            except Exception as e:
+                logger.warning(f"응답 파싱 중 일부 오류: {e}")
         
         return result
     
@@ -381,37 +1632,138 @@ YouTube URL: {url}
         
         return min(estimated_time, 30.0)  # 최대 30초로 제한
     
-    async def translate_batch(self, youtube_urls: list[str]) -> list[TranslateResponse]:
+    async def translate_batch_stream(
+        self,
+        youtube_urls: List[str],
+        target_language: Optional[str] = None,
+        item_timeout: Optional[float] = None
+    ) -> AsyncIterator[Tuple[int, TranslateResponse]]:
         """
-        여러 영상을 일괄 번역 (병렬 처리)
+        여러 영상을 병렬로 번역하면서 끝나는 순서대로 결과 전달
+        
+        먼저 모든 영상의 캐시를 한 번에 조회해서(L2 MGET 한 번) 적중한 결과는 바로 전달하고,
+        캐시 미스인 영상만 번역 작업으로 실행합니다.
+        느린 영상 하나 때문에 나머지 결과가 묶이지 않고,
+        전달한 결과는 바로 놓아줄 수 있습니다.
+        소비자가 중간에 멈추면(클라이언트 연결 종료 등) 남은 번역은 취소됩니다.
         
         Args:
-            youtube_urls: YouTube URL 목록
+            youtube_urls: YouTube URL 목록 (최대 BATCH_MAX_URLS개)
+            target_language: 번역 대상 언어
+            item_timeout: 영상당 제한 시간 (초, 기본값: BATCH_ITEM_TIMEOUT)
             
-        Returns:
-            list: 번역 결과 목록
+        Yields:
+            tuple: (요청 목록에서의 인덱스, 번역 결과 - 실패/시간 초과는 FAILED 상태)
+            
+        Raises:
+            ValueError: URL 개수가 BATCH_MAX_URLS를 넘음
         """
-        logger.info(f"📦 일괄 번역 시작 - {len(youtube_urls)}개 영상")
+        if len(youtube_urls) > settings.BATCH_MAX_URLS:
+            raise ValueError(f"한 번에 최대 {settings.BATCH_MAX_URLS}개까지 번역할 수 있습니다.")
         
-        # 동시 실행 제한 (API 속도 제한 고려)
-        semaphore = asyncio.Semaphore(3)  # 동시에 3개까지만
+        timeout = item_timeout or settings.BATCH_ITEM_TIMEOUT
+        start_time = time.time()
         
-        async def translate_with_semaphore(url: str) -> TranslateResponse:
-            async with semaphore:
+        # 1. 유효한 URL의 캐시를 한 번에 조회 (잘못된 URL은 translate()에서 오류 처리)
+        valid = [i for i, url in enumerate(youtube_urls) if self.is_valid_youtube_url(url)]
+        for i in valid:
+            self._record_access(youtube_urls[i], target_language)
+        entries: List[Optional[Dict[str, Any]]] = [None] * len(youtube_urls)
+        if valid and (self.cache is not None or self.store is not None):
+            with observe_duration(CACHE_LOOKUP_DURATION):
+                found = await self._get_many_from_cache(
+                    [youtube_urls[i] for i in valid], target_language
+                )
+            for i, cached in zip(valid, found):
+                entries[i] = cached
+        
+        async def translate_one(index: int, url: str) -> Tuple[int, TranslateResponse]:
+            item_start = time.time()
+            # 캐시는 이미 확인함 - 유효한 URL은 바로 번역, 잘못된 URL은 translate()가 거절
+            if entries[index] is None and index in valid_set:
+                work = self._translate_miss(url, target_language, item_start)
+            else:
+                work = self.translate(url, target_language)
+            # batch 레인 - Gemini 호출이 단일 번역 요청보다 뒤로 밀림
+            with priority_lane("batch"):
                 try:
-                    return await self.translate(url)
+                    return index, await asyncio.wait_for(work, timeout)
+                except asyncio.TimeoutError:
+                    error = f"제한 시간({timeout:.0f}초)을 넘었습니다."
                 except Exception as e:
-                    logger.error(f"일괄 번역 중 오류 ({url}): {e}")
-                    return TranslateResponse(
-                        status=TranslationStatus.FAILED,
-                        youtube_url=url,
-                        translation=f"번역 실패: {str(e)}",
-                        translated_at=datetime.now()
-                    )
+                    error = str(e)
+            
+            return index, self._failed_response(url, error, item_start)
         
-        # 모든 번역 작업을 병렬로 실행
-        tasks = [translate_with_semaphore(url) for url in youtube_urls]
-        results = await asyncio.gather(*tasks)
+        # 2. 캐시 미스만 번역 작업으로 실행 (적중 결과를 전달하는 동안에도 진행)
+        valid_set = set(valid)
+        tasks = [
+            asyncio.create_task(translate_one(i, url))
+            for i, url in enumerate(youtube_urls) if entries[i] is None
+        ]
+        try:
+            # 3. 캐시 적중은 바로 전달 (캐시된 실패는 FAILED)
+            hits = 0
+            for index, cached in enumerate(entries):
+                if cached is None:
+                    continue
+                url = youtube_urls[index]
+                try:
+                    result = self._resolve_cached(url, target_language, cached)
+                except ValueError as e:
+                    yield index, self._failed_response(url, str(e), start_time)
+                    continue
+                hits += 1
+                TRANSLATE_DURATION.labels("cache_hit").observe(time.time() - start_time)
+                yield index, TranslateResponse(**result)
+            if hits:
+                logger.info(f"✨ 일괄 번역 캐시 적중 {hits}개 - 번역할 영상 {len(tasks)}개")
+            
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 소비자가 떠나면 남은 번역 취소
+            for task in tasks:
+                task.cancel()
+    
+    @staticmethod
+    def _failed_response(url: str, error: str, start_time: float) -> TranslateResponse:
+        """일괄 번역에서 실패한 영상의 결과 (FAILED 상태)"""
+        logger.error(f"일괄 번역 중 오류 ({url}): {error}")
+        return TranslateResponse(
+            status=TranslationStatus.FAILED,
+            youtube_url=url,
+            translation=f"번역 실패: {error}",
+            error_message=error,
+            processing_time=time.time() - start_time,
+            translated_at=datetime.now()
+        )
+    
+    async def translate_batch(
+        self,
+        youtube_urls: list[str],
+        target_language: Optional[str] = None,
+        item_timeout: Optional[float] = None
+    ) -> list[TranslateResponse]:
+        """
+        여러 영상을 일괄 번역 (병렬 처리)
+        
+        결과를 하나씩 받으려면 translate_batch_stream()을 사용하세요.
+        
+        Args:
+            youtube_urls: YouTube URL 목록
+            target_language: 번역 대상 언어
+            item_timeout: 영상당 제한 시간 (초)
+            
+        Returns:
+            list: 요청 순서대로의 번역 결과 목록
+        """
+        logger.info(f"📦 일괄 번역 시작 - {len(youtube_urls)}개 영상")
+        
+        results: List[Optional[TranslateResponse]] = [None] * len(youtube_urls)
+        stream = self.translate_batch_stream(youtube_urls, target_language, item_timeout)
+        async for index, result in stream:
+            results[index] = result
         
         logger.info(f"✅ 일괄 번역 완료 - 성공: {sum(1 for r in results if r.status == TranslationStatus.COMPLETED)}개")
         
@@ -431,6 +1783,10 @@ print(result.translation)
 urls = ["url1", "url2", "url3"]
 results = await translator.translate_batch(urls)
 
+# 일괄 번역 - 끝나는 순서대로 받기
+async for index, result in translator.translate_batch_stream(urls):
+    print(index, result.status)
+
 # 캐시 활용
 # 같은 URL을 다시 번역하면 캐시에서 즉시 반환됩니다!
 """
@@ -0,0 +1,316 @@
+"""
+인기 영상 캐시 워머
+
+배포나 Redis 초기화 뒤에는 자주 보는 영상이 한꺼번에 캐시에서 사라져
+첫 요청들이 동시에 Gemini로 몰립니다. 워머는 주기적으로(WARMER_INTERVAL)
+많이 요청된 영상을 골라 미리 캐시를 채우고, soft TTL이 지나기 전에 다시 번역합니다.
+
+- 요청 빈도: 워커마다 AccessCounter에 모았다가 Redis 일별 sorted set에 합칩니다
+  (yt_popular:YYYYMMDD, 오늘과 어제를 합산). Redis가 없으면 이 워커의 집계를,
+  둘 다 비어 있으면 번역 저장소의 popular_videos 순서를 씁니다.
+- 저장소에 있는 결과는 캐시로 복원만 하므로 Gemini를 부르지 않습니다.
+- 새로 번역하거나 갱신하는 것은 주기마다 WARMER_MAX_TRANSLATIONS개까지이고,
+  스케줄러가 한가할 때(is_idle)만 가장 낮은 background 레인으로 호출합니다.
+  사용자 요청이 기다리기 시작하면 그 주기는 바로 멈춥니다.
+- Redis가 있으면 주기마다 락을 잡은 워커 하나만 데웁니다.
+"""
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from app.config import settings
+from app.services.metrics import CACHE_WARMER
+
+# 로깅 설정
+logger = logging.getLogger(__name__)
+
+POPULAR_KEY_PREFIX = "yt_popular:"
+LOCK_KEY = "yt_warmer:lock"
+DAY = 86400
+
+SOURCES = ("redis", "local", "store")
+
+
+def popular_key(timestamp: float) -> str:
+    """날짜별 요청 빈도 sorted set 키 (UTC)"""
+    return POPULAR_KEY_PREFIX + time.strftime("%Y%m%d", time.gmtime(timestamp))
+
+
+class AccessCounter:
+    """
+    워커별 요청 빈도 집계 (video_id, 언어)
+
+    counts는 워머 주기마다 절반으로 줄여 최근 요청에 무게를 두고,
+    pending은 아직 Redis에 합치지 않은 증가분입니다.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """
+        Args:
+            max_entries: 보관할 최대 항목 수 (줄일 때 적게 요청된 것부터 버림)
+        """
+        self.max_entries = max_entries
+        self.counts: Counter = Counter()
+        self.pending: Counter = Counter()
+
+    def record(self, video_id: Optional[str], target_language: str):
+        """요청 한 번 기록 (비디오 ID가 없으면 무시)"""
+        if not video_id:
+            return
+        member = f"{video_id}:{target_language}"
+        self.counts[member] += 1
+        self.pending[member] += 1
+
+    def drain(self) -> Counter:
+        """Redis에 합칠 증가분을 꺼내고 비움"""
+        pending, self.pending = self.pending, Counter()
+        return pending
+
+    def top(self, limit: int) -> List[Tuple[str, str]]:
+        """많이 요청된 (video_id, 언어)"""
+        return [split_member(member) for member, _ in self.counts.most_common(limit)]
+
+    def decay(self):
+        """모든 횟수를 절반으로 (0.5 미만은 삭제, max_entries 초과분 정리)"""
+        self.counts = Counter({
+            member: count / 2
+            for member, count in self.counts.most_common(self.max_entries)
+            if count / 2 >= 0.5
+        })
+
+
+def split_member(member: Any) -> Tuple[str, str]:
+    """'video_id:언어' → (video_id, 언어)"""
+    if isinstance(member, bytes):
+        member = member.decode("utf-8")
+    video_id, _, language = member.rpartition(":")
+    return video_id, language
+
+
+class CacheWarmer:
+    """
+    인기 영상 캐시 워머
+
+    서버 시작 시 start(), 종료 시 stop()을 호출합니다 (main.py lifespan).
+    """
+
+    def __init__(
+        self,
+        translator: Any,
+        interval: float = 600.0,
+        top_n: int = 50,
+        max_translations: int = 5,
+        source: str = "auto"
+    ):
+        """
+        Args:
+            translator: TranslatorService
+                (access_counter, cache_state, warm, scheduler, redis, store)
+            interval: 주기 (초)
+            top_n: 주기마다 확인할 인기 영상 수
+            max_translations: 주기마다 Gemini로 번역/갱신할 최대 개수
+            source: "auto" (redis → local → store 순), "redis", "local", "store"
+        """
+        if source != "auto" and source not in SOURCES:
+            raise ValueError(f"알 수 없는 인기 영상 출처: {source}")
+
+        self.translator = translator
+        self.interval = interval
+        self.top_n = top_n
+        self.max_translations = max_translations
+        self.source = source
+        self._task: Optional[asyncio.Task] = None
+
+        # 통계
+        self.runs = 0
+        self.last_source: Optional[str] = None
+        self.totals: Counter = Counter()
+
+    async def start(self):
+        """주기 작업 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+            logger.info(
+                f"🔥 캐시 워머 시작 - {self.interval:.0f}초마다 상위 {self.top_n}개, "
+                f"번역은 최대 {self.max_translations}개"
+            )
+
+    async def stop(self):
+        """주기 작업 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"캐시 워머 실패: {e}")
+
+    async def run_once(self) -> Dict[str, int]:
+        """
+        한 주기 실행
+
+        Returns:
+            dict: 결과별 개수 (fresh, restored, translated, refreshed, negative, failed,
+                busy, over_budget, in_flight, locked)
+        """
+        redis = self.translator.redis
+        await self._flush_counts(redis)
+
+        summary: Counter = Counter()
+        if redis is not None and not await self._acquire_lock(redis):
+            summary["locked"] += 1
+            return self._finish(summary)
+
+        budget = self.max_translations
+        for video_id, language in await self.candidates(redis):
+            url = f"https://www.youtube.com/watch?v={video_id}"
+            state = await self.translator.cache_state(url, language)
+            if state not in ("missing", "stale"):
+                summary[state] += 1
+                continue
+
+            if budget <= 0:
+                summary["over_budget"] += 1
+                continue
+            if not self.translator.scheduler.is_idle():
+                # 사용자 요청이 Gemini를 기다리는 중 - 다음 주기에 다시
+                summary["busy"] += 1
+                break
+
+            budget -= 1
+            try:
+                if not await self.translator.warm(url, language):
+                    # 사용자 요청이 이미 번역 중 - 예산을 쓰지 않음
+                    budget += 1
+                    summary["in_flight"] += 1
+                    continue
+                summary["translated" if state == "missing" else "refreshed"] += 1
+            except Exception as e:
+                summary["failed"] += 1
+                logger.warning(f"캐시 워머 번역 실패: {video_id} ({e})")
+
+        return self._finish(summary)
+
+    def _finish(self, summary: Counter) -> Dict[str, int]:
+        self.translator.access_counter.decay()
+        self.runs += 1
+        self.totals.update(summary)
+        for outcome, count in summary.items():
+            CACHE_WARMER.labels(outcome).inc(count)
+
+        if summary["translated"] or summary["refreshed"] or summary["restored"]:
+            logger.info(f"🔥 캐시 워머 ({self.last_source}): {dict(summary)}")
+        return dict(summary)
+
+    async def candidates(self, redis: Any = None) -> List[Tuple[str, str]]:
+        """
+        데울 (video_id, 언어) 목록 - 요청 빈도 순
+
+        Args:
+            redis: 비동기 Redis 클라이언트 (없으면 redis 출처 건너뜀)
+
+        Returns:
+            list: 최대 top_n개
+        """
+        sources = SOURCES if self.source == "auto" else (self.source,)
+        for source in sources:
+            try:
+                found = await self._ranked(source, redis)
+            except Exception as e:
+                logger.warning(f"인기 영상 조회 실패 ({source}): {e}")
+                continue
+            if found:
+                self.last_source = source
+                return found[:self.top_n]
+        return []
+
+    async def _ranked(self, source: str, redis: Any) -> List[Tuple[str, str]]:
+        if source == "local":
+            return self.translator.access_counter.top(self.top_n)
+
+        if source == "redis":
+            if redis is None:
+                return []
+            # 오늘과 어제 집계를 합산 (자정 직후에도 순위가 비지 않도록)
+            now = time.time()
+            scores: Counter = Counter()
+            for key in (popular_key(now), popular_key(now - DAY)):
+                ranked = await redis.zrevrange(key, 0, self.top_n * 2 - 1, withscores=True)
+                for member, score in ranked:
+                    scores[member] += score
+            return [split_member(member) for member, _ in scores.most_common(self.top_n)]
+
+        store = self.translator.store
+        if store is None:
+            return []
+        # popular_videos 뷰에는 언어가 없으므로 기본 언어로 데움
+        language = settings.DEFAULT_TARGET_LANGUAGE
+        return [(video_id, language) for video_id in await store.popular_videos(self.top_n)]
+
+    async def _flush_counts(self, redis: Any):
+        """이 워커의 요청 빈도를 Redis 일별 sorted set에 합침 (파이프라인 한 번)"""
+        if redis is None:
+            return
+
+        pending = self.translator.access_counter.drain()
+        if not pending:
+            return
+
+        key = popular_key(time.time())
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for member, count in pending.items():
+                pipe.zincrby(key, count, member)
+            pipe.expire(key, 2 * DAY)
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"요청 빈도 기록 실패 - 이번 집계는 버림: {e}")
+
+    async def _acquire_lock(self, redis: Any) -> bool:
+        """이번 주기를 이 워커가 맡을지 (Redis 오류 시에는 맡음)"""
+        try:
+            ttl = max(1, int(self.interval * 0.9))
+            return bool(await redis.set(LOCK_KEY, "1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.warning(f"캐시 워머 락 실패 - 이 워커에서 실행: {e}")
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        """워머 통계 반환"""
+        return {
+            "running": self._task is not None,
+            "interval": self.interval,
+            "top_n": self.top_n,
+            "max_translations": self.max_translations,
+            "source": self.source,
+            "last_source": self.last_source,
+            "runs": self.runs,
+            "outcomes": dict(self.totals),
+        }
+
+
+def create_cache_warmer(translator: Any) -> Optional[CacheWarmer]:
+    """
+    설정에 맞는 캐시 워머 생성
+
+    Returns:
+        CacheWarmer 또는 None (WARMER_ENABLED=False 또는 캐시 비활성화)
+    """
+    if not settings.WARMER_ENABLED or translator.cache is None:
+        return None
+
+    return CacheWarmer(
+        translator,
+        interval=settings.WARMER_INTERVAL,
+        top_n=settings.WARMER_TOP_N,
+        max_translations=settings.WARMER_MAX_TRANSLATIONS,
+        source=settings.WARMER_SOURCE
+    )
@@ -146,7 +146,8 @@ async function connectWebSocket() {
         }
         
         // 새 연결 생성
-        const wsUrl = `ws://localhost:8000/ws/${Date.now()}`;
+        const scheme = location.protocol === 'https:' ? 'wss' : 'ws';
+        const wsUrl = `${scheme}://${location.host}/ws/${Date.now()}`;
         socket = new WebSocket(wsUrl);
         
         socket.onopen = () => {
@@ -183,6 +184,22 @@ function handleWebSocketMessage(event) {
             resetSubmitButton();
             break;
             
+        case 'segments':
+            // 이후 묶음 번역 결과 추가
+            subtitles = subtitles.concat(data.data.subtitles);
+            displaySubtitleList();
+            break;
+            
+        case 'progress':
+            if (data.data.total_segments) {
+                console.log(`⏳ 번역 진행: ${data.data.current_segment}/${data.data.total_segments}`);
+            }
+            break;
+            
+        case 'complete':
+            console.log(`✅ 전체 자막 번역 완료 (${data.data.total_segments}개)`);
+            break;
+            
         case 'error':
             // 오류 발생
             showError(data.message);
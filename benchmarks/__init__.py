@@ -0,0 +1,17 @@
+"""
+YouTube Translator 벤치마크 / 부하 테스트
+
+실제 Gemini API와 YouTube 없이 같은 조건으로 반복 측정할 수 있도록
+가짜 Gemini 서버와 합성 자막을 쓰는 앱 서버를 띄우고 시나리오별 부하를 겁니다.
+
+- fake_gemini: 지연 시간, 오류율, 사용량 초과(429)를 설정할 수 있는 가짜 Gemini REST API
+- app_server: 실제 app.main을 가짜 Gemini에 연결해 실행 (자막은 합성)
+- run: 시나리오 실행, p50/p95/p99 보고, 기준 결과(baseline.json)와 비교
+- parser_bench: 번역 응답 파서 마이크로벤치마크
+- codec_bench: 캐시 값 형식별 크기, 인코딩/디코딩 시간 비교
+- response_bench: 캐시 적중 응답 생성 비용 (response_model 직렬화 vs 인코딩된 본문)
+
+실행 방법:
+- make bench
+- python -m benchmarks.run --scenario cache_hot --scenario thundering_herd
+"""
@@ -0,0 +1,95 @@
+"""
+벤치마크용 앱 서버
+
+실제 app.main을 가짜 Gemini 서버에 연결해 실행합니다.
+YouTube 자막은 네트워크 상태에 따라 결과가 흔들리지 않도록 합성 자막으로 바꿉니다
+(--transcript-lines 0이면 자막 없는 영상 = URL 프롬프트 경로).
+
+외부 저장소(Redis, PostgreSQL)와 번역 메모리는 기본으로 끄고,
+Gemini 속도 제한도 가짜 서버가 병목이 되도록 넉넉하게 잡습니다.
+설정은 app.config를 읽기 전에 환경 변수로 넣어야 하므로 import 순서에 주의하세요.
+
+실행 방법:
+- python -m benchmarks.app_server --port 8000 --gemini-url http://127.0.0.1:8090
+"""
+
+import argparse
+import logging
+import os
+from typing import Any, Dict, List
+
+# 벤치마크 기본 환경 (명시적으로 준 환경 변수가 우선)
+BENCHMARK_ENV = {
+    "GEMINI_API_KEY": "benchmark",
+    "GEMINI_HTTP2": "false",
+    "REDIS_URL": "",
+    "DATABASE_URL": "",
+    "TRANSLATION_MEMORY_ENABLED": "false",
+    "GEMINI_REQUESTS_PER_MINUTE": "1000000",
+    "GEMINI_TOKENS_PER_MINUTE": "1000000000",
+    "GEMINI_MAX_CONCURRENCY": "64",
+}
+
+
+def synthetic_transcript(video_id: str, lines: int) -> List[Dict[str, Any]]:
+    """
+    합성 자막 (영상마다 문장이 달라 번역 메모리/캐시 재사용이 생기지 않음)
+
+    Args:
+        video_id: YouTube 비디오 ID
+        lines: 자막 줄 수
+
+    Returns:
+        list: fetch_transcript와 같은 형식
+    """
+    return [
+        {
+            "text": f"This is line {i} of benchmark video {video_id}, spoken at a natural pace.",
+            "start": i * 3.0,
+            "duration": 3.0,
+        }
+        for i in range(lines)
+    ]
+
+
+def configure(gemini_url: str, transcript_lines: int):
+    """
+    환경 변수 설정 후 자막 가져오기를 합성 자막으로 교체
+
+    app.config를 처음 import하기 전에 호출해야 합니다.
+    """
+    os.environ["GEMINI_API_BASE_URL"] = gemini_url
+    for name, value in BENCHMARK_ENV.items():
+        os.environ.setdefault(name, value)
+
+    from app.services import translator
+
+    async def fetch_transcript(video_id: str, languages=None) -> List[Dict[str, Any]]:
+        if transcript_lines <= 0:
+            raise ValueError("벤치마크: 자막 없음")
+        return synthetic_transcript(video_id, transcript_lines)
+
+    translator.fetch_transcript = fetch_transcript
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 앱 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--gemini-url", default="http://127.0.0.1:8090", help="가짜 Gemini 서버 주소")
+    parser.add_argument("--transcript-lines", type=int, default=120, help="합성 자막 줄 수 (0이면 자막 없음)")
+    parser.add_argument("--log-level", default="WARNING", help="요청마다 남는 INFO 로그를 끄려면 WARNING (기본값)")
+    args = parser.parse_args()
+
+    configure(args.gemini_url, args.transcript_lines)
+
+    import uvicorn
+    from app.main import app
+
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+캐시 값 codec 벤치마크
+
+예전 방식 (json.dumps(ensure_ascii=False) 문자열)과 codec.py의 형식별로
+번역 결과 하나의 크기, 인코딩/디코딩 시간을 비교합니다.
+설치되지 않은 패키지(msgpack, zstandard)가 필요한 형식은 건너뜁니다.
+
+실행 방법:
+- python -m benchmarks.codec_bench
+- python -m benchmarks.codec_bench --segments 100 1000 --repeat 7
+"""
+
+import argparse
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+from app.models import TranslationStatus
+from app.services.codec import CacheCodec
+from benchmarks.parser_bench import best_of
+
+FORMATS = ("json", "json+zlib", "json+zstd", "msgpack", "msgpack+zlib", "msgpack+zstd")
+
+
+def sample_result(segments: int) -> Dict[str, Any]:
+    """자막 기반 번역 결과 (세그먼트 segments개)"""
+    items = [
+        {
+            "start_time": i * 3.0,
+            "end_time": i * 3.0 + 3.0,
+            "original_text": f"In this part we load batch number {i} and compute the loss again.",
+            "translated_text": f"이번 구간에서는 {i}번 묶음을 불러와 손실을 다시 계산합니다.",
+            "from_memory": i % 5 == 0,
+        }
+        for i in range(segments)
+    ]
+    return {
+        "status": TranslationStatus.COMPLETED,
+        "youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "video_metadata": {"video_id": "dQw4w9WgXcQ", "duration": segments * 3},
+        "segments": items,
+        "total_segments": segments,
+        "translation": "\n".join(
+            f"[{i * 3 // 60:02d}:{i * 3 % 60:02d}] {item['translated_text']}"
+            for i, item in enumerate(items)
+        ),
+        "video_duration": f"{segments * 3 // 60:02d}:{segments * 3 % 60:02d}",
+        "word_count": segments * 6,
+        "translated_at": datetime.now(),
+        "processing_time": 12.5,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐시 값 codec 벤치마크")
+    parser.add_argument(
+        "--segments", type=int, nargs="+", default=[50, 500, 2000], help="결과의 세그먼트 수"
+    )
+    parser.add_argument("--level", type=int, default=3, help="압축 수준")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for segments in args.segments:
+        value = sample_result(segments)
+        legacy = json.dumps(value, ensure_ascii=False, default=str)
+        legacy_size = len(legacy.encode("utf-8"))
+
+        print(f"\n세그먼트 {segments}개 - 예전 JSON {legacy_size / 1024:.1f}KB")
+        print(f"{'format':<16}{'size':>10}{'ratio':>8}{'encode':>12}{'decode':>12}")
+
+        encode = best_of(
+            lambda: json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"), args.repeat
+        )
+        decode = best_of(lambda: json.loads(legacy), args.repeat)
+        print(
+            f"{'legacy json':<16}{legacy_size / 1024:>8.1f}KB{1.0:>8.2f}"
+            f"{encode * 1e6:>10.1f}µs{decode * 1e6:>10.1f}µs"
+        )
+
+        for name in FORMATS:
+            serializer, _, compressor = name.partition("+")
+            try:
+                codec = CacheCodec(
+                    serializer, compressor or "none", compress_min_bytes=0, level=args.level
+                )
+            except ValueError as e:
+                print(f"{name:<16}건너뜀 ({e})")
+                continue
+
+            data = codec.encode(value)
+            encode = best_of(lambda: codec.encode(value), args.repeat)
+            decode = best_of(lambda: CacheCodec.decode(data), args.repeat)
+            print(
+                f"{name:<16}{len(data) / 1024:>8.1f}KB{len(data) / legacy_size:>8.2f}"
+                f"{encode * 1e6:>10.1f}µs{decode * 1e6:>10.1f}µs"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+벤치마크용 가짜 Gemini 서버
+
+GeminiClient가 호출하는 generateContent / streamGenerateContent(SSE)를 흉내 냅니다.
+응답은 프롬프트 종류에 맞춰 만듭니다.
+
+- 자막 묶음 프롬프트: 입력 JSON 배열의 모든 줄을 번역한 [{"i", "t"}] 배열
+- URL 프롬프트: 영상 정보 / 요약 / 전체 번역 형식의 텍스트
+
+지연 시간(+무작위 편차), 오류율(503), 사용량 초과 비율(429), 분당 요청 한도를
+설정할 수 있고, /stats에서 호출 수를 확인할 수 있습니다.
+
+실행 방법:
+- python -m benchmarks.fake_gemini --port 8090 --latency 0.5 --quota-rpm 600
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+# 자막 묶음 프롬프트의 입력 JSON 배열 (translator._create_segment_prompt 형식)
+SEGMENT_ITEMS = re.compile(r"자막:\s*(\[.*\])\s*$", re.S)
+
+
+@dataclass
+class FakeGeminiConfig:
+    """가짜 Gemini 동작 설정"""
+    latency: float = 0.2  # 응답 지연 (초)
+    jitter: float = 0.05  # 지연 편차 (0 ~ jitter초 추가)
+    error_rate: float = 0.0  # 503 응답 비율
+    quota_rate: float = 0.0  # 429 응답 비율
+    quota_rpm: int = 0  # 분당 요청 한도 (0이면 없음) - 넘으면 429
+    stream_chunks: int = 8  # 스트리밍 응답 조각 수
+    transcript_lines: int = 40  # URL 프롬프트 응답의 [00:00] 줄 수
+    seed: Optional[int] = None
+
+
+class FakeGemini:
+    """가짜 Gemini 응답 생성과 호출 통계"""
+
+    def __init__(self, config: FakeGeminiConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self._window: Deque[float] = deque()  # 최근 1분 요청 시각
+        self.reset()
+
+    def reset(self):
+        self.counters = {"requests": 0, "generate": 0, "stream": 0, "errors": 0, "quota_errors": 0}
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.counters, "config": asdict(self.config)}
+
+    def _over_quota(self) -> bool:
+        """분당 요청 한도 초과 여부 (슬라이딩 윈도)"""
+        if not self.config.quota_rpm:
+            return False
+
+        now = time.monotonic()
+        while self._window and now - self._window[0] >= 60:
+            self._window.popleft()
+        if len(self._window) >= self.config.quota_rpm:
+            return True
+        self._window.append(now)
+        return False
+
+    async def admit(self, kind: str) -> Optional[JSONResponse]:
+        """
+        호출 한 번 처리 - 지연 후 실패 응답 또는 None(성공)
+
+        사용량 초과는 실제 API처럼 지연 없이 바로 돌려줍니다.
+        """
+        self.counters["requests"] += 1
+        self.counters[kind] += 1
+
+        if self._over_quota() or self.random.random() < self.config.quota_rate:
+            self.counters["quota_errors"] += 1
+            return self.error_response(
+                429, "Resource has been exhausted (e.g. check quota).", "RESOURCE_EXHAUSTED"
+            )
+
+        await asyncio.sleep(self.config.latency + self.random.uniform(0, self.config.jitter))
+
+        if self.random.random() < self.config.error_rate:
+            self.counters["errors"] += 1
+            return self.error_response(
+                503, "The model is overloaded. Please try again later.", "UNAVAILABLE"
+            )
+        return None
+
+    @staticmethod
+    def error_response(status_code: int, message: str, status: str) -> JSONResponse:
+        return JSONResponse(
+            {"error": {"code": status_code, "message": message, "status": status}},
+            status_code=status_code
+        )
+
+    def respond_text(self, prompt: str) -> str:
+        """프롬프트 종류에 맞는 응답 텍스트"""
+        match = SEGMENT_ITEMS.search(prompt)
+        if match:
+            items = json.loads(match.group(1))
+            return json.dumps(
+                [{"i": item["i"], "t": f"[번역] {item['t']}"} for item in items],
+                ensure_ascii=False
+            )
+
+        lines = "\n".join(
+            f"[{i // 60:02d}:{i % 60:02d}] 벤치마크용 번역 문장 {i}번입니다. 내용은 **중요합니다**."
+            for i in range(0, self.config.transcript_lines * 5, 5)
+        )
+        return (
+            "=== 영상 정보 ===\n"
+            "제목: 벤치마크 영상\n"
+            "채널: 가짜 채널\n"
+            "길이: 10:00\n\n"
+            "=== 요약 ===\n"
+            "첫째 요약\n둘째 요약\n셋째 요약\n\n"
+            "=== 전체 번역 ===\n"
+            f"{lines}\n"
+        )
+
+    def chunks(self, text: str) -> List[str]:
+        """스트리밍용으로 텍스트를 stream_chunks 조각으로 나눔"""
+        count = max(1, self.config.stream_chunks)
+        size = max(1, -(-len(text) // count))
+        return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _candidate(text: str) -> Dict[str, Any]:
+    return {"candidates": [{"content": {"role": "model", "parts": [{"text": text}]}}]}
+
+
+def create_app(config: Optional[FakeGeminiConfig] = None) -> FastAPI:
+    """
+    가짜 Gemini REST API 앱 생성
+
+    Args:
+        config: 동작 설정 (기본값: FakeGeminiConfig())
+
+    Returns:
+        FastAPI: /models/{model}:generateContent, :streamGenerateContent, /stats, /reset
+    """
+    fake = FakeGemini(config or FakeGeminiConfig())
+    app = FastAPI(title="Fake Gemini")
+    app.state.fake = fake
+
+    @app.post("/models/{target}")
+    async def models(target: str, request: Request):
+        body = await request.json()
+        prompt = "".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+
+        if target.endswith(":generateContent"):
+            error = await fake.admit("generate")
+            return error or JSONResponse(_candidate(fake.respond_text(prompt)))
+
+        if target.endswith(":streamGenerateContent"):
+            # 첫 조각까지의 지연만 admit에서 기다리고 나머지 조각은 바로 보냄
+            error = await fake.admit("stream")
+            if error:
+                return error
+
+            async def events():
+                for chunk in fake.chunks(fake.respond_text(prompt)):
+                    yield f"data: {json.dumps(_candidate(chunk), ensure_ascii=False)}\r\n\r\n"
+                    await asyncio.sleep(0)
+
+            return StreamingResponse(events(), media_type="text/event-stream")
+
+        return fake.error_response(404, f"Unknown method: {target}", "NOT_FOUND")
+
+    @app.get("/stats")
+    async def stats():
+        return fake.stats()
+
+    @app.post("/reset")
+    async def reset():
+        fake.reset()
+        return fake.stats()
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="벤치마크용 가짜 Gemini 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--latency", type=float, default=0.2, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.05, help="지연 편차 (초)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 응답 비율 (0~1)")
+    parser.add_argument("--quota-rate", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--quota-rpm", type=int, default=0, help="분당 요청 한도 (0이면 없음)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    import uvicorn
+
+    config = FakeGeminiConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        quota_rate=args.quota_rate,
+        quota_rpm=args.quota_rpm,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(config), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
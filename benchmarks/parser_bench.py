@@ -0,0 +1,102 @@
+"""
+번역 응답 파서 마이크로벤치마크
+
+이전 방식 (패턴 5개를 매번 re.search + 전체 텍스트 re.sub로 단어 수 계산)과
+response_parser의 한 번 훑기 파서, 스트리밍 조각 단위 feed()를 응답 크기별로 비교합니다.
+
+실행 방법:
+- python -m benchmarks.parser_bench
+- python -m benchmarks.parser_bench --lines 50 500 5000 --repeat 7
+"""
+
+import argparse
+import re
+import timeit
+from typing import Any, Callable, Dict, List
+
+from app.services.response_parser import TranslationResponseParser, parse_translation_response
+
+
+def legacy_parse(response_text: str) -> Dict[str, Any]:
+    """이전 _parse_translation_response의 추출 부분 (비교 기준)"""
+    result: Dict[str, Any] = {}
+    title_match = re.search(r'제목:\s*(.+)', response_text)
+    if title_match:
+        result['video_title'] = title_match.group(1).strip()
+    channel_match = re.search(r'채널:\s*(.+)', response_text)
+    if channel_match:
+        result['channel_name'] = channel_match.group(1).strip()
+    duration_match = re.search(r'길이:\s*(.+)', response_text)
+    if duration_match:
+        result['video_duration'] = duration_match.group(1).strip()
+    summary_match = re.search(r'=== 요약 ===\n([\s\S]*?)\n=== 전체 번역 ===', response_text)
+    if summary_match:
+        result['summary'] = summary_match.group(1).strip()
+    korean_text = re.sub(r'[^\w\s]', '', response_text)
+    result['word_count'] = len(korean_text.split())
+    result['confidence_score'] = min(0.95, len(response_text) / 10000)
+    return result
+
+
+def sample_response(lines: int) -> str:
+    """[00:00] 줄이 lines개인 번역 응답"""
+    body = "\n".join(
+        f"[{i * 7 // 60:02d}:{i * 7 % 60:02d}] [화자 {i % 2 + 1}] 이번 구간에서는 "
+        "**머신러닝(Machine Learning)** "
+        f"모델의 학습 과정을 설명합니다. 데이터 {i}번 묶음을 불러와 손실(loss)을 계산하고, 다시 가중치를 갱신합니다."
+        for i in range(lines)
+    )
+    return (
+        "=== 영상 정보 ===\n"
+        "제목: 딥러닝 입문 강의\n"
+        "채널: 테스트 채널\n"
+        f"길이: {lines * 7 // 60}:{lines * 7 % 60:02d}\n\n"
+        "=== 요약 ===\n"
+        "1. 모델 구조 소개\n2. 학습 과정 설명\n3. 평가 방법 정리\n\n"
+        "=== 전체 번역 ===\n"
+        f"{body}\n"
+    )
+
+
+def streamed_parse(chunks: List[str]) -> Dict[str, Any]:
+    parser = TranslationResponseParser()
+    for chunk in chunks:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """한 번 실행 시간 (초) - 반복 측정 중 가장 빠른 값"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description="번역 응답 파서 마이크로벤치마크")
+    parser.add_argument(
+        "--lines", type=int, nargs="+", default=[40, 400, 4000], help="응답의 [00:00] 줄 수"
+    )
+    parser.add_argument("--chunk-size", type=int, default=256, help="스트리밍 조각 크기 (글자)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(
+        f"{'lines':>7}{'size':>10}{'legacy':>12}{'single-pass':>14}{'streamed':>12}{'speedup':>9}"
+    )
+    for lines in args.lines:
+        text = sample_response(lines)
+        chunks = [text[i:i + args.chunk_size] for i in range(0, len(text), args.chunk_size)]
+
+        legacy = best_of(lambda: legacy_parse(text), args.repeat)
+        single = best_of(lambda: parse_translation_response(text), args.repeat)
+        streamed = best_of(lambda: streamed_parse(chunks), args.repeat)
+
+        print(
+            f"{lines:>7}{len(text) // 1024:>8}KB{legacy * 1e6:>10.1f}µs{single * 1e6:>12.1f}µs"
+            f"{streamed * 1e6:>10.1f}µs{legacy / single:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
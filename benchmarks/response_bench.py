@@ -0,0 +1,60 @@
+"""
+캐시 적중 응답 마이크로벤치마크
+
+캐시 적중 한 번의 응답 생성 비용을 세그먼트 수별로 비교합니다.
+
+- legacy: TranslateResponse(**cached) → response_model 검증 → jsonable_encoder
+  → JSONResponse(json.dumps)
+- encode: 빠른 경로의 첫 적중 (모델 한 번 만들고 orjson으로 인코딩, ETag 계산)
+- fast: 빠른 경로의 다음 적중 (응답 본문 캐시에서 바이트 그대로)
+
+실행 방법:
+- python -m benchmarks.response_bench
+- python -m benchmarks.response_bench --segments 100 1000 --repeat 7
+"""
+
+import argparse
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.models import TranslateResponse
+from app.services.cache import MemoryCache
+from app.services.response_cache import encode_response
+from benchmarks.codec_bench import sample_result
+from benchmarks.parser_bench import best_of
+
+
+def legacy_response(cached) -> bytes:
+    """이전 /api/translate 캐시 적중 경로 (FastAPI response_model 직렬화)"""
+    model = TranslateResponse(**cached)
+    validated = TranslateResponse.validate(model)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캐시 적중 응답 마이크로벤치마크")
+    parser.add_argument(
+        "--segments", type=int, nargs="+", default=[50, 500, 2000], help="결과의 세그먼트 수"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'segments':>10}{'size':>10}{'legacy':>12}{'encode':>12}{'fast':>12}{'speedup':>10}")
+    for segments in args.segments:
+        cached = sample_result(segments)
+        response_cache = MemoryCache(max_entries=10)
+        encoded = encode_response(TranslateResponse(**cached))
+        response_cache.set("key", encoded)
+
+        legacy = best_of(lambda: legacy_response(cached), args.repeat)
+        encode = best_of(lambda: encode_response(TranslateResponse(**cached)), args.repeat)
+        fast = best_of(lambda: response_cache.get("key"), args.repeat)
+        print(
+            f"{segments:>10}{len(encoded.body) / 1024:>8.1f}KB{legacy * 1e6:>10.1f}µs"
+            f"{encode * 1e6:>10.1f}µs{fast * 1e6:>10.2f}µs{legacy / fast:>9.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
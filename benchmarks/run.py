@@ -0,0 +1,548 @@
+"""
+벤치마크 / 부하 테스트 실행
+
+가짜 Gemini 서버와 벤치마크용 앱 서버를 별도 프로세스로 띄우고
+시나리오별로 /api/translate, /api/translate/batch/stream에 부하를 건 뒤
+처리량과 p50/p95/p99를 보고합니다.
+
+시나리오:
+- cache_hot: 미리 번역해 둔 몇 개 영상을 반복 요청 (캐시 적중 경로)
+- cache_cold: 요청마다 새 영상 (자막 → Gemini → 파싱 → 캐시 저장 전체 경로)
+- thundering_herd: 같은 새 영상을 동시에 요청 (singleflight로 Gemini 호출이 1번인지 확인)
+- batch: translate_batch 스트리밍 엔드포인트로 여러 영상 일괄 번역
+
+결과는 benchmarks/results/에 저장하고, benchmarks/baseline.json과 비교해
+기준보다 느려진 항목을 표시합니다 (--fail-on-regression이면 종료 코드 1).
+
+실행 방법:
+- python -m benchmarks.run
+- python -m benchmarks.run --scenario cache_cold --requests 500 --concurrency 50
+- python -m benchmarks.run --save-baseline
+- python -m benchmarks.run --target http://localhost:8000 --scenario cache_hot  # 이미 실행 중인 서버
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+BENCHMARK_DIR = ROOT / "benchmarks"
+DEFAULT_BASELINE = BENCHMARK_DIR / "baseline.json"
+RESULTS_DIR = BENCHMARK_DIR / "results"
+
+SCENARIOS = ("cache_hot", "cache_cold", "thundering_herd", "batch")
+
+# 기준 결과와 비교하는 항목 (값이 클수록 나쁨)
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+# ===========================
+# 통계
+# ===========================
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    백분위수 (선형 보간)
+
+    Args:
+        sorted_values: 정렬된 값 목록
+        q: 0~100
+
+    Returns:
+        float: 백분위수 (값이 없으면 0)
+    """
+    if not sorted_values:
+        return 0.0
+
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    """
+    지연 시간 목록 요약
+
+    Args:
+        latencies: 요청별 지연 시간 (초, 실패 포함)
+        errors: 실패 수
+        elapsed: 전체 실행 시간 (초)
+
+    Returns:
+        dict: requests, errors, error_rate, throughput_rps, mean/p50/p95/p99/max (밀리초)
+    """
+    values = sorted(latencies)
+    count = len(values)
+    ms = lambda seconds: round(seconds * 1000, 2)  # noqa: E731
+
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 4) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": ms(sum(values) / count) if count else 0.0,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "max_ms": ms(values[-1]) if values else 0.0,
+    }
+
+
+def compare(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.2
+) -> List[str]:
+    """
+    기준 결과와 비교해 나빠진 항목 찾기
+
+    지연 시간이 (1 + tolerance)배를 넘거나, 처리량이 (1 - tolerance)배 아래로
+    떨어지거나, 오류율이 1%p 넘게 오르면 회귀로 봅니다.
+
+    Args:
+        current: 시나리오 → 요약
+        baseline: 시나리오 → 기준 요약
+        tolerance: 허용 비율
+
+    Returns:
+        list: 회귀 설명 목록 (없으면 빈 목록)
+    """
+    regressions = []
+    for name, summary in current.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        for metric in LATENCY_METRICS:
+            if base.get(metric) and summary[metric] > base[metric] * (1 + tolerance):
+                regressions.append(f"{name}.{metric}: {base[metric]} → {summary[metric]}")
+
+        rps, base_rps = summary["throughput_rps"], base.get("throughput_rps")
+        if base_rps and rps < base_rps * (1 - tolerance):
+            regressions.append(f"{name}.throughput_rps: {base_rps} → {rps}")
+
+        if summary["error_rate"] > base.get("error_rate", 0.0) + 0.01:
+            regressions.append(
+                f"{name}.error_rate: {base.get('error_rate', 0.0)} → {summary['error_rate']}"
+            )
+
+    return regressions
+
+
+# ===========================
+# 부하 생성
+# ===========================
+
+@dataclass
+class ScenarioResult:
+    """시나리오 하나의 측정 결과"""
+    name: str
+    latencies: List[float]
+    errors: int
+    elapsed: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        return {**summarize(self.latencies, self.errors, self.elapsed), **self.extra}
+
+
+async def run_load(
+    send: Callable[[int], Awaitable[bool]],
+    total: int,
+    concurrency: int
+) -> Tuple[List[float], int, float]:
+    """
+    요청 total개를 동시에 concurrency개씩 실행 (닫힌 루프)
+
+    Args:
+        send: 요청 번호를 받아 성공 여부를 돌려주는 코루틴 함수
+
+    Returns:
+        tuple: (지연 시간 목록, 실패 수, 전체 시간)
+    """
+    latencies: List[float] = []
+    errors = 0
+    next_index = 0
+
+    async def worker():
+        nonlocal errors, next_index
+        while next_index < total:
+            index = next_index
+            next_index += 1
+            start = time.perf_counter()
+            try:
+                ok = await send(index)
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            if not ok:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, total))))
+    return latencies, errors, time.perf_counter() - started
+
+
+class BenchmarkContext:
+    """시나리오가 공유하는 클라이언트와 옵션"""
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        args: argparse.Namespace,
+        gemini_url: Optional[str]
+    ):
+        self.client = client
+        self.args = args
+        self.gemini_url = gemini_url
+        self.nonce = uuid.uuid4().hex  # 실행마다 다른 영상 ID (이전 실행 캐시 회피)
+
+    def url(self, tag: str, index: int = 0) -> str:
+        """벤치마크용 YouTube URL (11자 영상 ID)"""
+        video_id = hashlib.sha1(f"{self.nonce}:{tag}:{index}".encode()).hexdigest()[:11]
+        return f"https://www.youtube.com/watch?v={video_id}"
+
+    async def translate(self, url: str) -> bool:
+        response = await self.client.post(
+            "/api/translate",
+            json={"youtube_url": url, "target_language": self.args.language}
+        )
+        return response.status_code == 200
+
+    async def gemini_calls(self) -> Optional[int]:
+        """가짜 Gemini 서버가 받은 호출 수 (주소를 모르면 None)"""
+        if not self.gemini_url:
+            return None
+        async with httpx.AsyncClient(base_url=self.gemini_url) as client:
+            response = await client.get("/stats")
+            return response.json()["requests"]
+
+
+# ===========================
+# 시나리오
+# ===========================
+
+async def scenario_cache_hot(ctx: BenchmarkContext) -> ScenarioResult:
+    urls = [ctx.url("hot", i) for i in range(ctx.args.hot_set)]
+    for url in urls:
+        await ctx.translate(url)
+
+    latencies, errors, elapsed = await run_load(
+        lambda i: ctx.translate(urls[i % len(urls)]), ctx.args.requests, ctx.args.concurrency
+    )
+    return ScenarioResult("cache_hot", latencies, errors, elapsed)
+
+
+async def scenario_cache_cold(ctx: BenchmarkContext) -> ScenarioResult:
+    before = await ctx.gemini_calls()
+    latencies, errors, elapsed = await run_load(
+        lambda i: ctx.translate(ctx.url("cold", i)), ctx.args.requests, ctx.args.concurrency
+    )
+    after = await ctx.gemini_calls()
+
+    extra = {}
+    if before is not None:
+        extra["gemini_calls_per_request"] = round((after - before) / max(len(latencies), 1), 2)
+    return ScenarioResult("cache_cold", latencies, errors, elapsed, extra)
+
+
+async def scenario_thundering_herd(ctx: BenchmarkContext) -> ScenarioResult:
+    latencies: List[float] = []
+    errors = 0
+    before = await ctx.gemini_calls()
+
+    started = time.perf_counter()
+    for round_index in range(ctx.args.herd_rounds):
+        url = ctx.url("herd", round_index)
+        round_latencies, round_errors, _ = await run_load(
+            lambda i: ctx.translate(url), ctx.args.concurrency, ctx.args.concurrency
+        )
+        latencies.extend(round_latencies)
+        errors += round_errors
+    elapsed = time.perf_counter() - started
+
+    after = await ctx.gemini_calls()
+    extra = {"rounds": ctx.args.herd_rounds, "fan_in": ctx.args.concurrency}
+    if before is not None:
+        # 같은 영상이므로 이상적으로는 (자막 묶음 수)만큼만 호출
+        extra["gemini_calls_per_round"] = round((after - before) / ctx.args.herd_rounds, 2)
+    return ScenarioResult("thundering_herd", latencies, errors, elapsed, extra)
+
+
+async def scenario_batch(ctx: BenchmarkContext) -> ScenarioResult:
+    item_latencies: List[float] = []
+    failed_items = 0
+
+    async def send(index: int) -> bool:
+        nonlocal failed_items
+        urls = [ctx.url(f"batch{index}", i) for i in range(ctx.args.batch_size)]
+        start = time.perf_counter()
+        complete = None
+
+        async with ctx.client.stream(
+            "POST",
+            "/api/translate/batch/stream",
+            json={"youtube_urls": urls, "target_language": ctx.args.language}
+        ) as response:
+            if response.status_code != 200:
+                return False
+            async for line in response.aiter_lines():
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                if event["type"] == "result":
+                    item_latencies.append(time.perf_counter() - start)
+                elif event["type"] == "complete":
+                    complete = event
+
+        if complete is None:
+            return False
+        failed_items += complete["failed"]
+        return complete["failed"] == 0
+
+    latencies, errors, elapsed = await run_load(send, ctx.args.batches, ctx.args.batch_concurrency)
+
+    items = summarize(item_latencies, failed_items, elapsed)
+    extra = {
+        "batch_size": ctx.args.batch_size,
+        "item_p50_ms": items["p50_ms"],
+        "item_p95_ms": items["p95_ms"],
+        "item_p99_ms": items["p99_ms"],
+        "items_per_second": items["throughput_rps"],
+    }
+    return ScenarioResult("batch", latencies, errors, elapsed, extra)
+
+
+SCENARIO_FUNCTIONS: Dict[str, Callable[[BenchmarkContext], Awaitable[ScenarioResult]]] = {
+    "cache_hot": scenario_cache_hot,
+    "cache_cold": scenario_cache_cold,
+    "thundering_herd": scenario_thundering_herd,
+    "batch": scenario_batch,
+}
+
+
+# ===========================
+# 서버 프로세스
+# ===========================
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(url: str, timeout: float = 30.0):
+    """서버가 응답할 때까지 대기"""
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while True:
+            try:
+                response = await client.get(url)
+                if response.status_code < 500:
+                    return
+            except httpx.HTTPError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"서버가 {timeout:.0f}초 안에 시작되지 않았습니다: {url}")
+            await asyncio.sleep(0.2)
+
+
+def start_servers(args: argparse.Namespace) -> Tuple[List[subprocess.Popen], str, str]:
+    """
+    가짜 Gemini 서버와 앱 서버 실행
+
+    Returns:
+        tuple: (프로세스 목록, 앱 주소, 가짜 Gemini 주소)
+    """
+    gemini_port, app_port = free_port(), free_port()
+    gemini_url = f"http://127.0.0.1:{gemini_port}"
+    target = f"http://127.0.0.1:{app_port}"
+
+    gemini = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.fake_gemini",
+        "--port", str(gemini_port),
+        "--latency", str(args.latency),
+        "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate),
+        "--quota-rate", str(args.quota_rate),
+        "--quota-rpm", str(args.quota_rpm),
+        "--seed", "0",
+    ], cwd=ROOT)
+    app = subprocess.Popen([
+        sys.executable, "-m", "benchmarks.app_server",
+        "--port", str(app_port),
+        "--gemini-url", gemini_url,
+        "--transcript-lines", str(args.transcript_lines),
+    ], cwd=ROOT, stdout=subprocess.DEVNULL)
+
+    return [gemini, app], target, gemini_url
+
+
+def stop_servers(processes: List[subprocess.Popen]):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+# ===========================
+# 보고
+# ===========================
+
+def environment() -> Dict[str, Any]:
+    """결과를 만든 환경 (다른 머신의 기준 결과와 비교할 때 참고)"""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def options(args: argparse.Namespace) -> Dict[str, Any]:
+    """결과에 영향을 주는 옵션 (기준 결과와 다르면 경고)"""
+    names = (
+        "requests", "concurrency", "hot_set", "herd_rounds", "batches", "batch_size",
+        "batch_concurrency", "latency", "jitter", "error_rate", "quota_rate", "quota_rpm",
+        "transcript_lines",
+    )
+    return {name: getattr(args, name) for name in names}
+
+
+def print_report(summaries: Dict[str, Dict[str, Any]]):
+    header = (
+        f"{'scenario':<16}{'reqs':>7}{'err%':>7}{'rps':>9}"
+        f"{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name, s in summaries.items():
+        print(
+            f"{name:<16}{s['requests']:>7}{s['error_rate'] * 100:>6.1f}%{s['throughput_rps']:>9.1f}"
+            f"{s['p50_ms']:>9.1f}ms{s['p95_ms']:>8.1f}ms{s['p99_ms']:>8.1f}ms{s['max_ms']:>8.1f}ms"
+        )
+        extra = {k: v for k, v in s.items() if k not in summarize([], 0, 0)}
+        if extra:
+            print(f"{'':<16}{json.dumps(extra, ensure_ascii=False)}")
+
+
+async def run_benchmarks(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    processes: List[subprocess.Popen] = []
+    target, gemini_url = args.target, args.gemini_url
+    if not target:
+        processes, target, gemini_url = start_servers(args)
+
+    try:
+        await wait_ready(f"{target}/health")
+        if gemini_url:
+            await wait_ready(f"{gemini_url}/stats")
+
+        connections = args.concurrency * 2
+        limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+        client = httpx.AsyncClient(base_url=target, limits=limits, timeout=args.timeout)
+        async with client:
+            ctx = BenchmarkContext(client, args, gemini_url)
+            summaries = {}
+            for name in args.scenario or SCENARIOS:
+                print(f"▶ {name} ...", flush=True)
+                result = await SCENARIO_FUNCTIONS[name](ctx)
+                summaries[name] = result.summary()
+            return summaries
+    finally:
+        stop_servers(processes)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="YouTube Translator 벤치마크")
+    parser.add_argument(
+        "--scenario", action="append", choices=SCENARIOS,
+        help="실행할 시나리오 (여러 번 지정 가능, 기본: 전체)"
+    )
+    parser.add_argument("--target", help="이미 실행 중인 앱 주소 (지정하면 서버를 띄우지 않음)")
+    parser.add_argument("--gemini-url", help="--target과 함께 쓸 가짜 Gemini 주소 (호출 수 집계용)")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--requests", type=int, default=300, help="cache_hot / cache_cold 요청 수")
+    parser.add_argument(
+        "--concurrency", type=int, default=20,
+        help="동시 요청 수 (thundering_herd는 라운드당 동시 요청 수)"
+    )
+    parser.add_argument("--hot-set", type=int, default=10, help="cache_hot 영상 수")
+    parser.add_argument("--herd-rounds", type=int, default=5)
+    parser.add_argument("--batches", type=int, default=8, help="batch 요청 수")
+    parser.add_argument("--batch-size", type=int, default=10, help="batch 요청당 영상 수")
+    parser.add_argument("--batch-concurrency", type=int, default=2)
+    parser.add_argument("--timeout", type=float, default=120.0, help="요청 제한 시간 (초)")
+    parser.add_argument("--latency", type=float, default=0.2, help="가짜 Gemini 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.05)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--quota-rate", type=float, default=0.0)
+    parser.add_argument("--quota-rpm", type=int, default=0)
+    parser.add_argument(
+        "--transcript-lines", type=int, default=120, help="합성 자막 줄 수 (0이면 URL 프롬프트 경로)"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준 결과로 저장")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 보지 않는 허용 비율")
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args(argv)
+
+    summaries = asyncio.run(run_benchmarks(args))
+    report = {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "environment": environment(),
+        "options": options(args),
+        "scenarios": summaries,
+    }
+
+    print()
+    print_report(summaries)
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    result_path = RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}.json"
+    result_path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    print(f"\n결과 저장: {result_path.relative_to(ROOT)}")
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+        print(f"기준 결과 저장: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("기준 결과가 없습니다 (--save-baseline으로 저장)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    same_options = baseline.get("options") == report["options"]
+    if not same_options or baseline.get("environment", {}).get("cpu_count") != os.cpu_count():
+        print("⚠️ 기준 결과와 옵션 또는 환경이 달라 비교가 정확하지 않을 수 있습니다")
+
+    regressions = compare(summaries, baseline.get("scenarios", {}), args.tolerance)
+    if not regressions:
+        print(f"✅ 기준 결과 대비 회귀 없음 (허용 {args.tolerance:.0%})")
+        return 0
+
+    print(f"❌ 기준 결과 대비 회귀 {len(regressions)}건:")
+    for line in regressions:
+        print(f"  - {line}")
+    return 1 if args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,36 @@
+"""
+gunicorn 설정 - 실행 디렉터리에 있으면 gunicorn이 자동으로 읽습니다
+
+Prometheus 메트릭을 워커 여러 개에서 합산하려면 모든 워커가
+같은 PROMETHEUS_MULTIPROC_DIR에 값을 기록해야 합니다 (app/services/metrics.py).
+워커 프로세스가 app을 import하기 전에 환경변수를 정하고,
+서버 시작 시 이전 실행의 파일을 지우며, 종료된 워커의 게이지는 정리합니다.
+
+워커 수는 GUNICORN_WORKERS로 워커에 알려줍니다 - 메모리 작업 큐는
+워커 하나에서만 동작하므로 app/services/jobs.py가 이 값을 확인합니다.
+"""
+
+import os
+import shutil
+import tempfile
+
+os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR", os.path.join(tempfile.gettempdir(), "yt_translator_metrics")
+)
+
+
+def on_starting(server):
+    """마스터 시작 - 이전 실행이 남긴 메트릭 파일 정리, 워커 수 전달"""
+    os.environ["GUNICORN_WORKERS"] = str(server.cfg.workers)
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """워커 종료 - 그 워커의 livesum 게이지 파일 정리"""
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
@@ -56,6 +56,7 @@ CREATE TABLE IF NOT EXISTS translations (
     word_count INTEGER,
     confidence_score DECIMAL(3,2) CHECK (confidence_score >= 0 AND confidence_score <= 1),
     processing_time DECIMAL(10,2),  -- 초 단위
+    result JSONB,                   -- 전체 번역 결과 (캐시에 다시 채울 때 사용)
     
     -- 타임스탬프
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
@@ -0,0 +1,11 @@
+"""
+테스트 공통 설정
+
+설정(app.config.settings)은 import 시점에 만들어지므로
+테스트 모듈보다 먼저 로드되는 여기서 환경변수를 지정합니다.
+"""
+
+import os
+
+# 테스트끼리 번역 메모리 파일을 공유하지 않도록 메모리 DB 사용
+os.environ.setdefault("TRANSLATION_MEMORY_PATH", ":memory:")
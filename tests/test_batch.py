@@ -0,0 +1,167 @@
+"""
+일괄 번역 스트리밍 테스트
+
+실행 방법:
+- pytest tests/test_batch.py
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import TranslateResponse, TranslationStatus
+from app.services.cache import MemoryCache, TieredCache
+from app.services.translator import TranslatorService
+from tests.test_cache import FakeRedis
+
+
+@pytest.fixture
+def service():
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        return TranslatorService()
+
+
+def make_translate(delays, cancelled=None):
+    """URL별로 정해진 시간 뒤 완료되는 캐시 미스 번역(_translate_miss) 대역"""
+    async def translate(url, target_language=None, start_time=None):
+        try:
+            await asyncio.sleep(delays[url])
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(url)
+            raise
+        return TranslateResponse(status=TranslationStatus.COMPLETED, youtube_url=url)
+
+    return translate
+
+
+async def test_results_arrive_in_completion_order(service):
+    """느린 영상을 기다리지 않고 끝난 순서대로 전달"""
+    delays = {"https://youtu.be/slow": 0.05, "https://youtu.be/fast": 0.0}
+
+    with patch.object(service, "_translate_miss", side_effect=make_translate(delays)):
+        results = [item async for item in service.translate_batch_stream(list(delays))]
+
+    assert [index for index, _ in results] == [1, 0]
+    assert results[0][1].youtube_url == "https://youtu.be/fast"
+
+
+async def test_item_timeout(service):
+    """제한 시간을 넘긴 영상만 실패 처리"""
+    delays = {"https://youtu.be/stuck": 10, "https://youtu.be/ok": 0.0}
+
+    with patch.object(service, "_translate_miss", side_effect=make_translate(delays)):
+        stream = service.translate_batch_stream(list(delays), item_timeout=0.05)
+        results = dict([item async for item in stream])
+
+    assert results[0].status == TranslationStatus.FAILED
+    assert "제한 시간" in results[0].error_message
+    assert results[1].status == TranslationStatus.COMPLETED
+
+
+async def test_stopping_early_cancels_remaining(service):
+    """소비자가 멈추면 남은 번역 취소"""
+    delays = {"https://youtu.be/a": 0.0, "https://youtu.be/b": 10, "https://youtu.be/c": 10}
+    cancelled = []
+
+    with patch.object(service, "_translate_miss", side_effect=make_translate(delays, cancelled)):
+        stream = service.translate_batch_stream(list(delays))
+        first = await stream.__anext__()
+        await stream.aclose()
+        await asyncio.sleep(0.01)
+
+    assert first[0] == 0
+    assert sorted(cancelled) == ["https://youtu.be/b", "https://youtu.be/c"]
+
+
+async def test_batch_size_cap(service):
+    """최대 개수를 넘으면 ValueError"""
+    with patch('app.config.settings.BATCH_MAX_URLS', 1):
+        with pytest.raises(ValueError):
+            await service.translate_batch(["https://youtu.be/a", "https://youtu.be/b"])
+
+
+async def test_translate_batch_keeps_request_order(service):
+    """목록 버전은 요청 순서대로 반환"""
+    delays = {"https://youtu.be/slow": 0.02, "https://youtu.be/fast": 0.0}
+
+    with patch.object(service, "_translate_miss", side_effect=make_translate(delays)):
+        results = await service.translate_batch(list(delays))
+
+    assert [r.youtube_url for r in results] == list(delays)
+
+
+async def test_cache_hits_skip_translation(service):
+    """캐시를 한 번에 조회해서 적중은 바로 전달하고 미스만 번역"""
+    redis = FakeRedis()
+    service.cache = TieredCache(l1=MemoryCache(), l2=redis, codec=service.cache.codec)
+    urls = [f"https://www.youtube.com/watch?v={c * 11}" for c in "abc"]
+    for url in urls[:2]:
+        result = {"status": "completed", "youtube_url": url, "translation": "캐시"}
+        await service._save_to_cache(url, result, "ko")
+    service.cache.l1.clear()  # 다른 워커가 저장한 상황 (L2에만 있음)
+
+    delays = {urls[2]: 0.0}
+    with patch.object(service, "_translate_miss", side_effect=make_translate(delays)) as miss:
+        results = [item async for item in service.translate_batch_stream(urls, "ko")]
+
+    assert miss.call_count == 1
+    assert miss.call_args.args[0] == urls[2]
+    assert [index for index, _ in results] == [0, 1, 2]
+    assert results[0][1].translation == "캐시"
+    assert redis.mget_calls == 1
+    assert service.cache_key_stats["hits"] == 2
+
+
+async def test_cached_failures_in_batch(service):
+    """캐시된 실패는 번역하지 않고 FAILED, 잘못된 URL은 translate()에서 거절"""
+    url = "https://www.youtube.com/watch?v=ddddddddddd"
+    await service._save_negative(url, "ko", "비공개 영상입니다")
+
+    with patch.object(service, "_translate_miss", side_effect=AssertionError("번역하지 않아야 함")):
+        stream = service.translate_batch_stream([url, "https://example.com/x"], "ko")
+        results = dict([item async for item in stream])
+
+    assert results[0].status == TranslationStatus.FAILED
+    assert results[0].error_message == "비공개 영상입니다"
+    assert "유효하지 않은" in results[1].error_message
+
+
+# ===========================
+# API 엔드포인트 테스트
+# ===========================
+
+def test_batch_stream_endpoint_ndjson():
+    """결과마다 NDJSON 한 줄, 마지막에 complete"""
+    client = TestClient(app)
+    delays = {
+        "https://www.youtube.com/watch?v=aaaaaaaaaaa": 0.02,
+        "https://www.youtube.com/watch?v=bbbbbbbbbbb": 0.0,
+    }
+
+    with patch("app.main.translator_service._translate_miss", side_effect=make_translate(delays)):
+        response = client.post("/api/translate/batch/stream", json={"youtube_urls": list(delays)})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [e["type"] for e in events] == ["result", "result", "complete"]
+    assert events[0]["index"] == 1
+    assert events[-1] == {"type": "complete", "total": 2, "succeeded": 2, "failed": 0}
+
+
+def test_batch_stream_endpoint_rejects_too_many_urls():
+    """최대 개수 초과 시 400"""
+    client = TestClient(app)
+
+    with patch("app.config.settings.BATCH_MAX_URLS", 1):
+        response = client.post(
+            "/api/translate/batch/stream",
+            json={"youtube_urls": ["https://youtu.be/aaaaaaaaaaa", "https://youtu.be/bbbbbbbbbbb"]}
+        )
+
+    assert response.status_code == 400
@@ -0,0 +1,118 @@
+"""
+벤치마크 도구 테스트 (가짜 Gemini 서버, 통계, 회귀 비교)
+
+실행 방법:
+- pytest tests/test_benchmarks.py
+"""
+
+import httpx
+import pytest
+from unittest.mock import patch
+
+from app.services.gemini_client import GeminiAPIError, GeminiClient
+from app.services.translator import TranslatorService
+from benchmarks.fake_gemini import FakeGeminiConfig, create_app
+from benchmarks.run import compare, percentile, summarize
+
+
+def fake_client(**config) -> GeminiClient:
+    app = create_app(FakeGeminiConfig(latency=0, jitter=0, seed=0, **config))
+    return GeminiClient(
+        api_key="benchmark",
+        model="gemini-1.5-flash",
+        base_url="http://fake-gemini",
+        http2=False,
+        transport=httpx.ASGITransport(app=app)
+    )
+
+
+@pytest.fixture
+def service():
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        return TranslatorService()
+
+
+async def test_fake_gemini_segment_response(service):
+    """자막 묶음 프롬프트에는 모든 줄을 번역한 JSON 배열로 응답"""
+    client = fake_client()
+    texts = ["Hello there.", "How are you?", "Goodbye."]
+
+    response = await client.generate(service._create_segment_prompt(texts, "ko"))
+    translations, missing = service._parse_segment_response(response, texts)
+
+    assert missing == 0
+    assert translations[1] == "[번역] How are you?"
+    await client.aclose()
+
+
+async def test_fake_gemini_url_response(service):
+    """URL 프롬프트에는 번역 형식 텍스트로 응답 (스트리밍은 여러 조각)"""
+    client = fake_client(stream_chunks=4)
+    prompt = service._create_translation_prompt("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "ko")
+
+    chunks = [chunk async for chunk in client.stream(prompt)]
+    parsed = service._parse_translation_response(
+        "".join(chunks), "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    )
+
+    assert len(chunks) == 4
+    assert parsed["video_title"] == "벤치마크 영상"
+    assert parsed["summary"].startswith("첫째 요약")
+    await client.aclose()
+
+
+async def test_fake_gemini_quota():
+    """분당 한도를 넘으면 429 (사용량 초과)"""
+    client = fake_client(quota_rpm=1)
+    await client.generate("prompt")
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await client.generate("prompt")
+    assert exc_info.value.is_quota
+    await client.aclose()
+
+
+async def test_fake_gemini_errors():
+    """오류율 1이면 항상 503 (재시도 가능 오류)"""
+    client = fake_client(error_rate=1.0)
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await client.generate("prompt")
+    assert exc_info.value.retryable
+    await client.aclose()
+
+
+def test_percentile():
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == pytest.approx(50.5)
+    assert percentile(values, 99) == pytest.approx(99.01)
+    assert percentile([], 95) == 0.0
+
+
+def test_summarize():
+    summary = summarize([0.1, 0.2, 0.3, 0.4], errors=1, elapsed=2.0)
+
+    assert summary["requests"] == 4
+    assert summary["error_rate"] == 0.25
+    assert summary["throughput_rps"] == 2.0
+    assert summary["p50_ms"] == 250.0
+    assert summary["max_ms"] == 400.0
+
+
+def test_compare_detects_regressions():
+    def scenario(p50, p95, p99, rps, error_rate):
+        return {"cache_hot": {
+            "p50_ms": p50, "p95_ms": p95, "p99_ms": p99,
+            "throughput_rps": rps, "error_rate": error_rate,
+        }}
+
+    baseline = scenario(10.0, 20.0, 30.0, 100.0, 0.0)
+
+    same = scenario(11.0, 21.0, 31.0, 95.0, 0.0)
+    assert compare(same, baseline, tolerance=0.2) == []
+
+    slower = scenario(11.0, 40.0, 31.0, 50.0, 0.05)
+    regressions = compare(slower, baseline, tolerance=0.2)
+    assert [line.split(":")[0] for line in regressions] == [
+        "cache_hot.p95_ms", "cache_hot.throughput_rps", "cache_hot.error_rate"
+    ]
@@ -0,0 +1,380 @@
+"""
+캐시 엔진 테스트
+MemoryCache의 LRU/TTL 동작과 TieredCache의 L1/L2 동작을 검증합니다.
+
+실행 방법:
+- pytest tests/test_cache.py
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from app.services.cache import MemoryCache, TieredCache, estimate_size
+from app.services.codec import CacheCodec
+
+
+class FakeRedis:
+    """테스트용 최소 비동기 Redis 대역 (get/mget/setex/delete/publish/pubsub/pipeline)"""
+
+    def __init__(self):
+        self.store = {}
+        self.published = []
+        self.messages = asyncio.Queue()
+        self.down = False
+        self.mget_calls = 0
+        self.pipelines = 0
+
+    async def get(self, key):
+        if self.down:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.down:
+            raise ConnectionError("redis down")
+        self.store[key] = value
+
+    async def mget(self, keys):
+        if self.down:
+            raise ConnectionError("redis down")
+        self.mget_calls += 1
+        return [self.store.get(key) for key in keys]
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        return FakePubSub(self)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """명령을 모았다가 execute()에서 한 번에 실행하는 파이프라인 대역"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def setex(self, key, ttl, value):
+        self.commands.append(("setex", key, ttl, value))
+        return self
+
+    def publish(self, channel, message):
+        self.commands.append(("publish", channel, message))
+        return self
+
+    async def execute(self):
+        if self.redis.down:
+            raise ConnectionError("redis down")
+        self.redis.pipelines += 1
+        for name, *args in self.commands:
+            await getattr(self.redis, name)(*args)
+
+
+class FakePubSub:
+    """FakeRedis.messages에 넣은 메시지를 돌려주는 구독 대역"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.channels = []
+        self.closed = False
+
+    async def subscribe(self, channel):
+        self.channels.append(channel)
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        try:
+            return await asyncio.wait_for(self.redis.messages.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def aclose(self):
+        self.closed = True
+
+
+# ===========================
+# MemoryCache 테스트
+# ===========================
+
+class TestMemoryCache:
+    """LRU/TTL 메모리 캐시 단위 테스트"""
+
+    def test_get_and_set(self):
+        """저장한 값을 그대로 조회"""
+        cache = MemoryCache(max_entries=10)
+        cache.set("a", {"translation": "안녕하세요"})
+
+        assert cache.get("a") == {"translation": "안녕하세요"}
+        assert cache.get("missing") is None
+        assert len(cache) == 1
+
+    def test_empty_cache_is_not_none(self):
+        """비어 있는 캐시도 '캐시 없음'으로 취급되면 안 됨"""
+        cache = MemoryCache()
+        assert len(cache) == 0
+        assert cache is not None
+
+    def test_lru_eviction_by_entries(self):
+        """항목 수 상한 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")  # a를 최근 사용으로 갱신
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert cache.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """전체 크기 상한 초과 시 오래된 항목부터 제거"""
+        value = "x" * 100
+        cache = MemoryCache(max_entries=100, max_bytes=estimate_size(value) * 2)
+        cache.set("a", value)
+        cache.set("b", value)
+        cache.set("c", value)
+
+        assert "a" not in cache
+        assert len(cache) == 2
+        assert cache.size_bytes <= cache.max_bytes
+
+    def test_oversized_value_is_rejected(self):
+        """상한보다 큰 값은 저장하지 않음"""
+        cache = MemoryCache(max_bytes=10)
+        assert cache.set("big", "x" * 100) is False
+        assert len(cache) == 0
+
+    def test_ttl_expiration(self):
+        """TTL이 지난 항목은 미스로 처리"""
+        cache = MemoryCache(default_ttl=60)
+
+        with patch("app.services.cache.time.monotonic", return_value=1000.0):
+            cache.set("a", 1)
+
+        with patch("app.services.cache.time.monotonic", return_value=1059.0):
+            assert cache.get("a") == 1
+
+        with patch("app.services.cache.time.monotonic", return_value=1061.0):
+            assert cache.get("a") is None
+
+        stats = cache.stats()
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 0
+
+    def test_overwrite_updates_size(self):
+        """같은 키를 덮어쓰면 크기가 다시 계산됨"""
+        cache = MemoryCache()
+        cache.set("a", "x" * 100)
+        cache.set("a", "x")
+
+        assert cache.size_bytes == estimate_size("x")
+
+    def test_stats(self):
+        """적중/미스 통계"""
+        cache = MemoryCache()
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+
+# ===========================
+# TieredCache 테스트
+# ===========================
+
+class TestTieredCache:
+    """L1 메모리 + L2 Redis 2단계 캐시 테스트"""
+
+    @pytest.fixture
+    def redis(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def cache(self, redis):
+        return TieredCache(l1=MemoryCache(max_entries=10), l2=redis, l1_ttl=60)
+
+    async def test_write_through(self, cache, redis):
+        """저장 시 L1과 L2에 모두 기록"""
+        await cache.set("k", {"translation": "번역"}, ttl=3600)
+
+        assert "k" in cache.l1
+        assert json.loads(redis.store["k"]) == {"translation": "번역"}
+
+    async def test_l2_hit_promotes_to_l1(self, cache, redis):
+        """L2 적중 시 L1으로 승격되어 다음 조회는 L2를 거치지 않음"""
+        redis.store["k"] = json.dumps({"translation": "번역"})
+
+        assert await cache.get("k") == {"translation": "번역"}
+        assert cache.promotions == 1
+        assert "k" in cache.l1
+
+        redis.store.clear()
+        assert await cache.get("k") == {"translation": "번역"}
+        assert cache.l2_hits == 1
+
+    async def test_miss(self, cache):
+        """두 계층 모두 없으면 None"""
+        assert await cache.get("missing") is None
+        assert cache.l2_misses == 1
+
+    async def test_memory_only(self):
+        """L2 없이도 메모리 캐시로 동작"""
+        cache = TieredCache(l1=MemoryCache())
+        await cache.set("k", 1, ttl=60)
+
+        assert await cache.get("k") == 1
+        assert cache.stats()["backend"] == "memory"
+
+    def test_invalidation_from_other_worker(self, cache):
+        """다른 워커의 무효화 메시지를 받으면 L1에서 제거"""
+        cache.l1.set("k", 1)
+        cache._handle_invalidation({"data": "other-node:k"})
+
+        assert "k" not in cache.l1
+        assert cache.invalidations_received == 1
+
+    def test_own_invalidation_is_ignored(self, cache):
+        """자신이 보낸 무효화 메시지는 무시"""
+        cache.l1.set("k", 1)
+        cache._handle_invalidation({"data": f"{cache.node_id}:k"})
+
+        assert "k" in cache.l1
+
+    async def test_publish_when_listener_running(self, cache, redis):
+        """무효화 리스너가 켜져 있으면 저장/삭제 시 전파"""
+        cache._listener = object()
+        await cache.set("k", 1, ttl=60)
+        await cache.delete("k")
+
+        assert [m for _, m in redis.published] == [f"{cache.node_id}:k"] * 2
+
+    async def test_get_many_uses_one_mget(self, cache, redis):
+        """L1에 없는 키만 MGET 한 번으로 조회하고 적중은 L1으로 승격"""
+        await cache.set("a", {"n": 1}, ttl=60)
+        redis.store["b"] = json.dumps({"n": 2})
+
+        found = await cache.get_many(["a", "b", "c", "b"])
+
+        assert found == {"a": {"n": 1}, "b": {"n": 2}}
+        assert redis.mget_calls == 1
+        assert "b" in cache.l1
+        assert cache.l2_hits == 1 and cache.l2_misses == 1
+
+        # 모두 L1에 있으면 Redis를 부르지 않음
+        await cache.get_many(["a", "b"])
+        assert redis.mget_calls == 1
+
+    async def test_set_many_uses_one_pipeline(self, cache, redis):
+        """여러 항목을 파이프라인 한 번으로 저장하고 무효화도 함께 전파"""
+        cache._listener = object()
+        await cache.set_many({"a": 1, "b": 2}, ttl=60)
+
+        assert redis.pipelines == 1
+        assert json.loads(redis.store["a"]) == 1
+        assert "a" in cache.l1 and "b" in cache.l1
+        assert len(redis.published) == 2
+
+    async def test_l2_errors_do_not_fail_requests(self, cache, redis):
+        """Redis 장애 시 조회는 미스, 저장은 L1에만 기록"""
+        redis.down = True
+        await cache.set("k", {"translation": "번역"}, ttl=60)
+
+        assert await cache.get("k") == {"translation": "번역"}
+        assert await cache.get("other") is None
+        await cache.set_many({"m": 1}, ttl=60)
+        assert await cache.get_many(["k", "m", "other"]) == {"k": {"translation": "번역"}, "m": 1}
+        assert cache.stats()["l2_errors"] == 4
+
+    async def test_invalidation_listener(self, cache, redis):
+        """리스너 Task가 다른 워커의 메시지를 받아 L1에서 제거하고, 중지 시 구독 종료"""
+        await cache.start_invalidation_listener()
+        pubsub = cache._pubsub
+        assert pubsub.channels == [TieredCache.INVALIDATION_CHANNEL]
+
+        cache.l1.set("k", 1)
+        await redis.messages.put({"type": "message", "data": "other-node:k"})
+        for _ in range(100):
+            if "k" not in cache.l1:
+                break
+            await asyncio.sleep(0.01)
+        assert "k" not in cache.l1
+
+        await cache.stop_invalidation_listener()
+        assert pubsub.closed
+        assert cache._listener is None
+
+
+class TestTieredCacheCodec:
+    """codec을 쓰는 2단계 캐시 - L2는 압축된 바이트, L1은 디코딩된 객체"""
+
+    @pytest.fixture
+    def redis(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def cache(self, redis):
+        codec = CacheCodec("json", "zlib", compress_min_bytes=0)
+        return TieredCache(l1=MemoryCache(max_entries=10), l2=redis, l1_ttl=60, codec=codec)
+
+    async def test_codec_only_at_l2(self, cache, redis):
+        """L2에는 인코딩된 바이트, L1 적중은 디코딩 없이 객체 반환"""
+        value = {"translation": "번역 " * 500}
+        await cache.set("k", value, ttl=3600)
+
+        assert isinstance(redis.store["k"], bytes)
+        assert redis.store["k"][0] == 0x11  # JSON + zlib
+        assert cache.l1.get("k") == value
+
+        with patch.object(cache.codec, "decode", side_effect=AssertionError("L1 적중에서 디코딩")):
+            assert await cache.get("k") == value
+            assert await cache.get_many(["k"]) == {"k": value}
+
+    async def test_results_are_not_shared(self, cache):
+        """조회 결과를 고쳐도 캐시 값은 그대로"""
+        await cache.set("k", {"translation": "번역"}, ttl=60)
+        (await cache.get("k"))["translation"] = "변경"
+
+        assert await cache.get("k") == {"translation": "번역"}
+
+    async def test_promotes_decoded_value(self, cache, redis):
+        """L2 값은 한 번 디코딩해서 객체로 L1에 승격"""
+        redis.store["k"] = cache.codec.encode({"translation": "번역"})
+
+        with patch.object(cache.codec, "decode", wraps=cache.codec.decode) as decode:
+            assert await cache.get("k") == {"translation": "번역"}
+            assert await cache.get("k") == {"translation": "번역"}
+
+        assert decode.call_count == 1
+        assert cache.l1.get("k") == {"translation": "번역"}
+
+    async def test_reads_legacy_json_entries(self, cache, redis):
+        redis.store["k"] = json.dumps({"translation": "예전"}, ensure_ascii=False).encode()
+
+        assert await cache.get("k") == {"translation": "예전"}
+
+    async def test_corrupt_entry_is_a_miss(self, cache, redis):
+        redis.store["k"] = b"\x11garbage"
+
+        assert await cache.get("k") is None
+        assert "k" not in redis.store
+        assert cache.stats()["decode_errors"] == 1
+
+    def test_invalidation_message_as_bytes(self, cache):
+        """decode_responses=False 클라이언트의 pub/sub 메시지"""
+        cache.l1.set("k", b"x")
+        cache._handle_invalidation({"data": b"other-node:k"})
+
+        assert "k" not in cache.l1
@@ -0,0 +1,101 @@
+"""
+캐시 값 codec 테스트
+
+실행 방법:
+- pytest tests/test_codec.py
+"""
+
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+
+from app.models import TranslationStatus
+from app.services import codec as codec_module
+from app.services.codec import CacheCodec, CodecError, create_cache_codec
+
+RESULT = {
+    "status": TranslationStatus.COMPLETED,
+    "youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "translation": "[00:00] 안녕하세요. 오늘은 캐시 형식을 설명합니다.\n" * 100,
+    "translated_at": datetime(2024, 1, 2, 3, 4, 5),
+    "word_count": 700,
+    "confidence_score": 0.95,
+}
+
+AVAILABLE = ["json", "json+zlib"]
+if codec_module.zstandard is not None:
+    AVAILABLE.append("json+zstd")
+if codec_module.msgpack is not None:
+    AVAILABLE += ["msgpack", "msgpack+zlib"]
+    if codec_module.zstandard is not None:
+        AVAILABLE.append("msgpack+zstd")
+
+
+def make(name: str, **options) -> CacheCodec:
+    serializer, _, compressor = name.partition("+")
+    return CacheCodec(serializer, compressor or "none", **options)
+
+
+@pytest.mark.parametrize("name", AVAILABLE)
+def test_round_trip(name):
+    """모든 형식이 같은 값을 돌려줌 (datetime, Enum은 문자열)"""
+    codec = make(name)
+    data = codec.encode(RESULT)
+
+    decoded = CacheCodec.decode(data)
+    assert decoded["translation"] == RESULT["translation"]
+    assert decoded["status"] == "completed"
+    assert decoded["translated_at"] == "2024-01-02T03:04:05"
+    assert decoded["word_count"] == 700
+
+
+@pytest.mark.parametrize("name", [n for n in AVAILABLE if "+" in n])
+def test_compresses_large_values(name):
+    """큰 값은 압축되어 JSON 텍스트보다 작음"""
+    codec = make(name)
+    legacy = json.dumps(RESULT, ensure_ascii=False, default=str).encode()
+
+    assert len(codec.encode(RESULT)) < len(legacy) / 5
+    assert codec.stats()["compression_ratio"] < 0.2
+
+
+def test_small_values_are_not_compressed():
+    codec = make("json+zlib", compress_min_bytes=1024)
+    data = codec.encode({"translation": "짧은 번역"})
+
+    assert data[0] == 0x10  # JSON, 압축 없음
+    assert CacheCodec.decode(data) == {"translation": "짧은 번역"}
+
+
+def test_reads_legacy_json():
+    """형식 바이트가 없는 예전 JSON 항목 (bytes / str 모두)"""
+    legacy = json.dumps({"translation": "예전 번역"}, ensure_ascii=False)
+
+    assert CacheCodec.decode(legacy) == {"translation": "예전 번역"}
+    assert CacheCodec.decode(legacy.encode("utf-8")) == {"translation": "예전 번역"}
+
+
+def test_corrupt_values_raise_codec_error():
+    with pytest.raises(CodecError):
+        CacheCodec.decode(b"\x11not-zlib")
+    with pytest.raises(CodecError):
+        CacheCodec.decode(b"{broken")
+    with pytest.raises(CodecError):
+        CacheCodec.decode(b"")
+
+
+def test_missing_package_on_read():
+    """zstd 값을 zstandard 없이 읽으면 CodecError (캐시 미스로 처리됨)"""
+    with patch.object(codec_module, "zstandard", None):
+        with pytest.raises(CodecError):
+            CacheCodec.decode(bytes((0x12,)) + b"...")
+
+
+def test_create_cache_codec_falls_back():
+    """설정한 패키지가 없으면 auto로 대체"""
+    with patch.object(codec_module, "msgpack", None), patch.object(codec_module, "zstandard", None):
+        codec = create_cache_codec("msgpack+zstd")
+
+    assert codec.name == "json+zlib"
+    assert create_cache_codec("json").name == "json"
@@ -0,0 +1,196 @@
+"""
+Gemini 비동기 HTTP 클라이언트 테스트
+
+실행 방법:
+- pytest tests/test_gemini_client.py
+"""
+
+import asyncio
+import json
+import pytest
+import httpx
+from unittest.mock import patch
+
+from app.services.gemini_client import GeminiAPIError, GeminiClient
+from app.services.translator import TranslatorService
+
+
+def gemini_body(text: str) -> dict:
+    return {"candidates": [{"content": {"parts": [{"text": text}]}}]}
+
+
+def make_client(handler, **kwargs) -> GeminiClient:
+    return GeminiClient(
+        api_key="test-key",
+        model="gemini-test",
+        base_url="https://gemini.test/v1beta",
+        transport=httpx.MockTransport(handler),
+        **kwargs
+    )
+
+
+class SlowStream(httpx.AsyncByteStream):
+    """첫 줄 이후 멈춰 있는 SSE 응답 본문 - 닫혔는지 기록"""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aiter__(self):
+        yield f"data: {json.dumps(gemini_body('첫 조각'))}\n\n".encode()
+        await asyncio.sleep(10)
+        yield b""
+
+    async def aclose(self):
+        self.closed = True
+
+
+# ===========================
+# generateContent
+# ===========================
+
+async def test_generate_success():
+    """요청 본문/헤더 확인 및 응답 텍스트 추출"""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=gemini_body("번역 결과"))
+
+    client = make_client(handler, generation_config={"temperature": 0.3})
+    assert await client.generate("프롬프트") == "번역 결과"
+    await client.aclose()
+
+    request = requests[0]
+    assert request.url.path == "/v1beta/models/gemini-test:generateContent"
+    assert request.headers["x-goog-api-key"] == "test-key"
+    payload = json.loads(request.content)
+    assert payload["contents"][0]["parts"][0]["text"] == "프롬프트"
+    assert payload["generationConfig"] == {"temperature": 0.3}
+
+
+@pytest.mark.parametrize("status, quota, retryable", [
+    (429, True, False),
+    (500, False, True),
+    (400, False, False),
+])
+async def test_generate_http_errors(status, quota, retryable):
+    """상태 코드별 오류 분류"""
+    def handler(request):
+        return httpx.Response(status, json={"error": {"message": "boom"}})
+
+    client = make_client(handler)
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await client.generate("프롬프트")
+
+    assert exc_info.value.status_code == status
+    assert exc_info.value.is_quota is quota
+    assert exc_info.value.retryable is retryable
+    assert "boom" in str(exc_info.value)
+
+
+async def test_generate_blocked_prompt():
+    """후보 응답이 없으면 차단 사유와 함께 실패"""
+    def handler(request):
+        return httpx.Response(200, json={"promptFeedback": {"blockReason": "SAFETY"}})
+
+    with pytest.raises(GeminiAPIError, match="SAFETY"):
+        await make_client(handler).generate("프롬프트")
+
+
+async def test_generate_timeout():
+    """제한 시간을 넘기면 재시도 가능한 GeminiAPIError"""
+    async def handler(request):
+        await asyncio.sleep(10)
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        await make_client(handler).generate("프롬프트", timeout=0.05)
+
+    assert exc_info.value.retryable
+
+
+async def test_client_is_reused():
+    """연결 풀을 쓰도록 HTTP 클라이언트는 하나만 생성"""
+    client = make_client(lambda request: httpx.Response(200, json=gemini_body("ok")))
+    first = client.client
+    await client.generate("a")
+    await client.generate("b")
+    assert client.client is first
+
+    await client.aclose()
+    assert first.is_closed
+
+
+# ===========================
+# streamGenerateContent
+# ===========================
+
+async def test_stream_parses_sse():
+    """SSE data 줄마다 텍스트 조각 전달"""
+    def handler(request):
+        assert request.url.params["alt"] == "sse"
+        body = "".join(f"data: {json.dumps(gemini_body(piece))}\r\n\r\n" for piece in ["안녕", "하세요"])
+        return httpx.Response(200, content=body.encode())
+
+    client = make_client(handler)
+    pieces = [piece async for piece in client.stream("프롬프트")]
+    assert pieces == ["안녕", "하세요"]
+
+
+async def test_stream_error_status():
+    """스트림 시작 전 오류 응답은 GeminiAPIError"""
+    def handler(request):
+        return httpx.Response(429, json={"error": {"message": "quota exceeded"}})
+
+    with pytest.raises(GeminiAPIError) as exc_info:
+        async for _ in make_client(handler).stream("프롬프트"):
+            pass
+
+    assert exc_info.value.is_quota
+
+
+async def test_stream_timeout_closes_response():
+    """중간에 멈춘 스트림은 제한 시간 후 연결을 닫음"""
+    body = SlowStream()
+    client = make_client(lambda request: httpx.Response(200, stream=body))
+
+    pieces = []
+    with pytest.raises(GeminiAPIError):
+        async for piece in client.stream("프롬프트", timeout=0.1):
+            pieces.append(piece)
+
+    assert pieces == ["첫 조각"]
+    assert body.closed
+
+
+async def test_stream_early_exit_closes_response():
+    """소비자가 중간에 멈추면 응답을 닫아 업스트림 요청 중단"""
+    body = SlowStream()
+    client = make_client(lambda request: httpx.Response(200, stream=body))
+
+    stream = client.stream("프롬프트")
+    assert await stream.__anext__() == "첫 조각"
+    await stream.aclose()
+
+    assert body.closed
+
+
+# ===========================
+# TranslatorService 연동
+# ===========================
+
+async def test_translator_does_not_retry_client_errors():
+    """400 같은 요청 오류는 재시도하지 않음"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(400, json={"error": {"message": "invalid argument"}})
+
+    service.gemini.transport = httpx.MockTransport(handler)
+    with pytest.raises(GeminiAPIError):
+        await service._call_gemini_api("prompt")
+
+    assert len(calls) == 1
+    await service.aclose()
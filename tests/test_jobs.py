@@ -0,0 +1,280 @@
+"""
+비동기 번역 작업 큐 테스트
+
+실행 방법:
+- pytest tests/test_jobs.py
+"""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models import TranslationStatus
+from app.services.jobs import (
+    InMemoryJobQueue,
+    JobManager,
+    QueueFullError,
+    RedisJobQueue,
+    create_job_queue,
+)
+
+
+class FakeResult:
+    """translate() 결과 대역 (pydantic .json()만 흉내)"""
+
+    def json(self):
+        return '{"status": "completed", "total_segments": 0}'
+
+
+class FakeJobRedis:
+    """RedisJobQueue가 쓰는 명령만 흉내 내는 비동기 Redis 대역 (Lua 스크립트는 같은 동작을 파이썬으로)"""
+
+    def __init__(self):
+        self.lists = {}
+        self.zsets = {}
+        self.hashes = {}
+
+    async def eval(self, script, numkeys, *args):
+        keys, argv = args[:numkeys], [str(arg) for arg in args[numkeys:]]
+        if script == RedisJobQueue.ENQUEUE_SCRIPT:
+            queue = self.lists.setdefault(keys[0], [])
+            if len(queue) >= int(argv[1]):
+                return 0
+            self.hashes.setdefault(keys[1], {}).update(zip(argv[3::2], argv[4::2]))
+            queue.insert(0, argv[0])
+            return 1
+        if script == RedisJobQueue.DEQUEUE_SCRIPT:
+            queue = self.lists.get(keys[0])
+            if not queue:
+                return None
+            job_id = queue.pop()
+            self.zsets.setdefault(keys[1], {})[job_id] = float(argv[0])
+            return job_id
+        if script == RedisJobQueue.UPDATE_SCRIPT:
+            if keys[0] not in self.hashes:
+                return 0
+            self.hashes[keys[0]].update(zip(argv[1::2], argv[2::2]))
+            return 1
+        raise NotImplementedError(script)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    async def zadd(self, key, mapping, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        for member, score in mapping.items():
+            if not xx or member in zset:
+                zset[member] = score
+
+    async def zrem(self, key, member):
+        self.zsets.get(key, {}).pop(member, None)
+
+    async def llen(self, key):
+        return len(self.lists.get(key, []))
+
+
+@pytest.fixture
+def fake_translator():
+    """느린 번역을 흉내 내는 번역 서비스 대역"""
+    translator = Mock()
+
+    async def translate(url, target_language=None):
+        await asyncio.sleep(0.01)
+        if "fail" in url:
+            raise ValueError("번역 실패")
+        return FakeResult()
+
+    translator.translate = translate
+    return translator
+
+
+# ===========================
+# InMemoryJobQueue 테스트
+# ===========================
+
+class TestInMemoryJobQueue:
+    """메모리 작업 큐 테스트"""
+
+    async def test_bounded_depth(self):
+        """대기열이 가득 차면 QueueFullError"""
+        queue = InMemoryJobQueue(max_depth=1)
+        await queue.enqueue({"job_id": "a", "status": "pending"})
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue({"job_id": "b", "status": "pending"})
+
+        assert await queue.depth() == 1
+
+    async def test_expired_lease_is_redelivered(self):
+        """임대 기한이 지난 작업은 큐로 되돌아감"""
+        queue = InMemoryJobQueue()
+        await queue.enqueue({"job_id": "a", "status": "pending"})
+
+        assert await queue.dequeue(lease_seconds=0, timeout=0.1) == "a"
+        assert await queue.depth() == 0
+
+        assert await queue.requeue_expired() == 1
+        assert await queue.dequeue(lease_seconds=60, timeout=0.1) == "a"
+
+    async def test_acked_job_is_not_redelivered(self):
+        """처리 완료된 작업은 되돌리지 않음"""
+        queue = InMemoryJobQueue()
+        await queue.enqueue({"job_id": "a", "status": "pending"})
+        await queue.dequeue(lease_seconds=0, timeout=0.1)
+        await queue.ack("a")
+
+        assert await queue.requeue_expired() == 0
+
+
+# ===========================
+# JobManager 테스트
+# ===========================
+
+class TestJobManager:
+    """작업 관리자 테스트"""
+
+    async def test_submit_and_wait(self, fake_translator):
+        """등록한 작업을 워커가 처리하고 long-poll로 결과 수신"""
+        manager = JobManager(fake_translator, InMemoryJobQueue(), workers=1, poll_interval=0.01)
+        await manager.start()
+        try:
+            job = await manager.submit("https://youtu.be/dQw4w9WgXcQ", "ko")
+            assert job["status"] == TranslationStatus.PENDING.value
+
+            done = await manager.wait(job["job_id"], timeout=2)
+        finally:
+            await manager.stop()
+
+        assert done["status"] == TranslationStatus.COMPLETED.value
+        assert done["attempts"] == 1
+        assert done["result"]["status"] == "completed"
+
+    async def test_failed_job(self, fake_translator):
+        """번역 실패는 failed 상태와 오류 메시지로 기록"""
+        manager = JobManager(fake_translator, InMemoryJobQueue(), workers=1, poll_interval=0.01)
+        await manager.start()
+        try:
+            job = await manager.submit("https://youtu.be/fail", "ko")
+            done = await manager.wait(job["job_id"], timeout=2)
+        finally:
+            await manager.stop()
+
+        assert done["status"] == TranslationStatus.FAILED.value
+        assert "번역 실패" in done["error_message"]
+
+    async def test_max_attempts(self, fake_translator):
+        """재전달이 최대 시도 횟수를 넘으면 실패 처리"""
+        queue = InMemoryJobQueue()
+        manager = JobManager(fake_translator, queue, workers=1, max_attempts=1, poll_interval=0.01)
+        job = await manager.submit("https://youtu.be/dQw4w9WgXcQ", "ko")
+        await queue.update(job["job_id"], attempts=1)
+
+        await queue.dequeue(lease_seconds=60, timeout=0.1)
+        await manager._process(job["job_id"])
+
+        done = await manager.get(job["job_id"])
+        assert done["status"] == TranslationStatus.FAILED.value
+
+
+    async def test_heartbeat_survives_extend_error(self, fake_translator):
+        """임대 연장이 한 번 실패해도 하트비트는 계속 연장"""
+        queue = InMemoryJobQueue()
+        queue.extend = AsyncMock(side_effect=[ConnectionError("Redis timeout")] + [None] * 10)
+        manager = JobManager(fake_translator, queue, workers=1, lease_seconds=0.03)
+
+        heartbeat = asyncio.ensure_future(manager._heartbeat("job"))
+        await asyncio.sleep(0.05)
+        assert not heartbeat.done()
+        heartbeat.cancel()
+
+        assert queue.extend.await_count >= 2
+
+
+# ===========================
+# RedisJobQueue 테스트
+# ===========================
+
+class TestRedisJobQueue:
+    """Redis 작업 큐 테스트"""
+
+    async def test_round_trip(self):
+        queue = RedisJobQueue(FakeJobRedis(), max_depth=1)
+        await queue.enqueue({"job_id": "a", "status": "pending", "result": None, "attempts": 0})
+
+        with pytest.raises(QueueFullError):
+            await queue.enqueue({"job_id": "b", "status": "pending"})
+
+        assert await queue.dequeue(lease_seconds=60, timeout=0) == "a"
+        assert await queue.get("a") == {
+            "job_id": "a", "status": "pending", "result": None, "attempts": 0
+        }
+        assert await queue.depth() == 0
+
+    async def test_concurrent_updates_keep_all_fields(self):
+        """하트비트와 작업 종료가 동시에 갱신해도 서로의 필드를 잃지 않음"""
+        queue = RedisJobQueue(FakeJobRedis())
+        await queue.enqueue({"job_id": "a", "status": "processing", "attempts": 1})
+
+        await asyncio.gather(
+            queue.update("a", status="completed", result={"total_segments": 3}),
+            queue.update("a", attempts=2),
+        )
+
+        job = await queue.get("a")
+        assert job["status"] == "completed"
+        assert job["result"] == {"total_segments": 3}
+        assert job["attempts"] == 2
+
+    async def test_update_does_not_revive_expired_job(self):
+        queue = RedisJobQueue(FakeJobRedis())
+        await queue.update("gone", status="completed")
+        assert await queue.get("gone") is None
+
+
+def test_memory_queue_refuses_multiple_workers():
+    """REDIS_URL 없이 gunicorn 워커가 여러 개면 작업이 다른 워커에서 404가 되므로 시작 거부"""
+    with patch("app.config.settings.REDIS_URL", ""), \
+            patch("app.config.settings.GUNICORN_WORKERS", 4):
+        with pytest.raises(RuntimeError):
+            create_job_queue()
+
+    with patch("app.config.settings.REDIS_URL", ""), \
+            patch("app.config.settings.GUNICORN_WORKERS", 1):
+        assert isinstance(create_job_queue(), InMemoryJobQueue)
+
+
+# ===========================
+# API 엔드포인트 테스트
+# ===========================
+
+def test_create_job_returns_429_when_queue_full():
+    """대기열이 가득 차면 429와 Retry-After 반환"""
+    client = TestClient(app)
+    with patch("app.main.job_manager.submit", AsyncMock(side_effect=QueueFullError("가득 참"))):
+        response = client.post(
+            "/api/jobs",
+            json={"youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+        )
+
+    assert response.status_code == 429
+    assert "Retry-After" in response.headers
+
+
+def test_create_job_returns_job_id():
+    """작업 등록 시 202와 작업 ID 반환"""
+    client = TestClient(app)
+    response = client.post(
+        "/api/jobs",
+        json={"youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+    )
+
+    assert response.status_code == 202
+    data = response.json()
+    assert data["status"] == "pending"
+    assert data["job_id"]
+
+    status = client.get(f"/api/jobs/{data['job_id']}")
+    assert status.status_code == 200
+    assert status.json()["job_id"] == data["job_id"]
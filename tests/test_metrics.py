@@ -0,0 +1,95 @@
+"""
+Prometheus 메트릭 테스트
+
+실행 방법:
+- pytest tests/test_metrics.py
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from app.main import app
+from app.services import metrics
+from app.services.gemini_client import GeminiAPIError
+from app.services.translator import TranslatorService
+
+
+def sample(name, **labels):
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0
+
+
+@pytest.fixture
+def service():
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        return TranslatorService()
+
+
+def test_metrics_endpoint():
+    """/metrics는 Prometheus 텍스트 형식으로 응답"""
+    client = TestClient(app)
+    client.get("/health")
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "yt_translate_duration_seconds" in response.text
+    expected = 'http_request_duration_seconds_count{method="GET",route="/health",status="200"}'
+    assert expected in response.text
+
+
+def test_route_label_uses_template():
+    """경로 파라미터 대신 라우트 템플릿으로 기록"""
+    client = TestClient(app)
+    labels = {"method": "GET", "route": "/api/jobs/{job_id}", "status": "404"}
+    before = sample("http_request_duration_seconds_count", **labels)
+    client.get("/api/jobs/does-not-exist")
+    after = sample("http_request_duration_seconds_count", **labels)
+
+    assert after == before + 1
+
+
+async def test_cache_hit_metrics(service):
+    """캐시 적중 시 계층별 카운터와 번역 시간 기록"""
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    result = {"status": "completed", "youtube_url": url, "translation": "번역"}
+    await service._save_to_cache(url, result, "ko")
+
+    hits = sample("yt_cache_requests_total", tier="l1", result="hit")
+    translated = sample("yt_translate_duration_seconds_count", outcome="cache_hit")
+    lookups = sample("yt_cache_lookup_duration_seconds_count")
+
+    await service.translate(url, "ko")
+
+    assert sample("yt_cache_requests_total", tier="l1", result="hit") == hits + 1
+    assert sample("yt_translate_duration_seconds_count", outcome="cache_hit") == translated + 1
+    assert sample("yt_cache_lookup_duration_seconds_count") == lookups + 1
+
+
+async def test_gemini_call_metrics(service):
+    """Gemini 호출 시간, 재시도, 사용량 초과 기록"""
+    ok = sample("yt_gemini_call_duration_seconds_count", kind="generate", status="ok")
+    with patch.object(service.gemini, "generate", AsyncMock(return_value="응답")):
+        await service._call_gemini_api("prompt")
+    assert sample("yt_gemini_call_duration_seconds_count", kind="generate", status="ok") == ok + 1
+
+    retries = sample("yt_retries_total", kind="gemini")
+    quota = sample("yt_gemini_quota_errors_total")
+    responses = [GeminiAPIError("boom", 503), GeminiAPIError("quota exceeded", 429)]
+    with patch.object(service.gemini, "generate", AsyncMock(side_effect=responses)), \
+            patch("app.services.translator.asyncio.sleep", AsyncMock()):
+        with pytest.raises(ValueError):
+            await service._call_gemini_api("prompt")
+
+    assert sample("yt_retries_total", kind="gemini") == retries + 1
+    assert sample("yt_gemini_quota_errors_total") == quota + 1
+    assert sample("yt_gemini_calls_in_flight") == 0
+
+
+def test_noop_metric_when_disabled():
+    """prometheus_client가 없으면 아무 일도 하지 않는 메트릭"""
+    metric = metrics._NoopMetric()
+    with metrics.observe_duration(metric.labels("x")), metrics.track_in_flight(metric):
+        metric.inc()
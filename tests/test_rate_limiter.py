@@ -0,0 +1,242 @@
+"""
+Gemini 호출 속도 제한 스케줄러 테스트
+
+실행 방법:
+- pytest tests/test_rate_limiter.py
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+
+from app.services.rate_limiter import (
+    GeminiScheduler,
+    LocalRateLimiter,
+    RedisRateLimiter,
+    _current_lane,
+    priority_lane,
+)
+from app.services.gemini_client import GeminiAPIError
+from app.services.translator import TranslatorService
+
+
+class BrokenRedis:
+    """항상 실패하는 Redis 대역"""
+
+    async def eval(self, *args):
+        raise ConnectionError("redis down")
+
+    async def set(self, *args, **kwargs):
+        raise ConnectionError("redis down")
+
+
+class FakeScriptRedis:
+    """ACQUIRE_SCRIPT 대신 정해진 대기 시간(ms)을 돌려주는 비동기 Redis 대역"""
+
+    def __init__(self, wait_ms=0):
+        self.wait_ms = wait_ms
+        self.calls = []
+
+    async def eval(self, *args):
+        self.calls.append(("eval", args))
+        return self.wait_ms
+
+    async def set(self, key, value, px=None):
+        self.calls.append(("set", key, px))
+
+
+# ===========================
+# 토큰 버킷
+# ===========================
+
+class TestLocalRateLimiter:
+    """워커별 토큰 버킷 테스트"""
+
+    async def test_requests_per_minute(self):
+        """RPM을 다 쓰면 다음 요청은 대기 시간 반환"""
+        limiter = LocalRateLimiter(rpm=2, tpm=1000)
+        assert await limiter.try_acquire(10) == 0
+        assert await limiter.try_acquire(10) == 0
+
+        wait = await limiter.try_acquire(10)
+        assert 0 < wait <= 30
+
+    async def test_tokens_per_minute(self):
+        """TPM이 부족하면 대기 - 요청 수는 차감하지 않음"""
+        limiter = LocalRateLimiter(rpm=100, tpm=100)
+        assert await limiter.try_acquire(80) == 0
+        assert await limiter.try_acquire(80) > 0
+        assert await limiter.try_acquire(20) == 0
+
+    async def test_pause(self):
+        """백오프 중에는 모든 요청 대기"""
+        limiter = LocalRateLimiter(rpm=100, tpm=1000)
+        await limiter.pause(5)
+        assert await limiter.try_acquire(1) > 4
+
+
+async def test_redis_limiter_falls_back_to_local():
+    """Redis 장애 시 로컬 버킷으로 계속 동작"""
+    limiter = RedisRateLimiter(BrokenRedis(), rpm=1, tpm=1000)
+    assert await limiter.try_acquire(10) == 0
+    assert await limiter.try_acquire(10) > 0
+    assert limiter.fallbacks == 2
+
+    await limiter.pause(1)  # 전파 실패해도 예외 없음
+
+
+async def test_scheduler_uses_async_redis_bucket():
+    """use_redis() 후에는 비동기 클라이언트로 공용 버킷 차감과 백오프 전파"""
+    redis = FakeScriptRedis()
+    scheduler = GeminiScheduler(LocalRateLimiter(rpm=60, tpm=1000))
+    scheduler.use_redis(redis)
+
+    async with scheduler.slot(5):
+        pass
+    await scheduler.report_quota_error()
+
+    assert scheduler.stats()["backend"] == "redis"
+    assert redis.calls[0][0] == "eval"
+    assert redis.calls[1] == ("set", RedisRateLimiter.PREFIX + "backoff", 2000)
+
+    scheduler.use_redis(None)
+    assert scheduler.stats()["backend"] == "local"
+
+
+# ===========================
+# 스케줄러
+# ===========================
+
+class TestGeminiScheduler:
+    """우선순위 레인 / 백오프 테스트"""
+
+    async def test_interactive_lane_goes_first(self):
+        """먼저 기다리던 batch 요청보다 interactive 요청이 먼저 자리를 받음"""
+        scheduler = GeminiScheduler(LocalRateLimiter(rpm=1000, tpm=10**6), max_concurrency=1)
+        order = []
+
+        async def call(name, lane):
+            async with scheduler.slot(1, lane):
+                order.append(name)
+
+        async with scheduler.slot(1):
+            batch = asyncio.ensure_future(call("batch", "batch"))
+            await asyncio.sleep(0)
+            interactive = asyncio.ensure_future(call("interactive", "interactive"))
+            await asyncio.sleep(0)
+            assert scheduler.stats()["waiting"] == {"interactive": 1, "batch": 1, "background": 0}
+
+        await asyncio.gather(batch, interactive)
+        assert order == ["interactive", "batch"]
+        assert scheduler.stats()["granted"] == {"interactive": 2, "batch": 1, "background": 0}
+
+    async def test_waits_for_bucket(self):
+        """버킷이 비면 채워질 때까지 기다렸다가 진행"""
+        scheduler = GeminiScheduler(LocalRateLimiter(rpm=600, tpm=10**6))  # 0.1초에 1개
+
+        async with scheduler.slot(1):
+            pass
+        scheduler.limiter._requests = 0
+
+        async with scheduler.slot(1):
+            pass
+
+        assert scheduler.delayed == 1
+        assert scheduler.stats()["wait_seconds"] > 0
+
+    async def test_adaptive_backoff(self):
+        """사용량 초과가 이어지면 백오프가 두 배씩, 성공하면 줄어듦"""
+        scheduler = GeminiScheduler(
+            LocalRateLimiter(rpm=60, tpm=1000), backoff_initial=2, backoff_max=5
+        )
+
+        await scheduler.report_quota_error()
+        scheduler._paused_until = 0.0  # 백오프 시간이 지난 뒤
+        await scheduler.report_quota_error()
+        assert scheduler.backoff == 4
+        scheduler._paused_until = 0.0
+        await scheduler.report_quota_error()
+        assert scheduler.backoff == 5  # 최대값
+
+        scheduler.report_success()
+        assert scheduler.backoff == 2.5
+        scheduler.report_success()
+        assert scheduler.backoff == 0
+        assert scheduler.quota_errors == 3
+
+    async def test_concurrent_quota_errors_double_once(self):
+        """멈춘 동안 동시에 들어온 사용량 초과는 백오프를 한 번만 늘림"""
+        scheduler = GeminiScheduler(
+            LocalRateLimiter(rpm=60, tpm=1000), backoff_initial=2, backoff_max=60
+        )
+
+        await asyncio.gather(*[scheduler.report_quota_error() for _ in range(8)])
+
+        assert scheduler.backoff == 2
+        assert scheduler.quota_errors == 8
+
+    async def test_is_idle(self):
+        """대기자나 백오프가 없고 동시 호출 자리가 절반 넘게 비었을 때만 한가함"""
+        scheduler = GeminiScheduler(LocalRateLimiter(rpm=60, tpm=1000), max_concurrency=4)
+        assert scheduler.is_idle()
+
+        async with scheduler.slot(1):
+            assert scheduler.is_idle()
+            async with scheduler.slot(1):
+                assert not scheduler.is_idle()
+
+        await scheduler.report_quota_error()
+        assert not scheduler.is_idle()
+
+    async def test_idle_again_after_backoff_expires(self):
+        """성공한 호출이 없어도 백오프 시간이 지나면 다시 한가함 (캐시 워머 재개)"""
+        scheduler = GeminiScheduler(LocalRateLimiter(rpm=60, tpm=1000), backoff_initial=0.05)
+
+        await scheduler.report_quota_error()
+        assert not scheduler.is_idle()
+        assert scheduler.stats()["paused_for"] > 0
+
+        await asyncio.sleep(0.06)
+        assert scheduler.is_idle()
+        assert scheduler.backoff == 0.05  # 다음 사용량 초과 시 두 배로 늘리기 위해 유지
+
+    def test_unknown_lane(self):
+        with pytest.raises(ValueError):
+            with priority_lane("urgent"):
+                pass
+
+
+# ===========================
+# TranslatorService 연동
+# ===========================
+
+async def test_quota_error_pauses_scheduler():
+    """Gemini 사용량 초과 시 스케줄러 백오프 시작"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+
+    error = GeminiAPIError("Resource has been exhausted (e.g. check quota).", 429)
+    with patch.object(service.gemini, "generate", side_effect=error):
+        with pytest.raises(ValueError):
+            await service._call_gemini_api("prompt")
+
+    assert service.scheduler.quota_errors == 1
+    assert service.scheduler.backoff > 0
+
+
+async def test_translate_batch_uses_batch_lane():
+    """일괄 번역은 batch 레인으로 실행"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+    lanes = []
+
+    async def fake_translate(url, target_language=None, start_time=None):
+        lanes.append(_current_lane.get())
+        raise ValueError("실패")
+
+    with patch.object(service, "_translate_miss", side_effect=fake_translate):
+        results = await service.translate_batch(["https://youtu.be/a", "https://youtu.be/b"])
+
+    assert lanes == ["batch", "batch"]
+    assert _current_lane.get() == "interactive"
+    assert all(r.status == "failed" for r in results)
@@ -0,0 +1,65 @@
+"""
+캐시용 비동기 Redis 클라이언트 테스트
+
+실행 방법:
+- pytest tests/test_redis_pool.py
+"""
+
+from unittest.mock import AsyncMock, patch
+
+from app.services.cache import MemoryCache
+from app.services.redis_pool import create_async_redis_client
+from app.services.translator import TranslatorService
+from tests.test_cache import FakeRedis
+
+
+async def test_no_url_means_memory_cache():
+    with patch('app.config.settings.REDIS_URL', ''):
+        assert await create_async_redis_client() is None
+
+
+async def test_unreachable_redis_falls_back():
+    """PING 실패 시 None (연결 풀도 닫음)"""
+    with patch('app.config.settings.REDIS_CONNECT_TIMEOUT', 0.2):
+        assert await create_async_redis_client("redis://127.0.0.1:1/0") is None
+
+
+async def test_pool_is_bounded():
+    """연결 풀 설정 (크기 상한, 대기 시간, 명령 제한 시간, 상태 확인)"""
+    with patch('app.services.redis_pool.redis_asyncio.Redis.ping', AsyncMock(return_value=True)):
+        client = await create_async_redis_client("redis://localhost:6379/0")
+
+    pool = client.connection_pool
+    assert pool.max_connections == 50
+    assert pool.timeout == 1.0
+    assert pool.connection_kwargs["socket_timeout"] == 0.5
+    assert pool.connection_kwargs["health_check_interval"] == 30
+    assert pool.connection_kwargs["decode_responses"] is False
+    await client.aclose(close_connection_pool=True)
+
+
+async def test_translator_start_wires_l2_and_closes():
+    """start()에서 L2와 분산 single-flight를 연결하고 aclose()에서 닫음"""
+    redis = FakeRedis()
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+    assert service.cache.l2 is None
+
+    connect = AsyncMock(return_value=redis)
+    with patch('app.services.translator.create_async_redis_client', connect), \
+            patch('app.config.settings.SINGLEFLIGHT_DISTRIBUTED', True):
+        await service.start()
+
+    assert service.cache.l2 is redis
+    assert isinstance(service.cache.l1, MemoryCache)
+    assert service._distributed_inflight.redis is redis
+
+    url = "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    result = {"status": "completed", "youtube_url": url, "translation": "번역"}
+    await service._save_to_cache(url, result, "ko")
+    assert isinstance(redis.store[service._generate_cache_key(url, "ko")], bytes)
+
+    with patch('app.services.translator.close_async_redis_client', AsyncMock()) as close:
+        await service.aclose()
+    close.assert_awaited_once_with(redis)
+    assert service.redis is None
@@ -0,0 +1,107 @@
+"""
+번역 응답 파서 테스트
+
+실행 방법:
+- pytest tests/test_response_parser.py
+"""
+
+import pytest
+from unittest.mock import patch
+
+from app.models import TranslateResponse
+from app.services.response_parser import (
+    TranslationResponseParser,
+    count_words,
+    parse_translation_response,
+)
+from app.services.translator import TranslatorService
+from benchmarks.parser_bench import legacy_parse, sample_response
+
+RESPONSE = """
+=== 영상 정보 ===
+제목: 테스트 비디오
+채널: 테스트 채널
+길이: 1:00:30
+
+=== 요약 ===
+- 첫째 요약
+
+- 둘째 요약
+
+=== 전체 번역 ===
+[00:00] [화자 1] 안녕하세요, 여러분.
+[00:15] 오늘은 **머신러닝(Machine Learning)**을 다룹니다.
+[화자 2] 영상 길이: 약 한 시간입니다.
+[1:00:00] 감사합니다.
+"""
+
+
+def test_extracts_sections_and_segments():
+    """영상 정보, 요약, [00:00] 세그먼트 추출"""
+    parsed = parse_translation_response(RESPONSE)
+
+    assert parsed["video_title"] == "테스트 비디오"
+    assert parsed["channel_name"] == "테스트 채널"
+    assert parsed["video_duration"] == "1:00:30"  # 본문의 "길이:"는 무시
+    assert parsed["summary"] == "- 첫째 요약\n\n- 둘째 요약"
+
+    segments = parsed["segments"]
+    assert parsed["total_segments"] == 3
+    spans = [(s["start_time"], s["end_time"]) for s in segments]
+    assert spans == [(0, 15), (15, 3600), (3600, 3630)]
+    assert segments[0]["translated_text"] == "[화자 1] 안녕하세요, 여러분."
+    assert segments[1]["translated_text"].endswith("\n[화자 2] 영상 길이: 약 한 시간입니다.")
+
+
+def test_matches_legacy_fields():
+    """이전 정규식 방식과 같은 영상 정보 / 요약 / 단어 수"""
+    text = sample_response(50)
+    parsed = parse_translation_response(text)
+    legacy = legacy_parse(text)
+
+    keys = (
+        "video_title", "channel_name", "video_duration", "summary", "word_count", "confidence_score"
+    )
+    for key in keys:
+        assert parsed[key] == legacy[key], key
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+def test_streamed_chunks_match_whole(chunk_size):
+    """조각 단위로 넣어도 한 번에 넣은 것과 같은 결과"""
+    parser = TranslationResponseParser()
+    for i in range(0, len(RESPONSE), chunk_size):
+        parser.feed(RESPONSE[i:i + chunk_size])
+
+    assert parser.close() == parse_translation_response(RESPONSE)
+
+
+def test_word_count():
+    """글머리표와 섹션 머리글의 ===는 단어로 세지 않음"""
+    assert count_words("  - 첫째 요약") == 2
+    assert count_words("[00:15] 오늘은 **머신러닝**을 다룹니다.") == 4
+    assert parse_translation_response("=== 요약 ===\n- 하나 둘\n")["word_count"] == 3
+
+
+def test_plain_text_without_sections():
+    """형식을 따르지 않은 응답도 단어 수와 신뢰도는 계산"""
+    parsed = parse_translation_response("그냥 번역된 문장입니다")
+
+    assert "segments" not in parsed
+    assert "summary" not in parsed
+    assert parsed["word_count"] == 3
+
+
+def test_translator_result_is_valid_response():
+    """파싱 결과의 세그먼트가 TranslateResponse로 검증됨"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+
+    result = service._parse_translation_response(
+        RESPONSE, "https://www.youtube.com/watch?v=dQw4w9WgXcQ"
+    )
+    response = TranslateResponse(**result)
+
+    assert response.total_segments == 3
+    assert response.segments[2].translated_text == "감사합니다."
+    assert response.translation == RESPONSE
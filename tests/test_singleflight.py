@@ -0,0 +1,302 @@
+"""
+중복 요청 합치기(single-flight) 테스트
+
+실행 방법:
+- pytest tests/test_singleflight.py
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import patch, AsyncMock
+
+from app.models import TranslationStatus
+from app.services.singleflight import SingleFlight, RedisSingleFlight
+from app.services.translator import TranslatorService
+
+
+class FakeLockRedis:
+    """테스트용 최소 비동기 Redis 대역 (SET NX PX / EXISTS / EVAL 해제·연장)"""
+
+    def __init__(self):
+        self.store = {}
+        self.expires = {}
+
+    def _expire(self, key):
+        if key in self.expires and self.expires[key] <= time.monotonic():
+            self.store.pop(key, None)
+            self.expires.pop(key, None)
+
+    async def set(self, key, value, nx=False, px=None):
+        self._expire(key)
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        if px is not None:
+            self.expires[key] = time.monotonic() + px / 1000
+        return True
+
+    async def exists(self, key):
+        self._expire(key)
+        return int(key in self.store)
+
+    async def eval(self, script, numkeys, key, token, *args):
+        self._expire(key)
+        if self.store.get(key) != token:
+            return 0
+        if "pexpire" in script:
+            self.expires[key] = time.monotonic() + int(args[0]) / 1000
+        else:
+            del self.store[key]
+            self.expires.pop(key, None)
+        return 1
+
+
+# ===========================
+# SingleFlight 테스트
+# ===========================
+
+class TestSingleFlight:
+    """프로세스 내부 합치기 테스트"""
+
+    async def test_concurrent_calls_share_one_execution(self):
+        """같은 키의 동시 호출은 작업을 한 번만 실행"""
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[flight.do("k", work) for _ in range(10)])
+
+        assert results == ["result"] * 10
+        assert calls == 1
+        assert flight.stats() == {"in_flight": 0, "leaders": 1, "coalesced": 9}
+
+    async def test_different_keys_run_separately(self):
+        """키가 다르면 각각 실행"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            return 1
+
+        await asyncio.gather(flight.do("a", work), flight.do("b", work))
+        assert flight.leaders == 2
+
+    async def test_exception_is_shared(self):
+        """작업 실패 시 기다리던 모든 호출자가 같은 예외를 받음"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("quota")
+
+        results = await asyncio.gather(
+            *[flight.do("k", work) for _ in range(3)],
+            return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert not flight.in_flight("k")
+
+    async def test_leader_cancellation_does_not_cancel_followers(self):
+        """첫 호출자가 취소되어도 다른 호출자는 결과를 받음"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("k", work))
+        await asyncio.sleep(0)
+
+        leader.cancel()
+        assert await follower == "done"
+
+    async def test_work_cancelled_when_all_callers_leave(self):
+        """기다리는 호출자가 모두 취소되면 작업도 취소"""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(flight.do("k", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        await asyncio.sleep(0)
+        assert not flight.in_flight("k")
+
+
+# ===========================
+# RedisSingleFlight 테스트
+# ===========================
+
+class TestRedisSingleFlight:
+    """Redis 락 기반 분산 합치기 테스트"""
+
+    async def test_lock_holder_runs_and_releases(self):
+        """락을 얻으면 작업 실행 후 락 해제"""
+        redis = FakeLockRedis()
+        flight = RedisSingleFlight(redis)
+
+        async def work():
+            return "result"
+
+        async def check():
+            return None
+
+        assert await flight.do("k", work, check) == "result"
+        assert redis.store == {}
+        assert flight.acquired == 1
+
+    async def test_waiter_uses_result_from_other_node(self):
+        """다른 노드가 락을 잡고 있으면 결과가 생길 때까지 기다림"""
+        redis = FakeLockRedis()
+        redis.store[f"{RedisSingleFlight.LOCK_PREFIX}k"] = "other-node"
+        flight = RedisSingleFlight(redis, poll_interval=0.01)
+        checks = iter([None, "from-other-node"])
+
+        async def work():
+            raise AssertionError("다른 노드가 작업 중이면 실행하지 않아야 함")
+
+        async def check():
+            return next(checks)
+
+        assert await flight.do("k", work, check) == "from-other-node"
+        assert flight.waited == 1
+
+    async def test_waiter_takes_over_when_lock_released(self):
+        """락이 결과 없이 풀리면 락을 다시 잡고 직접 실행"""
+        redis = FakeLockRedis()
+        lock_key = f"{RedisSingleFlight.LOCK_PREFIX}k"
+        redis.store[lock_key] = "other-node"
+        flight = RedisSingleFlight(redis, poll_interval=0.01)
+
+        async def work():
+            return "fallback"
+
+        async def check():
+            redis.store.pop(lock_key, None)
+            return None
+
+        assert await flight.do("k", work, check) == "fallback"
+        assert flight.acquired == 1
+        assert flight.fallbacks == 0
+        assert redis.store == {}
+
+    async def test_lock_is_extended_while_running(self):
+        """작업이 lock_ttl보다 길어도 락을 연장해 다른 노드가 중복 실행하지 않음"""
+        redis = FakeLockRedis()
+        calls = 0
+        result = None
+
+        async def work():
+            nonlocal calls, result
+            calls += 1
+            await asyncio.sleep(0.15)
+            result = "result"
+            return result
+
+        async def check():
+            return result
+
+        async def join_later():
+            await asyncio.sleep(0.1)
+            follower = RedisSingleFlight(redis, lock_ttl=0.05, poll_interval=0.01)
+            return await follower.do("k", work, check)
+
+        leader = RedisSingleFlight(redis, lock_ttl=0.05, poll_interval=0.01)
+        results = await asyncio.gather(leader.do("k", work, check), join_later())
+
+        assert results == ["result", "result"]
+        assert calls == 1
+
+    async def test_failed_holder_hands_over_to_one_waiter(self):
+        """작업 노드가 실패하면 기다리던 노드 중 하나만 작업을 이어받음"""
+        redis = FakeLockRedis()
+        calls = 0
+        result = None
+
+        async def failing():
+            await asyncio.sleep(0.02)
+            raise RuntimeError("Gemini 실패")
+
+        async def work():
+            nonlocal calls, result
+            calls += 1
+            await asyncio.sleep(0.05)
+            result = "result"
+            return result
+
+        async def check():
+            return result
+
+        def node():
+            return RedisSingleFlight(redis, poll_interval=0.01)
+
+        holder = asyncio.ensure_future(node().do("k", failing, check))
+        await asyncio.sleep(0)
+        waiters = await asyncio.gather(*[node().do("k", work, check) for _ in range(3)])
+
+        with pytest.raises(RuntimeError):
+            await holder
+        assert waiters == ["result"] * 3
+        assert calls == 1
+
+
+# ===========================
+# TranslatorService 통합
+# ===========================
+
+async def test_translate_coalesces_gemini_calls():
+    """같은 영상의 동시 번역 요청은 Gemini API를 한 번만 호출"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+
+    calls = 0
+
+    async def fake_gemini(prompt):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "번역 결과"
+
+    def fake_parse(response_text, youtube_url):
+        return {
+            "status": TranslationStatus.COMPLETED,
+            "video_metadata": {
+                "video_id": "dQw4w9WgXcQ",
+                "title": "Test",
+                "channel": "Test Channel",
+                "duration": 10,
+            },
+            "total_segments": 0,
+        }
+
+    urls = [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQ",
+    ] * 5
+
+    no_transcript = AsyncMock(side_effect=ValueError("자막 없음"))
+    with patch("app.services.translator.fetch_transcript", no_transcript), \
+            patch.object(service, "_call_gemini_api", side_effect=fake_gemini), \
+            patch.object(service, "_parse_translation_response", side_effect=fake_parse):
+        results = await asyncio.gather(*[service.translate(url) for url in urls])
+
+    assert calls == 1
+    assert all(r.status == TranslationStatus.COMPLETED for r in results)
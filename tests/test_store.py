@@ -0,0 +1,169 @@
+"""
+번역 결과 영구 저장소(L3) 테스트 - SQLite 대역 사용
+
+실행 방법:
+- pytest tests/test_store.py
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch
+
+from app.services.store import (
+    BatchedTranslationStore,
+    PostgresTranslationStore,
+    SQLiteTranslationStore,
+    build_row,
+    store_key,
+)
+from app.services.translator import TranslatorService
+
+
+RESULT = {
+    "status": "completed",
+    "youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+    "translation": "번역된 내용",
+    "summary": "요약",
+    "video_title": "제목",
+    "word_count": 2,
+    "confidence_score": 1.7,
+    "processing_time": 1.5,
+}
+
+
+@pytest.fixture
+def store():
+    return SQLiteTranslationStore(":memory:", batch_size=2, flush_interval=0.05)
+
+
+def test_build_row():
+    """translations 열 제약에 맞게 변환"""
+    row = build_row("yt_translation:v2:" + "x" * 80, "dQw4w9WgXcQ", "ko", RESULT)
+
+    assert len(row[0]) == 64
+    assert row[0] == store_key("yt_translation:v2:" + "x" * 80)
+    assert row[10] == 1.0  # confidence_score는 0~1
+    assert json.loads(row[-1])["translation"] == "번역된 내용"
+
+
+def test_postgres_upsert_sql():
+    """cache_key 기준 upsert, result는 jsonb로 변환"""
+    sql = PostgresTranslationStore.UPSERT_SQL
+    assert "ON CONFLICT (cache_key) DO UPDATE" in sql
+    assert "$13::jsonb" in sql
+
+
+async def test_save_is_visible_before_flush(store):
+    """기록 전인 결과도 바로 조회"""
+    await store.save("key-1", "vid", "ko", RESULT)
+    assert store.stats()["pending"] == 1
+    assert (await store.get("key-1"))["translation"] == "번역된 내용"
+    await store.aclose()
+
+
+async def test_writes_are_batched(store):
+    """batch_size만큼 모이면 한 번에 기록"""
+    with patch.object(store, "_write_rows", wraps=store._write_rows) as write_rows:
+        for i in range(4):
+            await store.save(f"key-{i}", "vid", "ko", RESULT)
+        await asyncio.sleep(0.01)
+        await store.flush()
+
+    assert [len(call.args[0]) for call in write_rows.call_args_list] == [2, 2]
+    assert store.stats()["pending"] == 0
+    assert (await store.get("key-3"))["summary"] == "요약"
+    assert await store.get("missing") is None
+    await store.aclose()
+
+
+async def test_interval_flush(store):
+    """묶음이 다 차지 않아도 주기마다 기록"""
+    await store.save("key-1", "vid", "ko", RESULT)
+    await asyncio.sleep(0.15)
+
+    assert store.stats()["writes"] == 1
+    assert store.stats()["pending"] == 0
+    await store.aclose()
+
+
+async def test_upsert_replaces_existing(store):
+    """같은 키를 다시 저장하면 최신 결과로 교체"""
+    await store.save("key-1", "vid", "ko", RESULT)
+    await store.flush()
+    await store.save("key-1", "vid", "ko", {**RESULT, "translation": "새 번역"})
+    await store.flush()
+
+    assert (await store.get("key-1"))["translation"] == "새 번역"
+    await store.aclose()
+
+
+async def test_popular_videos(store):
+    """많이 번역된 영상 순 (언어가 여러 개인 영상이 먼저)"""
+    await store.save("key-1", "popular_vid", "ko", RESULT)
+    await store.save("key-2", "popular_vid", "ja", RESULT)
+    await store.save("key-3", "other_vid", "ko", RESULT)
+    await store.flush()
+
+    assert await store.popular_videos(10) == ["popular_vid", "other_vid"]
+    assert await store.popular_videos(1) == ["popular_vid"]
+    await store.aclose()
+
+
+async def test_failed_write_is_retried(store):
+    """기록 실패 시 버리지 않고 다음 기록에 다시 시도"""
+    original = store._write_rows
+
+    async def broken(rows):
+        raise ConnectionError("db down")
+
+    await store.save("key-1", "vid", "ko", RESULT)
+    with patch.object(store, "_write_rows", side_effect=broken):
+        await store.flush()
+    assert store.stats()["write_errors"] == 1
+    assert store.stats()["pending"] == 1
+
+    with patch.object(store, "_write_rows", side_effect=original):
+        await store.flush()
+    assert store.stats()["pending"] == 0
+    await store.aclose()
+
+
+async def test_max_pending_drops_oldest():
+    """기록 대기 한도를 넘으면 오래된 것부터 버림"""
+    store = SQLiteTranslationStore(":memory:", batch_size=100, max_pending=2)
+    for i in range(3):
+        await store.save(f"key-{i}", "vid", "ko", RESULT)
+
+    assert store.stats()["dropped"] == 1
+    assert await store.get("key-0") is None
+    await store.aclose()
+
+
+async def test_translator_reads_through_store():
+    """캐시가 비어도 저장소에서 복원하고 캐시를 다시 채움"""
+    store = SQLiteTranslationStore(":memory:")
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'), \
+            patch('app.services.translator.create_translation_store', return_value=store):
+        service = TranslatorService()
+
+    url = RESULT["youtube_url"]
+    await service._save_to_cache(url, RESULT, "ko")
+    await store.flush()
+    service.cache.l1.clear()  # 재시작/캐시 제거 상황
+
+    restored = await service._get_from_cache(url, "ko")
+    assert restored["translation"] == "번역된 내용"
+    assert service.cache_key_stats["store_hits"] == 1
+
+    # 다음 조회는 캐시에서
+    await service._get_from_cache(url, "ko")
+    assert service.cache_key_stats["store_hits"] == 1
+    assert service.get_cache_stats()["store"]["hits"] == 1
+    await service.aclose()
+
+
+def test_batched_store_is_abstract():
+    """_fetch/_write_rows를 구현하지 않은 백엔드는 만들 수 없음"""
+    with pytest.raises(TypeError):
+        BatchedTranslationStore()
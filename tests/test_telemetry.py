@@ -0,0 +1,154 @@
+"""
+API 사용량 / 오류 기록 테스트 - SQLite 대역 사용
+
+실행 방법:
+- pytest tests/test_telemetry.py
+"""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.telemetry import SQLiteTelemetrySink, TelemetryWriter
+
+
+@pytest.fixture
+def writer():
+    return TelemetryWriter(
+        SQLiteTelemetrySink(":memory:"), capacity=100, batch_size=10, flush_interval=0.05
+    )
+
+
+def test_record_does_not_touch_sink():
+    """기록은 버퍼에 넣기만 함"""
+    class FailingSink:
+        backend = "broken"
+
+        async def write_usage(self, rows):
+            raise AssertionError("요청 경로에서 기록하면 안 됨")
+
+    writer = TelemetryWriter(FailingSink())
+    writer.record_usage("/api/translate", "POST", 200, 12.5)
+    assert writer.stats()["buffered"] == 1
+
+
+def test_ring_buffer_drops_oldest_under_overload():
+    """버퍼가 가득 차면 오래된 기록부터 버리고 개수를 셈"""
+    writer = TelemetryWriter(SQLiteTelemetrySink(":memory:"), capacity=3)
+    for i in range(5):
+        writer.record_usage(f"/api/{i}", "GET", 200, 1.0)
+
+    assert writer.stats()["dropped"] == 2
+    assert [row[0] for row in writer._usage] == ["/api/2", "/api/3", "/api/4"]
+
+
+async def test_flush_and_summary(writer):
+    """묶음으로 기록하고 DB에서 통계 계산"""
+    writer.record_usage("/api/translate", "POST", 200, 1000.0, "127.0.0.1", "pytest")
+    writer.record_usage("/api/translate", "POST", 200, 3000.0)
+    writer.record_usage("/api/translate/stream", "POST", 500, 2000.0)
+    writer.record_usage("/api/jobs", "POST", 202, 5.0)  # 번역 통계에서 제외
+    writer.record_usage("/api/translations/dQw4w9WgXcQ", "GET", 200, 1.0)  # 조회도 제외
+    writer.record_error(
+        "ValueError", "boom", endpoint="/api/translate", request_data={"youtube_url": "x"}
+    )
+    await writer.flush()
+
+    assert writer.stats()["written"] == 6
+    assert writer.stats()["buffered"] == 0
+
+    summary = await writer.summary()
+    assert summary["source"] == "sqlite"
+    assert summary["total_translations"] == 3
+    assert summary["today_translations"] == 3
+    assert summary["success_rate"] == pytest.approx(2 / 3, abs=1e-3)
+    assert summary["average_response_time"] == 2.0
+    assert summary["errors_today"] == 1
+    await writer.stop()
+
+
+async def test_background_flush(writer):
+    """주기마다 백그라운드에서 기록"""
+    await writer.start()
+    writer.record_usage("/api/translate", "POST", 200, 10.0)
+    await asyncio.sleep(0.15)
+
+    assert writer.stats()["written"] == 1
+    await writer.stop()
+
+
+async def test_failed_batch_is_dropped(writer):
+    """DB 오류 시 묶음을 버려 버퍼가 쌓이지 않음"""
+    writer.record_usage("/api/translate", "POST", 200, 10.0)
+    with patch.object(writer.sink, "write_usage", side_effect=ConnectionError("db down")):
+        await writer.flush()
+
+    assert writer.stats()["write_errors"] == 1
+    assert writer.stats()["dropped"] == 1
+    assert writer.stats()["buffered"] == 0
+    await writer.stop()
+
+
+async def test_summary_without_database():
+    """DB가 없으면 프로세스 내부 집계 사용"""
+    writer = TelemetryWriter()
+    writer.record_usage("/api/translate", "POST", 200, 500.0)
+    writer.record_usage("/api/translate", "POST", 400, 1500.0)
+
+    summary = await writer.summary()
+    assert summary["source"] == "process"
+    assert summary["total_translations"] == 2
+    assert summary["success_rate"] == 0.5
+    assert summary["average_response_time"] == 1.0
+    assert writer.stats()["buffered"] == 0
+
+
+def test_middleware_records_api_requests():
+    """API 요청은 기록, 정적 페이지는 제외"""
+    client = TestClient(app)
+    with patch("app.main.telemetry.record_usage") as record_usage:
+        client.get("/health")
+        client.post("/api/translate", json={})
+
+    assert record_usage.call_count == 1
+    kwargs = record_usage.call_args.kwargs
+    assert kwargs["endpoint"] == "/api/translate"
+    assert kwargs["status_code"] == 422
+    assert kwargs["response_time_ms"] >= 0
+
+
+def test_unhandled_error_is_recorded_once():
+    """처리되지 않은 예외는 500 핸들러에서 한 번만 error_logs에 기록"""
+    client = TestClient(app, raise_server_exceptions=False)
+    stats = patch("app.main.translator_service.get_cache_stats", side_effect=RuntimeError("boom"))
+    with patch("app.main.telemetry.record_error") as record_error, stats, \
+            patch("app.main.settings.DEBUG", True):
+        response = client.get("/api/stats")
+
+    assert response.status_code == 500
+    assert record_error.call_count == 1
+    assert record_error.call_args.args[:2] == ("RuntimeError", "boom")
+    assert "RuntimeError" in record_error.call_args.args[2]
+
+
+def test_stream_usage_is_recorded_when_body_finishes():
+    """스트리밍 응답은 본문이 끝난 뒤 전체 시간과 결과(error 이벤트면 500)로 기록"""
+    async def failing_stream(url, language):
+        yield {"type": "chunk", "text": "안녕"}
+        yield {"type": "error", "message": "Gemini 실패"}
+
+    client = TestClient(app)
+    with patch("app.main.telemetry.record_usage") as record_usage, \
+            patch("app.main.translator_service.translate_stream", failing_stream):
+        response = client.post(
+            "/api/translate/stream?format=ndjson",
+            json={"youtube_url": "https://www.youtube.com/watch?v=dQw4w9WgXcQ"}
+        )
+
+    assert response.status_code == 200
+    assert record_usage.call_count == 1
+    kwargs = record_usage.call_args.kwargs
+    assert kwargs["endpoint"] == "/api/translate/stream"
+    assert kwargs["status_code"] == 500
@@ -0,0 +1,117 @@
+"""
+요청 단계별 시간 측정 테스트
+
+실행 방법:
+- pytest tests/test_timing.py
+"""
+
+import logging
+import pytest
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import timing
+from app.services.translator import TranslatorService
+
+
+def test_span_accumulates_per_stage():
+    """같은 단계가 여러 번 실행되면 시간과 횟수를 합산"""
+    timings = timing.start_request_timing()
+    with timing.span("gemini"):
+        pass
+    with timing.span("gemini"):
+        pass
+    with timing.span("parse"):
+        pass
+
+    assert timings.counts == {"gemini": 2, "parse": 1}
+    header = timings.header()
+    assert header.startswith("gemini;dur=")
+    assert 'desc="x2"' in header
+    assert header.split(", ")[-1].startswith("total;dur=")
+
+
+def test_span_outside_request_is_ignored():
+    """요청 밖에서는 기록하지 않음"""
+    timing._current_timings.set(None)
+    with timing.span("gemini"):
+        pass
+    assert timing.current_timings() is None
+
+
+def test_span_records_on_error():
+    """예외가 나도 단계 시간은 기록"""
+    timings = timing.start_request_timing()
+    with pytest.raises(ValueError):
+        with timing.span("validate"):
+            raise ValueError("bad")
+    assert "validate" in timings.stages
+
+
+async def test_translate_stages():
+    """translate() 단계: 검증 → 캐시 → 프롬프트 → 속도 제한 대기 → Gemini → 파싱"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+
+    timings = timing.start_request_timing()
+    no_transcript = AsyncMock(side_effect=ValueError("자막 없음"))
+    with patch('app.services.translator.fetch_transcript', no_transcript), \
+            patch.object(service.gemini, "generate", AsyncMock(return_value="=== 전체 번역 ===\n안녕")):
+        await service.translate("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "ko")
+
+    assert list(timings.stages) == [
+        "validate", "cache", "transcript", "prompt", "rate_limit", "gemini", "parse"
+    ]
+
+
+def test_server_timing_header():
+    """API 응답에 Server-Timing 헤더"""
+    client = TestClient(app)
+    response = client.get("/api/jobs/does-not-exist")
+
+    assert response.status_code == 404
+    assert response.headers["server-timing"].startswith("total;dur=")
+
+
+def test_server_timing_can_be_disabled():
+    client = TestClient(app)
+    with patch("app.config.settings.SERVER_TIMING_ENABLED", False):
+        response = client.get("/api/jobs/does-not-exist")
+    assert "server-timing" not in response.headers
+
+
+def test_slow_request_log_has_fields(caplog):
+    """느린 요청은 단계별 시간을 구조화 필드로 로그"""
+    timings = timing.start_request_timing()
+    with timing.span("gemini"):
+        pass
+
+    with patch("app.config.settings.TIMING_SLOW_REQUEST_MS", 0), \
+            caplog.at_level(logging.INFO, logger="app.services.timing"):
+        timing.log_request_timings("POST", "/api/translate", 200, timings)
+
+    record = caplog.records[-1]
+    assert record.http_path == "/api/translate"
+    assert set(record.timings) == {"gemini", "total"}
+
+
+def test_opentelemetry_spans():
+    """트레이서가 설정되면 단계마다 OpenTelemetry span 생성"""
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    with patch.object(timing, "_tracer", provider.get_tracer("test")):
+        with timing.request_span("POST /api/translate"):
+            with timing.span("gemini", attempt=1):
+                pass
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert spans["gemini"].parent.span_id == spans["POST /api/translate"].context.span_id
+    assert spans["gemini"].attributes["attempt"] == 1
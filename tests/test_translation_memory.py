@@ -0,0 +1,139 @@
+"""
+자막 세그먼트 번역 메모리 테스트
+
+실행 방법:
+- pytest tests/test_translation_memory.py
+"""
+
+import json
+from unittest.mock import patch, AsyncMock
+
+from app.services.translation_memory import (
+    SQLiteTranslationMemory,
+    RedisTranslationMemory,
+    memory_key,
+    normalize_segment,
+)
+from app.services.translator import TranslatorService
+
+
+class FakeRedis:
+    """테스트용 최소 비동기 Redis 대역 (MGET / SETEX / EXPIRE 파이프라인)"""
+
+    def __init__(self):
+        self.store = {}
+
+    async def mget(self, keys):
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value
+
+    def expire(self, key, ttl):
+        pass
+
+    async def execute(self):
+        return []
+
+
+def test_normalize_segment():
+    """대소문자와 공백 차이는 같은 키"""
+    assert normalize_segment("  Subscribe   to my\nChannel ") == "subscribe to my channel"
+    key = memory_key("Subscribe to my channel", "ko")
+    assert key == memory_key("subscribe to  my channel", "ko")
+    assert key != memory_key("Subscribe to my channel", "ja")
+
+
+class TestSQLiteTranslationMemory:
+    """SQLite 번역 메모리 테스트"""
+
+    async def test_get_and_put(self):
+        """저장한 문장은 원문 순서대로 조회"""
+        memory = SQLiteTranslationMemory(":memory:")
+        await memory.put_many([("Hello", "안녕하세요")], "ko")
+
+        assert await memory.get_many(["hello", "Bye"], "ko") == ["안녕하세요", None]
+
+        stats = memory.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    async def test_lru_eviction(self):
+        """최대 항목 수를 넘으면 오래 사용하지 않은 항목부터 제거"""
+        memory = SQLiteTranslationMemory(":memory:", max_entries=2)
+        await memory.put_many([("a", "가")], "ko")
+        await memory.put_many([("b", "나")], "ko")
+        await memory.get_many(["a"], "ko")  # a를 최근 사용으로 갱신
+        await memory.put_many([("c", "다")], "ko")
+
+        assert len(memory) == 2
+        assert await memory.get_many(["a", "b", "c"], "ko") == ["가", None, "다"]
+        assert memory.stats()["evictions"] == 1
+
+    async def test_lookup_does_not_commit(self):
+        """조회 시 사용 시각은 모아 두었다가 다음 저장 때 기록"""
+        memory = SQLiteTranslationMemory(":memory:", touch_batch=3)
+        await memory.put_many([("a", "가"), ("b", "나"), ("c", "다")], "ko")
+        (before,) = memory._conn.execute("SELECT MAX(last_used) FROM translation_memory").fetchone()
+
+        await memory.get_many(["a", "b"], "ko")
+        assert memory._conn.total_changes == 3
+        assert len(memory._touched) == 2
+
+        await memory.get_many(["c"], "ko")  # touch_batch개가 모이면 저장 없이도 기록
+        assert not memory._touched
+        (after,) = memory._conn.execute("SELECT MIN(last_used) FROM translation_memory").fetchone()
+        assert after >= before
+        await memory.aclose()
+
+
+async def test_redis_translation_memory():
+    """Redis 번역 메모리는 MGET 한 번으로 조회"""
+    memory = RedisTranslationMemory(FakeRedis())
+    await memory.put_many([("Hello", "안녕하세요")], "ko")
+
+    assert await memory.get_many(["Hello", "Bye"], "ko") == ["안녕하세요", None]
+    assert memory.stats()["hit_rate"] == 0.5
+
+
+async def test_translate_segments_sends_only_misses():
+    """번역 메모리 적중 세그먼트는 Gemini 묶음에서 빠짐"""
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        service = TranslatorService()
+    service.translation_memory = SQLiteTranslationMemory(":memory:")
+    await service.translation_memory.put_many([("Subscribe to my channel", "구독 부탁드려요")], "ko")
+
+    segments = [
+        {"text": "Hello", "start": 0.0, "duration": 1.0},
+        {"text": "subscribe to my channel", "start": 1.0, "duration": 1.0},
+        {"text": "World", "start": 2.0, "duration": 1.0},
+        {"text": "Subscribe to my channel", "start": 3.0, "duration": 1.0},
+    ]
+    prompts = []
+
+    async def fake_gemini(prompt):
+        prompts.append(prompt)
+        items = json.loads(prompt.split("자막:")[-1])
+        return json.dumps([{"i": item["i"], "t": f"번역 {item['t']}"} for item in items])
+
+    with patch.object(service, "_call_gemini_api", side_effect=fake_gemini):
+        results = [item async for item in service.translate_segments(segments, "ko")]
+
+    subtitles = [s for _, batch in results for s in batch]
+    assert [s["translation"] for s in subtitles] == ["번역 Hello", "구독 부탁드려요", "번역 World", "구독 부탁드려요"]
+    assert [s["from_memory"] for s in subtitles] == [False, True, False, True]
+    assert [offset for offset, _ in results] == [0, 3]
+    assert len(prompts) == 1
+    assert "Subscribe" not in prompts[0]
+
+    # 한 번 번역한 문장은 다음 영상에서 재사용
+    with patch.object(service, "_call_gemini_api", AsyncMock()) as gemini:
+        results = [item async for item in service.translate_segments(segments[:1], "ko")]
+
+    gemini.assert_not_called()
+    assert results[0][1][0]["translation"] == "번역 Hello"
+    assert service.get_cache_stats()["translation_memory"]["hits"] == 3
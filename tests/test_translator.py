@@ -8,22 +8,40 @@ pytest를 사용하여 핵심 기능들을 테스트합니다.
 - 커버리지 포함: pytest --cov=app
 """
 
+import asyncio
+import httpx
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+import time
+from unittest.mock import patch, AsyncMock
 from datetime import datetime
+from fastapi.encoders import jsonable_encoder
 from fastapi.testclient import TestClient
 import json
 
-from app.main import app
+from app.main import app, translator_service as app_translator_service
 from app.models import TranslateRequest, TranslateResponse, TranslationStatus
 from app.services.translator import TranslatorService
+from app.services.gemini_client import GeminiAPIError, GeminiClient
+from app.services.transcript import TranscriptUnavailableError, VideoUnavailableError
+from app.services.response_cache import encode_response, etag_matches
 from app.config import settings
+from benchmarks.fake_gemini import FakeGeminiConfig, create_app
 
 
 # ===========================
 # Fixtures (테스트 데이터)
 # ===========================
 
+@pytest.fixture(autouse=True)
+def clear_app_cache():
+    """app.main의 translator_service 캐시를 테스트마다 비움 (앞 테스트 결과가 새지 않게)"""
+    if app_translator_service.cache is not None:
+        app_translator_service.cache.l1.clear()
+    if app_translator_service.response_cache is not None:
+        app_translator_service.response_cache.clear()
+    yield
+
+
 @pytest.fixture
 def test_client():
     """테스트용 FastAPI 클라이언트"""
@@ -102,7 +120,7 @@ def test_main_page(test_client):
 async def test_translate_endpoint_success(mock_translate, test_client, valid_youtube_url, mock_translation_response):
     """번역 API 성공 케이스"""
     # Mock 설정
-    mock_translate.return_value = AsyncMock(return_value=TranslateResponse(**mock_translation_response))
+    mock_translate.return_value = TranslateResponse(**mock_translation_response)
     
     # API 호출
     response = test_client.post(
@@ -118,6 +136,81 @@ async def test_translate_endpoint_success(mock_translate, test_client, valid_you
     assert data["youtube_url"] == valid_youtube_url
 
 
+def test_translate_endpoint_cache_hit(test_client, valid_youtube_url, mock_translation_response):
+    """캐시 적중은 인코딩된 본문을 그대로 보내고, POST는 If-None-Match와 무관하게 200"""
+    encoded = encode_response(TranslateResponse(**mock_translation_response))
+    
+    lookup = AsyncMock(return_value=encoded)
+    with patch('app.main.translator_service.get_cached_response', lookup), \
+            patch('app.main.translator_service.translate', AsyncMock()) as translate:
+        response = test_client.post(
+            "/api/translate",
+            json={"youtube_url": valid_youtube_url},
+            headers={"If-None-Match": encoded.etag}
+        )
+    
+    translate.assert_not_called()
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == encoded.body
+
+
+def test_get_translation_http_cache(test_client, mock_translation_response):
+    """GET 조회는 ETag, Cache-Control과 함께 응답하고 304도 같은 헤더"""
+    encoded = encode_response(TranslateResponse(**mock_translation_response))
+    
+    lookup = AsyncMock(return_value=encoded)
+    with patch('app.main.translator_service.get_cached_response', lookup):
+        response = test_client.get("/api/translations/dQw4w9WgXcQ?lang=en")
+        not_modified = test_client.get(
+            "/api/translations/dQw4w9WgXcQ?lang=en",
+            headers={"If-None-Match": f"W/{encoded.etag}"}
+        )
+    
+    lookup.assert_awaited_with("https://www.youtube.com/watch?v=dQw4w9WgXcQ", "en")
+    assert response.status_code == 200
+    assert response.content == encoded.body
+    assert response.headers["etag"] == encoded.etag
+    assert response.headers["cache-control"] == (
+        f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, "
+        f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}"
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == encoded.etag
+    assert not_modified.headers["cache-control"] == response.headers["cache-control"]
+
+
+def test_get_translation_miss_is_not_cached(test_client):
+    """캐시 미스(404)와 캐시된 실패(400)는 no-store, 잘못된 ID는 422"""
+    with patch('app.main.translator_service.get_cached_response', AsyncMock(return_value=None)):
+        missing = test_client.get("/api/translations/dQw4w9WgXcQ")
+    private = AsyncMock(side_effect=ValueError("Video is private"))
+    with patch('app.main.translator_service.get_cached_response', private):
+        failed = test_client.get("/api/translations/dQw4w9WgXcQ")
+    
+    assert missing.status_code == 404
+    assert missing.headers["cache-control"] == "no-store"
+    assert failed.status_code == 400
+    assert failed.json()["detail"] == "Video is private"
+    assert failed.headers["cache-control"] == "no-store"
+    assert test_client.get("/api/translations/not-an-id").status_code == 422
+    assert test_client.get("/api/translations/dQw4w9WgXcQ?lang=xx").status_code == 422
+
+
+@pytest.mark.parametrize("header,matches", [
+    (None, False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other", "abc"', True),
+    ('"other"', False),
+    ("*", True),
+])
+def test_etag_matches(header, matches):
+    """If-None-Match 비교 (약한 비교, 목록, *)"""
+    assert etag_matches(header, '"abc"') is matches
+
+
 def test_translate_endpoint_invalid_url(test_client, invalid_youtube_url):
     """잘못된 URL로 번역 요청"""
     response = test_client.post(
@@ -207,13 +300,63 @@ class TestTranslatorService:
         key3 = translator_service._generate_cache_key(different_url)
         assert key1 != key3
     
-    @patch('google.generativeai.GenerativeModel.generate_content')
+    def test_cache_key_is_canonical_per_video(self, translator_service):
+        """같은 영상의 여러 URL 형식은 같은 캐시 키 생성"""
+        urls = [
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://youtu.be/dQw4w9WgXcQ",
+            "https://www.youtube.com/watch?v=dQw4w9WgXcQ&t=30",
+            "https://m.youtube.com/watch?v=dQw4w9WgXcQ",
+            "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        ]
+        keys = {translator_service._generate_cache_key(url) for url in urls}
+        
+        assert len(keys) == 1
+        assert "dQw4w9WgXcQ" in keys.pop()
+        
+        # 대상 언어가 다르면 다른 키
+        ko_key = translator_service._generate_cache_key(urls[0], "ko")
+        ja_key = translator_service._generate_cache_key(urls[0], "ja")
+        assert ko_key != ja_key
+    
+    async def test_legacy_cache_key_is_migrated(
+        self, translator_service, valid_youtube_url, mock_translation_response
+    ):
+        """예전 URL 해시 키에 있는 결과를 찾아 정규화 키로 이전"""
+        legacy_key = translator_service._legacy_cache_key(valid_youtube_url)
+        await translator_service.cache.set(legacy_key, mock_translation_response, ttl=60)
+        
+        cached = await translator_service._get_from_cache(valid_youtube_url, "ko")
+        
+        # 캐시 값은 직렬화를 거치므로 datetime 등은 응답 모델로 비교
+        expected = TranslateResponse(**mock_translation_response)
+        assert TranslateResponse(**cached) == expected
+        new_key = translator_service._generate_cache_key(valid_youtube_url, "ko")
+        assert TranslateResponse(**await translator_service.cache.get(new_key)) == expected
+        assert translator_service.cache_key_stats["legacy_hits"] == 1
+    
+    async def test_normalized_hits_are_counted(self, translator_service, mock_translation_response):
+        """다른 URL 형식으로 적중하면 정규화 효과로 집계"""
+        await translator_service._save_to_cache(
+            mock_translation_response["youtube_url"],
+            mock_translation_response,
+            "ko"
+        )
+        
+        cached = await translator_service._get_from_cache("https://youtu.be/dQw4w9WgXcQ", "ko")
+        
+        assert cached is not None
+        stats = translator_service.get_cache_stats()["keys"]
+        assert stats["hits"] == 1
+        assert stats["normalized_hits"] == 1
+        assert stats["url_key_hit_rate"] < stats["hit_rate"]
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    @patch('app.services.gemini_client.GeminiClient.generate', new_callable=AsyncMock)
     async def test_translate_success(self, mock_generate, translator_service, valid_youtube_url, mock_gemini_response):
-        """번역 성공 테스트"""
+        """번역 성공 테스트 (자막이 없는 영상)"""
         # Mock 설정
-        mock_response = Mock()
-        mock_response.text = mock_gemini_response
-        mock_generate.return_value = mock_response
+        mock_generate.return_value = mock_gemini_response
         
         # 번역 실행
         result = await translator_service.translate(valid_youtube_url)
@@ -224,6 +367,287 @@ class TestTranslatorService:
         assert result.translation is not None
         assert "안녕하세요" in result.translation
     
+    async def test_translate_from_transcript(self, translator_service, valid_youtube_url):
+        """자막이 있으면 묶음 번역 결과로 segments 채우기"""
+        transcript = [
+            {"text": "Hello", "start": 0.0, "duration": 2.0},
+            {"text": "World", "start": 65.0, "duration": 1.5},
+        ]
+        response = '[{"i": 1, "t": "안녕하세요"}, {"i": 2, "t": "세계"}]'
+        
+        fetch = AsyncMock(return_value=transcript)
+        gemini = AsyncMock(return_value=response)
+        with patch('app.services.translator.fetch_transcript', fetch), \
+                patch.object(translator_service, "_call_gemini_api", gemini):
+            result = await translator_service.translate(valid_youtube_url)
+        
+        assert gemini.call_count == 1
+        assert result.total_segments == 2
+        assert result.segments[1].translated_text == "세계"
+        assert result.segments[1].end_time == 66.5
+        assert result.video_metadata.video_id == "dQw4w9WgXcQ"
+        assert result.video_metadata.duration == 66
+        assert result.translation == "[00:00] 안녕하세요\n[01:05] 세계"
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_translate_stream(
+        self, translator_service, valid_youtube_url, mock_gemini_response
+    ):
+        """스트리밍 번역 - 조각 전달 후 전체 결과 파싱 및 캐시 저장"""
+        pieces = [mock_gemini_response[:40], mock_gemini_response[40:]]
+        
+        async def fake_stream(prompt, timeout=None):
+            for piece in pieces:
+                yield piece
+        
+        with patch.object(translator_service.gemini, "stream", side_effect=fake_stream):
+            events = [
+                event async for event in translator_service.translate_stream(valid_youtube_url)
+            ]
+        
+        assert [e["text"] for e in events if e["type"] == "chunk"] == pieces
+        complete = events[-1]
+        assert complete["type"] == "complete"
+        assert complete["cached"] is False
+        assert complete["result"]["video_title"] == "테스트 비디오"
+        assert complete["ttfb"] is not None
+        
+        # 두 번째 요청은 캐시에서 바로 완료
+        events = [event async for event in translator_service.translate_stream(valid_youtube_url)]
+        assert len(events) == 1
+        assert events[0]["cached"] is True
+        assert translator_service.get_stream_stats()["cache_hits"] == 1
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_translate_stream_error(self, translator_service, valid_youtube_url):
+        """스트리밍 중 사용량 초과 시 error 이벤트"""
+        async def fake_stream(prompt, timeout=None):
+            raise GeminiAPIError("Resource has been exhausted (e.g. check quota).", 429)
+            yield
+        
+        with patch.object(translator_service.gemini, "stream", side_effect=fake_stream):
+            events = [
+                event async for event in translator_service.translate_stream(valid_youtube_url)
+            ]
+        
+        assert events[-1]["type"] == "error"
+        assert "사용량" in events[-1]["message"]
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_concurrent_streams_share_one_call(
+        self, translator_service, valid_youtube_url, mock_gemini_response
+    ):
+        """같은 영상의 스트림과 translate()는 Gemini 스트림 하나를 함께 기다림"""
+        calls = []
+        
+        async def fake_stream(prompt, timeout=None):
+            calls.append(prompt)
+            await asyncio.sleep(0.05)
+            yield mock_gemini_response
+        
+        async def collect(delay):
+            await asyncio.sleep(delay)
+            return [event async for event in translator_service.translate_stream(valid_youtube_url)]
+        
+        async def translate_later():
+            await asyncio.sleep(0.01)
+            return await translator_service.translate(valid_youtube_url)
+        
+        with patch.object(translator_service.gemini, "stream", side_effect=fake_stream):
+            leader, joined, result = await asyncio.gather(
+                collect(0), collect(0.01), translate_later()
+            )
+        
+        assert len(calls) == 1
+        assert [e["type"] for e in leader] == ["chunk", "complete"]
+        assert [e["type"] for e in joined] == ["complete"]
+        assert joined[-1]["result"]["video_title"] == result.video_title == "테스트 비디오"
+    
+    async def test_translate_stream_uses_transcript(self, translator_service, valid_youtube_url):
+        """자막이 있으면 스트림도 자막 기반으로 번역 (URL 프롬프트 결과로 덮어쓰지 않음)"""
+        transcript = [{"text": "Hello", "start": 0.0, "duration": 1.0}]
+        
+        async def fake_gemini(prompt):
+            items = json.loads(prompt.split("자막:")[-1])
+            return json.dumps([{"i": item["i"], "t": "안녕하세요"} for item in items])
+        
+        fetch = AsyncMock(return_value=transcript)
+        with patch('app.services.translator.fetch_transcript', fetch), \
+                patch.object(translator_service, "_call_gemini_api", side_effect=fake_gemini), \
+                patch.object(translator_service.gemini, "stream") as stream:
+            events = [
+                event async for event in translator_service.translate_stream(valid_youtube_url)
+            ]
+        
+        stream.assert_not_called()
+        assert [e["type"] for e in events] == ["complete"]
+        assert events[0]["result"]["total_segments"] == 1
+        cached = await translator_service._get_from_cache(valid_youtube_url)
+        assert cached["total_segments"] == 1
+    
+    async def _save_stale(self, service, url, data):
+        """soft TTL이 지난 캐시 항목 만들기"""
+        key = service._generate_cache_key(url, "ko")
+        stale_at = time.time() - settings.CACHE_SOFT_TTL - 1
+        await service.cache.set(key, {**data, "_cached_at": stale_at}, ttl=60)
+        return key
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_stale_entry_is_served_and_refreshed(
+        self, translator_service, valid_youtube_url, mock_translation_response, mock_gemini_response
+    ):
+        """soft TTL이 지난 결과는 바로 반환하고 백그라운드에서 한 번만 갱신"""
+        key = await self._save_stale(
+            translator_service, valid_youtube_url, mock_translation_response
+        )
+        
+        generate = AsyncMock(return_value=mock_gemini_response)
+        with patch.object(translator_service.gemini, "generate", generate):
+            first = await translator_service._get_from_cache(valid_youtube_url, "ko")
+            second = await translator_service._get_from_cache(valid_youtube_url, "ko")
+            await asyncio.gather(*translator_service._refreshing.values())
+        
+        assert first["translation"] == mock_translation_response["translation"]
+        assert "_cached_at" not in first
+        assert second["translation"] == first["translation"]
+        assert generate.call_count == 1
+        
+        refreshed = await translator_service._get_from_cache(valid_youtube_url, "ko")
+        assert refreshed["video_title"] == "테스트 비디오"
+        assert (await translator_service.cache.get(key))["_cached_at"] > time.time() - 5
+        stats = translator_service.get_cache_stats()["revalidation"]
+        assert stats["stale_hits"] == 2
+        assert stats["refreshes"] == 1
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_failed_refresh_keeps_stale_entry(
+        self, translator_service, valid_youtube_url, mock_translation_response
+    ):
+        """갱신이 실패해도 실패 결과로 덮어쓰지 않고 기존 결과 유지"""
+        await self._save_stale(translator_service, valid_youtube_url, mock_translation_response)
+        
+        error = GeminiAPIError("Video is private", 403)
+        with patch.object(translator_service.gemini, "generate", AsyncMock(side_effect=error)):
+            await translator_service._get_from_cache(valid_youtube_url, "ko")
+            await asyncio.gather(*translator_service._refreshing.values())
+        
+        cached = await translator_service._get_from_cache(valid_youtube_url, "ko")
+        assert cached["translation"] == mock_translation_response["translation"]
+        stats = translator_service.get_cache_stats()["revalidation"]
+        assert stats["refresh_failures"] == 1
+        assert stats["negative_saves"] == 0
+    
+    @patch('app.services.translator.fetch_transcript', AsyncMock(side_effect=ValueError("자막 없음")))
+    async def test_permanent_failure_is_cached(self, translator_service, valid_youtube_url):
+        """비공개 영상 등 4xx 실패는 NEGATIVE_CACHE_TTL 동안 Gemini를 다시 부르지 않음"""
+        error = GeminiAPIError("Gemini API 오류 (400): Video is private", 400)
+        generate = AsyncMock(side_effect=error)
+        with patch.object(translator_service.gemini, "generate", generate):
+            for _ in range(3):
+                with pytest.raises(ValueError, match="Video is private"):
+                    await translator_service.translate(valid_youtube_url)
+            
+            events = [
+                event async for event in translator_service.translate_stream(valid_youtube_url)
+            ]
+        
+        assert generate.call_count == 1
+        assert events == [{"type": "error", "message": events[0]["message"]}]
+        assert "Video is private" in events[0]["message"]
+        assert translator_service.get_cache_stats()["revalidation"]["negative_hits"] == 3
+    
+    @pytest.mark.parametrize("status_code,permanent", [
+        (400, True), (401, False), (403, False), (404, True),
+        (429, False), (500, False), (None, False)
+    ])
+    def test_permanent_failure_classification(self, status_code, permanent):
+        """4xx만 캐시 (API 키/권한 오류, 사용량 초과, 5xx, 시간 초과/연결 오류 제외)"""
+        error = GeminiAPIError("오류", status_code)
+        assert TranslatorService._is_permanent_failure(error) is permanent
+        assert TranslatorService._is_permanent_failure(ValueError("오류")) is False
+        assert TranslatorService._is_permanent_failure(
+            GeminiAPIError(
+                "Gemini API 오류 (400): API key not valid. Please pass a valid API key.", 400
+            )
+        ) is False
+        assert TranslatorService._is_permanent_failure(VideoUnavailableError("비공개 영상")) is True
+    
+    async def test_unavailable_video_is_cached(self, translator_service, valid_youtube_url):
+        """비공개/삭제된 영상은 URL 프롬프트로 넘기지 않고 실패 결과로 캐시"""
+        fetch = AsyncMock(side_effect=VideoUnavailableError("이 영상을 볼 수 없습니다"))
+        with patch('app.services.translator.fetch_transcript', fetch), \
+                patch.object(translator_service.gemini, "generate", AsyncMock()) as generate:
+            for _ in range(2):
+                with pytest.raises(ValueError, match="이 영상을 볼 수 없습니다"):
+                    await translator_service.translate(valid_youtube_url)
+        
+        generate.assert_not_called()
+        assert fetch.await_count == 1
+        assert translator_service.get_cache_stats()["revalidation"]["negative_hits"] == 1
+    
+    async def test_missing_transcript_is_remembered(
+        self, translator_service, valid_youtube_url, mock_gemini_response
+    ):
+        """자막이 없는 영상은 NEGATIVE_CACHE_TTL 동안 자막 조회 없이 URL 프롬프트로 번역"""
+        fetch = AsyncMock(side_effect=TranscriptUnavailableError("자막 없음"))
+        generate = AsyncMock(return_value=mock_gemini_response)
+        with patch('app.services.translator.fetch_transcript', fetch), \
+                patch.object(translator_service.gemini, "generate", generate):
+            await translator_service.translate(valid_youtube_url, "ko")
+            await translator_service.translate(valid_youtube_url, "ja")
+        
+        assert fetch.await_count == 1
+        stats = translator_service.get_cache_stats()["revalidation"]
+        assert stats["no_transcript_saves"] == 1
+        assert stats["no_transcript_hits"] == 1
+    
+    async def test_cached_response_matches_slow_path(
+        self, translator_service, valid_youtube_url, mock_translation_response
+    ):
+        """빠른 경로 본문은 response_model 직렬화와 같고, 워커에서 한 번만 인코딩"""
+        await translator_service._save_to_cache(valid_youtube_url, mock_translation_response, "ko")
+        
+        with patch('app.services.translator.encode_response', wraps=encode_response) as encode:
+            first = await translator_service.get_cached_response(valid_youtube_url, "ko")
+            second = await translator_service.get_cached_response(valid_youtube_url, "ko")
+        
+        expected = jsonable_encoder(TranslateResponse(**mock_translation_response))
+        assert json.loads(first.body) == expected
+        assert second is first
+        assert encode.call_count == 1
+        
+        # 새 결과를 저장하면 인코딩된 본문도 다시 만듦
+        await translator_service._save_to_cache(
+            valid_youtube_url, {**mock_translation_response, "translation": "새 번역"}, "ko"
+        )
+        updated = await translator_service.get_cached_response(valid_youtube_url, "ko")
+        assert json.loads(updated.body)["translation"] == "새 번역"
+        assert updated.etag != first.etag
+    
+    async def test_cached_response_miss_and_negative(
+        self, translator_service, valid_youtube_url, invalid_youtube_url
+    ):
+        """미스와 잘못된 URL은 None, 캐시된 실패는 ValueError"""
+        assert await translator_service.get_cached_response(valid_youtube_url, "ko") is None
+        assert await translator_service.get_cached_response(invalid_youtube_url, "ko") is None
+        
+        await translator_service._save_negative(valid_youtube_url, "ko", "Video is private")
+        with pytest.raises(ValueError, match="Video is private"):
+            await translator_service.get_cached_response(valid_youtube_url, "ko")
+    
+    async def test_cache_miss_checks_tiers_once(
+        self, translator_service, valid_youtube_url, mock_gemini_response
+    ):
+        """빠른 경로에서 미스를 확인했으면 translate()는 캐시를 다시 조회하지 않음"""
+        fetch = AsyncMock(side_effect=TranscriptUnavailableError("자막 없음"))
+        generate = AsyncMock(return_value=mock_gemini_response)
+        with patch('app.services.translator.fetch_transcript', fetch), \
+                patch.object(translator_service.gemini, "generate", generate):
+            assert await translator_service.get_cached_response(valid_youtube_url, "ko") is None
+            await translator_service.translate(valid_youtube_url, "ko", cache_checked=True)
+        
+        assert translator_service.cache_key_stats["lookups"] == 1
+    
     async def test_translate_invalid_url(self, translator_service, invalid_youtube_url):
         """잘못된 URL로 번역 시도"""
         with pytest.raises(ValueError, match="유효하지 않은 YouTube URL"):
@@ -319,26 +743,46 @@ class TestIntegration:
 
 @pytest.mark.performance
 class TestPerformance:
-    """성능 테스트"""
+    """성능 테스트 (benchmarks/fake_gemini.py의 가짜 Gemini 서버 사용)"""
     
-    def test_cache_performance(self, translator_service):
-        """캐시 성능 테스트"""
-        import time
-        
-        url = "https://www.youtube.com/watch?v=test"
-        
-        # 첫 번째 호출 (캐시 미스)
-        start = time.time()
-        key1 = translator_service._generate_cache_key(url)
-        time1 = time.time() - start
-        
-        # 두 번째 호출 (이미 계산됨)
-        start = time.time()
-        key2 = translator_service._generate_cache_key(url)
-        time2 = time.time() - start
+    GEMINI_LATENCY = 0.05
+    
+    @pytest.fixture
+    def fake_gemini(self):
+        """지연 시간이 고정된 가짜 Gemini 앱"""
+        return create_app(FakeGeminiConfig(latency=self.GEMINI_LATENCY, jitter=0, seed=0))
+    
+    @pytest.fixture
+    def translator_service(self, fake_gemini):
+        """가짜 Gemini로 호출하는 번역 서비스"""
+        with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+            service = TranslatorService()
+        service.gemini = GeminiClient(
+            api_key="benchmark",
+            model=settings.GEMINI_MODEL,
+            base_url="http://fake-gemini",
+            http2=False,
+            transport=httpx.ASGITransport(app=fake_gemini)
+        )
+        return service
+    
+    async def test_cache_performance(self, translator_service, fake_gemini, valid_youtube_url):
+        """같은 영상 동시 요청은 Gemini 한 번, 이후 캐시 적중은 Gemini 지연 없이 응답"""
+        fetch = AsyncMock(side_effect=TranscriptUnavailableError("자막 없음"))
+        with patch('app.services.translator.fetch_transcript', fetch):
+            herd = await asyncio.gather(*[
+                translator_service.translate(valid_youtube_url, "ko") for _ in range(10)
+            ])
+            
+            start = time.perf_counter()
+            for _ in range(20):
+                await translator_service.translate(valid_youtube_url, "ko")
+            hot_latency = (time.perf_counter() - start) / 20
         
-        assert key1 == key2
-        assert time2 < time1  # 두 번째가 더 빨라야 함
+        assert all(result.status == TranslationStatus.COMPLETED for result in herd)
+        assert fake_gemini.state.fake.counters["requests"] == 1
+        assert hot_latency < self.GEMINI_LATENCY
+        await translator_service.aclose()
 
 
 # ===========================
@@ -0,0 +1,251 @@
+"""
+인기 영상 캐시 워머 테스트
+
+실행 방법:
+- pytest tests/test_warmer.py
+"""
+
+import asyncio
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from app.config import settings
+from app.services.store import SQLiteTranslationStore
+from app.services.translator import TranslatorService
+from app.services.warmer import AccessCounter, CacheWarmer, popular_key
+from tests.test_cache import FakePipeline, FakeRedis
+
+
+RESULT = {
+    "status": "completed",
+    "youtube_url": "https://www.youtube.com/watch?v=aaaaaaaaaaa",
+    "translation": "번역된 내용",
+}
+
+
+class FakeCounterRedis(FakeRedis):
+    """sorted set과 SET NX를 지원하는 Redis 대역"""
+
+    def __init__(self):
+        super().__init__()
+        self.zsets = {}
+
+    async def zincrby(self, key, amount, member):
+        zset = self.zsets.setdefault(key, {})
+        zset[member] = zset.get(member, 0) + amount
+
+    async def zrevrange(self, key, start, end, withscores=False):
+        ranked = sorted(self.zsets.get(key, {}).items(), key=lambda item: -item[1])
+        return [(member.encode(), score) for member, score in ranked[start:end + 1]]
+
+    async def expire(self, key, seconds):
+        pass
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def pipeline(self, transaction=True):
+        return FakeCounterPipeline(self)
+
+
+class FakeCounterPipeline(FakePipeline):
+    def zincrby(self, key, amount, member):
+        self.commands.append(("zincrby", key, amount, member))
+        return self
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+        return self
+
+
+@pytest.fixture
+def service():
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        return TranslatorService()
+
+
+def url(video_id):
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+
+def test_access_counter():
+    """많이 요청된 순서, 주기마다 절반으로 줄이고 1번뿐인 항목은 사라짐"""
+    counter = AccessCounter()
+    for _ in range(3):
+        counter.record("aaaaaaaaaaa", "ko")
+    counter.record("bbbbbbbbbbb", "ja")
+    counter.record(None, "ko")
+
+    assert counter.top(10) == [("aaaaaaaaaaa", "ko"), ("bbbbbbbbbbb", "ja")]
+    assert counter.drain() == {"aaaaaaaaaaa:ko": 3, "bbbbbbbbbbb:ja": 1}
+    assert not counter.pending
+
+    counter.decay()
+    counter.decay()
+    assert counter.top(10) == [("aaaaaaaaaaa", "ko")]
+
+
+async def test_requests_are_counted(service):
+    """translate()와 캐시 적중 빠른 경로가 요청 빈도를 기록"""
+    await service._save_to_cache(url("aaaaaaaaaaa"), RESULT, "ko")
+
+    await service.translate(url("aaaaaaaaaaa"), "ko")
+    await service.get_cached_response("https://youtu.be/aaaaaaaaaaa", "ko")
+    with pytest.raises(ValueError):
+        await service.translate("https://not-youtube.com/video")
+
+    assert service.access_counter.counts == {"aaaaaaaaaaa:ko": 2}
+
+
+async def test_warms_popular_videos_within_budget(service):
+    """인기 순으로 확인 - 최신 결과는 건너뛰고, 없거나 오래된 것만 예산 안에서 번역"""
+    counts = {"aaaaaaaaaaa": 5, "bbbbbbbbbbb": 4, "ccccccccccc": 3, "ddddddddddd": 2}
+    for video_id, count in counts.items():
+        for _ in range(count):
+            service.access_counter.record(video_id, "ko")
+
+    await service._save_to_cache(url("aaaaaaaaaaa"), RESULT, "ko")
+    stale_at = time.time() - settings.CACHE_SOFT_TTL - 1
+    stale_key = service._generate_cache_key(url("bbbbbbbbbbb"), "ko")
+    await service.cache.set(stale_key, {**RESULT, "_cached_at": stale_at}, ttl=60)
+
+    warmer = CacheWarmer(service, max_translations=2)
+    with patch.object(service, "warm", AsyncMock()) as warm:
+        summary = await warmer.run_once()
+
+    assert summary == {"fresh": 1, "refreshed": 1, "translated": 1, "over_budget": 1}
+    assert [call.args for call in warm.await_args_list] == [
+        (url("bbbbbbbbbbb"), "ko"), (url("ccccccccccc"), "ko")
+    ]
+    assert warmer.last_source == "local"
+    assert warmer.stats()["outcomes"]["translated"] == 1
+
+
+async def test_busy_scheduler_stops_the_cycle(service):
+    """사용자 요청이 기다리고 있으면 Gemini를 쓰지 않고 이번 주기 종료"""
+    service.access_counter.record("aaaaaaaaaaa", "ko")
+    service.access_counter.record("bbbbbbbbbbb", "ko")
+
+    warmer = CacheWarmer(service)
+    with patch.object(service.scheduler, "is_idle", return_value=False), \
+            patch.object(service, "warm", AsyncMock()) as warm:
+        summary = await warmer.run_once()
+
+    warm.assert_not_awaited()
+    assert summary == {"busy": 1}
+
+
+async def test_failed_warm_is_counted(service):
+    service.access_counter.record("aaaaaaaaaaa", "ko")
+
+    warmer = CacheWarmer(service)
+    with patch.object(service, "warm", AsyncMock(side_effect=ValueError("자막 없음"))):
+        assert await warmer.run_once() == {"failed": 1}
+
+
+async def test_warm_uses_background_lane(service):
+    """미리 번역은 가장 낮은 레인으로 Gemini 호출"""
+    lanes = []
+
+    async def fake_translate(*args, **kwargs):
+        from app.services.rate_limiter import _current_lane
+        lanes.append(_current_lane.get())
+        assert kwargs["cache_failure"] is False
+
+    with patch.object(service, "_translate_uncached", fake_translate):
+        await service.warm(url("aaaaaaaaaaa"), "ko")
+
+    assert lanes == ["background"]
+
+
+async def test_warm_skips_key_in_flight(service):
+    """사용자 요청이 이미 번역 중인 키는 건너뛰고 예산도 쓰지 않음"""
+    service.access_counter.record("aaaaaaaaaaa", "ko")
+    release = asyncio.Event()
+
+    async def user_translation():
+        await release.wait()
+        return RESULT
+
+    cache_key = service._generate_cache_key(url("aaaaaaaaaaa"), "ko")
+    user = asyncio.ensure_future(service._inflight.do(cache_key, user_translation))
+    await asyncio.sleep(0)
+
+    warmer = CacheWarmer(service, max_translations=1)
+    with patch.object(service, "_translate_uncached", AsyncMock()) as translate:
+        assert await service.warm(url("aaaaaaaaaaa"), "ko") is False
+        assert await warmer.run_once() == {"in_flight": 1}
+
+    translate.assert_not_awaited()
+    release.set()
+    assert await user == RESULT
+
+
+async def test_cache_state_reads_store_without_cache(service):
+    """캐시가 꺼져 있으면 저장소 결과를 복원하지 않고 그 상태만 확인"""
+    service.cache = None
+    service.store = SQLiteTranslationStore(":memory:")
+    cache_key = service._generate_cache_key(url("aaaaaaaaaaa"), "ko")
+    await service.store.save(cache_key, "aaaaaaaaaaa", "ko", {**RESULT, "_cached_at": time.time()})
+    await service.store.flush()
+
+    assert await service.cache_state(url("aaaaaaaaaaa"), "ko") == "fresh"
+    await service.store.aclose()
+
+
+async def test_restores_from_store_without_gemini(service):
+    """캐시가 비어도 저장소에 있는 인기 영상은 복원만 (popular_videos 순서)"""
+    service.store = SQLiteTranslationStore(":memory:")
+    cache_key = service._generate_cache_key(url("aaaaaaaaaaa"), "ko")
+    await service.store.save(cache_key, "aaaaaaaaaaa", "ko", {**RESULT, "_cached_at": time.time()})
+    await service.store.flush()
+
+    warmer = CacheWarmer(service)
+    with patch.object(service, "warm", AsyncMock()) as warm:
+        summary = await warmer.run_once()
+
+    warm.assert_not_awaited()
+    assert summary == {"restored": 1}
+    assert warmer.last_source == "store"
+    assert await service.cache_state(url("aaaaaaaaaaa"), "ko") == "fresh"
+    await service.store.aclose()
+
+
+async def test_restored_entry_keeps_stored_timestamp(service):
+    """저장소에서 복원한 오래된 결과는 stale로 남아 다시 번역됨"""
+    service.store = SQLiteTranslationStore(":memory:")
+    old = time.time() - settings.CACHE_SOFT_TTL - 10
+    cache_key = service._generate_cache_key(url("aaaaaaaaaaa"), "ko")
+    await service.store.save(cache_key, "aaaaaaaaaaa", "ko", {**RESULT, "_cached_at": old})
+    await service.store.flush()
+
+    assert await service.cache_state(url("aaaaaaaaaaa"), "ko") == "restored"
+    assert await service.cache_state(url("aaaaaaaaaaa"), "ko") == "stale"
+    await service.store.aclose()
+
+
+async def test_redis_counts_are_shared_and_locked(service):
+    """워커 집계를 Redis에 합치고, 주기마다 한 워커만 데움"""
+    redis = FakeCounterRedis()
+    service.redis = redis
+    for _ in range(2):
+        service.access_counter.record("aaaaaaaaaaa", "ko")
+    redis.zsets[popular_key(time.time() - 86400)] = {"bbbbbbbbbbb:ja": 5}
+
+    first = CacheWarmer(service, max_translations=0)
+    second = CacheWarmer(service, max_translations=0)
+    assert await first.run_once() == {"over_budget": 2}
+    assert await second.run_once() == {"locked": 1}
+
+    assert redis.zsets[popular_key(time.time())] == {"aaaaaaaaaaa:ko": 2}
+    assert await first.candidates(redis) == [("bbbbbbbbbbb", "ja"), ("aaaaaaaaaaa", "ko")]
+    assert first.last_source == "redis"
+
+
+def test_unknown_source(service):
+    with pytest.raises(ValueError):
+        CacheWarmer(service, source="kafka")
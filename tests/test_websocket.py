@@ -0,0 +1,162 @@
+"""
+실시간 자막 번역 (WebSocket) 테스트
+
+실행 방법:
+- pytest tests/test_websocket.py
+"""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import patch, AsyncMock
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.gemini_client import GeminiAPIError
+from app.services.transcript import batch_segments
+from app.services.translator import TranslatorService
+
+
+def make_segments(count):
+    """테스트용 자막 세그먼트 생성"""
+    return [
+        {"text": f"line {i}", "start": float(i), "duration": 1.0}
+        for i in range(count)
+    ]
+
+
+async def fake_gemini(prompt):
+    """입력 JSON의 각 줄을 그대로 '번역'해서 돌려주는 Gemini 대역"""
+    items = json.loads(prompt.split("자막:")[-1])
+    return json.dumps([{"i": item["i"], "t": item["t"].replace("line", "번역")} for item in items])
+
+
+@pytest.fixture
+def service():
+    with patch('app.config.settings.GEMINI_API_KEY', 'test-key'):
+        return TranslatorService()
+
+
+# ===========================
+# 세그먼트 번역 파이프라인
+# ===========================
+
+def test_batch_segments():
+    """고정 개수 묶음으로 나누기"""
+    batches = batch_segments(make_segments(5), 2)
+    assert [len(b) for b in batches] == [2, 2, 1]
+
+
+async def test_segment_batch_keeps_original_for_missing_lines(service):
+    """재시도 후에도 응답에 빠진 줄은 원문을 유지"""
+    response = '```json\n[{"i": 1, "t": "첫 줄"}, {"i": 3, "t": "셋째 줄"}]\n```'
+    gemini = AsyncMock(return_value=response)
+
+    with patch('app.config.settings.SEGMENT_BATCH_RETRIES', 1), \
+            patch.object(service, "_call_gemini_api", gemini):
+        translations = await service._translate_segment_batch(make_segments(3))
+
+    assert translations == ["첫 줄", "line 1", "셋째 줄"]
+    assert gemini.call_count == 2
+
+
+async def test_segment_batch_retries_malformed_json(service):
+    """JSON이 깨진 응답은 다시 요청"""
+    gemini = AsyncMock(side_effect=["죄송합니다, 번역할 수 없습니다", await fake_gemini(
+        service._create_segment_prompt(["line 0"])
+    )])
+
+    with patch.object(service, "_call_gemini_api", gemini):
+        translations = await service._translate_segment_batch(make_segments(1))
+
+    assert translations == ["번역 0"]
+    assert gemini.call_count == 2
+
+
+async def test_segment_batch_does_not_retry_api_errors(service):
+    """Gemini 호출 실패는 _call_gemini_api의 재시도 결과를 그대로 전달"""
+    gemini = AsyncMock(side_effect=GeminiAPIError("Bad Request", status_code=400))
+
+    with patch.object(service, "_call_gemini_api", gemini), pytest.raises(GeminiAPIError):
+        await service._translate_segment_batch(make_segments(1))
+
+    assert gemini.call_count == 1
+
+
+def test_batch_segments_respects_token_budget():
+    """토큰 예산을 넘으면 새 묶음 시작"""
+    segments = [{"text": "x" * 400, "start": float(i), "duration": 1.0} for i in range(4)]
+    batches = batch_segments(segments, 50, max_tokens=250)
+    assert [len(b) for b in batches] == [2, 2]
+
+
+async def test_translate_segments_yields_in_order(service):
+    """여러 묶음을 동시에 번역해도 결과는 영상 순서대로 전달"""
+    async def slow_first(prompt):
+        # 첫 묶음이 더 늦게 끝나도 순서는 유지되어야 함
+        if '"t": "line 0"' in prompt:
+            await asyncio.sleep(0.05)
+        return await fake_gemini(prompt)
+
+    with patch('app.config.settings.SEGMENT_BATCH_SIZE', 2), \
+            patch('app.config.settings.SEGMENT_BATCH_CONCURRENCY', 3), \
+            patch.object(service, "_call_gemini_api", side_effect=slow_first):
+        results = [item async for item in service.translate_segments(make_segments(5))]
+
+    assert [offset for offset, _ in results] == [0, 2, 4]
+    subtitles = [s for _, batch in results for s in batch]
+    assert [s["translation"] for s in subtitles] == [f"번역 {i}" for i in range(5)]
+    assert subtitles[3]["start"] == 3.0
+
+
+# ===========================
+# WebSocket 엔드포인트
+# ===========================
+
+def test_websocket_streams_subtitles():
+    """ready → segments → complete 순서로 자막 전달"""
+    client = TestClient(app)
+
+    with patch('app.main.fetch_transcript', AsyncMock(return_value=make_segments(3))), \
+            patch('app.config.settings.SEGMENT_BATCH_SIZE', 2), \
+            patch('app.main.translator_service._call_gemini_api', side_effect=fake_gemini):
+        with client.websocket_connect("/ws/test-client") as websocket:
+            websocket.send_json({"type": "init", "url": "https://youtu.be/dQw4w9WgXcQ"})
+
+            messages = []
+            while not messages or messages[-1]["type"] not in ("complete", "error"):
+                messages.append(websocket.receive_json())
+
+    types = [m["type"] for m in messages]
+    assert types.index("ready") < types.index("segments") < types.index("complete")
+
+    ready = messages[types.index("ready")]
+    assert ready["total"] == 3
+    assert [s["translation"] for s in ready["subtitles"]] == ["번역 0", "번역 1"]
+
+    segments = messages[types.index("segments")]
+    assert segments["data"]["start_index"] == 2
+
+
+def test_websocket_invalid_url():
+    """잘못된 URL은 error 메시지로 응답"""
+    client = TestClient(app)
+
+    with client.websocket_connect("/ws/test-client") as websocket:
+        websocket.send_json({"type": "init", "url": "https://example.com/video"})
+        message = websocket.receive_json()
+
+    assert message["type"] == "error"
+
+
+def test_websocket_transcript_unavailable():
+    """자막을 가져올 수 없으면 error 메시지로 응답"""
+    client = TestClient(app)
+    error = ValueError("이 영상의 자막을 가져올 수 없습니다: NoTranscriptFound")
+
+    with patch('app.main.fetch_transcript', AsyncMock(side_effect=error)):
+        with client.websocket_connect("/ws/test-client") as websocket:
+            websocket.send_json({"type": "init", "url": "https://youtu.be/dQw4w9WgXcQ"})
+            messages = [websocket.receive_json(), websocket.receive_json()]
+
+    assert messages[-1] == {"type": "error", "message": str(error)}